@@ -0,0 +1,144 @@
+"""Throughput of the set-based bulk upserts against the configured database.
+
+Run from the project root:
+
+    python -m benchmarks.bulk_upsert --sizes 1000 100000 1000000
+
+Each size runs three passes inside one transaction that is rolled back
+at the end: inserting new rows, re-sending the same rows (no-op) and
+changing every tenth row.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import replace
+from typing import Awaitable, Callable, List
+from uuid import uuid4
+
+from src.core.db import async_session_maker, init_db
+from src.domain.advertisers.entities import AdvertiserEntity, MLScoreEntity
+from src.domain.clients.entities import ClientEntity
+from src.infrastructure.advertisers.mappers import AdvertisersMapper, MLScoreMapper
+from src.infrastructure.advertisers.orm import AdvertiserModel as AdvertiserModel
+from src.infrastructure.advertisers.repositories import (
+    AdvertisersRepository,
+    MLScoreRepository,
+)
+from src.infrastructure.campaigns.orm import CampaignModel as CampaignModel
+from src.infrastructure.clients.mappers import ClientsMapper
+from src.infrastructure.clients.orm import ClientModel as ClientModel
+from src.infrastructure.clients.repositories import ClientsRepository
+from src.infrastructure.statistics.orm import UniqueEventModel as UniqueEventModel
+
+ML_SCORES_ADVERTISERS = 100
+
+
+def make_clients(size: int) -> List[ClientEntity]:
+    return [
+        ClientEntity(
+            id=uuid4(),
+            login=f"client_{i}",
+            age=random.randint(14, 90),
+            location=random.choice(["Moscow", "Kazan", "Perm"]),
+            gender=random.choice(["MALE", "FEMALE"]),
+        )
+        for i in range(size)
+    ]
+
+
+def make_advertisers(size: int) -> List[AdvertiserEntity]:
+    return [AdvertiserEntity(id=uuid4(), name=f"advertiser_{i}") for i in range(size)]
+
+
+async def timed(label: str, size: int, fn: Callable[[], Awaitable[object]]) -> None:
+    started = time.perf_counter()
+    await fn()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<10} {elapsed:8.2f}s {size / elapsed:12.0f} rows/s")
+
+
+async def bench_clients(size: int) -> None:
+    clients = make_clients(size)
+    changed = [
+        replace(client, age=client.age + 1) if i % 10 == 0 else client
+        for i, client in enumerate(clients)
+    ]
+
+    async with async_session_maker() as session:
+        repository = ClientsRepository(session, ClientsMapper())
+        print(f"clients, {size} rows")
+        await timed("insert", size, lambda: repository.bulk_upsert(clients))
+        await timed("unchanged", size, lambda: repository.bulk_upsert(clients))
+        await timed("update 10%", size, lambda: repository.bulk_upsert(changed))
+        await session.rollback()
+
+
+async def bench_advertisers(size: int) -> None:
+    advertisers = make_advertisers(size)
+    changed = [
+        replace(advertiser, name=f"{advertiser.name}_renamed")
+        if i % 10 == 0
+        else advertiser
+        for i, advertiser in enumerate(advertisers)
+    ]
+
+    async with async_session_maker() as session:
+        repository = AdvertisersRepository(session, AdvertisersMapper())
+        print(f"advertisers, {size} rows")
+        await timed("insert", size, lambda: repository.bulk_upsert(advertisers))
+        await timed("unchanged", size, lambda: repository.bulk_upsert(advertisers))
+        await timed("update 10%", size, lambda: repository.bulk_upsert(changed))
+        await session.rollback()
+
+
+async def bench_ml_scores(size: int) -> None:
+    advertisers = make_advertisers(ML_SCORES_ADVERTISERS)
+    clients = make_clients(max(size // ML_SCORES_ADVERTISERS, 1))
+    scores = [
+        MLScoreEntity(
+            id=uuid4(),
+            client_id=client.id,
+            advertiser_id=advertiser.id,
+            score=random.randint(0, 1000),
+        )
+        for client in clients
+        for advertiser in advertisers
+    ][:size]
+    changed = [
+        replace(score, score=score.score + 1) if i % 10 == 0 else score
+        for i, score in enumerate(scores)
+    ]
+
+    async with async_session_maker() as session:
+        await ClientsRepository(session, ClientsMapper()).bulk_upsert(clients)
+        await AdvertisersRepository(session, AdvertisersMapper()).bulk_upsert(
+            advertisers
+        )
+        repository = MLScoreRepository(session, MLScoreMapper(), None, None)
+        print(f"ml scores, {len(scores)} rows")
+        await timed(
+            "insert", len(scores), lambda: repository.bulk_upsert_ml_scores(scores)
+        )
+        await timed(
+            "unchanged", len(scores), lambda: repository.bulk_upsert_ml_scores(scores)
+        )
+        await timed(
+            "update 10%", len(scores), lambda: repository.bulk_upsert_ml_scores(changed)
+        )
+        await session.rollback()
+
+
+async def main(sizes: List[int]) -> None:
+    await init_db()
+    for size in sizes:
+        await bench_clients(size)
+        await bench_advertisers(size)
+        await bench_ml_scores(size)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000])
+    asyncio.run(main(parser.parse_args().sizes))
@@ -0,0 +1,133 @@
+"""Latency of /ads while the same app instance uploads campaign images.
+
+Run from the project root against a running app (single uvicorn worker):
+
+    python -m benchmarks.storage_event_loop --base-url http://localhost:8080 \\
+        --client-id <client> --advertiser-id <advertiser> --campaign-id <campaign>
+
+The first phase measures /ads alone, the second repeats it while
+--uploaders concurrent tasks keep uploading an image of --image-size bytes
+to the campaign. Event loop lag is read from the app's
+event_loop_lag_seconds histogram on /metrics for each phase.
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import time
+from typing import Dict, List, Tuple
+
+import aiohttp
+
+LAG_METRIC = re.compile(
+    r"^event_loop_lag_seconds_(sum|count|bucket)(\{[^}]*\})? (\S+)$"
+)
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def read_lag(session: aiohttp.ClientSession, base_url: str) -> Dict[str, float]:
+    async with session.get(f"{base_url}/metrics") as response:
+        text = await response.text()
+    values: Dict[str, float] = {}
+    for line in text.splitlines():
+        match = LAG_METRIC.match(line)
+        if match is None:
+            continue
+        kind, labels, value = match.groups()
+        if kind == "bucket":
+            if labels == '{le="0.05"}':
+                values["under_50ms"] = float(value)
+        else:
+            values[kind] = float(value)
+    return values
+
+
+async def probe_ads(
+    session: aiohttp.ClientSession, base_url: str, client_id: str, requests: int
+) -> List[float]:
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        async with session.get(
+            f"{base_url}/ads", params={"client_id": client_id}
+        ) as response:
+            await response.read()
+        latencies.append(time.perf_counter() - started)
+        await asyncio.sleep(0.01)
+    return latencies
+
+
+async def upload_forever(
+    session: aiohttp.ClientSession, url: str, image: bytes, stop: asyncio.Event
+) -> Tuple[int, int]:
+    # Rejected uploads are counted apart: a phase whose uploads all fail
+    # (wrong method, missing campaign) says nothing about storage I/O.
+    uploads = failures = 0
+    while not stop.is_set():
+        form = aiohttp.FormData()
+        form.add_field("image", image, filename="bench.png", content_type="image/png")
+        async with session.put(url, data=form) as response:
+            await response.read()
+            if response.status < 300:
+                uploads += 1
+            else:
+                failures += 1
+    return uploads, failures
+
+
+async def run_phase(
+    label: str, args: argparse.Namespace, session: aiohttp.ClientSession
+) -> None:
+    upload_url = (
+        f"{args.base_url}/advertisers/{args.advertiser_id}"
+        f"/campaigns/{args.campaign_id}/image"
+    )
+    # PNG signature followed by random bytes, so the payload does not compress.
+    image = b"\x89PNG\r\n\x1a\n" + os.urandom(args.image_size - 8)
+    stop = asyncio.Event()
+    uploaders = [
+        asyncio.create_task(upload_forever(session, upload_url, image, stop))
+        for _ in range(args.uploaders if label == "uploads" else 0)
+    ]
+
+    lag_before = await read_lag(session, args.base_url)
+    latencies = await probe_ads(session, args.base_url, args.client_id, args.requests)
+    lag_after = await read_lag(session, args.base_url)
+    stop.set()
+    results = await asyncio.gather(*uploaders)
+    uploads = sum(done for done, _ in results)
+    failures = sum(failed for _, failed in results)
+
+    ticks = lag_after.get("count", 0) - lag_before.get("count", 0)
+    lag_sum = lag_after.get("sum", 0) - lag_before.get("sum", 0)
+    slow = ticks - (lag_after.get("under_50ms", 0) - lag_before.get("under_50ms", 0))
+    print(
+        f"{label:<8} /ads p50 {percentile(latencies, 0.5) * 1000:7.1f}ms"
+        f"  p99 {percentile(latencies, 0.99) * 1000:7.1f}ms"
+        f"  loop lag mean {lag_sum / ticks * 1000 if ticks else 0:6.1f}ms"
+        f"  ticks over 50ms {slow:.0f}/{ticks:.0f}"
+        f"  uploads {uploads} failed {failures}"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with aiohttp.ClientSession() as session:
+        await run_phase("idle", args, session)
+        await run_phase("uploads", args, session)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://localhost:8080")
+    parser.add_argument("--client-id", required=True)
+    parser.add_argument("--advertiser-id", required=True)
+    parser.add_argument("--campaign-id", required=True)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--uploaders", type=int, default=8)
+    parser.add_argument("--image-size", type=int, default=5 * 1024 * 1024)
+    asyncio.run(main(parser.parse_args()))
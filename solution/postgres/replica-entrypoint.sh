@@ -0,0 +1,16 @@
+#!/bin/bash
+set -e
+
+if [ -z "$(ls -A "$PGDATA" 2>/dev/null)" ]; then
+  until pg_isready -h postgres -U "$POSTGRES_USER"; do
+    sleep 1
+  done
+
+  mkdir -p "$PGDATA"
+  chown postgres:postgres "$PGDATA"
+  chmod 700 "$PGDATA"
+  export PGPASSWORD="$POSTGRES_PASSWORD"
+  gosu postgres pg_basebackup -h postgres -U "$POSTGRES_USER" -D "$PGDATA" -R -X stream
+fi
+
+exec docker-entrypoint.sh postgres -c hot_standby=on
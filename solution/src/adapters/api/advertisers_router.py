@@ -1,9 +1,10 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Request
 from src.application.advertisers.dtos import (
     GetAdvertiserByIdSchema,
+    MLScoreBulkResponse,
     MLScoreSchema,
 )
 from src.core.uow import AbstractUow
@@ -13,18 +14,28 @@ from src.domain.advertisers.exceptions import (
     MLScoreRepositoryError,
 )
 from src.domain.advertisers.interfaces import (
+    BulkUpsertMLScoresUseCaseProtocol,
     GetAdvertiserByIdUseCaseProtocol,
+    StreamUpsertAdvertisersUseCaseProtocol,
     UpsertAdvertisersUseCaseProtocol,
     UpsertMLScoreUseCaseProtocol,
 )
 from src.domain.clients.exceptions import ClientNotFoundException
 
 from .dependencies import (
+    get_bulk_upsert_ml_scores_use_case,
     get_get_advertiser_by_id_use_case,
+    get_stream_upsert_advertisers_use_case,
     get_uow,
     get_upsert_advertisers_use_case,
     get_upsert_ml_score_use_case,
 )
+from .ndjson import (
+    NDJSONStreamingResponse,
+    iter_ndjson_models,
+    iter_request_lines,
+    iter_request_records,
+)
 
 router = APIRouter()
 
@@ -67,6 +78,25 @@ async def upsert_advertisers(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post(
+    "/advertisers/bulk/stream",
+    tags=["Advertisers"],
+    response_class=NDJSONStreamingResponse,
+)
+async def stream_upsert_advertisers(
+    request: Request,
+    usecase: StreamUpsertAdvertisersUseCaseProtocol = Depends(
+        get_stream_upsert_advertisers_use_case
+    ),
+) -> NDJSONStreamingResponse:
+    """
+    Потоковое создание или обновление рекламодателей из NDJSON с итогами по пачкам
+    """
+    return NDJSONStreamingResponse(
+        iter_ndjson_models(usecase.execute(lines=iter_request_lines(request)))
+    )
+
+
 @router.post("/ml-scores", tags=["Advertisers"])
 async def upsert_ml_score(
     data: MLScoreSchema,
@@ -87,3 +117,22 @@ async def upsert_ml_score(
         raise HTTPException(status_code=500, detail=str(e))
     except AdvertiserRepositoryError as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/ml-scores/bulk", tags=["Advertisers"])
+async def bulk_upsert_ml_scores(
+    request: Request,
+    uow: AbstractUow = Depends(get_uow),
+    usecase: BulkUpsertMLScoresUseCaseProtocol = Depends(
+        get_bulk_upsert_ml_scores_use_case
+    ),
+) -> MLScoreBulkResponse:
+    """
+    Массовая загрузка ML скоров из JSON массива или NDJSON потока
+    """
+    rows = await iter_request_records(request)
+    try:
+        async with uow:
+            return await usecase.execute(rows=rows)
+    except MLScoreRepositoryError as e:
+        raise HTTPException(status_code=500, detail=str(e))
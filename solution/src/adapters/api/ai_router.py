@@ -1,20 +1,28 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query
 from src.application.ai.dtos import (
     AdvertisementGenerationResponse,
+    ImageJobResponse,
 )
 from src.common.depends import get_uow
 from src.core.uow import AbstractUow
+from src.domain.ai.exceptions import (
+    ImageJobNotFoundError,
+    ImageJobQueueError,
+    ImageJobQueueFullError,
+)
 from src.domain.ai.interfaces import (
     GenerateAdUseCaseProtocol,
-    GenerateImageUseCaseProtocol,
+    GetImageJobUseCaseProtocol,
+    SubmitImageJobUseCaseProtocol,
 )
+from src.domain.campaigns.exceptions import CampaignNotFoundException
 
 from .dependencies import (
     get_generate_ad_use_case,
-    get_generate_image_use_case,
+    get_image_job_use_case,
+    get_submit_image_job_use_case,
 )
 
 router = APIRouter()
@@ -24,24 +32,60 @@ router = APIRouter()
 async def generate_ad(
     advertiser_id: UUID,
     ad_title: str,
+    bypass_cache: bool = False,
     uow: AbstractUow = Depends(get_uow),
     usecase: GenerateAdUseCaseProtocol = Depends(get_generate_ad_use_case),
 ) -> AdvertisementGenerationResponse:
     """
     Генерация рекламного объявления
+
+    Повторный запрос с тем же названием возвращает сохранённый результат,
+    `bypass_cache=true` запрашивает новый вариант у модели.
     """
     async with uow:
-        return await usecase.execute(advertiser_id=advertiser_id, ad_title=ad_title)
+        return await usecase.execute(
+            advertiser_id=advertiser_id, ad_title=ad_title, bypass_cache=bypass_cache
+        )
 
 
-@router.get("/generate-image", tags=["AI"])
+@router.post("/generate-image", tags=["AI"], status_code=202)
 async def generate_image(
     campaign_id: UUID,
     uow: AbstractUow = Depends(get_uow),
-    usecase: GenerateImageUseCaseProtocol = Depends(get_generate_image_use_case),
-) -> FileResponse:
+    usecase: SubmitImageJobUseCaseProtocol = Depends(get_submit_image_job_use_case),
+) -> ImageJobResponse:
     """
-    Генерация изображения
+    Постановка задачи генерации изображения в очередь
+
+    Изображение генерируется фоновым воркером и загружается в MinIO,
+    статус и ссылку можно получить через `GET /generate-image/{job_id}`.
     """
-    async with uow:
-        return await usecase.execute(campaign_id=campaign_id)
+    try:
+        async with uow:
+            return await usecase.execute(campaign_id=campaign_id)
+    except CampaignNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ImageJobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except ImageJobQueueError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/generate-image/{job_id}", tags=["AI"])
+async def get_image_job(
+    job_id: UUID,
+    wait_seconds: float = Query(0.0, ge=0.0, le=30.0),
+    usecase: GetImageJobUseCaseProtocol = Depends(get_image_job_use_case),
+) -> ImageJobResponse:
+    """
+    Статус задачи генерации изображения
+
+    С `wait_seconds` запрос ждёт завершения задачи до указанного времени
+    вместо частого опроса.
+    """
+    try:
+        return await usecase.execute(job_id=job_id, wait_seconds=wait_seconds)
+    except ImageJobNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ImageJobQueueError as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -22,6 +22,8 @@ from src.core.uow import AbstractUow
 from src.domain.advertisers.exceptions import AdvertiserNotFoundException
 from src.domain.campaigns.exceptions import (
     CampaignForbiddenError,
+    CampaignImageInvalidError,
+    CampaignImageTooLargeError,
     CampaignImageUploadError,
     CampaignModerationError,
     CampaignNotFoundException,
@@ -223,6 +225,10 @@ async def upload_campaign_image(
         raise HTTPException(status_code=404, detail=str(e))
     except CampaignForbiddenError as e:
         raise HTTPException(status_code=403, detail=str(e))
+    except CampaignImageInvalidError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except CampaignImageTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except CampaignImageUploadError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except CampaignRepositoryError as e:
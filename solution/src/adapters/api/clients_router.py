@@ -1,6 +1,6 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Request
 from src.application.clients.dtos import (
     ClientSchema,
     ClientUpsertSchema,
@@ -10,14 +10,17 @@ from src.core.uow import AbstractUow
 from src.domain.clients.exceptions import ClientNotFoundException, ClientRepositoryError
 from src.domain.clients.interfaces import (
     GetClientByIdUseCaseProtocol,
+    StreamUpsertClientsUseCaseProtocol,
     UpsertClientUseCaseProtocol,
 )
 
 from .dependencies import (
     get_client_by_id_use_case,
+    get_stream_upsert_clients_use_case,
     get_uow,
     get_upsert_client_use_case,
 )
+from .ndjson import NDJSONStreamingResponse, iter_ndjson_models, iter_request_lines
 
 router = APIRouter()
 
@@ -60,3 +63,22 @@ async def upsert_clients(
         raise HTTPException(status_code=500, detail=str(e))
     except ClientNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.post(
+    "/clients/bulk/stream",
+    tags=["Clients"],
+    response_class=NDJSONStreamingResponse,
+)
+async def stream_upsert_clients(
+    request: Request,
+    usecase: StreamUpsertClientsUseCaseProtocol = Depends(
+        get_stream_upsert_clients_use_case
+    ),
+) -> NDJSONStreamingResponse:
+    """
+    Потоковое создание/обновление клиентов из NDJSON с итогами по пачкам
+    """
+    return NDJSONStreamingResponse(
+        iter_ndjson_models(usecase.execute(lines=iter_request_lines(request)))
+    )
@@ -1,5 +1,8 @@
+import secrets
+from typing import Optional
+
 import redis.asyncio as redis
-from fastapi import Depends
+from fastapi import Depends, Header, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.application.ads.use_cases import (
     GetAdForClientUseCase,
@@ -7,13 +10,16 @@ from src.application.ads.use_cases import (
     SubmitAdFeedbackUseCase,
 )
 from src.application.advertisers.use_cases import (
+    BulkUpsertMLScoresUseCase,
     GetAdvertiserByIdUseCase,
+    StreamUpsertAdvertisersUseCase,
     UpsertAdvertisersUseCase,
     UpsertMLScoreUseCase,
 )
 from src.application.ai.use_cases import (
     GenerateAdUseCase,
-    GenerateImageUseCase,
+    GetImageJobUseCase,
+    SubmitImageJobUseCase,
 )
 from src.application.campaigns.use_cases import (
     CreateCampaignFromYandexUseCase,
@@ -28,9 +34,11 @@ from src.application.campaigns.use_cases import (
 )
 from src.application.clients.use_cases import (
     GetClientByIdUseCase,
+    StreamUpsertClientsUseCase,
     UpsertClientUseCase,
 )
 from src.application.export.use_cases import ExportAdvertiserDataUseCase
+from src.application.loader.use_cases import BulkLoadUseCase
 from src.application.moderation.use_cases import (
     CheckForbiddenWordsUseCase,
     GetForbiddenWordsUseCase,
@@ -39,8 +47,10 @@ from src.application.moderation.use_cases import (
 from src.application.statistics.use_cases import (
     GetAdvertiserCampaignsStatsUseCase,
     GetAdvertiserDailyStatsUseCase,
+    GetAdvertiserReachUseCase,
     GetCampaignDailyStatsUseCase,
     GetCampaignFeedbackStatsUseCase,
+    GetCampaignReachUseCase,
     GetCampaignStatsUseCase,
     GetClientsStatsUseCase,
 )
@@ -48,7 +58,9 @@ from src.application.time.use_cases import (
     GetCurrentDateUseCase,
     TimeUseCase,
 )
-from src.common.depends import get_session, get_uow
+from src.common.depends import get_read_session, get_read_uow, get_session, get_uow
+from src.core.db import async_session_maker
+from src.core.http import HttpClient, http_client
 from src.core.redis import get_redis
 from src.core.settings import Settings, get_settings
 from src.core.uow import AbstractUow
@@ -59,15 +71,22 @@ from src.domain.ads.interfaces import (
 )
 from src.domain.advertisers.interfaces import (
     AdvertisersRepositoryProtocol,
+    BulkUpsertMLScoresUseCaseProtocol,
     GetAdvertiserByIdUseCaseProtocol,
     MLScoreRepositoryProtocol,
+    MLScoreStoreProtocol,
+    StreamUpsertAdvertisersUseCaseProtocol,
     UpsertAdvertisersUseCaseProtocol,
     UpsertMLScoreUseCaseProtocol,
 )
 from src.domain.ai.interfaces import (
+    AIBackendProtocol,
+    AIResultCacheProtocol,
     AIServiceProtocol,
     GenerateAdUseCaseProtocol,
-    GenerateImageUseCaseProtocol,
+    GetImageJobUseCaseProtocol,
+    ImageJobRepositoryProtocol,
+    SubmitImageJobUseCaseProtocol,
 )
 from src.domain.campaigns.interfaces import (
     CampaignsRepositoryProtocol,
@@ -85,22 +104,35 @@ from src.domain.campaigns.interfaces import (
 from src.domain.clients.interfaces import (
     ClientsRepositoryProtocol,
     GetClientByIdUseCaseProtocol,
+    StreamUpsertClientsUseCaseProtocol,
     UpsertClientUseCaseProtocol,
 )
 from src.domain.export.interfaces import (
     ExportAdvertiserDataUseCaseProtocol,
     ExportServiceProtocol,
 )
+from src.domain.loader.interfaces import (
+    BulkLoadUseCaseProtocol,
+    CopyLoaderRepositoryProtocol,
+)
 from src.domain.moderation.interfaces import (
     CheckForbiddenWordsUseCaseProtocol,
+    ForbiddenWordsMatcherCacheProtocol,
     ForbiddenWordsRepositoryProtocol,
+    ForbiddenWordsVersionRepositoryProtocol,
     GetForbiddenWordsUseCaseProtocol,
+    ModerationQueueProtocol,
     ModerationServiceProtocol,
     UpdateForbiddenWordsUseCaseProtocol,
 )
 from src.domain.statistics.interfaces import (
+    GetAdvertiserReachUseCaseProtocol,
     GetCampaignFeedbackStatsUseCaseProtocol,
+    GetCampaignReachUseCaseProtocol,
     GetClientsStatsUseCaseProtocol,
+    ReachRepositoryProtocol,
+    StatisticsCacheProtocol,
+    StatisticsRepositoryFactoryProtocol,
     StatisticsRepositoryProtocol,
 )
 from src.domain.storage.interfaces import (
@@ -115,7 +147,11 @@ from src.infrastructure.advertisers.repositories import (
     AdvertisersRepository,
     MLScoreRepository,
 )
+from src.infrastructure.advertisers.score_store import ml_score_store
 from src.infrastructure.ai.ai_service import AIService
+from src.infrastructure.ai.backends import ai_backend
+from src.infrastructure.ai.cache import AIResultCacheRepository
+from src.infrastructure.ai.jobs import ImageJobRepository
 from src.infrastructure.campaigns.mappers import CampaignsMapper
 from src.infrastructure.campaigns.repositories import (
     CampaignsRepository,
@@ -125,14 +161,23 @@ from src.infrastructure.clients.repositories import (
     ClientsRepository,
 )
 from src.infrastructure.export.export_service import ExportService
+from src.infrastructure.loader.repositories import CopyLoaderRepository
 from src.infrastructure.moderation.mappers import ModerationMapper
-from src.infrastructure.moderation.repositories import ForbiddenWordsRepository
+from src.infrastructure.moderation.matcher import forbidden_words_matcher_cache
+from src.infrastructure.moderation.queue import ModerationQueueRepository
+from src.infrastructure.moderation.repositories import (
+    ForbiddenWordsRepository,
+    ForbiddenWordsVersionRepository,
+)
 from src.infrastructure.moderation.services import ModerationService
 from src.infrastructure.statistics.mappers import StatisticsMapper
 from src.infrastructure.statistics.repositories import (
+    ReachRepository,
+    StatisticsCacheRepository,
     StatisticsRepository,
+    StatisticsRepositoryFactory,
 )
-from src.infrastructure.storage.minio_service import MinioService
+from src.infrastructure.storage.minio_service import minio_service
 from src.infrastructure.time.repositories import (
     TimeRepository,
     TimeRepositoryProtocol,
@@ -140,8 +185,51 @@ from src.infrastructure.time.repositories import (
 from src.infrastructure.yandex.yandex_service import YandexDirectService
 
 
-def get_ai_service(settings: Settings = Depends(get_settings)) -> AIServiceProtocol:
-    return AIService(settings=settings)
+def get_ai_result_cache(
+    redis: redis.Redis = Depends(get_redis),
+    settings: Settings = Depends(get_settings),
+) -> Optional[AIResultCacheProtocol]:
+    if not settings.ai_result_cache_enabled:
+        return None
+    return AIResultCacheRepository(
+        redis,
+        ttl_seconds=settings.ai_result_cache_ttl_seconds,
+        max_entries=settings.ai_result_cache_max_entries,
+    )
+
+
+def get_http_client() -> HttpClient:
+    return http_client
+
+
+def get_ai_backend() -> AIBackendProtocol:
+    return ai_backend
+
+
+def get_ai_service(
+    settings: Settings = Depends(get_settings),
+    client: HttpClient = Depends(get_http_client),
+    result_cache: Optional[AIResultCacheProtocol] = Depends(get_ai_result_cache),
+    backend: AIBackendProtocol = Depends(get_ai_backend),
+) -> AIServiceProtocol:
+    return AIService(
+        settings=settings,
+        http_client=client,
+        result_cache=result_cache,
+        backend=backend,
+    )
+
+
+def get_image_job_repository(
+    redis: redis.Redis = Depends(get_redis),
+    settings: Settings = Depends(get_settings),
+) -> ImageJobRepositoryProtocol:
+    return ImageJobRepository(
+        redis,
+        ttl_seconds=settings.image_job_ttl_seconds,
+        max_queue_length=settings.image_job_queue_max_length,
+        lease_seconds=settings.image_job_lease_seconds,
+    )
 
 
 def get_moderation_mapper() -> ModerationMapper:
@@ -154,13 +242,37 @@ def get_moderation_repository(
     return ForbiddenWordsRepository(session)
 
 
+def get_forbidden_words_version_repository(
+    redis: redis.Redis = Depends(get_redis),
+) -> ForbiddenWordsVersionRepositoryProtocol:
+    return ForbiddenWordsVersionRepository(redis)
+
+
+def get_forbidden_words_matcher_cache() -> ForbiddenWordsMatcherCacheProtocol:
+    return forbidden_words_matcher_cache
+
+
+def get_moderation_queue(
+    redis: redis.Redis = Depends(get_redis),
+) -> ModerationQueueProtocol:
+    return ModerationQueueRepository(redis)
+
+
 def get_moderation_service(
     uow: AbstractUow = Depends(get_uow),
     repository: ForbiddenWordsRepositoryProtocol = Depends(get_moderation_repository),
     ai_service: AIServiceProtocol = Depends(get_ai_service),
     settings: Settings = Depends(get_settings),
+    matcher_cache: ForbiddenWordsMatcherCacheProtocol = Depends(
+        get_forbidden_words_matcher_cache
+    ),
+    version_repository: ForbiddenWordsVersionRepositoryProtocol = Depends(
+        get_forbidden_words_version_repository
+    ),
 ) -> ModerationServiceProtocol:
-    return ModerationService(uow, repository, ai_service, settings)
+    return ModerationService(
+        uow, repository, ai_service, settings, matcher_cache, version_repository
+    )
 
 
 def get_get_forbidden_words_use_case(
@@ -173,8 +285,16 @@ def get_get_forbidden_words_use_case(
 def get_update_forbidden_words_use_case(
     uow: AbstractUow = Depends(get_uow),
     repository: ForbiddenWordsRepositoryProtocol = Depends(get_moderation_repository),
+    matcher_cache: ForbiddenWordsMatcherCacheProtocol = Depends(
+        get_forbidden_words_matcher_cache
+    ),
+    version_repository: ForbiddenWordsVersionRepositoryProtocol = Depends(
+        get_forbidden_words_version_repository
+    ),
 ) -> UpdateForbiddenWordsUseCaseProtocol:
-    return UpdateForbiddenWordsUseCase(uow, repository)
+    return UpdateForbiddenWordsUseCase(
+        uow, repository, matcher_cache, version_repository
+    )
 
 
 def get_check_forbidden_words_use_case(
@@ -192,10 +312,19 @@ def get_time_repository(
     return TimeRepository(redis=redis)
 
 
-def get_minio_service(
+def get_statistics_cache(
+    redis: redis.Redis = Depends(get_redis),
     settings: Settings = Depends(get_settings),
-) -> MinioServiceProtocol:
-    return MinioService(settings)
+) -> Optional[StatisticsCacheProtocol]:
+    if not settings.stats_cache_enabled:
+        return None
+    return StatisticsCacheRepository(
+        redis=redis, ttl_seconds=settings.stats_cache_ttl_seconds
+    )
+
+
+def get_minio_service() -> MinioServiceProtocol:
+    return minio_service
 
 
 def get_clients_mapper() -> ClientsMapper:
@@ -213,6 +342,13 @@ def get_advertisers_repository(
     return AdvertisersRepository(session, mapper)
 
 
+def get_read_advertisers_repository(
+    session: AsyncSession = Depends(get_read_session),
+    mapper: AdvertisersMapper = Depends(get_advertisers_mapper),
+) -> AdvertisersRepositoryProtocol:
+    return AdvertisersRepository(session, mapper)
+
+
 def get_clients_repository(
     session: AsyncSession = Depends(get_session),
     mapper: ClientsMapper = Depends(get_clients_mapper),
@@ -220,6 +356,13 @@ def get_clients_repository(
     return ClientsRepository(session, mapper)
 
 
+def get_read_clients_repository(
+    session: AsyncSession = Depends(get_read_session),
+    mapper: ClientsMapper = Depends(get_clients_mapper),
+) -> ClientsRepositoryProtocol:
+    return ClientsRepository(session, mapper)
+
+
 def get_client_by_id_use_case(
     uow: AbstractUow = Depends(get_uow),
     repository: ClientsRepositoryProtocol = Depends(get_clients_repository),
@@ -236,6 +379,14 @@ def get_upsert_client_use_case(
     return UpsertClientUseCase(uow, repository, mapper)
 
 
+def get_stream_upsert_clients_use_case(
+    uow: AbstractUow = Depends(get_uow),
+    repository: ClientsRepositoryProtocol = Depends(get_clients_repository),
+    mapper: ClientsMapper = Depends(get_clients_mapper),
+) -> StreamUpsertClientsUseCaseProtocol:
+    return StreamUpsertClientsUseCase(uow, repository, mapper)
+
+
 def get_campaigns_mapper() -> CampaignsMapper:
     return CampaignsMapper()
 
@@ -248,6 +399,14 @@ def get_campaigns_repository(
     return CampaignsRepository(session, mapper, time_repository)
 
 
+def get_read_campaigns_repository(
+    session: AsyncSession = Depends(get_read_session),
+    mapper: CampaignsMapper = Depends(get_campaigns_mapper),
+    time_repository: TimeRepositoryProtocol = Depends(get_time_repository),
+) -> CampaignsRepositoryProtocol:
+    return CampaignsRepository(session, mapper, time_repository)
+
+
 def get_create_campaign_use_case(
     uow: AbstractUow = Depends(get_uow),
     repository: CampaignsRepositoryProtocol = Depends(get_campaigns_repository),
@@ -257,6 +416,8 @@ def get_create_campaign_use_case(
         get_advertisers_repository
     ),
     settings: Settings = Depends(get_settings),
+    statistics_cache: Optional[StatisticsCacheProtocol] = Depends(get_statistics_cache),
+    moderation_queue: ModerationQueueProtocol = Depends(get_moderation_queue),
 ) -> CreateCampaignUseCaseProtocol:
     return CreateCampaignUseCase(
         uow,
@@ -265,6 +426,8 @@ def get_create_campaign_use_case(
         moderation_service,
         advertisers_repository,
         settings,
+        statistics_cache=statistics_cache,
+        moderation_queue=moderation_queue,
     )
 
 
@@ -288,6 +451,8 @@ def get_update_campaign_use_case(
         get_advertisers_repository
     ),
     settings: Settings = Depends(get_settings),
+    statistics_cache: Optional[StatisticsCacheProtocol] = Depends(get_statistics_cache),
+    moderation_queue: ModerationQueueProtocol = Depends(get_moderation_queue),
 ) -> UpdateCampaignUseCaseProtocol:
     return UpdateCampaignUseCase(
         uow,
@@ -296,6 +461,8 @@ def get_update_campaign_use_case(
         moderation_service,
         advertisers_repository,
         settings,
+        statistics_cache=statistics_cache,
+        moderation_queue=moderation_queue,
     )
 
 
@@ -306,8 +473,15 @@ def get_delete_campaign_use_case(
     advertisers_repository: AdvertisersRepositoryProtocol = Depends(
         get_advertisers_repository
     ),
+    statistics_cache: Optional[StatisticsCacheProtocol] = Depends(get_statistics_cache),
 ) -> DeleteCampaignUseCaseProtocol:
-    return DeleteCampaignUseCase(uow, repository, minio_service, advertisers_repository)
+    return DeleteCampaignUseCase(
+        uow,
+        repository,
+        minio_service,
+        advertisers_repository,
+        statistics_cache=statistics_cache,
+    )
 
 
 def get_upload_campaign_image_use_case(
@@ -354,12 +528,45 @@ def get_ml_score_repository(
     )
 
 
+def get_read_ml_score_repository(
+    session: AsyncSession = Depends(get_read_session),
+    mapper: MLScoreMapper = Depends(get_ml_score_mapper),
+    clients_repository: ClientsRepositoryProtocol = Depends(
+        get_read_clients_repository
+    ),
+    advertisers_repository: AdvertisersRepositoryProtocol = Depends(
+        get_read_advertisers_repository
+    ),
+) -> MLScoreRepositoryProtocol:
+    return MLScoreRepository(
+        session, mapper, clients_repository, advertisers_repository
+    )
+
+
+def get_ml_score_store(
+    settings: Settings = Depends(get_settings),
+) -> Optional[MLScoreStoreProtocol]:
+    if not settings.ml_score_store_enabled or not ml_score_store.is_loaded:
+        return None
+    return ml_score_store
+
+
 def get_upsert_ml_score_use_case(
     uow: AbstractUow = Depends(get_uow),
     repository: MLScoreRepositoryProtocol = Depends(get_ml_score_repository),
     mapper: MLScoreMapper = Depends(get_ml_score_mapper),
+    score_store: Optional[MLScoreStoreProtocol] = Depends(get_ml_score_store),
 ) -> UpsertMLScoreUseCaseProtocol:
-    return UpsertMLScoreUseCase(uow, repository, mapper)
+    return UpsertMLScoreUseCase(uow, repository, mapper, score_store=score_store)
+
+
+def get_bulk_upsert_ml_scores_use_case(
+    uow: AbstractUow = Depends(get_uow),
+    repository: MLScoreRepositoryProtocol = Depends(get_ml_score_repository),
+    mapper: MLScoreMapper = Depends(get_ml_score_mapper),
+    score_store: Optional[MLScoreStoreProtocol] = Depends(get_ml_score_store),
+) -> BulkUpsertMLScoresUseCaseProtocol:
+    return BulkUpsertMLScoresUseCase(uow, repository, mapper, score_store=score_store)
 
 
 async def get_ads_mapper() -> AdsMapper:
@@ -378,59 +585,160 @@ def get_statistics_repository(
     return StatisticsRepository(session, mapper, time_repository)
 
 
+def get_read_statistics_repository(
+    session: AsyncSession = Depends(get_read_session),
+    mapper: StatisticsMapper = Depends(get_statistics_mapper),
+    time_repository: TimeRepositoryProtocol = Depends(get_time_repository),
+) -> StatisticsRepositoryProtocol:
+    return StatisticsRepository(session, mapper, time_repository)
+
+
+def get_statistics_fill_repository(
+    mapper: StatisticsMapper = Depends(get_statistics_mapper),
+    time_repository: TimeRepositoryProtocol = Depends(get_time_repository),
+) -> StatisticsRepositoryFactoryProtocol:
+    return StatisticsRepositoryFactory(async_session_maker, mapper, time_repository)
+
+
+def get_reach_repository(
+    redis: redis.Redis = Depends(get_redis),
+) -> ReachRepositoryProtocol:
+    return ReachRepository(redis=redis)
+
+
 def get_get_campaign_stats_use_case(
-    uow: AbstractUow = Depends(get_uow),
-    repository: StatisticsRepositoryProtocol = Depends(get_statistics_repository),
+    uow: AbstractUow = Depends(get_read_uow),
+    repository: StatisticsRepositoryProtocol = Depends(get_read_statistics_repository),
     campaigns_repository: CampaignsRepositoryProtocol = Depends(
-        get_campaigns_repository
+        get_read_campaigns_repository
     ),
     mapper: StatisticsMapper = Depends(get_statistics_mapper),
+    cache: Optional[StatisticsCacheProtocol] = Depends(get_statistics_cache),
+    reach_repository: ReachRepositoryProtocol = Depends(get_reach_repository),
+    fill_repository: StatisticsRepositoryFactoryProtocol = Depends(
+        get_statistics_fill_repository
+    ),
 ) -> GetCampaignStatsUseCase:
     return GetCampaignStatsUseCase(
         uow,
         repository,
         campaigns_repository,
         mapper,
+        cache=cache,
+        reach_repository=reach_repository,
+        fill_repository=fill_repository,
     )
 
 
 def get_get_advertiser_campaigns_stats_use_case(
-    uow: AbstractUow = Depends(get_uow),
-    repository: StatisticsRepositoryProtocol = Depends(get_statistics_repository),
+    uow: AbstractUow = Depends(get_read_uow),
+    repository: StatisticsRepositoryProtocol = Depends(get_read_statistics_repository),
     advertisers_repository: AdvertisersRepositoryProtocol = Depends(
-        get_advertisers_repository
+        get_read_advertisers_repository
     ),
     mapper: StatisticsMapper = Depends(get_statistics_mapper),
+    cache: Optional[StatisticsCacheProtocol] = Depends(get_statistics_cache),
+    reach_repository: ReachRepositoryProtocol = Depends(get_reach_repository),
+    fill_repository: StatisticsRepositoryFactoryProtocol = Depends(
+        get_statistics_fill_repository
+    ),
 ) -> GetAdvertiserCampaignsStatsUseCase:
     return GetAdvertiserCampaignsStatsUseCase(
         uow,
         repository,
         advertisers_repository,
         mapper,
+        cache=cache,
+        reach_repository=reach_repository,
+        fill_repository=fill_repository,
     )
 
 
 def get_get_campaign_daily_stats_use_case(
-    uow: AbstractUow = Depends(get_uow),
-    repository: StatisticsRepositoryProtocol = Depends(get_statistics_repository),
+    uow: AbstractUow = Depends(get_read_uow),
+    repository: StatisticsRepositoryProtocol = Depends(get_read_statistics_repository),
     campaigns_repository: CampaignsRepositoryProtocol = Depends(
-        get_campaigns_repository
+        get_read_campaigns_repository
     ),
+    time_repository: TimeRepositoryProtocol = Depends(get_time_repository),
     mapper: StatisticsMapper = Depends(get_statistics_mapper),
+    cache: Optional[StatisticsCacheProtocol] = Depends(get_statistics_cache),
+    reach_repository: ReachRepositoryProtocol = Depends(get_reach_repository),
+    fill_repository: StatisticsRepositoryFactoryProtocol = Depends(
+        get_statistics_fill_repository
+    ),
 ) -> GetCampaignDailyStatsUseCase:
-    return GetCampaignDailyStatsUseCase(uow, repository, campaigns_repository, mapper)
+    return GetCampaignDailyStatsUseCase(
+        uow,
+        repository,
+        campaigns_repository,
+        time_repository,
+        mapper,
+        cache=cache,
+        reach_repository=reach_repository,
+        fill_repository=fill_repository,
+    )
 
 
 def get_get_advertiser_daily_stats_use_case(
-    uow: AbstractUow = Depends(get_uow),
-    repository: StatisticsRepositoryProtocol = Depends(get_statistics_repository),
+    uow: AbstractUow = Depends(get_read_uow),
+    repository: StatisticsRepositoryProtocol = Depends(get_read_statistics_repository),
     advertisers_repository: AdvertisersRepositoryProtocol = Depends(
-        get_advertisers_repository
+        get_read_advertisers_repository
     ),
+    time_repository: TimeRepositoryProtocol = Depends(get_time_repository),
     mapper: StatisticsMapper = Depends(get_statistics_mapper),
+    cache: Optional[StatisticsCacheProtocol] = Depends(get_statistics_cache),
+    reach_repository: ReachRepositoryProtocol = Depends(get_reach_repository),
+    fill_repository: StatisticsRepositoryFactoryProtocol = Depends(
+        get_statistics_fill_repository
+    ),
 ) -> GetAdvertiserDailyStatsUseCase:
     return GetAdvertiserDailyStatsUseCase(
-        uow, repository, advertisers_repository, mapper
+        uow,
+        repository,
+        advertisers_repository,
+        time_repository,
+        mapper,
+        cache=cache,
+        reach_repository=reach_repository,
+        fill_repository=fill_repository,
+    )
+
+
+def get_get_campaign_reach_use_case(
+    uow: AbstractUow = Depends(get_read_uow),
+    repository: ReachRepositoryProtocol = Depends(get_reach_repository),
+    campaigns_repository: CampaignsRepositoryProtocol = Depends(
+        get_read_campaigns_repository
+    ),
+    mapper: StatisticsMapper = Depends(get_statistics_mapper),
+    cache: Optional[StatisticsCacheProtocol] = Depends(get_statistics_cache),
+) -> GetCampaignReachUseCaseProtocol:
+    return GetCampaignReachUseCase(
+        uow,
+        repository,
+        campaigns_repository,
+        mapper,
+        cache=cache,
+    )
+
+
+def get_get_advertiser_reach_use_case(
+    uow: AbstractUow = Depends(get_read_uow),
+    repository: ReachRepositoryProtocol = Depends(get_reach_repository),
+    advertisers_repository: AdvertisersRepositoryProtocol = Depends(
+        get_read_advertisers_repository
+    ),
+    mapper: StatisticsMapper = Depends(get_statistics_mapper),
+    cache: Optional[StatisticsCacheProtocol] = Depends(get_statistics_cache),
+) -> GetAdvertiserReachUseCaseProtocol:
+    return GetAdvertiserReachUseCase(
+        uow,
+        repository,
+        advertisers_repository,
+        mapper,
+        cache=cache,
     )
 
 
@@ -446,6 +754,9 @@ async def get_get_ad_for_client_use_case(
     statistics_repository: StatisticsRepositoryProtocol = Depends(
         get_statistics_repository
     ),
+    reach_repository: ReachRepositoryProtocol = Depends(get_reach_repository),
+    statistics_cache: Optional[StatisticsCacheProtocol] = Depends(get_statistics_cache),
+    ml_score_store: Optional[MLScoreStoreProtocol] = Depends(get_ml_score_store),
 ) -> GetAdForClientUseCaseProtocol:
     return GetAdForClientUseCase(
         uow,
@@ -455,6 +766,9 @@ async def get_get_ad_for_client_use_case(
         campaigns_repository,
         ml_score_repository,
         statistics_repository,
+        reach_repository,
+        statistics_cache=statistics_cache,
+        ml_score_store=ml_score_store,
     )
 
 
@@ -469,6 +783,7 @@ async def get_record_ad_click_use_case(
         get_campaigns_repository
     ),
     clients_repository: ClientsRepositoryProtocol = Depends(get_clients_repository),
+    statistics_cache: Optional[StatisticsCacheProtocol] = Depends(get_statistics_cache),
 ) -> RecordAdClickUseCaseProtocol:
     return RecordAdClickUseCase(
         uow,
@@ -477,6 +792,7 @@ async def get_record_ad_click_use_case(
         time_repository,
         campaigns_repository,
         clients_repository,
+        statistics_cache=statistics_cache,
     )
 
 
@@ -507,6 +823,14 @@ def get_upsert_advertisers_use_case(
     return UpsertAdvertisersUseCase(uow, repository, mapper)
 
 
+def get_stream_upsert_advertisers_use_case(
+    uow: AbstractUow = Depends(get_uow),
+    repository: AdvertisersRepositoryProtocol = Depends(get_advertisers_repository),
+    mapper: AdvertisersMapper = Depends(get_advertisers_mapper),
+) -> StreamUpsertAdvertisersUseCaseProtocol:
+    return StreamUpsertAdvertisersUseCase(uow, repository, mapper)
+
+
 def get_generate_ad_use_case(
     uow: AbstractUow = Depends(get_uow),
     advertisers_repository: AdvertisersRepositoryProtocol = Depends(
@@ -533,8 +857,8 @@ def get_get_current_date_use_case(
 
 
 def get_get_clients_stats_use_case(
-    uow: AbstractUow = Depends(get_uow),
-    repository: StatisticsRepositoryProtocol = Depends(get_statistics_repository),
+    uow: AbstractUow = Depends(get_read_uow),
+    repository: StatisticsRepositoryProtocol = Depends(get_read_statistics_repository),
 ) -> GetClientsStatsUseCaseProtocol:
     return GetClientsStatsUseCase(uow, repository)
 
@@ -548,25 +872,36 @@ def get_submit_ad_feedback_use_case(
     campaigns_repository: CampaignsRepositoryProtocol = Depends(
         get_campaigns_repository
     ),
+    statistics_cache: Optional[StatisticsCacheProtocol] = Depends(get_statistics_cache),
 ) -> SubmitAdFeedbackUseCaseProtocol:
     return SubmitAdFeedbackUseCase(
         uow=uow,
         statistics_repository=statistics_repository,
         clients_repository=clients_repository,
         campaigns_repository=campaigns_repository,
+        statistics_cache=statistics_cache,
     )
 
 
 def get_get_campaign_feedback_stats_use_case(
-    uow: AbstractUow = Depends(get_uow),
-    repository: StatisticsRepositoryProtocol = Depends(get_statistics_repository),
+    uow: AbstractUow = Depends(get_read_uow),
+    repository: StatisticsRepositoryProtocol = Depends(get_read_statistics_repository),
     campaigns_repository: CampaignsRepositoryProtocol = Depends(
-        get_campaigns_repository
+        get_read_campaigns_repository
     ),
     mapper: StatisticsMapper = Depends(get_statistics_mapper),
+    cache: Optional[StatisticsCacheProtocol] = Depends(get_statistics_cache),
+    fill_repository: StatisticsRepositoryFactoryProtocol = Depends(
+        get_statistics_fill_repository
+    ),
 ) -> GetCampaignFeedbackStatsUseCaseProtocol:
     return GetCampaignFeedbackStatsUseCase(
-        uow, repository, campaigns_repository, mapper
+        uow,
+        repository,
+        campaigns_repository,
+        mapper,
+        cache=cache,
+        fill_repository=fill_repository,
     )
 
 
@@ -575,17 +910,19 @@ def get_export_service() -> ExportServiceProtocol:
 
 
 def get_export_advertiser_data_use_case(
-    uow: AbstractUow = Depends(get_uow),
+    uow: AbstractUow = Depends(get_read_uow),
     advertisers_repository: AdvertisersRepositoryProtocol = Depends(
-        get_advertisers_repository
+        get_read_advertisers_repository
     ),
     campaigns_repository: CampaignsRepositoryProtocol = Depends(
-        get_campaigns_repository
+        get_read_campaigns_repository
     ),
     statistics_repository: StatisticsRepositoryProtocol = Depends(
-        get_statistics_repository
+        get_read_statistics_repository
+    ),
+    ml_score_repository: MLScoreRepositoryProtocol = Depends(
+        get_read_ml_score_repository
     ),
-    ml_score_repository: MLScoreRepositoryProtocol = Depends(get_ml_score_repository),
     export_service: ExportServiceProtocol = Depends(get_export_service),
 ) -> ExportAdvertiserDataUseCaseProtocol:
     return ExportAdvertiserDataUseCase(
@@ -600,8 +937,9 @@ def get_export_advertiser_data_use_case(
 
 def get_yandex_direct_service(
     settings: Settings = Depends(get_settings),
+    client: HttpClient = Depends(get_http_client),
 ) -> YandexDirectServiceProtocol:
-    return YandexDirectService(settings)
+    return YandexDirectService(settings, client)
 
 
 def get_get_campaigns_from_yandex_use_case(
@@ -626,11 +964,41 @@ def get_create_campaign_from_yandex_use_case(
     )
 
 
-def get_generate_image_use_case(
-    uow: AbstractUow = Depends(get_uow),
-    ai_service: AIServiceProtocol = Depends(get_ai_service),
+def get_submit_image_job_use_case(
     campaigns_repository: CampaignsRepositoryProtocol = Depends(
         get_campaigns_repository
     ),
-) -> GenerateImageUseCaseProtocol:
-    return GenerateImageUseCase(uow, ai_service, campaigns_repository)
+    job_repository: ImageJobRepositoryProtocol = Depends(get_image_job_repository),
+) -> SubmitImageJobUseCaseProtocol:
+    return SubmitImageJobUseCase(campaigns_repository, job_repository)
+
+
+def get_image_job_use_case(
+    job_repository: ImageJobRepositoryProtocol = Depends(get_image_job_repository),
+) -> GetImageJobUseCaseProtocol:
+    return GetImageJobUseCase(job_repository)
+
+
+def verify_admin_token(
+    x_admin_token: Optional[str] = Header(None),
+    settings: Settings = Depends(get_settings),
+) -> None:
+    # Without a configured token the admin endpoints stay closed.
+    if not settings.admin_token:
+        raise HTTPException(status_code=403, detail="Токен администратора не задан")
+    if not secrets.compare_digest(x_admin_token or "", settings.admin_token):
+        raise HTTPException(status_code=403, detail="Неверный токен администратора")
+
+
+def get_copy_loader_repository(
+    session: AsyncSession = Depends(get_session),
+) -> CopyLoaderRepositoryProtocol:
+    return CopyLoaderRepository(session)
+
+
+def get_bulk_load_use_case(
+    uow: AbstractUow = Depends(get_uow),
+    repository: CopyLoaderRepositoryProtocol = Depends(get_copy_loader_repository),
+    score_store: Optional[MLScoreStoreProtocol] = Depends(get_ml_score_store),
+) -> BulkLoadUseCaseProtocol:
+    return BulkLoadUseCase(uow, repository, score_store=score_store)
@@ -0,0 +1,56 @@
+from logging import getLogger
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from src.application.loader.dtos import LoadResultSchema
+from src.common.enums import LoadFormat, LoadTarget
+from src.core.uow import AbstractUow
+from src.domain.loader.exceptions import LoaderError
+from src.domain.loader.interfaces import BulkLoadUseCaseProtocol
+
+from .dependencies import get_bulk_load_use_case, get_uow, verify_admin_token
+from .ndjson import iter_request_lines
+
+logger = getLogger(__name__)
+
+router = APIRouter()
+
+
+def log_progress(result: LoadResultSchema) -> None:
+    logger.info(
+        f"Bulk load {result.target.value}: received {result.received}, "
+        f"staged {result.staged}, invalid {result.invalid}, written {result.written}"
+    )
+
+
+@router.post(
+    "/admin/load/{target}",
+    tags=["Admin"],
+    dependencies=[Depends(verify_admin_token)],
+)
+async def bulk_load(
+    request: Request,
+    target: LoadTarget = Path(...),
+    format: Optional[LoadFormat] = Query(
+        None,
+        description="Формат тела запроса; по умолчанию определяется по Content-Type",
+    ),
+    uow: AbstractUow = Depends(get_uow),
+    usecase: BulkLoadUseCaseProtocol = Depends(get_bulk_load_use_case),
+) -> LoadResultSchema:
+    """
+    Высокоскоростная загрузка клиентов или ML скоров через COPY
+    """
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        format = LoadFormat.CSV if "csv" in content_type else LoadFormat.NDJSON
+    try:
+        async with uow:
+            return await usecase.execute(
+                target=target,
+                format=format,
+                lines=iter_request_lines(request),
+                on_progress=log_progress,
+            )
+    except LoaderError as e:
+        raise HTTPException(status_code=500, detail=str(e))
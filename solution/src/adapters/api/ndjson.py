@@ -0,0 +1,65 @@
+import json
+from typing import Any, AsyncIterable, AsyncIterator, List
+
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from starlette.types import Receive, Scope, Send
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+def is_ndjson(request: Request) -> bool:
+    content_type = request.headers.get("content-type", "")
+    return content_type.split(";")[0].strip().lower() in NDJSON_MEDIA_TYPES
+
+
+async def iter_request_lines(request: Request) -> AsyncIterator[bytes]:
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
+async def iter_ndjson_lines(request: Request) -> AsyncIterator[bytes]:
+    async for line in iter_request_lines(request):
+        if line.strip():
+            yield line
+
+
+async def _iter_items(items: List[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+async def iter_request_records(request: Request) -> AsyncIterator[Any]:
+    if is_ndjson(request):
+        return iter_ndjson_lines(request)
+
+    try:
+        body = json.loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Тело запроса не является JSON")
+    if not isinstance(body, list):
+        raise HTTPException(status_code=400, detail="Ожидается JSON массив")
+    return _iter_items(body)
+
+
+async def iter_ndjson_models(models: AsyncIterable[BaseModel]) -> AsyncIterator[bytes]:
+    async for model in models:
+        yield model.model_dump_json().encode() + b"\n"
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    media_type = NDJSON_MEDIA_TYPES[0]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # The body iterator keeps reading the request stream, so nothing else
+        # may consume `receive`; a disconnect surfaces from request.stream().
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
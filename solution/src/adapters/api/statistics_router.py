@@ -1,34 +1,42 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response
 from src.application.statistics.dtos import (
     CampaignFeedbackResponse,
     ClientStatsResponse,
     DailyStatsResponse,
+    ReachResponse,
     StatsResponse,
 )
-from src.common.depends import get_uow
+from src.common.depends import get_read_uow
+from src.common.enums import StatsGranularity
 from src.core.uow import AbstractUow
 from src.domain.advertisers.exceptions import AdvertiserNotFoundException
 from src.domain.campaigns.exceptions import CampaignNotFoundException
 from src.domain.statistics.exceptions import (
+    InvalidStatsRangeError,
     StatisticsRepositoryError,
 )
 from src.domain.statistics.interfaces import (
     GetAdvertiserCampaignsStatsUseCaseProtocol,
     GetAdvertiserDailyStatsUseCaseProtocol,
+    GetAdvertiserReachUseCaseProtocol,
     GetCampaignDailyStatsUseCaseProtocol,
     GetCampaignFeedbackStatsUseCaseProtocol,
+    GetCampaignReachUseCaseProtocol,
     GetCampaignStatsUseCaseProtocol,
     GetClientsStatsUseCaseProtocol,
 )
+from src.domain.statistics.types import DAILY_STATS_MAX_PAGE_LIMIT
 
 from .dependencies import (
     get_get_advertiser_campaigns_stats_use_case,
     get_get_advertiser_daily_stats_use_case,
+    get_get_advertiser_reach_use_case,
     get_get_campaign_daily_stats_use_case,
     get_get_campaign_feedback_stats_use_case,
+    get_get_campaign_reach_use_case,
     get_get_campaign_stats_use_case,
     get_get_clients_stats_use_case,
 )
@@ -39,7 +47,7 @@ router = APIRouter()
 @router.get("/stats/campaigns/{campaignId}", tags=["Statistics"])
 async def get_campaign_stats(
     campaign_id: UUID = Path(..., alias="campaignId"),
-    uow: AbstractUow = Depends(get_uow),
+    uow: AbstractUow = Depends(get_read_uow),
     usecase: GetCampaignStatsUseCaseProtocol = Depends(get_get_campaign_stats_use_case),
 ) -> StatsResponse:
     """
@@ -60,7 +68,7 @@ async def get_campaign_stats(
 )
 async def get_advertiser_campaigns_stats(
     advertiser_id: UUID = Path(..., alias="advertiserId"),
-    uow: AbstractUow = Depends(get_uow),
+    uow: AbstractUow = Depends(get_read_uow),
     usecase: GetAdvertiserCampaignsStatsUseCaseProtocol = Depends(
         get_get_advertiser_campaigns_stats_use_case
     ),
@@ -82,37 +90,129 @@ async def get_advertiser_campaigns_stats(
     tags=["Statistics"],
 )
 async def get_campaign_daily_stats(
+    response: Response,
     campaign_id: UUID = Path(..., alias="campaignId"),
-    uow: AbstractUow = Depends(get_uow),
+    date_from: Optional[int] = Query(None, alias="from", ge=0),
+    date_to: Optional[int] = Query(None, alias="to", ge=0),
+    granularity: StatsGranularity = Query(StatsGranularity.DAY),
+    cursor: Optional[int] = Query(None, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=DAILY_STATS_MAX_PAGE_LIMIT),
+    uow: AbstractUow = Depends(get_read_uow),
     usecase: GetCampaignDailyStatsUseCaseProtocol = Depends(
         get_get_campaign_daily_stats_use_case
     ),
 ) -> List[DailyStatsResponse]:
     """
-    Получение ежедневной статистики по рекламной кампании
+    Получение ежедневной статистики по рекламной кампании за интервал дней [from, to]
+    с группировкой по дням, неделям или за весь интервал.
+    Без limit возвращается весь интервал. С limit ответ разбивается на страницы:
+    курсор следующей страницы возвращается в заголовке X-Next-Cursor
+    и передаётся в параметре cursor
     """
     try:
         async with uow:
-            return await usecase.execute(campaign_id)
+            page = await usecase.execute(
+                campaign_id,
+                date_from=date_from,
+                date_to=date_to,
+                granularity=granularity,
+                cursor=cursor,
+                limit=limit,
+            )
     except CampaignNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except InvalidStatsRangeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except StatisticsRepositoryError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(page.next_cursor)
+    return page.items
+
 
 @router.get(
     "/stats/advertisers/{advertiserId}/campaigns/daily",
     tags=["Statistics"],
 )
 async def get_advertiser_daily_stats(
+    response: Response,
     advertiser_id: UUID = Path(..., alias="advertiserId"),
-    uow: AbstractUow = Depends(get_uow),
+    date_from: Optional[int] = Query(None, alias="from", ge=0),
+    date_to: Optional[int] = Query(None, alias="to", ge=0),
+    granularity: StatsGranularity = Query(StatsGranularity.DAY),
+    cursor: Optional[int] = Query(None, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=DAILY_STATS_MAX_PAGE_LIMIT),
+    uow: AbstractUow = Depends(get_read_uow),
     usecase: GetAdvertiserDailyStatsUseCaseProtocol = Depends(
         get_get_advertiser_daily_stats_use_case
     ),
 ) -> List[DailyStatsResponse]:
     """
-    Получение ежедневной агрегированной статистики по всем кампаниям рекламодателя
+    Получение ежедневной агрегированной статистики по всем кампаниям рекламодателя за интервал дней [from, to]
+    с группировкой по дням, неделям или за весь интервал.
+    Без limit возвращается весь интервал. С limit ответ разбивается на страницы:
+    курсор следующей страницы возвращается в заголовке X-Next-Cursor
+    и передаётся в параметре cursor
+    """
+    try:
+        async with uow:
+            page = await usecase.execute(
+                advertiser_id,
+                date_from=date_from,
+                date_to=date_to,
+                granularity=granularity,
+                cursor=cursor,
+                limit=limit,
+            )
+    except AdvertiserNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidStatsRangeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except StatisticsRepositoryError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(page.next_cursor)
+    return page.items
+
+
+@router.get(
+    "/stats/campaigns/{campaignId}/reach",
+    tags=["Statistics"],
+)
+async def get_campaign_reach(
+    campaign_id: UUID = Path(..., alias="campaignId"),
+    uow: AbstractUow = Depends(get_read_uow),
+    usecase: GetCampaignReachUseCaseProtocol = Depends(get_get_campaign_reach_use_case),
+) -> ReachResponse:
+    """
+    Получение приблизительного охвата (уникальных клиентов) рекламной кампании.
+    Оценка HyperLogLog, относительная стандартная ошибка 0.81%
+    """
+    try:
+        async with uow:
+            return await usecase.execute(campaign_id)
+    except CampaignNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except StatisticsRepositoryError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get(
+    "/stats/advertisers/{advertiserId}/reach",
+    tags=["Statistics"],
+)
+async def get_advertiser_reach(
+    advertiser_id: UUID = Path(..., alias="advertiserId"),
+    uow: AbstractUow = Depends(get_read_uow),
+    usecase: GetAdvertiserReachUseCaseProtocol = Depends(
+        get_get_advertiser_reach_use_case
+    ),
+) -> ReachResponse:
+    """
+    Получение приблизительного охвата (уникальных клиентов) по всем кампаниям рекламодателя.
+    Оценка HyperLogLog, относительная стандартная ошибка 0.81%
     """
     try:
         async with uow:
@@ -128,7 +228,7 @@ async def get_advertiser_daily_stats(
     tags=["Statistics"],
 )
 async def get_clients_stats(
-    uow: AbstractUow = Depends(get_uow),
+    uow: AbstractUow = Depends(get_read_uow),
     usecase: GetClientsStatsUseCaseProtocol = Depends(get_get_clients_stats_use_case),
 ) -> ClientStatsResponse:
     """
@@ -147,7 +247,7 @@ async def get_clients_stats(
 )
 async def get_campaign_feedback_stats(
     campaign_id: UUID = Path(..., alias="campaignId"),
-    uow: AbstractUow = Depends(get_uow),
+    uow: AbstractUow = Depends(get_read_uow),
     usecase: GetCampaignFeedbackStatsUseCaseProtocol = Depends(
         get_get_campaign_feedback_stats_use_case
     ),
@@ -1,11 +1,16 @@
 from contextlib import asynccontextmanager
 from typing import Any, Awaitable, Callable, Optional, TypeVar
+from uuid import UUID
 
 from aiogram import F
 from aiogram.types import Message, User
+from src.application.statistics.cache import invalidate_statistics_cache
 from src.core.db import async_session_maker
+from src.core.redis import get_redis
+from src.core.settings import settings
 from src.infrastructure.advertisers.mappers import AdvertisersMapper
 from src.infrastructure.advertisers.repositories import AdvertisersRepository
+from src.infrastructure.statistics.repositories import StatisticsCacheRepository
 
 T = TypeVar("T")
 
@@ -27,6 +32,21 @@ async def get_session_with_advertiser(telegram_id: int):
         yield session, mapper, repository, advertiser
 
 
+async def invalidate_campaign_statistics(
+    campaign_id: UUID, advertiser_id: UUID
+) -> None:
+    if not settings.stats_cache_enabled:
+        return
+    redis_client = await get_redis().__anext__()
+    await invalidate_statistics_cache(
+        StatisticsCacheRepository(
+            redis=redis_client, ttl_seconds=settings.stats_cache_ttl_seconds
+        ),
+        campaign_id,
+        advertiser_id,
+    )
+
+
 async def handle_db_operation(
     operation: Callable[..., Awaitable[T]],
     error_message: str,
@@ -1,3 +1,4 @@
+from typing import List
 from uuid import UUID, uuid4
 
 import redis.asyncio as redis
@@ -20,7 +21,11 @@ from src.adapters.telegram.common.states import (
     CampaignCreationStates,
     CampaignManagementStates,
 )
-from src.adapters.telegram.common.utils import check_user, get_session_with_advertiser
+from src.adapters.telegram.common.utils import (
+    check_user,
+    get_session_with_advertiser,
+    invalidate_campaign_statistics,
+)
 from src.adapters.telegram.keyboards.campaigns import (
     CAMPAIGN_MANAGEMENT_KEYBOARD,
     CONFIRM_KEYBOARD,
@@ -29,13 +34,24 @@ from src.adapters.telegram.keyboards.campaigns import (
     get_campaigns_list_keyboard,
 )
 from src.adapters.telegram.messages.campaigns import Messages
-from src.common.enums import TargetingGender
+from src.common.enums import ModerationStatus, TargetingGender
+from src.core.db import async_session_maker
+from src.core.http import http_client
 from src.core.redis import get_redis
+from src.core.settings import settings
 from src.core.uow import SQLAlchemyUow
 from src.domain.campaigns.entities import CampaignEntity
 from src.domain.time.interfaces import TimeRepositoryProtocol
+from src.infrastructure.ai.ai_service import AIService
 from src.infrastructure.campaigns.mappers import CampaignsMapper
 from src.infrastructure.campaigns.repositories import CampaignsRepository
+from src.infrastructure.moderation.matcher import forbidden_words_matcher_cache
+from src.infrastructure.moderation.queue import ModerationQueueRepository
+from src.infrastructure.moderation.repositories import (
+    ForbiddenWordsRepository,
+    ForbiddenWordsVersionRepository,
+)
+from src.infrastructure.moderation.services import ModerationService
 from src.infrastructure.time.repositories import TimeRepository
 
 router = Router(name="campaign_handlers")
@@ -47,6 +63,21 @@ def get_time_repository(
     return TimeRepository(redis=redis_client)
 
 
+async def find_forbidden_words(text: str) -> List[str]:
+    redis_client = await get_redis().__anext__()
+    async with async_session_maker() as session:
+        moderation_service = ModerationService(
+            SQLAlchemyUow(session),
+            ForbiddenWordsRepository(session),
+            AIService(settings=settings, http_client=http_client),
+            settings,
+            forbidden_words_matcher_cache,
+            ForbiddenWordsVersionRepository(redis_client),
+        )
+        result = await moderation_service.check_forbidden_words_db(text)
+    return list(dict.fromkeys(match.word for match in result.matches))
+
+
 @router.message(F.text.in_(["/campaigns", BACK_TEXT]))
 async def cmd_campaigns(message: Message, state: FSMContext) -> None:
     await state.clear()
@@ -86,6 +117,13 @@ async def process_campaign_title(message: Message, state: FSMContext) -> None:
         await message.answer(Messages.ERROR["campaign"]["invalid_title"])
         return
 
+    forbidden_words = await find_forbidden_words(message.text)
+    if forbidden_words:
+        await message.answer(
+            Messages.ERROR["forbidden_words"].format(words=", ".join(forbidden_words))
+        )
+        return
+
     await state.update_data(title=message.text.strip())
     await state.set_state(CampaignCreationStates.entering_text)
     await message.answer(Messages.PROMPTS["enter_text"])
@@ -97,6 +135,13 @@ async def process_campaign_text(message: Message, state: FSMContext) -> None:
         await message.answer(Messages.ERROR["invalid_text"])
         return
 
+    forbidden_words = await find_forbidden_words(message.text)
+    if forbidden_words:
+        await message.answer(
+            Messages.ERROR["forbidden_words"].format(words=", ".join(forbidden_words))
+        )
+        return
+
     await state.update_data(text=message.text.strip())
     await state.set_state(CampaignCreationStates.entering_impressions_limit)
     await message.answer(Messages.PROMPTS["enter_impressions_limit"])
@@ -364,6 +409,7 @@ async def list_campaigns(message: Message, state: FSMContext, page: int = 1) ->
                     status="Активна"
                     if campaign.start_date <= current_date <= campaign.end_date
                     else "Неактивна",
+                    moderation=Messages.MODERATION_STATUSES[campaign.moderation_status],
                 )
                 for campaign in campaigns
             )
@@ -453,6 +499,7 @@ async def confirm_delete_campaign(callback: CallbackQuery, state: FSMContext) ->
                     campaign_id=campaign_id,
                 )
                 await uow.commit()
+                await invalidate_campaign_statistics(campaign_id, advertiser.id)
                 await callback.message.edit_text(Messages.SUCCESS["campaign_deleted"])
         except Exception as e:
             await callback.message.edit_text(
@@ -532,6 +579,9 @@ async def confirm_campaign_creation(callback: CallbackQuery, state: FSMContext)
         time_repository = get_time_repository()
         repository = CampaignsRepository(session, mapper, time_repository)
         uow = SQLAlchemyUow(session)
+        # Title and text already passed the forbidden words check while being
+        # entered, the AI verdict is left to the moderation worker.
+        queued = settings.ai_moderation_enabled and settings.ai_moderation_async
 
         try:
             async with uow:
@@ -553,9 +603,16 @@ async def confirm_campaign_creation(callback: CallbackQuery, state: FSMContext)
                         age_from=data["age_from"],
                         age_to=data["age_to"],
                         location=data["location"],
+                        moderation_status=ModerationStatus.PENDING
+                        if queued
+                        else ModerationStatus.APPROVED,
                     )
                 )
                 await uow.commit()
+                if queued:
+                    redis_client = await get_redis().__anext__()
+                    await ModerationQueueRepository(redis_client).enqueue(campaign.id)
+                await invalidate_campaign_statistics(campaign.id, advertiser.id)
 
                 await callback.message.edit_text(
                     Messages.SUCCESS["created"].format(
@@ -568,6 +625,11 @@ async def confirm_campaign_creation(callback: CallbackQuery, state: FSMContext)
                         cost_per_impression=campaign.cost_per_impression,
                         cost_per_click=campaign.cost_per_click,
                     )
+                    + (
+                        "\n\n" + Messages.SUCCESS["moderation_pending"]
+                        if queued
+                        else ""
+                    )
                 )
         except Exception as e:
             await callback.message.edit_text(
@@ -9,7 +9,11 @@ from src.adapters.telegram.common.constants import (
     CALLBACK_EDIT_TARGETING,
 )
 from src.adapters.telegram.common.states import TargetingStates
-from src.adapters.telegram.common.utils import check_user, get_session_with_advertiser
+from src.adapters.telegram.common.utils import (
+    check_user,
+    get_session_with_advertiser,
+    invalidate_campaign_statistics,
+)
 from src.adapters.telegram.keyboards.campaigns import (
     CONFIRM_KEYBOARD,
     get_campaign_management_keyboard,
@@ -133,6 +137,7 @@ async def confirm_targeting(callback: CallbackQuery, state: FSMContext) -> None:
                     data=update_data,
                 )
                 await uow.commit()
+                await invalidate_campaign_statistics(campaign_id, advertiser.id)
 
                 keyboard = get_campaign_management_keyboard(str(campaign_id))
                 await callback.message.edit_text(
@@ -1,4 +1,6 @@
-from typing import TypedDict
+from typing import Dict, TypedDict
+
+from src.common.enums import ModerationStatus
 
 
 class CampaignErrorMessages(TypedDict):
@@ -15,6 +17,7 @@ class CampaignErrorMessages(TypedDict):
     invalid_targeting: str
     invalid_title: str
     invalid_text: str
+    forbidden_words: str
     user_not_found: str
     not_registered: str
 
@@ -26,6 +29,7 @@ class CampaignSuccessMessages(TypedDict):
     image_uploaded: str
     image_deleted: str
     targeting_updated: str
+    moderation_pending: str
 
 
 class CampaignPromptMessages(TypedDict):
@@ -76,6 +80,7 @@ class Messages:
         "invalid_targeting": "❌ Неверный формат параметров таргетинга",
         "invalid_title": "❌ Название кампании не может быть пустым",
         "invalid_text": "❌ Текст объявления не может быть пустым",
+        "forbidden_words": "❌ Текст содержит запрещённые слова: {words}",
         "user_not_found": "❌ Пользователь не найден",
         "not_registered": "❌ Вы не зарегистрированы как рекламодатель. Пожалуйста, зарегистрируйтесь",
     }
@@ -94,6 +99,9 @@ class Messages:
         "image_uploaded": "✅ Изображение успешно загружено\nURL: {image_url}",
         "image_deleted": "✅ Изображение успешно удалено",
         "targeting_updated": "✅ Настройки таргетинга успешно обновлены",
+        "moderation_pending": (
+            "⏳ Кампания отправлена на модерацию и начнёт показываться после проверки"
+        ),
     }
 
     PROMPTS: CampaignPromptMessages = {
@@ -170,7 +178,9 @@ class Messages:
             "Страница {page} из {total_pages}\n\n"
             "{campaigns}"
         ),
-        "campaign_list_item": ("🎯 Кампания: {title}\nID: {id}\nСтатус: {status}"),
+        "campaign_list_item": (
+            "🎯 Кампания: {title}\nID: {id}\nСтатус: {status}\nМодерация: {moderation}"
+        ),
         "no_campaigns": "У вас пока нет рекламных кампаний",
         "targeting_info": (
             "🎯 Таргетинг:\n"
@@ -179,3 +189,9 @@ class Messages:
             "- Локация: {location}"
         ),
     }
+
+    MODERATION_STATUSES: Dict[ModerationStatus, str] = {
+        ModerationStatus.APPROVED: "✅ Одобрена",
+        ModerationStatus.PENDING: "⏳ На проверке",
+        ModerationStatus.REJECTED: "❌ Отклонена",
+    }
@@ -1,7 +1,9 @@
+from logging import getLogger
 from typing import List, Optional
 from uuid import UUID
 
 from src.application.ads.dtos import AdsGetResponse
+from src.application.statistics.cache import invalidate_statistics_cache
 from src.core.uow import AbstractUow
 from src.domain.ads.entities import AdEntity
 from src.domain.ads.exceptions import AdsNotFoundException
@@ -10,6 +12,7 @@ from src.domain.ads.interfaces import (
 )
 from src.domain.advertisers.interfaces import (
     MLScoreRepositoryProtocol,
+    MLScoreStoreProtocol,
 )
 from src.domain.campaigns.entities import CampaignEntity
 from src.domain.campaigns.exceptions import CampaignNotFoundException
@@ -29,11 +32,15 @@ from src.domain.statistics.exceptions import (
     StatisticsRepositoryError,
 )
 from src.domain.statistics.interfaces import (
+    ReachRepositoryProtocol,
+    StatisticsCacheProtocol,
     StatisticsRepositoryProtocol,
 )
 from src.domain.time.interfaces import TimeRepositoryProtocol
 from src.infrastructure.ads.mappers import AdsMapper
 
+logger = getLogger(__name__)
+
 
 class GetAdForClientUseCase:
     def __init__(
@@ -45,6 +52,9 @@ class GetAdForClientUseCase:
         campaigns_repository: CampaignsRepositoryProtocol,
         ml_score_repository: MLScoreRepositoryProtocol,
         statistics_repository: StatisticsRepositoryProtocol,
+        reach_repository: Optional[ReachRepositoryProtocol] = None,
+        statistics_cache: Optional[StatisticsCacheProtocol] = None,
+        ml_score_store: Optional[MLScoreStoreProtocol] = None,
     ):
         self._uow = uow
         self._mapper = mapper
@@ -53,6 +63,9 @@ class GetAdForClientUseCase:
         self._campaigns_repository = campaigns_repository
         self._ml_score_repository = ml_score_repository
         self._statistics_repository = statistics_repository
+        self._reach_repository = reach_repository
+        self._statistics_cache = statistics_cache
+        self._ml_score_store = ml_score_store
 
     async def execute(self, client_id: UUID) -> AdsGetResponse:
         async with self._uow:
@@ -77,26 +90,58 @@ class GetAdForClientUseCase:
                 raise AdsNotFoundException("Не найдены подходящие объявления")
 
             async with self._uow.impression_lock:
-                await self._statistics_repository.register_impression(
+                registered = await self._statistics_repository.register_impression(
                     client_id=client.id, campaign_id=best_campaign.id
                 )
                 ad_entity: AdEntity = self._mapper.from_model_to_entity(best_campaign)
                 await self._uow.commit()
+
+            if registered is True:
+                await self._record_reach(client.id, best_campaign)
+                await invalidate_statistics_cache(
+                    self._statistics_cache,
+                    best_campaign.id,
+                    best_campaign.advertiser_id,
+                )
             return self._mapper.from_entity_to_schema(ad_entity)
 
+    async def _record_reach(self, client_id: UUID, campaign: CampaignEntity) -> None:
+        if self._reach_repository is None:
+            return
+        try:
+            current_day = await self._time_repository.get_current_date()
+            await self._reach_repository.add_impression(
+                client_id=client_id,
+                campaign_id=campaign.id,
+                advertiser_id=campaign.advertiser_id,
+                date=current_day,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record reach for campaign {campaign.id}: {e}")
+
     async def _get_best_matching_campaign(
         self, campaigns: List[CampaignEntity], client: ClientEntity
     ) -> CampaignEntity | None:
         best_campaign = None
         best_score = float("-inf")
+        stored_scores = (
+            self._ml_score_store.get_scores(
+                client.id, {campaign.advertiser_id for campaign in campaigns}
+            )
+            if self._ml_score_store is not None
+            else None
+        )
 
         for campaign in campaigns:
-            ml_score = (
-                await self._ml_score_repository.get_ml_score(
-                    client.id, campaign.advertiser_id
+            if stored_scores is not None:
+                ml_score = stored_scores.get(campaign.advertiser_id, 0)
+            else:
+                ml_score = (
+                    await self._ml_score_repository.get_ml_score(
+                        client.id, campaign.advertiser_id
+                    )
+                    or 0
                 )
-                or 0
-            )
 
             stats: StatisticsEntity = (
                 await self._statistics_repository.get_campaign_stats(
@@ -147,6 +192,7 @@ class RecordAdClickUseCase:
         time_repository: TimeRepositoryProtocol,
         campaigns_repository: CampaignsRepositoryProtocol,
         clients_repository: ClientsRepositoryProtocol,
+        statistics_cache: Optional[StatisticsCacheProtocol] = None,
     ):
         self._uow = uow
         self._mapper = mapper
@@ -154,13 +200,14 @@ class RecordAdClickUseCase:
         self._time_repository = time_repository
         self._campaigns_repository = campaigns_repository
         self._clients_repository = clients_repository
+        self._statistics_cache = statistics_cache
 
     async def execute(self, ad_id: UUID, client_id: UUID) -> None:
         try:
             async with self._uow:
                 async with self._uow.click_lock:
                     try:
-                        await self._campaigns_repository.get_by_id(ad_id)
+                        campaign = await self._campaigns_repository.get_by_id(ad_id)
                     except CampaignNotFoundException as e:
                         raise CampaignNotFoundException(str(e))
 
@@ -184,6 +231,10 @@ class RecordAdClickUseCase:
                     except StatisticsRepositoryError as e:
                         await self._uow.rollback()
                         raise StatisticsRepositoryError(str(e))
+
+            await invalidate_statistics_cache(
+                self._statistics_cache, ad_id, campaign.advertiser_id
+            )
         except (
             CampaignNotFoundException,
             ClientNotFoundException,
@@ -206,11 +257,13 @@ class SubmitAdFeedbackUseCase(SubmitAdFeedbackUseCaseProtocol):
         statistics_repository: StatisticsRepositoryProtocol,
         clients_repository: ClientsRepositoryProtocol,
         campaigns_repository: CampaignsRepositoryProtocol,
+        statistics_cache: Optional[StatisticsCacheProtocol] = None,
     ) -> None:
         self._uow = uow
         self._statistics_repository = statistics_repository
         self._clients_repository = clients_repository
         self._campaigns_repository = campaigns_repository
+        self._statistics_cache = statistics_cache
 
     async def execute(
         self, ad_id: UUID, client_id: UUID, rating: int, comment: Optional[str]
@@ -222,7 +275,7 @@ class SubmitAdFeedbackUseCase(SubmitAdFeedbackUseCaseProtocol):
                 raise ClientNotFoundException(f"Клиент с id {client_id} не найден")
 
             try:
-                await self._campaigns_repository.get_by_id(ad_id)
+                campaign = await self._campaigns_repository.get_by_id(ad_id)
             except CampaignNotFoundException:
                 raise CampaignNotFoundException(
                     f"Рекламная кампания с id {ad_id} не найдена"
@@ -235,3 +288,7 @@ class SubmitAdFeedbackUseCase(SubmitAdFeedbackUseCaseProtocol):
                 comment=comment,
             )
             await self._uow.commit()
+
+        await invalidate_statistics_cache(
+            self._statistics_cache, ad_id, campaign.advertiser_id
+        )
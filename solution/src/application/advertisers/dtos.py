@@ -1,3 +1,4 @@
+from typing import List
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -26,3 +27,19 @@ class MLScoreSchema(BaseModel):
         ...,
         description="Целочисленное значение ML скора; чем больше – тем выше релевантность.",
     )
+
+
+class MLScoreRejectSchema(BaseModel):
+    row: int = Field(
+        ..., description="Номер строки NDJSON или элемента JSON массива, начиная с 1."
+    )
+    reason: str = Field(..., description="Причина, по которой строка не загружена.")
+
+
+class MLScoreBulkResponse(BaseModel):
+    accepted: int = Field(..., description="Количество загруженных строк.")
+    rejected: int = Field(..., description="Количество отклонённых строк.")
+    rejects: List[MLScoreRejectSchema] = Field(
+        default_factory=list,
+        description="Отклонённые строки (не больше 1000 первых).",
+    )
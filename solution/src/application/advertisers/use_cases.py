@@ -1,11 +1,22 @@
-from typing import List
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from pydantic import ValidationError
 from src.application.advertisers.dtos import (
     GetAdvertiserByIdSchema,
+    MLScoreBulkResponse,
+    MLScoreRejectSchema,
     MLScoreSchema,
 )
+from src.application.ingest.chunks import (
+    add_to_total,
+    format_validation_error,
+    iter_validated_chunks,
+)
+from src.application.ingest.dtos import BulkStreamSummarySchema
+from src.common.types import BULK_UPSERT_CHUNK_SIZE
 from src.core.uow import AbstractUow
+from src.domain.advertisers.entities import MLScoreEntity
 from src.domain.advertisers.exceptions import (
     AdvertiserNotFoundException,
     AdvertiserRepositoryError,
@@ -14,7 +25,9 @@ from src.domain.advertisers.exceptions import (
 from src.domain.advertisers.interfaces import (
     AdvertisersRepositoryProtocol,
     MLScoreRepositoryProtocol,
+    MLScoreStoreProtocol,
 )
+from src.domain.advertisers.types import ML_SCORES_MAX_REPORTED_REJECTS
 from src.domain.clients.exceptions import ClientNotFoundException
 from src.infrastructure.advertisers.mappers import AdvertisersMapper, MLScoreMapper
 
@@ -84,16 +97,56 @@ class UpsertAdvertisersUseCase:
             raise AdvertiserRepositoryError(f"Unexpected error during upsert: {str(e)}")
 
 
+class StreamUpsertAdvertisersUseCase:
+    def __init__(
+        self,
+        uow: AbstractUow,
+        repository: AdvertisersRepositoryProtocol,
+        mapper: AdvertisersMapper,
+    ) -> None:
+        self._uow = uow
+        self._repository = repository
+        self._mapper = mapper
+
+    async def execute(
+        self, lines: AsyncIterable[bytes]
+    ) -> AsyncIterator[BulkStreamSummarySchema]:
+        total = BulkStreamSummarySchema(done=True)
+        try:
+            async with self._uow:
+                async for chunk in iter_validated_chunks(
+                    lines, GetAdvertiserByIdSchema, BULK_UPSERT_CHUNK_SIZE
+                ):
+                    entities = [
+                        self._mapper.from_schema_to_entity(advertiser)
+                        for advertiser in chunk.rows
+                    ]
+                    if entities:
+                        await self._repository.bulk_upsert(entities)
+                        await self._uow.commit()
+
+                    summary = chunk.summary(upserted=len(entities))
+                    add_to_total(total, summary)
+                    yield summary
+        except AdvertiserRepositoryError as e:
+            total.error = str(e)
+        except Exception as e:
+            total.error = f"Unexpected error during upsert: {str(e)}"
+        yield total
+
+
 class UpsertMLScoreUseCase:
     def __init__(
         self,
         uow: AbstractUow,
         repository: MLScoreRepositoryProtocol,
         mapper: MLScoreMapper,
+        score_store: Optional[MLScoreStoreProtocol] = None,
     ) -> None:
         self._uow = uow
         self._repository = repository
         self._mapper = mapper
+        self._score_store = score_store
 
     async def execute(self, data: MLScoreSchema) -> None:
         try:
@@ -101,6 +154,12 @@ class UpsertMLScoreUseCase:
                 ml_score_entity = self._mapper.from_schema_to_entity(data)
                 await self._repository.upsert_ml_score(ml_score_entity)
                 await self._uow.commit()
+                if self._score_store is not None:
+                    self._score_store.set_score(
+                        ml_score_entity.client_id,
+                        ml_score_entity.advertiser_id,
+                        ml_score_entity.score,
+                    )
         except AdvertiserNotFoundException as e:
             raise AdvertiserNotFoundException(str(e))
         except ClientNotFoundException as e:
@@ -111,3 +170,87 @@ class UpsertMLScoreUseCase:
             raise MLScoreRepositoryError(
                 f"Unexpected error upserting ML score: {str(e)}"
             )
+
+
+class BulkUpsertMLScoresUseCase:
+    def __init__(
+        self,
+        uow: AbstractUow,
+        repository: MLScoreRepositoryProtocol,
+        mapper: MLScoreMapper,
+        score_store: Optional[MLScoreStoreProtocol] = None,
+    ) -> None:
+        self._uow = uow
+        self._repository = repository
+        self._mapper = mapper
+        self._score_store = score_store
+
+    async def execute(self, rows: AsyncIterable[Any]) -> MLScoreBulkResponse:
+        try:
+            async with self._uow:
+                response = MLScoreBulkResponse(accepted=0, rejected=0)
+                chunk: Dict[Tuple[UUID, UUID], Tuple[MLScoreEntity, List[int]]] = {}
+                row_number = 0
+
+                async for row in rows:
+                    row_number += 1
+                    try:
+                        schema = self._parse(row)
+                    except ValidationError as e:
+                        self._reject(response, row_number, format_validation_error(e))
+                        continue
+
+                    entity = self._mapper.from_schema_to_entity(schema)
+                    key = (entity.client_id, entity.advertiser_id)
+                    row_numbers = chunk[key][1] if key in chunk else []
+                    chunk[key] = (entity, row_numbers + [row_number])
+                    if len(chunk) >= BULK_UPSERT_CHUNK_SIZE:
+                        await self._flush(chunk, response)
+                        chunk = {}
+
+                if chunk:
+                    await self._flush(chunk, response)
+                return response
+        except MLScoreRepositoryError as e:
+            raise MLScoreRepositoryError(str(e))
+        except Exception as e:
+            raise MLScoreRepositoryError(
+                f"Unexpected error during ML scores bulk upsert: {str(e)}"
+            )
+
+    async def _flush(
+        self,
+        chunk: Dict[Tuple[UUID, UUID], Tuple[MLScoreEntity, List[int]]],
+        response: MLScoreBulkResponse,
+    ) -> None:
+        rejects = await self._repository.bulk_upsert_ml_scores(
+            [entity for entity, _ in chunk.values()]
+        )
+        await self._uow.commit()
+
+        if self._score_store is not None:
+            rejected_keys = {(r.client_id, r.advertiser_id) for r in rejects}
+            for key, (entity, _) in chunk.items():
+                if key not in rejected_keys:
+                    self._score_store.set_score(*key, entity.score)
+
+        rejected_rows = 0
+        for reject in rejects:
+            for row_number in chunk[(reject.client_id, reject.advertiser_id)][1]:
+                self._reject(response, row_number, reject.reason)
+                rejected_rows += 1
+        response.accepted += (
+            sum(len(row_numbers) for _, row_numbers in chunk.values()) - rejected_rows
+        )
+
+    @staticmethod
+    def _parse(row: Any) -> MLScoreSchema:
+        if isinstance(row, (bytes, str)):
+            return MLScoreSchema.model_validate_json(row)
+        return MLScoreSchema.model_validate(row)
+
+    @staticmethod
+    def _reject(response: MLScoreBulkResponse, row_number: int, reason: str) -> None:
+        response.rejected += 1
+        if len(response.rejects) < ML_SCORES_MAX_REPORTED_REJECTS:
+            response.rejects.append(MLScoreRejectSchema(row=row_number, reason=reason))
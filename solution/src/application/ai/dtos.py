@@ -1,4 +1,5 @@
-from typing import TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
@@ -9,6 +10,18 @@ class AdvertisementGenerationResponse(BaseModel):
     )
 
 
+class ImageJobResponse(BaseModel):
+    job_id: UUID = Field(..., description="Идентификатор задачи генерации")
+    campaign_id: UUID = Field(..., description="Идентификатор рекламной кампании")
+    status: str = Field(
+        ..., description="Статус задачи: queued, running, succeeded или failed"
+    )
+    image_url: Optional[str] = Field(
+        None, description="Ссылка на сгенерированное изображение в MinIO"
+    )
+    error: Optional[str] = Field(None, description="Причина ошибки генерации")
+
+
 class GeneratedAdResponse(TypedDict):
     generated_text: str
 
@@ -21,3 +34,7 @@ class ModerationResponse(TypedDict):
     profanity: bool
     offensive: bool
     inappropriate: bool
+
+
+class ModerationBatchResponse(TypedDict):
+    results: List[Dict[str, Any]]
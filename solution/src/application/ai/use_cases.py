@@ -1,15 +1,26 @@
 import json
-from uuid import UUID
+from typing import Optional
+from uuid import UUID, uuid4
 
-from fastapi.responses import FileResponse
-from src.application.ai.dtos import AdvertisementGenerationResponse
+from src.application.ai.dtos import AdvertisementGenerationResponse, ImageJobResponse
+from src.common.enums import ImageJobStatus
 from src.core.uow import AbstractUow
 from src.domain.advertisers.interfaces import (
     AdvertisersRepositoryProtocol,
 )
-from src.domain.ai.exceptions import AIError, AIImageGenerationError, AIRequestError
-from src.domain.ai.interfaces import AIServiceProtocol
+from src.domain.ai.entities import ImageJobEntity
+from src.domain.ai.exceptions import (
+    AIError,
+    AIRequestError,
+    ImageJobNotFoundError,
+    ImageJobQueueError,
+    ImageJobQueueFullError,
+)
+from src.domain.ai.interfaces import AIServiceProtocol, ImageJobRepositoryProtocol
+from src.domain.campaigns.exceptions import CampaignNotFoundException
 from src.domain.campaigns.interfaces import CampaignsRepositoryProtocol
+from src.domain.storage.exceptions import MinioServiceError
+from src.domain.storage.interfaces import MinioServiceProtocol
 
 
 class GenerateAdUseCase:
@@ -42,13 +53,15 @@ class GenerateAdUseCase:
         return cleaned_text
 
     async def execute(
-        self, advertiser_id: UUID, ad_title: str
+        self, advertiser_id: UUID, ad_title: str, bypass_cache: bool = False
     ) -> AdvertisementGenerationResponse:
         try:
             advertiser = await self.advertisers_repository.get_by_id(advertiser_id)
 
             ai_response = await self.ai_service.generate_ad(
-                advertiser_name=advertiser.name, ad_title=ad_title
+                advertiser_name=advertiser.name,
+                ad_title=ad_title,
+                bypass_cache=bypass_cache,
             )
 
             cleaned_text = self._clean_markdown_response(ai_response["generated_text"])
@@ -59,27 +72,101 @@ class GenerateAdUseCase:
             raise AIRequestError(f"Unexpected error during ad generation: {str(e)}")
 
 
+def _image_job_response(job: ImageJobEntity) -> ImageJobResponse:
+    return ImageJobResponse(
+        job_id=job.id,
+        campaign_id=job.campaign_id,
+        status=job.status.value,
+        image_url=job.image_url,
+        error=job.error,
+    )
+
+
+class SubmitImageJobUseCase:
+    def __init__(
+        self,
+        campaigns_repository: CampaignsRepositoryProtocol,
+        job_repository: ImageJobRepositoryProtocol,
+    ):
+        self.campaigns_repository = campaigns_repository
+        self.job_repository = job_repository
+
+    async def execute(self, campaign_id: UUID) -> ImageJobResponse:
+        try:
+            await self.campaigns_repository.get_by_id(campaign_id)
+
+            job = ImageJobEntity(id=uuid4(), campaign_id=campaign_id)
+            await self.job_repository.submit(job)
+            return _image_job_response(job)
+        except CampaignNotFoundException as e:
+            raise CampaignNotFoundException(str(e))
+        except ImageJobQueueFullError as e:
+            raise ImageJobQueueFullError(str(e))
+        except ImageJobQueueError as e:
+            raise ImageJobQueueError(str(e))
+        except Exception as e:
+            raise ImageJobQueueError(f"Unexpected error: {str(e)}")
+
+
+class GetImageJobUseCase:
+    def __init__(self, job_repository: ImageJobRepositoryProtocol):
+        self.job_repository = job_repository
+
+    async def execute(
+        self, job_id: UUID, wait_seconds: float = 0.0
+    ) -> ImageJobResponse:
+        try:
+            job = await self.job_repository.wait(job_id, wait_seconds)
+        except ImageJobQueueError as e:
+            raise ImageJobQueueError(str(e))
+        except Exception as e:
+            raise ImageJobQueueError(f"Unexpected error: {str(e)}")
+
+        if job is None:
+            raise ImageJobNotFoundError(f"Job {job_id} not found")
+        return _image_job_response(job)
+
+
 class GenerateImageUseCase:
     def __init__(
         self,
         uow: AbstractUow,
         ai_service: AIServiceProtocol,
         campaigns_repository: CampaignsRepositoryProtocol,
+        minio_service: MinioServiceProtocol,
+        job_repository: ImageJobRepositoryProtocol,
     ):
         self.uow = uow
         self.ai_service = ai_service
         self.campaigns_repository = campaigns_repository
+        self.minio_service = minio_service
+        self.job_repository = job_repository
+
+    async def execute(self, job_id: UUID) -> Optional[ImageJobEntity]:
+        job = await self.job_repository.get(job_id)
+        if job is None or job.is_finished:
+            # Expired, or finished before a restart put it back on the queue.
+            return job
+
+        job.status = ImageJobStatus.RUNNING
+        await self.job_repository.update(job)
 
-    async def execute(self, campaign_id: UUID) -> FileResponse:
         try:
-            campaign = await self.campaigns_repository.get_by_id(campaign_id)
-            return await self.ai_service.generate_image(
+            async with self.uow:
+                campaign = await self.campaigns_repository.get_by_id(job.campaign_id)
+            image = await self.ai_service.generate_image(
                 ad_title=campaign.ad_title,
                 ad_text=campaign.ad_text,
             )
-        except AIError as e:
-            raise AIError(str(e))
-        except Exception as e:
-            raise AIImageGenerationError(
-                f"Unexpected error during image generation: {str(e)}"
+            job.image_url = await self.minio_service.upload_generated_image(
+                job.id, image
             )
+            job.status = ImageJobStatus.SUCCEEDED
+        except (AIError, CampaignNotFoundException, MinioServiceError) as e:
+            job.status, job.error = ImageJobStatus.FAILED, str(e)
+        except Exception as e:
+            job.status = ImageJobStatus.FAILED
+            job.error = f"Unexpected error during image generation: {str(e)}"
+
+        await self.job_repository.update(job)
+        return job
@@ -2,7 +2,7 @@ from typing import Any, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
-from src.common.enums import TargetingGender
+from src.common.enums import ModerationStatus, TargetingGender
 
 
 class TargetingSchema(BaseModel):
@@ -143,6 +143,13 @@ class CampaignResponse(BaseModel):
         None,
         description="URL изображения рекламной кампании.",
     )
+    moderation_status: ModerationStatus = Field(
+        ModerationStatus.APPROVED,
+        description="Статус модерации. Кампании на модерации и отклонённые не показываются.",
+    )
+    moderation_reason: Optional[str] = Field(
+        None, description="Причина отклонения кампании модерацией."
+    )
 
 
 class ImageUploadResponse(BaseModel):
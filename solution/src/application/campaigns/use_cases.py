@@ -1,3 +1,4 @@
+from logging import getLogger
 from typing import List, Optional
 from uuid import UUID
 
@@ -8,14 +9,19 @@ from src.application.campaigns.dtos import (
     CampaignUpdateRequest,
     ImageUploadResponse,
 )
+from src.application.statistics.cache import invalidate_statistics_cache
+from src.common.enums import ModerationStatus
 from src.core.settings import Settings
 from src.core.uow import AbstractUow
 from src.domain.advertisers.exceptions import AdvertiserNotFoundException
 from src.domain.advertisers.interfaces import AdvertisersRepositoryProtocol
 from src.domain.campaigns.exceptions import (
     CampaignForbiddenError,
+    CampaignImageInvalidError,
+    CampaignImageTooLargeError,
     CampaignImageUploadError,
     CampaignModerationError,
+    CampaignModerationUnavailableError,
     CampaignNotFoundException,
     CampaignRepositoryError,
 )
@@ -23,10 +29,51 @@ from src.domain.campaigns.interfaces import (
     CampaignsRepositoryProtocol,
     YandexDirectServiceProtocol,
 )
-from src.domain.moderation.interfaces import ModerationServiceProtocol
+from src.domain.moderation.exceptions import ModerationQueueError
+from src.domain.moderation.interfaces import (
+    ModerationQueueProtocol,
+    ModerationResult,
+    ModerationServiceProtocol,
+)
+from src.domain.statistics.interfaces import StatisticsCacheProtocol
+from src.domain.storage.exceptions import MinioFileTooLargeError, MinioInvalidFileType
 from src.domain.storage.interfaces import MinioServiceProtocol
 from src.infrastructure.campaigns.mappers import CampaignsMapper
 
+logger = getLogger(__name__)
+
+
+def _queues_ai_moderation(
+    settings: Settings, moderation_queue: Optional[ModerationQueueProtocol]
+) -> bool:
+    return (
+        moderation_queue is not None
+        and settings.ai_moderation_enabled
+        and settings.ai_moderation_async
+    )
+
+
+def _moderation_rejection_reason(
+    title_moderation_result: ModerationResult,
+    text_moderation_result: ModerationResult,
+) -> Optional[str]:
+    if title_moderation_result.contains_forbidden_words:
+        return "Название объявления содержит запрещенные слова"
+    if text_moderation_result.contains_forbidden_words:
+        return "Текст объявления содержит запрещенные слова"
+    return None
+
+
+async def _enqueue_moderation(
+    moderation_queue: ModerationQueueProtocol, campaign_id: UUID
+) -> None:
+    try:
+        await moderation_queue.enqueue(campaign_id)
+    except ModerationQueueError as e:
+        # The campaign stays pending; the worker re-enqueues pending
+        # campaigns from the database when it starts.
+        logger.warning(f"Failed to enqueue campaign {campaign_id}: {e}")
+
 
 class CreateCampaignUseCase:
     def __init__(
@@ -37,6 +84,8 @@ class CreateCampaignUseCase:
         moderation_service: ModerationServiceProtocol,
         advertisers_repository: AdvertisersRepositoryProtocol,
         settings: Settings,
+        statistics_cache: Optional[StatisticsCacheProtocol] = None,
+        moderation_queue: Optional[ModerationQueueProtocol] = None,
     ) -> None:
         self._uow = uow
         self._repository = repository
@@ -44,6 +93,8 @@ class CreateCampaignUseCase:
         self._moderation_service = moderation_service
         self._settings = settings
         self._advertisers_repository = advertisers_repository
+        self._statistics_cache = statistics_cache
+        self._moderation_queue = moderation_queue
 
     async def execute(
         self, advertiser_id: UUID, data: CampaignCreateRequest
@@ -51,37 +102,38 @@ class CreateCampaignUseCase:
         try:
             async with self._uow:
                 await self._advertisers_repository.get_by_id(advertiser_id)
-
-                title_moderation_result = (
-                    await self._moderation_service.check_forbidden_words(
-                        data.ad_title,
-                        check_database=True,
-                        check_ai=self._settings.ai_moderation_enabled,
-                    )
+                queued = _queues_ai_moderation(self._settings, self._moderation_queue)
+
+                # In async mode only the forbidden words list is checked inline,
+                # the AI verdict comes later from the moderation worker.
+                (
+                    title_moderation_result,
+                    text_moderation_result,
+                ) = await self._moderation_service.check_forbidden_words_batch(
+                    [data.ad_title, data.ad_text],
+                    check_database=True,
+                    check_ai=self._settings.ai_moderation_enabled and not queued,
                 )
 
-                if title_moderation_result.contains_forbidden_words:
-                    raise CampaignModerationError(
-                        "Название объявления содержит запрещенные слова"
-                    )
-
-                text_moderation_result = (
-                    await self._moderation_service.check_forbidden_words(
-                        data.ad_text,
-                        check_database=True,
-                        check_ai=self._settings.ai_moderation_enabled,
-                    )
+                reason = _moderation_rejection_reason(
+                    title_moderation_result, text_moderation_result
                 )
-
-                if text_moderation_result.contains_forbidden_words:
-                    raise CampaignModerationError(
-                        "Текст объявления содержит запрещенные слова"
-                    )
+                if reason:
+                    raise CampaignModerationError(reason)
 
                 campaign_entity = self._mapper.from_create_schema_to_entity(data)
                 campaign_entity.advertiser_id = advertiser_id
+                if queued:
+                    campaign_entity.moderation_status = ModerationStatus.PENDING
                 campaign_entity = await self._repository.create(campaign_entity)
                 await self._uow.commit()
+                if queued and self._moderation_queue is not None:
+                    await _enqueue_moderation(
+                        self._moderation_queue, campaign_entity.id
+                    )
+                await invalidate_statistics_cache(
+                    self._statistics_cache, campaign_entity.id, advertiser_id
+                )
                 return self._mapper.from_entity_to_schema(campaign_entity)
         except AdvertiserNotFoundException as e:
             raise AdvertiserNotFoundException(str(e))
@@ -171,6 +223,8 @@ class UpdateCampaignUseCase:
         moderation_service: ModerationServiceProtocol,
         advertisers_repository: AdvertisersRepositoryProtocol,
         settings: Settings,
+        statistics_cache: Optional[StatisticsCacheProtocol] = None,
+        moderation_queue: Optional[ModerationQueueProtocol] = None,
     ) -> None:
         self._uow = uow
         self._repository = repository
@@ -178,6 +232,8 @@ class UpdateCampaignUseCase:
         self._moderation_service = moderation_service
         self._settings = settings
         self._advertisers_repository = advertisers_repository
+        self._statistics_cache = statistics_cache
+        self._moderation_queue = moderation_queue
 
     async def execute(
         self, advertiser_id: UUID, campaign_id: UUID, data: CampaignUpdateRequest
@@ -185,38 +241,44 @@ class UpdateCampaignUseCase:
         try:
             async with self._uow:
                 await self._advertisers_repository.get_by_id(advertiser_id)
-
-                title_moderation_result = (
-                    await self._moderation_service.check_forbidden_words(
-                        data.ad_title or "",
-                        check_database=True,
-                        check_ai=self._settings.ai_moderation_enabled,
-                    )
+                queued = _queues_ai_moderation(self._settings, self._moderation_queue)
+
+                (
+                    title_moderation_result,
+                    text_moderation_result,
+                ) = await self._moderation_service.check_forbidden_words_batch(
+                    [data.ad_title or "", data.ad_text or ""],
+                    check_database=True,
+                    check_ai=self._settings.ai_moderation_enabled and not queued,
                 )
 
-                if title_moderation_result.contains_forbidden_words:
-                    raise CampaignModerationError(
-                        "Название объявления содержит запрещенные слова"
-                    )
-
-                text_moderation_result = (
-                    await self._moderation_service.check_forbidden_words(
-                        data.ad_text or "",
-                        check_database=True,
-                        check_ai=self._settings.ai_moderation_enabled,
-                    )
+                reason = _moderation_rejection_reason(
+                    title_moderation_result, text_moderation_result
                 )
-
-                if text_moderation_result.contains_forbidden_words:
-                    raise CampaignModerationError(
-                        "Текст объявления содержит запрещенные слова"
-                    )
+                if reason:
+                    raise CampaignModerationError(reason)
 
                 campaign_entity = self._mapper.from_update_schema_to_entity(data)
                 campaign_entity.id = campaign_id
                 campaign_entity.advertiser_id = advertiser_id
+                if queued:
+                    current = await self._repository.get_by_id(campaign_id)
+                    queued = (current.ad_title, current.ad_text) != (
+                        data.ad_title,
+                        data.ad_text,
+                    )
+                    if queued:
+                        campaign_entity.moderation_status = ModerationStatus.PENDING
+                    else:
+                        campaign_entity.moderation_status = current.moderation_status
+                        campaign_entity.moderation_reason = current.moderation_reason
                 campaign_entity = await self._repository.update(campaign_entity)
                 await self._uow.commit()
+                if queued and self._moderation_queue is not None:
+                    await _enqueue_moderation(self._moderation_queue, campaign_id)
+                await invalidate_statistics_cache(
+                    self._statistics_cache, campaign_id, advertiser_id
+                )
                 return self._mapper.from_entity_to_schema(campaign_entity)
         except AdvertiserNotFoundException as e:
             raise AdvertiserNotFoundException(str(e))
@@ -230,6 +292,65 @@ class UpdateCampaignUseCase:
             raise CampaignRepositoryError(f"Unexpected error: {str(e)}")
 
 
+class ModerateCampaignUseCase:
+    def __init__(
+        self,
+        uow: AbstractUow,
+        repository: CampaignsRepositoryProtocol,
+        moderation_service: ModerationServiceProtocol,
+        settings: Settings,
+    ) -> None:
+        self._uow = uow
+        self._repository = repository
+        self._moderation_service = moderation_service
+        self._settings = settings
+
+    async def execute(self, campaign_id: UUID) -> Optional[ModerationStatus]:
+        try:
+            async with self._uow:
+                campaign = await self._repository.get_by_id(campaign_id)
+            if campaign.moderation_status != ModerationStatus.PENDING:
+                return campaign.moderation_status
+
+            # No transaction is held open while waiting for the LLM.
+            (
+                title_moderation_result,
+                text_moderation_result,
+            ) = await self._moderation_service.check_forbidden_words_batch(
+                [campaign.ad_title, campaign.ad_text],
+                check_database=True,
+                check_ai=self._settings.ai_moderation_enabled,
+            )
+            reason = _moderation_rejection_reason(
+                title_moderation_result, text_moderation_result
+            )
+            if reason is None and any(
+                result.source == "ai_error"
+                for result in (title_moderation_result, text_moderation_result)
+            ):
+                # Unlike sync mode, the queue can wait for the provider: the
+                # campaign stays pending instead of being approved unchecked.
+                raise CampaignModerationUnavailableError(
+                    f"AI moderation failed for campaign {campaign_id}"
+                )
+            status = ModerationStatus.REJECTED if reason else ModerationStatus.APPROVED
+
+            async with self._uow:
+                applied = await self._repository.set_moderation_status(
+                    campaign_id, status, reason, campaign.ad_title, campaign.ad_text
+                )
+                await self._uow.commit()
+            return status if applied else None
+        except CampaignNotFoundException:
+            return None
+        except CampaignModerationUnavailableError as e:
+            raise CampaignModerationUnavailableError(str(e))
+        except CampaignRepositoryError as e:
+            raise CampaignRepositoryError(str(e))
+        except Exception as e:
+            raise CampaignRepositoryError(f"Unexpected error: {str(e)}")
+
+
 class UploadCampaignImageUseCase:
     def __init__(
         self,
@@ -258,10 +379,15 @@ class UploadCampaignImageUseCase:
                         "Объявление не принадлежит этому рекламодателю"
                     )
 
-                image_data = await image.read()
+                # The spooled upload file is streamed to storage part by part
+                # instead of being read into memory whole.
                 try:
-                    await self._minio_service.upload_image(campaign_id, image_data)
+                    await self._minio_service.upload_image(campaign_id, image.file)
                     image_url = await self._minio_service.get_image_url(campaign_id)
+                except MinioInvalidFileType as e:
+                    raise CampaignImageInvalidError(str(e))
+                except MinioFileTooLargeError as e:
+                    raise CampaignImageTooLargeError(str(e))
                 except Exception as e:
                     raise CampaignImageUploadError(f"Failed to upload image: {str(e)}")
                 finally:
@@ -280,6 +406,10 @@ class UploadCampaignImageUseCase:
             raise CampaignNotFoundException(str(e))
         except CampaignForbiddenError as e:
             raise CampaignForbiddenError(str(e))
+        except CampaignImageInvalidError as e:
+            raise CampaignImageInvalidError(str(e))
+        except CampaignImageTooLargeError as e:
+            raise CampaignImageTooLargeError(str(e))
         except CampaignImageUploadError as e:
             raise CampaignImageUploadError(str(e))
         except CampaignRepositoryError as e:
@@ -334,11 +464,13 @@ class DeleteCampaignUseCase:
         repository: CampaignsRepositoryProtocol,
         minio_service: MinioServiceProtocol,
         advertisers_repository: AdvertisersRepositoryProtocol,
+        statistics_cache: Optional[StatisticsCacheProtocol] = None,
     ) -> None:
         self._uow = uow
         self._repository = repository
         self._minio_service = minio_service
         self._advertisers_repository = advertisers_repository
+        self._statistics_cache = statistics_cache
 
     async def execute(self, advertiser_id: UUID, campaign_id: UUID) -> None:
         try:
@@ -358,6 +490,9 @@ class DeleteCampaignUseCase:
                     advertiser_id=advertiser_id, campaign_id=campaign_id
                 )
                 await self._uow.commit()
+                await invalidate_statistics_cache(
+                    self._statistics_cache, campaign_id, advertiser_id
+                )
         except AdvertiserNotFoundException as e:
             raise AdvertiserNotFoundException(str(e))
         except CampaignNotFoundException as e:
@@ -1,10 +1,12 @@
-from typing import List
+from typing import AsyncIterable, AsyncIterator, List
 
 from src.application.clients.dtos import (
     ClientSchema,
     ClientUpsertSchema,
 )
-from src.common.types import ClientId
+from src.application.ingest.chunks import add_to_total, iter_validated_chunks
+from src.application.ingest.dtos import BulkStreamSummarySchema
+from src.common.types import BULK_UPSERT_CHUNK_SIZE, ClientId
 from src.core.uow import AbstractUow
 from src.domain.clients.exceptions import ClientNotFoundException, ClientRepositoryError
 from src.domain.clients.interfaces import (
@@ -65,3 +67,41 @@ class UpsertClientUseCase:
             raise ClientRepositoryError(str(e))
         except Exception as e:
             raise ClientRepositoryError(f"Unexpected error during upsert: {str(e)}")
+
+
+class StreamUpsertClientsUseCase:
+    def __init__(
+        self,
+        uow: AbstractUow,
+        repository: ClientsRepositoryProtocol,
+        mapper: ClientsMapper,
+    ) -> None:
+        self._uow = uow
+        self._repository = repository
+        self._mapper = mapper
+
+    async def execute(
+        self, lines: AsyncIterable[bytes]
+    ) -> AsyncIterator[BulkStreamSummarySchema]:
+        total = BulkStreamSummarySchema(done=True)
+        try:
+            async with self._uow:
+                async for chunk in iter_validated_chunks(
+                    lines, ClientUpsertSchema, BULK_UPSERT_CHUNK_SIZE
+                ):
+                    entities = [
+                        self._mapper.from_schema_to_entity(client)
+                        for client in chunk.rows
+                    ]
+                    if entities:
+                        await self._repository.bulk_upsert(entities)
+                        await self._uow.commit()
+
+                    summary = chunk.summary(upserted=len(entities))
+                    add_to_total(total, summary)
+                    yield summary
+        except ClientRepositoryError as e:
+            total.error = str(e)
+        except Exception as e:
+            total.error = f"Unexpected error during upsert: {str(e)}"
+        yield total
@@ -0,0 +1,63 @@
+from dataclasses import dataclass, field
+from typing import AsyncIterable, AsyncIterator, Generic, List, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+from src.application.ingest.dtos import BulkRowErrorSchema, BulkStreamSummarySchema
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+@dataclass
+class ValidatedChunk(Generic[SchemaT]):
+    number: int
+    rows: List[SchemaT] = field(default_factory=list)
+    errors: List[BulkRowErrorSchema] = field(default_factory=list)
+
+    def summary(self, upserted: int) -> BulkStreamSummarySchema:
+        return BulkStreamSummarySchema(
+            chunk=self.number,
+            rows=len(self.rows) + len(self.errors),
+            upserted=upserted,
+            rejected=len(self.errors),
+            errors=self.errors,
+        )
+
+
+async def iter_validated_chunks(
+    lines: AsyncIterable[bytes], schema: Type[SchemaT], chunk_size: int
+) -> AsyncIterator[ValidatedChunk[SchemaT]]:
+    chunk: ValidatedChunk[SchemaT] = ValidatedChunk(number=1)
+    row_number = 0
+
+    async for line in lines:
+        row_number += 1
+        if not line.strip():
+            continue
+        try:
+            chunk.rows.append(schema.model_validate_json(line))
+        except ValidationError as e:
+            chunk.errors.append(
+                BulkRowErrorSchema(row=row_number, reason=format_validation_error(e))
+            )
+
+        if len(chunk.rows) + len(chunk.errors) >= chunk_size:
+            yield chunk
+            chunk = ValidatedChunk(number=chunk.number + 1)
+
+    if chunk.rows or chunk.errors:
+        yield chunk
+
+
+def format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}"
+        for item in error.errors()
+    )
+
+
+def add_to_total(
+    total: BulkStreamSummarySchema, summary: BulkStreamSummarySchema
+) -> None:
+    total.rows += summary.rows
+    total.upserted += summary.upserted
+    total.rejected += summary.rejected
@@ -0,0 +1,24 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BulkRowErrorSchema(BaseModel):
+    row: int = Field(..., description="Номер строки NDJSON, начиная с 1.")
+    reason: str = Field(..., description="Причина, по которой строка отклонена.")
+
+
+class BulkStreamSummarySchema(BaseModel):
+    chunk: Optional[int] = Field(
+        None, description="Номер обработанной пачки; пусто в итоговой строке."
+    )
+    done: bool = Field(False, description="Признак итоговой строки.")
+    rows: int = Field(0, description="Количество прочитанных строк.")
+    upserted: int = Field(0, description="Количество записанных строк.")
+    rejected: int = Field(0, description="Количество строк, не прошедших валидацию.")
+    errors: List[BulkRowErrorSchema] = Field(
+        default_factory=list, description="Ошибки валидации строк пачки."
+    )
+    error: Optional[str] = Field(
+        None, description="Ошибка, прервавшая загрузку (только в итоговой строке)."
+    )
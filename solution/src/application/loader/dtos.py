@@ -0,0 +1,26 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+from src.common.enums import LoadTarget
+
+
+class LoadErrorSchema(BaseModel):
+    line: int = Field(..., description="Номер строки входного файла, начиная с 1.")
+    reason: str = Field(..., description="Причина, по которой строка пропущена.")
+
+
+class LoadResultSchema(BaseModel):
+    target: LoadTarget = Field(
+        ..., description="Таблица, в которую загружаются данные."
+    )
+    received: int = Field(0, description="Количество прочитанных строк данных.")
+    staged: int = Field(0, description="Количество строк, скопированных в staging.")
+    invalid: int = Field(0, description="Количество строк, не прошедших разбор.")
+    rejected: int = Field(
+        0, description="Количество строк со ссылками на несуществующие записи."
+    )
+    written: int = Field(0, description="Количество вставленных или изменённых строк.")
+    errors: List[LoadErrorSchema] = Field(
+        default_factory=list,
+        description="Ошибки разбора (не больше 100 первых).",
+    )
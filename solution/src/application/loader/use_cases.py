@@ -0,0 +1,141 @@
+import csv
+import json
+from logging import getLogger
+from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from src.application.loader.dtos import LoadErrorSchema, LoadResultSchema
+from src.common.enums import Gender, LoadFormat, LoadTarget
+from src.core.uow import AbstractUow
+from src.domain.advertisers.interfaces import MLScoreStoreProtocol
+from src.domain.loader.exceptions import LoaderError
+from src.domain.loader.interfaces import CopyLoaderRepositoryProtocol
+from src.domain.loader.types import LOADER_BATCH_SIZE, LOADER_MAX_REPORTED_ERRORS
+
+logger = getLogger(__name__)
+
+
+def _client_row(record: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (
+        UUID(str(record["client_id"])),
+        str(record["login"]),
+        int(record["age"]),
+        str(record["location"]),
+        Gender(record["gender"]).value,
+    )
+
+
+def _ml_score_row(record: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (
+        UUID(str(record["client_id"])),
+        UUID(str(record["advertiser_id"])),
+        int(record["score"]),
+    )
+
+
+ROW_PARSERS: Dict[LoadTarget, Callable[[Dict[str, Any]], Tuple[Any, ...]]] = {
+    LoadTarget.CLIENTS: _client_row,
+    LoadTarget.ML_SCORES: _ml_score_row,
+    LoadTarget.ML_SCORES_SNAPSHOT: _ml_score_row,
+}
+
+
+class BulkLoadUseCase:
+    def __init__(
+        self,
+        uow: AbstractUow,
+        repository: CopyLoaderRepositoryProtocol,
+        score_store: Optional[MLScoreStoreProtocol] = None,
+    ) -> None:
+        self._uow = uow
+        self._repository = repository
+        self._score_store = score_store
+
+    async def execute(
+        self,
+        target: LoadTarget,
+        format: LoadFormat,
+        lines: AsyncIterable[bytes],
+        on_progress: Optional[Callable[[LoadResultSchema], None]] = None,
+    ) -> LoadResultSchema:
+        try:
+            async with self._uow:
+                result = LoadResultSchema(target=target)
+                parse_row = ROW_PARSERS[target]
+                header: Optional[List[str]] = None
+                batch: List[Tuple[Any, ...]] = []
+                line_number = 0
+
+                await self._repository.create_staging(target)
+
+                async for line in lines:
+                    line_number += 1
+                    if not line.strip():
+                        continue
+                    if format == LoadFormat.CSV and header is None:
+                        header = self._csv_values(line)
+                        continue
+
+                    result.received += 1
+                    try:
+                        batch.append(parse_row(self._decode(format, header, line)))
+                    except (KeyError, TypeError, ValueError) as e:
+                        self._add_error(result, line_number, f"{type(e).__name__}: {e}")
+                        continue
+
+                    if len(batch) >= LOADER_BATCH_SIZE:
+                        result.staged += await self._repository.copy_records(
+                            target, batch
+                        )
+                        batch = []
+                        if on_progress:
+                            on_progress(result)
+
+                if batch:
+                    result.staged += await self._repository.copy_records(target, batch)
+
+                merged = await self._repository.merge(target)
+                await self._uow.commit()
+                if target != LoadTarget.CLIENTS:
+                    await self._reload_score_store()
+
+                result.written = merged.written
+                result.rejected = merged.rejected
+                if on_progress:
+                    on_progress(result)
+                return result
+        except LoaderError as e:
+            raise LoaderError(str(e))
+        except Exception as e:
+            raise LoaderError(f"Unexpected error during bulk load: {str(e)}")
+
+    async def _reload_score_store(self) -> None:
+        if self._score_store is None:
+            return
+        # The load is already committed; a failed reload only delays
+        # visibility until the periodic refresh.
+        try:
+            await self._score_store.reload()
+        except Exception as e:
+            logger.warning(f"Failed to reload ML score store after bulk load: {e}")
+
+    @staticmethod
+    def _csv_values(line: bytes) -> List[str]:
+        return next(csv.reader([line.decode("utf-8-sig").rstrip("\r\n")]))
+
+    def _decode(
+        self, format: LoadFormat, header: Optional[List[str]], line: bytes
+    ) -> Dict[str, Any]:
+        if format == LoadFormat.NDJSON:
+            return json.loads(line)
+
+        values = self._csv_values(line)
+        if header is None or len(values) != len(header):
+            raise ValueError(f"expected {len(header or [])} columns, got {len(values)}")
+        return dict(zip(header, values))
+
+    @staticmethod
+    def _add_error(result: LoadResultSchema, line_number: int, reason: str) -> None:
+        result.invalid += 1
+        if len(result.errors) < LOADER_MAX_REPORTED_ERRORS:
+            result.errors.append(LoadErrorSchema(line=line_number, reason=reason))
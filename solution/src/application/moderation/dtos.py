@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel
 
@@ -13,8 +13,15 @@ class AIModerationResponse(BaseModel):
     inappropriate: bool
 
 
+class ForbiddenWordMatch(BaseModel):
+    word: str
+    start: int
+    end: int
+
+
 class ModerationResponse(BaseModel):
     contains_forbidden_words: bool
     source: str
     details: Optional[Union[Dict[str, bool], AIModerationResponse]] = None
+    matches: List[ForbiddenWordMatch] = []
 
@@ -1,13 +1,19 @@
-from typing import List
+from logging import getLogger
+from typing import List, Optional
 
 from src.application.moderation.dtos import ModerationResponse
 from src.core.uow import AbstractUow
+from src.domain.moderation.exceptions import ForbiddenWordsVersionError
 from src.domain.moderation.interfaces import (
+    ForbiddenWordsMatcherCacheProtocol,
     ForbiddenWordsRepositoryProtocol,
+    ForbiddenWordsVersionRepositoryProtocol,
     ModerationServiceProtocol,
 )
 from src.infrastructure.moderation.mappers import ModerationMapper
 
+logger = getLogger(__name__)
+
 
 class GetForbiddenWordsUseCase:
     def __init__(self, uow: AbstractUow, repository: ForbiddenWordsRepositoryProtocol):
@@ -25,14 +31,25 @@ class UpdateForbiddenWordsUseCase:
         self,
         uow: AbstractUow,
         repository: ForbiddenWordsRepositoryProtocol,
+        matcher_cache: Optional[ForbiddenWordsMatcherCacheProtocol] = None,
+        version_repository: Optional[ForbiddenWordsVersionRepositoryProtocol] = None,
     ):
         self.uow = uow
         self.repository = repository
+        self.matcher_cache = matcher_cache
+        self.version_repository = version_repository
 
     async def execute(self, data: List[str]) -> None:
         async with self.uow:
-            await self.repository.update(data)
+            version = await self.repository.update(data)
             await self.uow.commit()
+        if self.matcher_cache is not None:
+            self.matcher_cache.store(version, data)
+        if self.version_repository is not None:
+            try:
+                await self.version_repository.publish(version)
+            except ForbiddenWordsVersionError as e:
+                logger.warning(f"Failed to publish forbidden words version: {e}")
 
 
 class CheckForbiddenWordsUseCase:
@@ -0,0 +1,86 @@
+from logging import getLogger
+from typing import AsyncContextManager, Awaitable, Callable, Optional, Type, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+from src.core.singleflight import SingleFlight
+from src.domain.statistics.exceptions import StatisticsRepositoryError
+from src.domain.statistics.interfaces import StatisticsCacheProtocol
+
+logger = getLogger(__name__)
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+RepositoryT = TypeVar("RepositoryT")
+
+cache_fill_flight = SingleFlight("statistics_cache_fill")
+
+
+async def cached_response(
+    cache: Optional[StatisticsCacheProtocol],
+    response_type: Type[ResponseT],
+    loader: Callable[[RepositoryT], Awaitable[ResponseT]],
+    repository: RepositoryT,
+    fill_repository: Optional[Callable[[], AsyncContextManager[RepositoryT]]],
+    endpoint: str,
+    scope: str,
+    entity_id: UUID,
+    *params: object,
+) -> ResponseT:
+    if cache is None:
+        return await loader(repository)
+
+    try:
+        key = await cache.build_key(endpoint, scope, entity_id, *params)
+        cached = await cache.get(key)
+    except StatisticsRepositoryError as e:
+        logger.warning(f"Statistics cache lookup failed: {e}")
+        return await loader(repository)
+
+    if cached is not None:
+        return response_type.model_validate_json(cached)
+
+    # The request repository may read from a lagging replica, so only the
+    # fill repository, which reads from the primary, may populate the cache.
+    if fill_repository is None:
+        return await loader(repository)
+
+    # The coalesced fill is shared by every waiter on the key, so it reads
+    # through its own session rather than the first caller's.
+    return await cache_fill_flight.do(
+        key, lambda: _fill(cache, key, loader, fill_repository)
+    )
+
+
+async def _fill(
+    cache: StatisticsCacheProtocol,
+    key: str,
+    loader: Callable[[RepositoryT], Awaitable[ResponseT]],
+    fill_repository: Callable[[], AsyncContextManager[RepositoryT]],
+) -> ResponseT:
+    async with fill_repository() as repository:
+        return await _load_and_store(cache, key, loader, repository)
+
+
+async def _load_and_store(
+    cache: StatisticsCacheProtocol,
+    key: str,
+    loader: Callable[[RepositoryT], Awaitable[ResponseT]],
+    repository: RepositoryT,
+) -> ResponseT:
+    response = await loader(repository)
+    try:
+        await cache.set(key, response.model_dump_json())
+    except StatisticsRepositoryError as e:
+        logger.warning(f"Statistics cache store failed: {e}")
+    return response
+
+
+async def invalidate_statistics_cache(
+    cache: Optional[StatisticsCacheProtocol], campaign_id: UUID, advertiser_id: UUID
+) -> None:
+    if cache is None:
+        return
+    try:
+        await cache.bump_version(campaign_id, advertiser_id)
+    except StatisticsRepositoryError as e:
+        logger.warning(f"Statistics cache invalidation failed for {campaign_id}: {e}")
@@ -27,6 +27,11 @@ class StatsResponse(BaseModel):
     spent_total: float = Field(
         ..., description="Общая сумма денег, потраченная на кампанию (показы и клики)."
     )
+    unique_clients: Optional[int] = Field(
+        None,
+        description="Приблизительный охват (уникальные клиенты), оценка HyperLogLog "
+        "с относительной стандартной ошибкой 0.81%. Отсутствует, если охват недоступен.",
+    )
 
 
 class DailyStatsResponse(BaseModel):
@@ -52,6 +57,21 @@ class DailyStatsResponse(BaseModel):
         ..., description="Общая сумма денег, потраченная на кампанию (показы и клики)."
     )
     date: int = Field(..., description="День, за который была собрана статистика.")
+    unique_clients: Optional[int] = Field(
+        None,
+        description="Приблизительный охват за день (HyperLogLog, ошибка 0.81%). "
+        "Заполняется только при granularity=day.",
+    )
+
+
+class DailyStatsPage(BaseModel):
+    items: list[DailyStatsResponse] = Field(
+        ..., description="Статистика по интервалам текущей страницы."
+    )
+    next_cursor: Optional[int] = Field(
+        None,
+        description="Курсор следующей страницы (день начала следующего интервала).",
+    )
 
 
 class ClientStatsResponse(BaseModel):
@@ -79,3 +99,15 @@ class CampaignFeedbackResponse(BaseModel):
     average_rating: float = Field(..., description="Средний рейтинг кампании")
     total_ratings: int = Field(..., description="Общее количество оценок")
     feedbacks: list[CampaignFeedbackItem] = Field(..., description="Список отзывов")
+
+
+class ReachResponse(BaseModel):
+    unique_clients: int = Field(
+        ...,
+        description="Приблизительное количество уникальных клиентов, увидевших рекламу.",
+    )
+    relative_standard_error: float = Field(
+        ...,
+        description="Относительная стандартная ошибка оценки HyperLogLog (0.0081 = 0.81%). "
+        "С вероятностью ~95% истинное значение лежит в пределах ±2 стандартных ошибок.",
+    )
@@ -1,23 +1,44 @@
-from typing import List
+from contextlib import nullcontext
+from logging import getLogger
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from src.application.statistics.cache import cached_response
 from src.application.statistics.dtos import (
     CampaignFeedbackResponse,
     ClientStatsResponse,
-    DailyStatsResponse,
+    DailyStatsPage,
+    ReachResponse,
     StatsResponse,
 )
+from src.common.enums import StatsGranularity
 from src.core.uow import AbstractUow
 from src.domain.advertisers.exceptions import AdvertiserNotFoundException
 from src.domain.advertisers.interfaces import AdvertisersRepositoryProtocol
+from src.domain.campaigns.entities import CampaignEntity
 from src.domain.campaigns.exceptions import CampaignNotFoundException
 from src.domain.campaigns.interfaces import CampaignsRepositoryProtocol
-from src.domain.statistics.exceptions import StatisticsRepositoryError
+from src.domain.statistics.entities import ReachEntity, StatisticsEntity
+from src.domain.statistics.exceptions import (
+    InvalidStatsRangeError,
+    StatisticsRepositoryError,
+)
 from src.domain.statistics.interfaces import (
+    ReachRepositoryProtocol,
+    StatisticsCacheProtocol,
+    StatisticsRepositoryFactoryProtocol,
     StatisticsRepositoryProtocol,
 )
+from src.domain.statistics.types import (
+    STATS_CACHE_SCOPE_ADVERTISER,
+    STATS_CACHE_SCOPE_CAMPAIGN,
+    WEEK_LENGTH_DAYS,
+)
+from src.domain.time.interfaces import TimeRepositoryProtocol
 from src.infrastructure.statistics.mappers import StatisticsMapper
 
+logger = getLogger(__name__)
+
 
 class GetCampaignStatsUseCase:
     def __init__(
@@ -26,19 +47,33 @@ class GetCampaignStatsUseCase:
         repository: StatisticsRepositoryProtocol,
         campaigns_repository: CampaignsRepositoryProtocol,
         mapper: StatisticsMapper,
+        cache: Optional[StatisticsCacheProtocol] = None,
+        reach_repository: Optional[ReachRepositoryProtocol] = None,
+        fill_repository: Optional[StatisticsRepositoryFactoryProtocol] = None,
     ) -> None:
         self._uow = uow
         self._repository = repository
         self._campaigns_repository = campaigns_repository
         self._mapper = mapper
+        self._cache = cache
+        self._reach_repository = reach_repository
+        self._fill_repository = fill_repository
 
     async def execute(self, campaign_id: UUID) -> StatsResponse:
         try:
             async with self._uow:
                 await self._campaigns_repository.get_by_id(campaign_id)
 
-                statistics = await self._repository.get_campaign_stats(campaign_id)
-                return self._mapper.from_entity_to_statistics_schema(statistics)
+                return await cached_response(
+                    self._cache,
+                    StatsResponse,
+                    lambda repository: self._load(repository, campaign_id),
+                    self._repository,
+                    self._fill_repository,
+                    "campaign",
+                    STATS_CACHE_SCOPE_CAMPAIGN,
+                    campaign_id,
+                )
         except CampaignNotFoundException as e:
             raise CampaignNotFoundException(str(e))
         except StatisticsRepositoryError as e:
@@ -46,6 +81,18 @@ class GetCampaignStatsUseCase:
         except Exception as e:
             raise StatisticsRepositoryError(f"Unexpected error: {str(e)}")
 
+    async def _load(
+        self, repository: StatisticsRepositoryProtocol, campaign_id: UUID
+    ) -> StatsResponse:
+        statistics = await repository.get_campaign_stats(campaign_id)
+        reach: Optional[ReachEntity] = None
+        if self._reach_repository is not None:
+            try:
+                reach = await self._reach_repository.get_campaign_reach(campaign_id)
+            except StatisticsRepositoryError as e:
+                logger.warning(f"Reach unavailable for campaign {campaign_id}: {e}")
+        return self._mapper.from_entity_to_statistics_schema(statistics, reach)
+
 
 class GetAdvertiserCampaignsStatsUseCase:
     def __init__(
@@ -54,19 +101,33 @@ class GetAdvertiserCampaignsStatsUseCase:
         repository: StatisticsRepositoryProtocol,
         advertisers_repository: AdvertisersRepositoryProtocol,
         mapper: StatisticsMapper,
+        cache: Optional[StatisticsCacheProtocol] = None,
+        reach_repository: Optional[ReachRepositoryProtocol] = None,
+        fill_repository: Optional[StatisticsRepositoryFactoryProtocol] = None,
     ) -> None:
         self._uow = uow
         self._repository = repository
         self._advertisers_repository = advertisers_repository
         self._mapper = mapper
+        self._cache = cache
+        self._reach_repository = reach_repository
+        self._fill_repository = fill_repository
 
     async def execute(self, advertiser_id: UUID) -> StatsResponse:
         try:
             async with self._uow:
                 await self._advertisers_repository.get_by_id(advertiser_id)
 
-                statistics = await self._repository.get_advertiser_stats(advertiser_id)
-                return self._mapper.from_entity_to_statistics_schema(statistics)
+                return await cached_response(
+                    self._cache,
+                    StatsResponse,
+                    lambda repository: self._load(repository, advertiser_id),
+                    self._repository,
+                    self._fill_repository,
+                    "advertiser",
+                    STATS_CACHE_SCOPE_ADVERTISER,
+                    advertiser_id,
+                )
         except AdvertiserNotFoundException as e:
             raise AdvertiserNotFoundException(str(e))
         except StatisticsRepositoryError as e:
@@ -74,6 +135,68 @@ class GetAdvertiserCampaignsStatsUseCase:
         except Exception as e:
             raise StatisticsRepositoryError(f"Unexpected error: {str(e)}")
 
+    async def _load(
+        self, repository: StatisticsRepositoryProtocol, advertiser_id: UUID
+    ) -> StatsResponse:
+        statistics = await repository.get_advertiser_stats(advertiser_id)
+        reach: Optional[ReachEntity] = None
+        if self._reach_repository is not None:
+            try:
+                reach = await self._reach_repository.get_advertiser_reach(advertiser_id)
+            except StatisticsRepositoryError as e:
+                logger.warning(f"Reach unavailable for advertiser {advertiser_id}: {e}")
+        return self._mapper.from_entity_to_statistics_schema(statistics, reach)
+
+
+def _page_buckets(
+    date_from: int,
+    date_to: int,
+    granularity: StatsGranularity,
+    cursor: Optional[int],
+    limit: Optional[int],
+) -> Optional[Tuple[int, int, int, Optional[int]]]:
+    if date_to < date_from:
+        raise InvalidStatsRangeError("Параметр from не может быть больше параметра to")
+
+    if granularity == StatsGranularity.DAY:
+        bucket_size = 1
+    elif granularity == StatsGranularity.WEEK:
+        bucket_size = WEEK_LENGTH_DAYS
+    else:
+        bucket_size = date_to - date_from + 1
+
+    buckets = range(date_from, date_to + 1, bucket_size)
+    first_index = 0
+    if cursor is not None and cursor > date_from:
+        first_index = -(-(cursor - date_from) // bucket_size)
+
+    # Without a limit the whole range is returned, as before paging existed.
+    next_index = len(buckets) if limit is None else first_index + limit
+    page = buckets[first_index:next_index]
+    if not page:
+        return None
+
+    next_cursor = buckets[next_index] if next_index < len(buckets) else None
+    page_to = min(page[-1] + bucket_size - 1, date_to)
+    return page[0], page_to, bucket_size, next_cursor
+
+
+async def _daily_reach(
+    load: Optional[Callable[[UUID, List[int]], Awaitable[Dict[int, int]]]],
+    entity_id: UUID,
+    granularity: StatsGranularity,
+    statistics: List[StatisticsEntity],
+) -> Dict[int, int]:
+    # Daily sketches are only counted for the rows on the page; coarser
+    # buckets would need a merge over every day they cover.
+    if load is None or granularity != StatsGranularity.DAY:
+        return {}
+    try:
+        return await load(entity_id, [statistic.date for statistic in statistics])
+    except StatisticsRepositoryError as e:
+        logger.warning(f"Daily reach unavailable for {entity_id}: {e}")
+        return {}
+
 
 class GetCampaignDailyStatsUseCase:
     def __init__(
@@ -81,32 +204,108 @@ class GetCampaignDailyStatsUseCase:
         uow: AbstractUow,
         repository: StatisticsRepositoryProtocol,
         campaigns_repository: CampaignsRepositoryProtocol,
+        time_repository: TimeRepositoryProtocol,
         mapper: StatisticsMapper,
+        cache: Optional[StatisticsCacheProtocol] = None,
+        reach_repository: Optional[ReachRepositoryProtocol] = None,
+        fill_repository: Optional[StatisticsRepositoryFactoryProtocol] = None,
     ) -> None:
         self._uow = uow
         self._repository = repository
         self._campaigns_repository = campaigns_repository
+        self._time_repository = time_repository
         self._mapper = mapper
+        self._cache = cache
+        self._reach_repository = reach_repository
+        self._fill_repository = fill_repository
 
-    async def execute(self, campaign_id: UUID) -> List[DailyStatsResponse]:
+    async def execute(
+        self,
+        campaign_id: UUID,
+        date_from: Optional[int] = None,
+        date_to: Optional[int] = None,
+        granularity: StatsGranularity = StatsGranularity.DAY,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> DailyStatsPage:
         try:
             async with self._uow:
-                await self._campaigns_repository.get_by_id(campaign_id)
+                campaign = await self._campaigns_repository.get_by_id(campaign_id)
 
-                statistics = await self._repository.get_campaign_daily_stats(
-                    campaign_id
+                return await cached_response(
+                    self._cache,
+                    DailyStatsPage,
+                    lambda repository: self._load(
+                        repository,
+                        campaign,
+                        date_from,
+                        date_to,
+                        granularity,
+                        cursor,
+                        limit,
+                    ),
+                    self._repository,
+                    self._fill_repository,
+                    "campaign_daily",
+                    STATS_CACHE_SCOPE_CAMPAIGN,
+                    campaign_id,
+                    date_from,
+                    date_to,
+                    granularity.value,
+                    cursor,
+                    limit,
                 )
-                return [
-                    self._mapper.from_entity_to_schema_daily_stats(statistic)
-                    for statistic in statistics
-                ]
         except CampaignNotFoundException as e:
             raise CampaignNotFoundException(str(e))
+        except InvalidStatsRangeError as e:
+            raise InvalidStatsRangeError(str(e))
         except StatisticsRepositoryError as e:
             raise StatisticsRepositoryError(str(e))
         except Exception as e:
             raise StatisticsRepositoryError(f"Unexpected error: {str(e)}")
 
+    async def _load(
+        self,
+        repository: StatisticsRepositoryProtocol,
+        campaign: CampaignEntity,
+        date_from: Optional[int],
+        date_to: Optional[int],
+        granularity: StatsGranularity,
+        cursor: Optional[int],
+        limit: Optional[int],
+    ) -> DailyStatsPage:
+        if date_from is None:
+            date_from = campaign.start_date
+        if date_to is None:
+            current_day = await self._time_repository.get_current_date()
+            date_to = max(date_from, min(current_day, campaign.end_date))
+
+        page = _page_buckets(date_from, date_to, granularity, cursor, limit)
+        if page is None:
+            return DailyStatsPage(items=[], next_cursor=None)
+
+        page_from, page_to, bucket_size, next_cursor = page
+        statistics = await repository.get_campaign_daily_stats(
+            campaign.id, page_from, page_to, bucket_size
+        )
+        daily_reach = await _daily_reach(
+            self._reach_repository.get_campaign_daily_reach
+            if self._reach_repository
+            else None,
+            campaign.id,
+            granularity,
+            statistics,
+        )
+        return DailyStatsPage(
+            items=[
+                self._mapper.from_entity_to_schema_daily_stats(
+                    statistic, daily_reach.get(statistic.date)
+                )
+                for statistic in statistics
+            ],
+            next_cursor=next_cursor,
+        )
+
 
 class GetAdvertiserDailyStatsUseCase:
     def __init__(
@@ -114,32 +313,113 @@ class GetAdvertiserDailyStatsUseCase:
         uow: AbstractUow,
         repository: StatisticsRepositoryProtocol,
         advertisers_repository: AdvertisersRepositoryProtocol,
+        time_repository: TimeRepositoryProtocol,
         mapper: StatisticsMapper,
+        cache: Optional[StatisticsCacheProtocol] = None,
+        reach_repository: Optional[ReachRepositoryProtocol] = None,
+        fill_repository: Optional[StatisticsRepositoryFactoryProtocol] = None,
     ) -> None:
         self._uow = uow
         self._repository = repository
         self._advertisers_repository = advertisers_repository
+        self._time_repository = time_repository
         self._mapper = mapper
+        self._cache = cache
+        self._reach_repository = reach_repository
+        self._fill_repository = fill_repository
 
-    async def execute(self, advertiser_id: UUID) -> List[DailyStatsResponse]:
+    async def execute(
+        self,
+        advertiser_id: UUID,
+        date_from: Optional[int] = None,
+        date_to: Optional[int] = None,
+        granularity: StatsGranularity = StatsGranularity.DAY,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> DailyStatsPage:
         try:
             async with self._uow:
                 await self._advertisers_repository.get_by_id(advertiser_id)
 
-                statistics = await self._repository.get_advertiser_daily_stats(
-                    advertiser_id
+                return await cached_response(
+                    self._cache,
+                    DailyStatsPage,
+                    lambda repository: self._load(
+                        repository,
+                        advertiser_id,
+                        date_from,
+                        date_to,
+                        granularity,
+                        cursor,
+                        limit,
+                    ),
+                    self._repository,
+                    self._fill_repository,
+                    "advertiser_daily",
+                    STATS_CACHE_SCOPE_ADVERTISER,
+                    advertiser_id,
+                    date_from,
+                    date_to,
+                    granularity.value,
+                    cursor,
+                    limit,
                 )
-                return [
-                    self._mapper.from_entity_to_schema_daily_stats(statistic)
-                    for statistic in statistics
-                ]
         except AdvertiserNotFoundException as e:
             raise AdvertiserNotFoundException(str(e))
+        except InvalidStatsRangeError as e:
+            raise InvalidStatsRangeError(str(e))
         except StatisticsRepositoryError as e:
             raise StatisticsRepositoryError(str(e))
         except Exception as e:
             raise StatisticsRepositoryError(f"Unexpected error: {str(e)}")
 
+    async def _load(
+        self,
+        repository: StatisticsRepositoryProtocol,
+        advertiser_id: UUID,
+        date_from: Optional[int],
+        date_to: Optional[int],
+        granularity: StatsGranularity,
+        cursor: Optional[int],
+        limit: Optional[int],
+    ) -> DailyStatsPage:
+        if date_from is None or date_to is None:
+            period = await repository.get_advertiser_period(advertiser_id)
+            if period is None:
+                return DailyStatsPage(items=[], next_cursor=None)
+            first_day, last_day = period
+            if date_from is None:
+                date_from = first_day
+            if date_to is None:
+                current_day = await self._time_repository.get_current_date()
+                date_to = max(date_from, min(current_day, last_day))
+
+        page = _page_buckets(date_from, date_to, granularity, cursor, limit)
+        if page is None:
+            return DailyStatsPage(items=[], next_cursor=None)
+
+        page_from, page_to, bucket_size, next_cursor = page
+        statistics = await repository.get_advertiser_daily_stats(
+            advertiser_id, page_from, page_to, bucket_size
+        )
+        daily_reach = await _daily_reach(
+            self._reach_repository.get_advertiser_daily_reach
+            if self._reach_repository
+            else None,
+            advertiser_id,
+            granularity,
+            statistics,
+        )
+        return DailyStatsPage(
+            items=[
+                self._mapper.from_entity_to_schema_daily_stats(
+                    statistic, daily_reach.get(statistic.date)
+                )
+                for statistic in statistics
+            ],
+            next_cursor=next_cursor,
+        )
+
 
 class GetClientsStatsUseCase:
     def __init__(
@@ -168,22 +448,128 @@ class GetCampaignFeedbackStatsUseCase:
         repository: StatisticsRepositoryProtocol,
         campaigns_repository: CampaignsRepositoryProtocol,
         mapper: StatisticsMapper,
+        cache: Optional[StatisticsCacheProtocol] = None,
+        fill_repository: Optional[StatisticsRepositoryFactoryProtocol] = None,
     ) -> None:
         self._uow = uow
         self._repository = repository
         self._campaigns_repository = campaigns_repository
         self._mapper = mapper
+        self._cache = cache
+        self._fill_repository = fill_repository
 
     async def execute(self, campaign_id: UUID) -> CampaignFeedbackResponse:
         try:
             async with self._uow:
                 await self._campaigns_repository.get_by_id(campaign_id)
 
-                feedbacks = await self._repository.get_campaign_feedbacks(campaign_id)
-                return self._mapper.from_entity_to_schema_campaign_feedback(feedbacks)
+                return await cached_response(
+                    self._cache,
+                    CampaignFeedbackResponse,
+                    lambda repository: self._load(repository, campaign_id),
+                    self._repository,
+                    self._fill_repository,
+                    "campaign_feedback",
+                    STATS_CACHE_SCOPE_CAMPAIGN,
+                    campaign_id,
+                )
+        except CampaignNotFoundException as e:
+            raise CampaignNotFoundException(str(e))
+        except StatisticsRepositoryError as e:
+            raise StatisticsRepositoryError(str(e))
+        except Exception as e:
+            raise StatisticsRepositoryError(f"Unexpected error: {str(e)}")
+
+    async def _load(
+        self, repository: StatisticsRepositoryProtocol, campaign_id: UUID
+    ) -> CampaignFeedbackResponse:
+        feedbacks = await repository.get_campaign_feedbacks(campaign_id)
+        return self._mapper.from_entity_to_schema_campaign_feedback(feedbacks)
+
+
+class GetCampaignReachUseCase:
+    def __init__(
+        self,
+        uow: AbstractUow,
+        repository: ReachRepositoryProtocol,
+        campaigns_repository: CampaignsRepositoryProtocol,
+        mapper: StatisticsMapper,
+        cache: Optional[StatisticsCacheProtocol] = None,
+    ) -> None:
+        self._uow = uow
+        self._repository = repository
+        self._campaigns_repository = campaigns_repository
+        self._mapper = mapper
+        self._cache = cache
+
+    async def execute(self, campaign_id: UUID) -> ReachResponse:
+        try:
+            async with self._uow:
+                await self._campaigns_repository.get_by_id(campaign_id)
+
+                return await cached_response(
+                    self._cache,
+                    ReachResponse,
+                    lambda repository: self._load(repository, campaign_id),
+                    self._repository,
+                    lambda: nullcontext(self._repository),
+                    "campaign_reach",
+                    STATS_CACHE_SCOPE_CAMPAIGN,
+                    campaign_id,
+                )
         except CampaignNotFoundException as e:
             raise CampaignNotFoundException(str(e))
         except StatisticsRepositoryError as e:
             raise StatisticsRepositoryError(str(e))
         except Exception as e:
             raise StatisticsRepositoryError(f"Unexpected error: {str(e)}")
+
+    async def _load(
+        self, repository: ReachRepositoryProtocol, campaign_id: UUID
+    ) -> ReachResponse:
+        reach = await repository.get_campaign_reach(campaign_id)
+        return self._mapper.from_entity_to_reach_schema(reach)
+
+
+class GetAdvertiserReachUseCase:
+    def __init__(
+        self,
+        uow: AbstractUow,
+        repository: ReachRepositoryProtocol,
+        advertisers_repository: AdvertisersRepositoryProtocol,
+        mapper: StatisticsMapper,
+        cache: Optional[StatisticsCacheProtocol] = None,
+    ) -> None:
+        self._uow = uow
+        self._repository = repository
+        self._advertisers_repository = advertisers_repository
+        self._mapper = mapper
+        self._cache = cache
+
+    async def execute(self, advertiser_id: UUID) -> ReachResponse:
+        try:
+            async with self._uow:
+                await self._advertisers_repository.get_by_id(advertiser_id)
+
+                return await cached_response(
+                    self._cache,
+                    ReachResponse,
+                    lambda repository: self._load(repository, advertiser_id),
+                    self._repository,
+                    lambda: nullcontext(self._repository),
+                    "advertiser_reach",
+                    STATS_CACHE_SCOPE_ADVERTISER,
+                    advertiser_id,
+                )
+        except AdvertiserNotFoundException as e:
+            raise AdvertiserNotFoundException(str(e))
+        except StatisticsRepositoryError as e:
+            raise StatisticsRepositoryError(str(e))
+        except Exception as e:
+            raise StatisticsRepositoryError(f"Unexpected error: {str(e)}")
+
+    async def _load(
+        self, repository: ReachRepositoryProtocol, advertiser_id: UUID
+    ) -> ReachResponse:
+        reach = await repository.get_advertiser_reach(advertiser_id)
+        return self._mapper.from_entity_to_reach_schema(reach)
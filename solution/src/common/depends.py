@@ -2,7 +2,7 @@ from typing import AsyncGenerator
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.core.db import async_session_maker
+from src.core.db import async_read_session_maker, async_session_maker, replica_status
 from src.core.uow import AbstractUow, SQLAlchemyUow
 
 
@@ -14,7 +14,30 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    if async_read_session_maker is not None:
+        async with async_read_session_maker() as session:
+            if await replica_status.is_fresh(session):
+                try:
+                    yield session
+                finally:
+                    await session.close()
+                return
+
+    async with async_session_maker() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
 def get_uow(
     session: AsyncSession = Depends(get_session),
 ) -> AbstractUow:
     return SQLAlchemyUow(session)
+
+
+def get_read_uow(
+    session: AsyncSession = Depends(get_read_session),
+) -> AbstractUow:
+    return SQLAlchemyUow(session)
@@ -11,3 +11,32 @@ class TargetingGender(Enum):
     FEMALE = "FEMALE"
     ALL = "ALL"
 
+
+class StatsGranularity(Enum):
+    DAY = "day"
+    WEEK = "week"
+    TOTAL = "total"
+
+
+class LoadTarget(Enum):
+    CLIENTS = "clients"
+    ML_SCORES = "ml_scores"
+    ML_SCORES_SNAPSHOT = "ml_scores_snapshot"
+
+
+class LoadFormat(Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class ModerationStatus(Enum):
+    APPROVED = "approved"
+    PENDING = "pending_moderation"
+    REJECTED = "rejected"
+
+
+class ImageJobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
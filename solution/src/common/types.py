@@ -6,4 +6,6 @@ AdvertiserId = NewType("AdvertiserId", UUID)
 CampaignId = NewType("CampaignId", UUID)
 
 EVENT_TYPE_IMPRESSION = "impression"
-EVENT_TYPE_CLICK = "click"
\ No newline at end of file
+EVENT_TYPE_CLICK = "click"
+
+BULK_UPSERT_CHUNK_SIZE = 5000
\ No newline at end of file
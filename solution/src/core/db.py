@@ -1,10 +1,20 @@
 import asyncio
+import time
+from logging import getLogger
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.pool import AsyncAdaptedQueuePool
 from src.core.settings import settings
 
+logger = getLogger(__name__)
+
 
 class Base(DeclarativeBase):
     pass
@@ -33,9 +43,79 @@ async_session_maker = async_sessionmaker(
     future=True,
 )
 
+async_read_engine: AsyncEngine | None = None
+async_read_session_maker: async_sessionmaker[AsyncSession] | None = None
+
+if settings.database_replica_url:
+    async_read_engine = create_async_engine(
+        settings.database_replica_url,
+        echo=settings.database_debug,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=10,
+        max_overflow=20,
+        pool_timeout=90,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        pool_use_lifo=True,
+    )
+
+    async_read_session_maker = async_sessionmaker(
+        async_read_engine,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        future=True,
+    )
+
 Session = AsyncSession
 
 
+class ReplicaStatus:
+    LAG_QUERY = text("""
+        SELECT CASE
+            WHEN NOT pg_is_in_recovery() THEN 0
+            WHEN NOT EXISTS (
+                SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming'
+            ) THEN NULL
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+        END as lag_seconds
+    """)
+
+    def __init__(self, max_lag_seconds: float, check_interval_seconds: float) -> None:
+        self._max_lag_seconds = max_lag_seconds
+        self._check_interval_seconds = check_interval_seconds
+        self._checked_at = float("-inf")
+        self._fresh = False
+
+    async def is_fresh(self, session: AsyncSession) -> bool:
+        now = time.monotonic()
+        if now - self._checked_at < self._check_interval_seconds:
+            return self._fresh
+
+        try:
+            result = await session.execute(self.LAG_QUERY)
+            lag = result.scalar()
+        except Exception as e:
+            logger.warning(f"Replica lag check failed: {str(e)}")
+            lag = None
+
+        fresh = lag is not None and float(lag) <= self._max_lag_seconds
+        if fresh != self._fresh:
+            logger.warning(
+                f"Read replica {'enabled' if fresh else 'disabled'}, lag: {lag}"
+            )
+        self._fresh = fresh
+        self._checked_at = now
+        return fresh
+
+
+replica_status = ReplicaStatus(
+    max_lag_seconds=settings.database_replica_max_lag_seconds,
+    check_interval_seconds=settings.database_replica_check_interval_seconds,
+)
+
+
 async def init_db() -> None:
     async with async_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
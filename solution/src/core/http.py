@@ -0,0 +1,107 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Optional
+
+import aiohttp
+from prometheus_client import Counter
+from src.core.settings import settings
+
+http_client_requests_total = Counter(
+    "http_client_requests_total",
+    "Outgoing HTTP requests made through the shared client",
+    ["host"],
+)
+http_client_connections_created_total = Counter(
+    "http_client_connections_created_total",
+    "New connections opened by the shared HTTP client",
+    ["host"],
+)
+http_client_connections_reused_total = Counter(
+    "http_client_connections_reused_total",
+    "Requests served over a pooled keep-alive connection",
+    ["host"],
+)
+
+
+async def _on_request_start(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceRequestStartParams,
+) -> None:
+    context.host = params.url.host or ""
+    http_client_requests_total.labels(context.host).inc()
+
+
+async def _on_connection_create_end(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceConnectionCreateEndParams,
+) -> None:
+    http_client_connections_created_total.labels(context.host).inc()
+
+
+async def _on_connection_reuseconn(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceConnectionReuseconnParams,
+) -> None:
+    http_client_connections_reused_total.labels(context.host).inc()
+
+
+class HttpClient:
+    def __init__(
+        self,
+        limit: int,
+        limit_per_host: int,
+        keepalive_timeout: float,
+        connect_timeout: float,
+        total_timeout: float,
+    ) -> None:
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._timeout = aiohttp.ClientTimeout(
+            total=total_timeout, sock_connect=connect_timeout
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock = asyncio.Lock()
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so the session binds to the loop that uses it.
+        if self._session is None or self._session.closed:
+            async with self._lock:
+                if self._session is None or self._session.closed:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(_on_request_start)
+        trace_config.on_connection_create_end.append(_on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+
+        connector = aiohttp.TCPConnector(
+            limit=self._limit,
+            limit_per_host=self._limit_per_host,
+            keepalive_timeout=self._keepalive_timeout,
+            ttl_dns_cache=300,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=self._timeout,
+            trace_configs=[trace_config],
+        )
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+http_client = HttpClient(
+    limit=settings.http_client_limit,
+    limit_per_host=settings.http_client_limit_per_host,
+    keepalive_timeout=settings.http_client_keepalive_seconds,
+    connect_timeout=settings.http_client_connect_timeout_seconds,
+    total_timeout=settings.http_client_timeout_seconds,
+)
@@ -0,0 +1,21 @@
+import asyncio
+
+from prometheus_client import Histogram
+
+event_loop_lag_seconds = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop wakes a sleeping task",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+
+async def monitor_event_loop_lag(interval_seconds: float) -> None:
+    # Anything that blocks the loop (sync I/O, heavy CPU) delays the wake-up
+    # of this task by the same amount as it delays request handling.
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval_seconds)
+        event_loop_lag_seconds.observe(
+            max(0.0, loop.time() - started - interval_seconds)
+        )
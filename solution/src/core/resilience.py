@@ -0,0 +1,198 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import AsyncIterator, Callable, Optional
+
+from prometheus_client import Counter, Gauge
+from src.core.exceptions.base import BaseException
+
+provider_circuit_state = Gauge(
+    "provider_circuit_state",
+    "Circuit breaker state per provider: 0 closed, 1 half-open, 2 open",
+    ["provider"],
+)
+provider_circuit_trips_total = Counter(
+    "provider_circuit_trips_total",
+    "Times the circuit breaker opened for a provider",
+    ["provider"],
+)
+provider_rejected_total = Counter(
+    "provider_rejected_total",
+    "Calls failed fast without reaching the provider",
+    ["provider", "reason"],
+)
+provider_throttled_total = Counter(
+    "provider_throttled_total",
+    "Calls delayed by the client-side rate limiter",
+    ["provider"],
+)
+provider_inflight = Gauge(
+    "provider_inflight",
+    "Calls currently in flight to a provider",
+    ["provider"],
+)
+
+
+class CircuitOpenError(BaseException):
+    pass
+
+
+class RateLimitExceededError(BaseException):
+    pass
+
+
+class CircuitState(Enum):
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, burst: int) -> None:
+        self._rate = rate_per_second
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self, max_wait: float) -> float:
+        # Tokens may go negative: each caller reserves its slot up front and
+        # sleeps until it is due, so waiters are served in arrival order.
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+        wait = max(0.0, (1 - self._tokens) / self._rate)
+        if wait > max_wait:
+            raise RateLimitExceededError(
+                f"Rate limit would delay the call by {wait:.1f}s"
+            )
+        self._tokens -= 1
+        return wait
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float) -> None:
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_until = 0.0
+        self._state = CircuitState.CLOSED
+        self._probing = False
+        provider_circuit_state.labels(name).set(self._state.value)
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and time.monotonic() >= self._opened_until:
+            self._set_state(CircuitState.HALF_OPEN)
+        return self._state
+
+    def before_call(self) -> bool:
+        """Raises while open; returns True if the call is the half-open probe."""
+        state = self.state
+        if state == CircuitState.OPEN:
+            retry_after = self._opened_until - time.monotonic()
+            raise CircuitOpenError(
+                f"Provider {self._name} is unavailable, retry in {retry_after:.0f}s"
+            )
+        if state == CircuitState.HALF_OPEN:
+            if self._probing:
+                raise CircuitOpenError(
+                    f"Provider {self._name} is being probed after a failure"
+                )
+            self._probing = True
+            return True
+        return False
+
+    def release_probe(self) -> None:
+        self._probing = False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._probing = False
+        self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self, open_for: Optional[float] = None) -> None:
+        self._failures += 1
+        self._probing = False
+        if (
+            open_for is not None
+            or self._state == CircuitState.HALF_OPEN
+            or self._failures >= self._failure_threshold
+        ):
+            self._trip(open_for or self._reset_timeout)
+
+    def _trip(self, open_for: float) -> None:
+        self._opened_until = max(self._opened_until, time.monotonic() + open_for)
+        if self._state != CircuitState.OPEN:
+            provider_circuit_trips_total.labels(self._name).inc()
+        self._set_state(CircuitState.OPEN)
+
+    def _set_state(self, state: CircuitState) -> None:
+        self._state = state
+        provider_circuit_state.labels(self._name).set(state.value)
+
+
+class ProviderGuard:
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: float,
+        burst: int,
+        max_concurrency: int,
+        max_wait: float,
+        failure_threshold: int,
+        reset_timeout: float,
+        is_failure: Callable[[Exception], bool],
+    ) -> None:
+        self._name = name
+        self._bucket = TokenBucket(requests_per_minute / 60, burst)
+        self._breaker = CircuitBreaker(name, failure_threshold, reset_timeout)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_wait = max_wait
+        self._is_failure = is_failure
+
+    @property
+    def state(self) -> CircuitState:
+        return self._breaker.state
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        try:
+            probe = self._breaker.before_call()
+        except CircuitOpenError:
+            provider_rejected_total.labels(self._name, "circuit_open").inc()
+            raise
+
+        try:
+            try:
+                wait = self._bucket.reserve(self._max_wait)
+            except RateLimitExceededError:
+                provider_rejected_total.labels(self._name, "rate_limited").inc()
+                raise
+            if wait:
+                provider_throttled_total.labels(self._name).inc()
+                await asyncio.sleep(wait)
+
+            async with self._semaphore:
+                provider_inflight.labels(self._name).inc()
+                try:
+                    yield
+                except Exception as e:
+                    # Other errors say nothing about provider health: they
+                    # neither count as a failure nor close the circuit.
+                    if self._is_failure(e):
+                        # A provider-supplied Retry-After keeps the circuit
+                        # open for exactly that long.
+                        self._breaker.record_failure(getattr(e, "retry_after", None))
+                    raise
+                else:
+                    self._breaker.record_success()
+                finally:
+                    provider_inflight.labels(self._name).dec()
+        finally:
+            if probe:
+                self._breaker.release_probe()
@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Literal
 
 from fastapi import Depends
 from pydantic_settings import BaseSettings
@@ -13,21 +13,68 @@ class Settings(BaseSettings):
     database_debug: bool = False
     database_provider: str = "postgresql+asyncpg"
 
+    database_replica_host: str | None = None
+    database_replica_port: int | None = None
+    database_replica_max_lag_seconds: float = 5.0
+    database_replica_check_interval_seconds: float = 1.0
+
     redis_host: str
     redis_port: int
     redis_password: str
     redis_db: int = 0
     redis_provider: str = "redis://"
 
+    stats_cache_enabled: bool = True
+    stats_cache_ttl_seconds: int = 300
+
+    ml_score_store_enabled: bool = False
+    ml_score_store_refresh_seconds: float = 300.0
+
+    http_client_limit: int = 100
+    http_client_limit_per_host: int = 20
+    http_client_keepalive_seconds: float = 30.0
+    http_client_connect_timeout_seconds: float = 10.0
+    http_client_timeout_seconds: float = 120.0
+
+    event_loop_lag_interval_seconds: float = 0.5
+
     telegram_bot_token: str
 
+    admin_token: str | None = None
+
     current_day: str = "2025-02-14"
 
     ai_api_key: str
+    ai_backend: Literal["remote", "local"] = "remote"
+    ai_local_latency_distribution: Literal[
+        "fixed", "uniform", "normal", "lognormal"
+    ] = "lognormal"
+    ai_local_latency_ms: float = 800.0
+    ai_local_image_latency_ms: float = 3000.0
+    ai_local_latency_spread: float = 0.5
+    ai_local_error_rate: float = 0.0
+    ai_local_rate_limit_rate: float = 0.0
+    ai_local_retry_after_seconds: float = 1.0
+    ai_local_seed: int = 0
     ai_moderation_enabled: bool = False
+    ai_moderation_async: bool = False
+    moderation_worker_concurrency: int = 4
+    image_worker_concurrency: int = 2
+    image_job_queue_max_length: int = 1000
+    image_job_ttl_seconds: int = 24 * 3600
+    image_job_lease_seconds: int = 60
     ai_check_profanity: bool = False
     ai_check_offensive: bool = False
     ai_check_inappropriate: bool = False
+    ai_result_cache_enabled: bool = True
+    ai_result_cache_ttl_seconds: int = 7 * 24 * 3600
+    ai_result_cache_max_entries: int = 100_000
+    ai_rate_limit_max_wait_seconds: float = 10.0
+    ai_circuit_failure_threshold: int = 5
+    ai_circuit_reset_seconds: float = 30.0
+    openrouter_requests_per_minute: float = 20.0
+    openrouter_burst: int = 5
+    openrouter_max_concurrency: int = 8
 
     minio_endpoint: str
     minio_access_key: str
@@ -35,6 +82,8 @@ class Settings(BaseSettings):
     minio_secure: bool = False
     minio_bucket_name: str
     minio_public_host: str
+    minio_io_threads: int = 8
+    minio_health_check_interval_seconds: float = 30.0
 
     yandex_token: str
     yandex_sandbox_mode: bool = True
@@ -42,6 +91,9 @@ class Settings(BaseSettings):
     cloudflare_api_token: str
     cloudflare_account_id: str
     cloudflare_model: str = "@cf/bytedance/stable-diffusion-xl-lightning"
+    cloudflare_requests_per_minute: float = 60.0
+    cloudflare_burst: int = 5
+    cloudflare_max_concurrency: int = 4
 
     @property
     def minio_public_url(self) -> str:
@@ -52,6 +104,13 @@ class Settings(BaseSettings):
     def database_url(self) -> str:
         return f"{self.database_provider}://{self.database_user}:{self.database_password}@{self.database_host}:{self.database_port}/{self.database_db_name}"
 
+    @property
+    def database_replica_url(self) -> str | None:
+        if not self.database_replica_host:
+            return None
+        port = self.database_replica_port or self.database_port
+        return f"{self.database_provider}://{self.database_user}:{self.database_password}@{self.database_replica_host}:{port}/{self.database_db_name}"
+
     @property
     def redis_url(self) -> str:
         return f"{self.redis_provider}{self.redis_host}:{self.redis_port}"
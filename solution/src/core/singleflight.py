@@ -0,0 +1,58 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+from prometheus_client import Counter
+
+T = TypeVar("T")
+
+singleflight_calls_total = Counter(
+    "singleflight_calls_total",
+    "Executions started by the single-flight layer",
+    ["name"],
+)
+singleflight_coalesced_total = Counter(
+    "singleflight_coalesced_total",
+    "Requests that attached to an already running identical call",
+    ["name"],
+)
+
+
+class _Call:
+    def __init__(self, task: asyncio.Future[Any]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._calls: Dict[Hashable, _Call] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        call = self._calls.get(key)
+        if call is not None:
+            singleflight_coalesced_total.labels(self._name).inc()
+        else:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda done: self._forget(key, done))
+            singleflight_calls_total.labels(self._name).inc()
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            # The shared call outlives a cancelled waiter while anyone else
+            # still needs it; once nobody does, it is cancelled as well.
+            if call.waiters == 0 and not call.task.done():
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+                call.task.cancel()
+
+    def _forget(self, key: Hashable, task: asyncio.Future[Any]) -> None:
+        call = self._calls.get(key)
+        if call is not None and call.task is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
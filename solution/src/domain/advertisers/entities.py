@@ -14,3 +14,10 @@ class MLScoreEntity(BaseEntity):
     client_id: UUID
     advertiser_id: UUID
     score: int
+
+
+@dataclass
+class MLScoreRejectEntity:
+    client_id: UUID
+    advertiser_id: UUID
+    reason: str
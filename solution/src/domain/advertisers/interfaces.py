@@ -1,9 +1,18 @@
-from typing import List, Protocol
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Protocol
 from uuid import UUID
 
-from src.application.advertisers.dtos import GetAdvertiserByIdSchema, MLScoreSchema
+from src.application.advertisers.dtos import (
+    GetAdvertiserByIdSchema,
+    MLScoreBulkResponse,
+    MLScoreSchema,
+)
+from src.application.ingest.dtos import BulkStreamSummarySchema
 from src.core.uow import AbstractUow
-from src.domain.advertisers.entities import AdvertiserEntity, MLScoreEntity
+from src.domain.advertisers.entities import (
+    AdvertiserEntity,
+    MLScoreEntity,
+    MLScoreRejectEntity,
+)
 
 
 class AdvertisersRepositoryProtocol(Protocol):
@@ -17,11 +26,25 @@ class AdvertisersRepositoryProtocol(Protocol):
 class MLScoreRepositoryProtocol(Protocol):
     async def upsert_ml_score(self, entity: MLScoreEntity) -> None: ...
 
+    async def bulk_upsert_ml_scores(
+        self, entities: List[MLScoreEntity]
+    ) -> List[MLScoreRejectEntity]: ...
+
     async def get_ml_score(
         self, client_id: UUID, advertiser_id: UUID
     ) -> int | None: ...
 
 
+class MLScoreStoreProtocol(Protocol):
+    def get_scores(
+        self, client_id: UUID, advertiser_ids: Iterable[UUID]
+    ) -> Dict[UUID, int]: ...
+
+    def set_score(self, client_id: UUID, advertiser_id: UUID, score: int) -> None: ...
+
+    async def reload(self) -> None: ...
+
+
 class GetAdvertiserByIdUseCaseProtocol(Protocol):
     async def execute(self, advertiser_id: UUID) -> GetAdvertiserByIdSchema: ...
     def get_uow(self) -> AbstractUow: ...
@@ -34,5 +57,15 @@ class UpsertAdvertisersUseCaseProtocol(Protocol):
     def get_uow(self) -> AbstractUow: ...
 
 
+class StreamUpsertAdvertisersUseCaseProtocol(Protocol):
+    def execute(
+        self, lines: AsyncIterable[bytes]
+    ) -> AsyncIterator[BulkStreamSummarySchema]: ...
+
+
 class UpsertMLScoreUseCaseProtocol(Protocol):
     async def execute(self, data: MLScoreSchema) -> None: ...
+
+
+class BulkUpsertMLScoresUseCaseProtocol(Protocol):
+    async def execute(self, rows: AsyncIterable[Any]) -> MLScoreBulkResponse: ...
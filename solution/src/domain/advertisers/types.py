@@ -0,0 +1,11 @@
+ML_SCORES_MAX_REPORTED_REJECTS = 1000
+
+ML_SCORE_REJECT_CLIENT_NOT_FOUND = "Клиент не найден"
+ML_SCORE_REJECT_ADVERTISER_NOT_FOUND = "Рекламодатель не найден"
+
+ML_SCORE_SNAPSHOT_ACTIVE = "active"
+ML_SCORE_SNAPSHOT_RETIRED = "retired"
+ML_SCORE_SNAPSHOT_DROPPED = "dropped"
+ML_SCORE_SNAPSHOTS_RETAINED = 1
+
+ML_SCORE_STORE_FETCH_SIZE = 50000
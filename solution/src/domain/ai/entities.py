@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from src.common.enums import ImageJobStatus
+from src.core.entities.base_entity import BaseEntity
+
+
+@dataclass
+class ImageJobEntity(BaseEntity):
+    campaign_id: UUID
+    status: ImageJobStatus = ImageJobStatus.QUEUED
+    image_url: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (ImageJobStatus.SUCCEEDED, ImageJobStatus.FAILED)
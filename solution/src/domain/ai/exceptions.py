@@ -1,3 +1,5 @@
+from typing import Optional
+
 from src.core.exceptions.base import BaseException
 
 
@@ -40,7 +42,36 @@ class AIRateLimitError(AIError):
     status_code = 429
     default_message = "AI service rate limit exceeded. Please try again later."
 
+    def __init__(self, message: str = "", retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AIProviderUnavailableError(AIError):
+    status_code = 503
+    default_message = "AI service is temporarily unavailable. Please try again later."
+
 
 class AIAuthenticationError(AIError):
     status_code = 401
     default_message = "Failed to authenticate with AI service"
+
+
+class AIResultCacheError(BaseException):
+    status_code = 500
+    default_message = "Error occurred while accessing AI result cache"
+
+
+class ImageJobNotFoundError(BaseException):
+    status_code = 404
+    default_message = "Image generation job not found"
+
+
+class ImageJobQueueError(BaseException):
+    status_code = 500
+    default_message = "Error occurred while accessing image generation queue"
+
+
+class ImageJobQueueFullError(ImageJobQueueError):
+    status_code = 503
+    default_message = "Too many image generation jobs queued. Please try again later."
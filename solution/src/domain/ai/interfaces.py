@@ -1,29 +1,78 @@
-from typing import Protocol
+from typing import Any, Dict, List, Optional, Protocol
 from uuid import UUID
 
-from fastapi.responses import FileResponse
 from src.application.ai.dtos import (
     AdvertisementGenerationResponse,
     GeneratedAdResponse,
+    ImageJobResponse,
     ModerationResponse,
 )
+from src.domain.ai.entities import ImageJobEntity
 
 
 class GenerateAdUseCaseProtocol(Protocol):
     async def execute(
-        self, advertiser_id: UUID, ad_title: str
+        self, advertiser_id: UUID, ad_title: str, bypass_cache: bool = False
     ) -> AdvertisementGenerationResponse: ...
 
 
+class AIResultCacheProtocol(Protocol):
+    async def get_many(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]: ...
+
+    async def set_many(self, items: Dict[str, Dict[str, Any]]) -> None: ...
+
+
+class AIBackendProtocol(Protocol):
+    model: str
+
+    async def complete(self, prompt: str, expected_fields: List[str]) -> str: ...
+
+    async def generate_image(self, prompt: str) -> bytes: ...
+
+
 class AIServiceProtocol(Protocol):
     async def generate_ad(
-        self, advertiser_name: str, ad_title: str
+        self, advertiser_name: str, ad_title: str, bypass_cache: bool = False
     ) -> GeneratedAdResponse: ...
 
     async def check_forbidden_words(self, text: str) -> ModerationResponse: ...
 
-    async def generate_image(self, ad_title: str, ad_text: str) -> FileResponse: ...
+    async def check_forbidden_words_batch(
+        self, texts: List[str]
+    ) -> List[ModerationResponse]: ...
+
+    async def generate_image(self, ad_title: str, ad_text: str) -> bytes: ...
+
+
+class ImageJobRepositoryProtocol(Protocol):
+    async def submit(self, job: ImageJobEntity) -> None: ...
+
+    async def get(self, job_id: UUID) -> Optional[ImageJobEntity]: ...
+
+    async def update(self, job: ImageJobEntity) -> None: ...
+
+    async def wait(
+        self, job_id: UUID, timeout_seconds: float
+    ) -> Optional[ImageJobEntity]: ...
+
+    async def dequeue(self, timeout_seconds: float) -> Optional[UUID]: ...
+
+    async def extend_lease(self, job_id: UUID) -> None: ...
+
+    async def ack(self, job_id: UUID) -> None: ...
+
+    async def requeue_expired(self) -> int: ...
+
+
+class SubmitImageJobUseCaseProtocol(Protocol):
+    async def execute(self, campaign_id: UUID) -> ImageJobResponse: ...
+
+
+class GetImageJobUseCaseProtocol(Protocol):
+    async def execute(
+        self, job_id: UUID, wait_seconds: float = 0.0
+    ) -> ImageJobResponse: ...
 
 
 class GenerateImageUseCaseProtocol(Protocol):
-    async def execute(self, campaign_id: UUID) -> FileResponse: ...
+    async def execute(self, job_id: UUID) -> Optional[ImageJobEntity]: ...
@@ -0,0 +1,9 @@
+# Bump when prompts or response parsing change in a way the prompt text alone
+# does not capture, so cached results from the old version stop matching.
+AI_PROMPT_VERSION = 1
+
+AI_CACHE_KIND_AD_GENERATION = "ad_generation"
+AI_CACHE_KIND_MODERATION = "moderation"
+
+AI_BACKEND_REMOTE = "remote"
+AI_BACKEND_LOCAL = "local"
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID
 
-from src.common.enums import TargetingGender
+from src.common.enums import ModerationStatus, TargetingGender
 from src.core.entities.base_entity import BaseEntity
 
 
@@ -22,6 +22,8 @@ class CampaignEntity(BaseEntity):
     age_from: Optional[int] = None
     age_to: Optional[int] = None
     location: Optional[str] = None
+    moderation_status: ModerationStatus = ModerationStatus.APPROVED
+    moderation_reason: Optional[str] = None
 
 
 @dataclass
@@ -36,3 +38,5 @@ class CampaignUpdateEntity(BaseEntity):
     age_to: Optional[int] = None
     location: Optional[str] = None
     image_url: Optional[str] = None
+    moderation_status: ModerationStatus = ModerationStatus.APPROVED
+    moderation_reason: Optional[str] = None
@@ -21,6 +21,21 @@ class CampaignImageUploadError(BaseException):
     default_message = "Failed to upload campaign image"
 
 
+class CampaignImageInvalidError(BaseException):
+    status_code = 400
+    default_message = "Unsupported campaign image"
+
+
+class CampaignImageTooLargeError(BaseException):
+    status_code = 413
+    default_message = "Campaign image is too large"
+
+
 class CampaignModerationError(BaseException):
     status_code = 400
     default_message = "Campaign moderation error"
+
+
+class CampaignModerationUnavailableError(BaseException):
+    status_code = 503
+    default_message = "Campaign moderation is temporarily unavailable"
@@ -8,6 +8,7 @@ from src.application.campaigns.dtos import (
     CampaignUpdateRequest,
     ImageUploadResponse,
 )
+from src.common.enums import ModerationStatus
 from src.domain.campaigns.entities import CampaignEntity, CampaignUpdateEntity
 
 
@@ -28,6 +29,17 @@ class CampaignsRepositoryProtocol(Protocol):
 
     async def delete(self, advertiser_id: UUID, campaign_id: UUID) -> None: ...
 
+    async def set_moderation_status(
+        self,
+        campaign_id: UUID,
+        status: ModerationStatus,
+        reason: Optional[str],
+        ad_title: str,
+        ad_text: str,
+    ) -> bool: ...
+
+    async def get_pending_moderation_ids(self) -> List[UUID]: ...
+
     async def get_targeted_campaigns(self, client_id: UUID) -> List[CampaignEntity]: ...
 
 
@@ -84,6 +96,10 @@ class CreateCampaignFromYandexUseCaseProtocol(Protocol):
     ) -> List[CampaignResponse]: ...
 
 
+class ModerateCampaignUseCaseProtocol(Protocol):
+    async def execute(self, campaign_id: UUID) -> Optional[ModerationStatus]: ...
+
+
 class YandexDirectServiceProtocol(Protocol):
     async def get_campaign_entities(
         self, token: Optional[str], advertiser_id: UUID
@@ -1,7 +1,8 @@
-from typing import List, Protocol
+from typing import AsyncIterable, AsyncIterator, List, Protocol
 from uuid import UUID
 
 from src.application.clients.dtos import ClientSchema, ClientUpsertSchema
+from src.application.ingest.dtos import BulkStreamSummarySchema
 from src.common.types import ClientId
 from src.domain.clients.entities import ClientEntity
 
@@ -20,3 +21,9 @@ class UpsertClientUseCaseProtocol(Protocol):
     async def execute(
         self, clients: List[ClientUpsertSchema]
     ) -> List[ClientSchema]: ...
+
+
+class StreamUpsertClientsUseCaseProtocol(Protocol):
+    def execute(
+        self, lines: AsyncIterable[bytes]
+    ) -> AsyncIterator[BulkStreamSummarySchema]: ...
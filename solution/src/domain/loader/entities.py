@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class LoadMergeEntity:
+    written: int
+    rejected: int
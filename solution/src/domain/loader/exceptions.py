@@ -0,0 +1,6 @@
+from src.core.exceptions.base import BaseException
+
+
+class LoaderError(BaseException):
+    status_code = 500
+    default_message = "Error occurred while bulk loading data"
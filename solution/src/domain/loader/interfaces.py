@@ -0,0 +1,25 @@
+from typing import AsyncIterable, Callable, List, Optional, Protocol, Tuple
+
+from src.application.loader.dtos import LoadResultSchema
+from src.common.enums import LoadFormat, LoadTarget
+from src.domain.loader.entities import LoadMergeEntity
+
+
+class CopyLoaderRepositoryProtocol(Protocol):
+    async def create_staging(self, target: LoadTarget) -> None: ...
+
+    async def copy_records(
+        self, target: LoadTarget, records: List[Tuple[object, ...]]
+    ) -> int: ...
+
+    async def merge(self, target: LoadTarget) -> LoadMergeEntity: ...
+
+
+class BulkLoadUseCaseProtocol(Protocol):
+    async def execute(
+        self,
+        target: LoadTarget,
+        format: LoadFormat,
+        lines: AsyncIterable[bytes],
+        on_progress: Optional[Callable[[LoadResultSchema], None]] = None,
+    ) -> LoadResultSchema: ...
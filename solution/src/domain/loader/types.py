@@ -0,0 +1,2 @@
+LOADER_BATCH_SIZE = 10000
+LOADER_MAX_REPORTED_ERRORS = 100
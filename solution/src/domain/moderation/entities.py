@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Dict, Optional, Union
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union
 
 from src.application.ai.dtos import ModerationResponse
 from src.core.entities.base_entity import BaseEntity
@@ -10,8 +10,16 @@ class ForbiddenWordsEntity(BaseEntity):
     word: str
 
 
+@dataclass
+class ForbiddenWordMatchEntity:
+    word: str
+    start: int
+    end: int
+
+
 @dataclass
 class ModerationResultEntity(BaseEntity):
     contains_forbidden_words: bool
     source: str
     details: Optional[Union[Dict[str, bool], ModerationResponse]] = None
+    matches: List[ForbiddenWordMatchEntity] = field(default_factory=list)
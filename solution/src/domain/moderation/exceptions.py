@@ -0,0 +1,11 @@
+from src.core.exceptions.base import BaseException
+
+
+class ForbiddenWordsVersionError(BaseException):
+    status_code = 500
+    default_message = "Error occurred while reading forbidden words version"
+
+
+class ModerationQueueError(BaseException):
+    status_code = 500
+    default_message = "Error occurred while accessing moderation queue"
@@ -1,6 +1,8 @@
-from typing import Dict, List, Optional, Protocol, Union
+from typing import AsyncContextManager, Dict, List, Optional, Protocol, Union
+from uuid import UUID
 
 from src.application.moderation.dtos import ModerationResponse
+from src.domain.moderation.entities import ForbiddenWordMatchEntity
 
 
 class ModerationResult:
@@ -9,16 +11,52 @@ class ModerationResult:
         contains_forbidden_words: bool,
         source: str = "",
         details: Optional[Union[Dict[str, bool], ModerationResponse]] = None,
+        matches: Optional[List[ForbiddenWordMatchEntity]] = None,
     ):
         self.contains_forbidden_words = contains_forbidden_words
         self.source = source
         self.details = details or {}
+        self.matches = matches or []
 
 
 class ForbiddenWordsRepositoryProtocol(Protocol):
     async def get_all(self) -> List[str]: ...
 
-    async def update(self, data: List[str]) -> None: ...
+    async def get_version(self) -> int: ...
+
+    async def update(self, data: List[str]) -> int: ...
+
+
+class ForbiddenWordsRepositoryFactoryProtocol(Protocol):
+    def __call__(self) -> AsyncContextManager[ForbiddenWordsRepositoryProtocol]: ...
+
+
+class ForbiddenWordsVersionRepositoryProtocol(Protocol):
+    async def get(self) -> Optional[int]: ...
+
+    async def publish(self, version: int) -> None: ...
+
+
+class ModerationQueueProtocol(Protocol):
+    async def enqueue(self, campaign_id: UUID) -> None: ...
+
+    async def dequeue(self, timeout_seconds: float) -> Optional[UUID]: ...
+
+
+class ForbiddenWordsMatcherProtocol(Protocol):
+    def find_all(self, text: str) -> List[ForbiddenWordMatchEntity]: ...
+
+
+class ForbiddenWordsMatcherCacheProtocol(Protocol):
+    async def get_matcher(
+        self,
+        repository: ForbiddenWordsRepositoryProtocol,
+        version_repository: Optional[ForbiddenWordsVersionRepositoryProtocol] = None,
+    ) -> ForbiddenWordsMatcherProtocol: ...
+
+    def store(
+        self, version: int, words: List[str]
+    ) -> ForbiddenWordsMatcherProtocol: ...
 
 
 class GetForbiddenWordsUseCaseProtocol(Protocol):
@@ -53,5 +91,9 @@ class ModerationServiceProtocol(Protocol):
         check_database: bool = True,
         check_ai: bool = True,
     ) -> ModerationResult: ...
-
-
+    async def check_forbidden_words_batch(
+        self,
+        texts: List[str],
+        check_database: bool = True,
+        check_ai: bool = True,
+    ) -> List[ModerationResult]: ...
@@ -25,3 +25,8 @@ class FeedbackEntity(BaseEntity):
     rating: int
     comment: Optional[str]
     created_at: datetime
+
+
+@dataclass
+class ReachEntity:
+    unique_clients: int
@@ -19,3 +19,8 @@ class NoImpressionError(BaseException):
 class ClicksLimitReachedError(BaseException):
     status_code = 400
     default_message = "Clicks limit has been reached for this campaign"
+
+
+class InvalidStatsRangeError(BaseException):
+    status_code = 400
+    default_message = "Invalid statistics date range"
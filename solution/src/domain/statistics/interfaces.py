@@ -1,13 +1,19 @@
-from typing import List, Optional, Protocol
+from typing import AsyncContextManager, Dict, List, Optional, Protocol, Tuple
 from uuid import UUID
 
 from src.application.statistics.dtos import (
     CampaignFeedbackResponse,
     ClientStatsResponse,
-    DailyStatsResponse,
+    DailyStatsPage,
+    ReachResponse,
     StatsResponse,
 )
-from src.domain.statistics.entities import FeedbackEntity, StatisticsEntity
+from src.common.enums import StatsGranularity
+from src.domain.statistics.entities import (
+    FeedbackEntity,
+    ReachEntity,
+    StatisticsEntity,
+)
 
 
 class StatisticsRepositoryProtocol(Protocol):
@@ -16,14 +22,18 @@ class StatisticsRepositoryProtocol(Protocol):
     async def get_advertiser_stats(self, advertiser_id: UUID) -> StatisticsEntity: ...
 
     async def get_campaign_daily_stats(
-        self, campaign_id: UUID
+        self, campaign_id: UUID, date_from: int, date_to: int, bucket_size: int
     ) -> List[StatisticsEntity]: ...
 
     async def get_advertiser_daily_stats(
-        self, advertiser_id: UUID
+        self, advertiser_id: UUID, date_from: int, date_to: int, bucket_size: int
     ) -> List[StatisticsEntity]: ...
 
-    async def register_impression(self, client_id: UUID, campaign_id: UUID): ...
+    async def get_advertiser_period(
+        self, advertiser_id: UUID
+    ) -> Optional[Tuple[int, int]]: ...
+
+    async def register_impression(self, client_id: UUID, campaign_id: UUID) -> bool: ...
 
     async def register_click(self, client_id: UUID, campaign_id: UUID): ...
 
@@ -38,6 +48,40 @@ class StatisticsRepositoryProtocol(Protocol):
     ) -> List[FeedbackEntity]: ...
 
 
+class StatisticsRepositoryFactoryProtocol(Protocol):
+    def __call__(self) -> AsyncContextManager[StatisticsRepositoryProtocol]: ...
+
+
+class ReachRepositoryProtocol(Protocol):
+    async def add_impression(
+        self, client_id: UUID, campaign_id: UUID, advertiser_id: UUID, date: int
+    ) -> None: ...
+
+    async def get_campaign_reach(self, campaign_id: UUID) -> ReachEntity: ...
+
+    async def get_advertiser_reach(self, advertiser_id: UUID) -> ReachEntity: ...
+
+    async def get_campaign_daily_reach(
+        self, campaign_id: UUID, dates: List[int]
+    ) -> Dict[int, int]: ...
+
+    async def get_advertiser_daily_reach(
+        self, advertiser_id: UUID, dates: List[int]
+    ) -> Dict[int, int]: ...
+
+
+class StatisticsCacheProtocol(Protocol):
+    async def build_key(
+        self, endpoint: str, scope: str, entity_id: UUID, *params: object
+    ) -> str: ...
+
+    async def get(self, key: str) -> Optional[str]: ...
+
+    async def set(self, key: str, value: str) -> None: ...
+
+    async def bump_version(self, campaign_id: UUID, advertiser_id: UUID) -> None: ...
+
+
 class GetCampaignStatsUseCaseProtocol(Protocol):
     async def execute(self, campaign_id: UUID) -> StatsResponse: ...
 
@@ -47,11 +91,27 @@ class GetAdvertiserCampaignsStatsUseCaseProtocol(Protocol):
 
 
 class GetCampaignDailyStatsUseCaseProtocol(Protocol):
-    async def execute(self, campaign_id: UUID) -> List[DailyStatsResponse]: ...
+    async def execute(
+        self,
+        campaign_id: UUID,
+        date_from: Optional[int] = None,
+        date_to: Optional[int] = None,
+        granularity: StatsGranularity = StatsGranularity.DAY,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> DailyStatsPage: ...
 
 
 class GetAdvertiserDailyStatsUseCaseProtocol(Protocol):
-    async def execute(self, advertiser_id: UUID) -> List[DailyStatsResponse]: ...
+    async def execute(
+        self,
+        advertiser_id: UUID,
+        date_from: Optional[int] = None,
+        date_to: Optional[int] = None,
+        granularity: StatsGranularity = StatsGranularity.DAY,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> DailyStatsPage: ...
 
 
 class GetClientsStatsUseCaseProtocol(Protocol):
@@ -60,3 +120,11 @@ class GetClientsStatsUseCaseProtocol(Protocol):
 
 class GetCampaignFeedbackStatsUseCaseProtocol(Protocol):
     async def execute(self, campaign_id: UUID) -> CampaignFeedbackResponse: ...
+
+
+class GetCampaignReachUseCaseProtocol(Protocol):
+    async def execute(self, campaign_id: UUID) -> ReachResponse: ...
+
+
+class GetAdvertiserReachUseCaseProtocol(Protocol):
+    async def execute(self, advertiser_id: UUID) -> ReachResponse: ...
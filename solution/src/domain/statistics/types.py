@@ -1 +1,7 @@
- 
\ No newline at end of file
+REACH_HLL_STANDARD_ERROR = 0.0081
+
+DAILY_STATS_MAX_PAGE_LIMIT = 1000
+WEEK_LENGTH_DAYS = 7
+
+STATS_CACHE_SCOPE_CAMPAIGN = "campaign"
+STATS_CACHE_SCOPE_ADVERTISER = "advertiser"
@@ -21,3 +21,8 @@ class MinioGetUrlError(MinioServiceError):
 class MinioInvalidFileType(MinioServiceError):
 
     pass
+
+
+class MinioFileTooLargeError(MinioServiceError):
+
+    pass
@@ -1,7 +1,11 @@
 import uuid
+from datetime import datetime
+from typing import Optional
 
-from sqlalchemy import BigInteger, ForeignKey, Integer, String
+import sqlalchemy
+from sqlalchemy import BigInteger, ForeignKey, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from src.core.db import Base
 from src.core.models import SQLAlchemyBaseModel, SQLAlchemyTimestampMixin
 
 
@@ -13,6 +17,11 @@ class AdvertiserModel(SQLAlchemyBaseModel, SQLAlchemyTimestampMixin):
 
 class MLScoreModel(SQLAlchemyBaseModel, SQLAlchemyTimestampMixin):
     __tablename__ = "ml_scores"
+    __table_args__ = (
+        UniqueConstraint(
+            "client_id", "advertiser_id", name="uq_ml_scores_client_advertiser"
+        ),
+    )
 
     client_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("clients.id"),
@@ -38,3 +47,17 @@ class TelegramAdvertiserModel(SQLAlchemyBaseModel, SQLAlchemyTimestampMixin):
     )
 
     advertiser = relationship("AdvertiserModel", backref="telegram_users")
+
+
+class MLScoreSnapshotModel(Base):
+    __tablename__ = "ml_score_snapshots"
+
+    version: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    status: Mapped[str] = mapped_column(String(length=20), nullable=False)
+    row_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    activated_at: Mapped[datetime] = mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=False
+    )
+    retired_at: Mapped[Optional[datetime]] = mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=True
+    )
@@ -1,11 +1,16 @@
 from datetime import UTC, datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID, uuid4
 
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.domain.advertisers.entities import AdvertiserEntity, MLScoreEntity
+from src.common.types import BULK_UPSERT_CHUNK_SIZE
+from src.domain.advertisers.entities import (
+    AdvertiserEntity,
+    MLScoreEntity,
+    MLScoreRejectEntity,
+)
 from src.domain.advertisers.exceptions import (
     AdvertiserNotFoundException,
     AdvertiserRepositoryError,
@@ -13,6 +18,10 @@ from src.domain.advertisers.exceptions import (
     TelegramLinkError,
 )
 from src.domain.advertisers.interfaces import AdvertisersRepositoryProtocol
+from src.domain.advertisers.types import (
+    ML_SCORE_REJECT_ADVERTISER_NOT_FOUND,
+    ML_SCORE_REJECT_CLIENT_NOT_FOUND,
+)
 from src.domain.clients.exceptions import ClientNotFoundException
 from src.domain.clients.interfaces import ClientsRepositoryProtocol
 from src.infrastructure.advertisers.mappers import AdvertisersMapper, MLScoreMapper
@@ -40,53 +49,41 @@ class AdvertisersRepository:
         self, entities: List[AdvertiserEntity]
     ) -> List[AdvertiserEntity]:
         try:
-            models: List[AdvertiserModel] = []
-            current_time = datetime.now(UTC)
             latest_entities = {entity.id: entity for entity in entities}
+            rows = list(latest_entities.values())
+            upserted: Dict[UUID, AdvertiserEntity] = {}
 
-            for entity_id, entity in latest_entities.items():
+            for start in range(0, len(rows), BULK_UPSERT_CHUNK_SIZE):
+                chunk = rows[start : start + BULK_UPSERT_CHUNK_SIZE]
                 result = await self._session.execute(
-                    text("SELECT * FROM advertisers WHERE id = :id"), {"id": entity_id}
+                    text("""
+                        INSERT INTO advertisers (id, name, created_at, updated_at)
+                        SELECT id, name, :current_time, :current_time
+                        FROM unnest(
+                            CAST(:ids AS uuid[]), CAST(:names AS varchar[])
+                        ) AS t(id, name)
+                        ON CONFLICT (id) DO UPDATE
+                        SET name = EXCLUDED.name,
+                            updated_at = EXCLUDED.updated_at
+                        WHERE advertisers.name IS DISTINCT FROM EXCLUDED.name
+                        RETURNING *
+                    """),
+                    {
+                        "ids": [entity.id for entity in chunk],
+                        "names": [entity.name for entity in chunk],
+                        "current_time": datetime.now(UTC),
+                    },
                 )
-                existing = result.mappings().first()
-
-                if existing:
-                    await self._session.execute(
-                        text("""
-                            UPDATE advertisers 
-                            SET name = :name, 
-                                updated_at = :updated_at
-                            WHERE id = :id
-                        """),
-                        {
-                            "id": entity_id,
-                            "name": entity.name,
-                            "updated_at": current_time,
-                        },
+                for model in result.mappings().all():
+                    upserted[model["id"]] = self._mapper.from_model_to_entity(
+                        AdvertiserModel(**model)
                     )
-                else:
-                    await self._session.execute(
-                        text("""
-                            INSERT INTO advertisers (id, name, created_at, updated_at)
-                            VALUES (:id, :name, :created_at, :updated_at)
-                        """),
-                        {
-                            "id": entity_id,
-                            "name": entity.name,
-                            "created_at": current_time,
-                            "updated_at": current_time,
-                        },
-                    )
-
-                result = await self._session.execute(
-                    text("SELECT * FROM advertisers WHERE id = :id"), {"id": entity_id}
-                )
-                model = result.mappings().one()
-                count = sum(1 for e in entities if e.id == entity_id)
-                models.extend([AdvertiserModel(**model)] * count)
 
             await self._session.flush()
-            return [self._mapper.from_model_to_entity(model) for model in models]
+            return [
+                upserted.get(entity.id, latest_entities[entity.id])
+                for entity in entities
+            ]
         except SQLAlchemyError as e:
             raise AdvertiserRepositoryError(f"Db error during bulk upsert: {str(e)}")
 
@@ -176,55 +173,108 @@ class MLScoreRepository:
             await self._advertisers_repository.get_by_id(entity.advertiser_id)
 
             current_time = datetime.now(UTC)
-            result = await self._session.execute(
+            await self._session.execute(
                 text("""
-                    SELECT * FROM ml_scores 
-                    WHERE client_id = :client_id AND advertiser_id = :advertiser_id
+                    INSERT INTO ml_scores (
+                        id, client_id, advertiser_id, score, created_at, updated_at
+                    ) VALUES (
+                        :id, :client_id, :advertiser_id, :score, :created_at, :updated_at
+                    )
+                    ON CONFLICT (client_id, advertiser_id) DO UPDATE
+                    SET score = EXCLUDED.score,
+                        updated_at = EXCLUDED.updated_at
+                    WHERE ml_scores.score IS DISTINCT FROM EXCLUDED.score
                 """),
-                {"client_id": entity.client_id, "advertiser_id": entity.advertiser_id},
+                {
+                    "id": uuid4(),
+                    "client_id": entity.client_id,
+                    "advertiser_id": entity.advertiser_id,
+                    "score": entity.score,
+                    "created_at": current_time,
+                    "updated_at": current_time,
+                },
             )
-            existing = result.mappings().first()
+        except ClientNotFoundException as e:
+            raise ClientNotFoundException(str(e))
+        except AdvertiserNotFoundException as e:
+            raise AdvertiserNotFoundException(str(e))
+        except SQLAlchemyError as e:
+            raise MLScoreRepositoryError(f"Failed to upsert ML score: {str(e)}")
 
-            if existing:
-                await self._session.execute(
-                    text("""
-                        UPDATE ml_scores 
-                        SET score = :score,
-                            updated_at = :updated_at
-                        WHERE client_id = :client_id 
-                        AND advertiser_id = :advertiser_id
-                    """),
-                    {
-                        "client_id": entity.client_id,
-                        "advertiser_id": entity.advertiser_id,
-                        "score": entity.score,
-                        "updated_at": current_time,
-                    },
-                )
-            else:
-                await self._session.execute(
+    async def bulk_upsert_ml_scores(
+        self, entities: List[MLScoreEntity]
+    ) -> List[MLScoreRejectEntity]:
+        try:
+            latest_entities = {
+                (entity.client_id, entity.advertiser_id): entity for entity in entities
+            }
+            rows = list(latest_entities.values())
+            rejects: List[MLScoreRejectEntity] = []
+
+            for start in range(0, len(rows), BULK_UPSERT_CHUNK_SIZE):
+                chunk = rows[start : start + BULK_UPSERT_CHUNK_SIZE]
+                result = await self._session.execute(
                     text("""
-                        INSERT INTO ml_scores (
-                            id, client_id, advertiser_id, score, created_at, updated_at
-                        ) VALUES (
-                            :id, :client_id, :advertiser_id, :score, :created_at, :updated_at
+                        WITH input AS (
+                            SELECT
+                                t.client_id,
+                                t.advertiser_id,
+                                t.score,
+                                EXISTS (
+                                    SELECT 1 FROM clients c WHERE c.id = t.client_id
+                                ) AS client_exists,
+                                EXISTS (
+                                    SELECT 1 FROM advertisers a WHERE a.id = t.advertiser_id
+                                ) AS advertiser_exists
+                            FROM unnest(
+                                CAST(:client_ids AS uuid[]),
+                                CAST(:advertiser_ids AS uuid[]),
+                                CAST(:scores AS integer[])
+                            ) AS t(client_id, advertiser_id, score)
+                        ),
+                        upserted AS (
+                            INSERT INTO ml_scores (
+                                id, client_id, advertiser_id, score, created_at, updated_at
+                            )
+                            SELECT
+                                gen_random_uuid(),
+                                client_id,
+                                advertiser_id,
+                                score,
+                                :current_time,
+                                :current_time
+                            FROM input
+                            WHERE client_exists AND advertiser_exists
+                            ON CONFLICT (client_id, advertiser_id) DO UPDATE
+                            SET score = EXCLUDED.score,
+                                updated_at = EXCLUDED.updated_at
+                            WHERE ml_scores.score IS DISTINCT FROM EXCLUDED.score
                         )
+                        SELECT client_id, advertiser_id, client_exists, advertiser_exists
+                        FROM input
+                        WHERE NOT (client_exists AND advertiser_exists)
                     """),
                     {
-                        "id": uuid4(),
-                        "client_id": entity.client_id,
-                        "advertiser_id": entity.advertiser_id,
-                        "score": entity.score,
-                        "created_at": current_time,
-                        "updated_at": current_time,
+                        "client_ids": [entity.client_id for entity in chunk],
+                        "advertiser_ids": [entity.advertiser_id for entity in chunk],
+                        "scores": [entity.score for entity in chunk],
+                        "current_time": datetime.now(UTC),
                     },
                 )
-        except ClientNotFoundException as e:
-            raise ClientNotFoundException(str(e))
-        except AdvertiserNotFoundException as e:
-            raise AdvertiserNotFoundException(str(e))
+                for row in result.mappings().all():
+                    rejects.append(
+                        MLScoreRejectEntity(
+                            client_id=row["client_id"],
+                            advertiser_id=row["advertiser_id"],
+                            reason=ML_SCORE_REJECT_CLIENT_NOT_FOUND
+                            if not row["client_exists"]
+                            else ML_SCORE_REJECT_ADVERTISER_NOT_FOUND,
+                        )
+                    )
+
+            return rejects
         except SQLAlchemyError as e:
-            raise MLScoreRepositoryError(f"Failed to upsert ML score: {str(e)}")
+            raise MLScoreRepositoryError(f"Failed to bulk upsert ML scores: {str(e)}")
 
     async def get_ml_score(self, client_id: UUID, advertiser_id: UUID) -> int | None:
         try:
@@ -245,3 +295,26 @@ class MLScoreRepository:
             raise AdvertiserNotFoundException(str(e))
         except SQLAlchemyError as e:
             raise MLScoreRepositoryError(f"Failed to get ML score: {str(e)}")
+
+
+async def ensure_ml_scores_unique_key(session: AsyncSession) -> None:
+    await session.execute(
+        text("""
+            DELETE FROM ml_scores m
+            USING ml_scores newer
+            WHERE m.client_id = newer.client_id
+            AND m.advertiser_id = newer.advertiser_id
+            AND (m.updated_at, m.id) < (newer.updated_at, newer.id)
+            AND NOT EXISTS (
+                SELECT 1 FROM pg_indexes
+                WHERE indexname = 'uq_ml_scores_client_advertiser'
+            )
+        """)
+    )
+    await session.execute(
+        text("""
+            CREATE UNIQUE INDEX IF NOT EXISTS uq_ml_scores_client_advertiser
+            ON ml_scores (client_id, advertiser_id)
+        """)
+    )
+    await session.commit()
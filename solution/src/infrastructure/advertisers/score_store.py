@@ -0,0 +1,164 @@
+import asyncio
+import sys
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from prometheus_client import Gauge
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.core.db import async_session_maker
+from src.domain.advertisers.types import ML_SCORE_STORE_FETCH_SIZE
+
+logger = getLogger(__name__)
+
+ml_score_store_scores = Gauge(
+    "ml_score_store_scores",
+    "ML scores held by the in-process score store",
+)
+ml_score_store_bytes = Gauge(
+    "ml_score_store_bytes",
+    "Approximate memory used by the in-process score store",
+)
+ml_score_store_bytes_per_million_scores = Gauge(
+    "ml_score_store_bytes_per_million_scores",
+    "Approximate store memory normalised to one million scores",
+)
+
+
+@dataclass
+class _ScoreTable:
+    # CSR layout: scores of client i live in [offsets[i], offsets[i + 1]),
+    # sorted by advertiser index so a lookup is a bisect inside that slice.
+    clients: Dict[UUID, int] = field(default_factory=dict)
+    advertisers: Dict[UUID, int] = field(default_factory=dict)
+    offsets: array = field(default_factory=lambda: array("I", [0]))
+    advertiser_indexes: array = field(default_factory=lambda: array("I"))
+    scores: array = field(default_factory=lambda: array("i"))
+
+    def get(self, client_id: UUID, advertiser_id: UUID) -> Optional[int]:
+        client = self.clients.get(client_id)
+        advertiser = self.advertisers.get(advertiser_id)
+        if client is None or advertiser is None:
+            return None
+        start, end = self.offsets[client], self.offsets[client + 1]
+        position = bisect_left(self.advertiser_indexes, advertiser, start, end)
+        if position < end and self.advertiser_indexes[position] == advertiser:
+            return self.scores[position]
+        return None
+
+    def memory_bytes(self) -> int:
+        arrays = (self.offsets, self.advertiser_indexes, self.scores)
+        keys = list(self.clients) + list(self.advertisers)
+        key_bytes = sum(sys.getsizeof(key) + sys.getsizeof(key.int) for key in keys)
+        return (
+            sum(item.buffer_info()[1] * item.itemsize for item in arrays)
+            + sys.getsizeof(self.clients)
+            + sys.getsizeof(self.advertisers)
+            + key_bytes
+        )
+
+
+class MLScoreStore:
+    def __init__(self, session_maker: Optional[async_sessionmaker] = None) -> None:
+        self._session_maker = session_maker
+        self._table: Optional[_ScoreTable] = None
+        self._overlay: Dict[Tuple[UUID, UUID], int] = {}
+        self._pending: Optional[Dict[Tuple[UUID, UUID], int]] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._table is not None
+
+    def get_scores(
+        self, client_id: UUID, advertiser_ids: Iterable[UUID]
+    ) -> Dict[UUID, int]:
+        scores: Dict[UUID, int] = {}
+        if self._table is None:
+            return scores
+        for advertiser_id in advertiser_ids:
+            score = self._overlay.get((client_id, advertiser_id))
+            if score is None:
+                score = self._table.get(client_id, advertiser_id)
+            if score is not None:
+                scores[advertiser_id] = score
+        return scores
+
+    def set_score(self, client_id: UUID, advertiser_id: UUID, score: int) -> None:
+        self._overlay[(client_id, advertiser_id)] = score
+        if self._pending is not None:
+            self._pending[(client_id, advertiser_id)] = score
+
+    async def load(self, session: AsyncSession) -> None:
+        self._pending = {}
+        try:
+            table = await self._build(session, self._pending)
+            self._table, self._overlay = table, self._pending
+        finally:
+            self._pending = None
+
+        self._publish_metrics(table)
+        logger.info(
+            f"ML score store loaded {len(table.scores)} scores "
+            f"for {len(table.clients)} clients"
+        )
+
+    async def reload(self) -> None:
+        if self._session_maker is None:
+            raise RuntimeError("ML score store has no session maker to reload from")
+        async with self._session_maker() as session:
+            await self.load(session)
+
+    async def refresh_forever(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.reload()
+            except Exception as e:
+                logger.warning(f"Failed to refresh ML score store: {e}")
+
+    @staticmethod
+    async def _build(
+        session: AsyncSession, overlay: Dict[Tuple[UUID, UUID], int]
+    ) -> _ScoreTable:
+        table = _ScoreTable()
+        result = await session.execute(text("SELECT id FROM advertisers ORDER BY id"))
+        for index, advertiser_id in enumerate(result.scalars()):
+            table.advertisers[advertiser_id] = index
+
+        stream = await session.stream(
+            text("""
+                SELECT client_id, advertiser_id, score FROM ml_scores
+                ORDER BY client_id, advertiser_id
+            """),
+            execution_options={"yield_per": ML_SCORE_STORE_FETCH_SIZE},
+        )
+        async for client_id, advertiser_id, score in stream:
+            advertiser = table.advertisers.get(advertiser_id)
+            if advertiser is None:
+                # Advertiser created between the two queries, not indexed yet.
+                overlay[(client_id, advertiser_id)] = score
+                continue
+            if client_id not in table.clients:
+                table.clients[client_id] = len(table.clients)
+                table.offsets.append(len(table.scores))
+            table.advertiser_indexes.append(advertiser)
+            table.scores.append(score)
+            table.offsets[-1] = len(table.scores)
+        return table
+
+    @staticmethod
+    def _publish_metrics(table: _ScoreTable) -> None:
+        memory = table.memory_bytes()
+        ml_score_store_scores.set(len(table.scores))
+        ml_score_store_bytes.set(memory)
+        if table.scores:
+            ml_score_store_bytes_per_million_scores.set(
+                memory * 1_000_000 / len(table.scores)
+            )
+
+
+ml_score_store = MLScoreStore(async_session_maker)
@@ -1,17 +1,19 @@
+import hashlib
 import json
-import os
-import tempfile
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from json import JSONDecodeError
-from typing import TypeVar, cast
+from logging import getLogger
+from typing import Any, AsyncIterator, Dict, List, Optional, TypeVar, cast
 
-import aiohttp
-from fastapi.responses import FileResponse
 from src.application.ai.dtos import (
     GeneratedAdResponse,
     ImageDescriptionResponse,
+    ModerationBatchResponse,
     ModerationResponse,
 )
+from src.core.http import HttpClient
+from src.core.resilience import CircuitOpenError, ProviderGuard, RateLimitExceededError
 from src.core.settings import Settings
 from src.domain.ai.exceptions import (
     AIAuthenticationError,
@@ -19,12 +21,31 @@ from src.domain.ai.exceptions import (
     AIContentModerationError,
     AIImageGenerationError,
     AIInvalidResponseFormat,
+    AIProviderUnavailableError,
     AIRateLimitError,
     AIRequestError,
     AIResponseParsingError,
+    AIResultCacheError,
 )
+from src.domain.ai.interfaces import AIBackendProtocol, AIResultCacheProtocol
+from src.domain.ai.types import (
+    AI_CACHE_KIND_AD_GENERATION,
+    AI_CACHE_KIND_MODERATION,
+    AI_PROMPT_VERSION,
+)
+from src.infrastructure.ai.backends import create_ai_backend
+from src.infrastructure.ai.cache import ai_result_cache_requests_total
+from src.infrastructure.ai.providers import cloudflare_guard, openrouter_guard
+
+logger = getLogger(__name__)
 
-T = TypeVar("T", GeneratedAdResponse, ModerationResponse, ImageDescriptionResponse)
+T = TypeVar(
+    "T",
+    GeneratedAdResponse,
+    ModerationResponse,
+    ModerationBatchResponse,
+    ImageDescriptionResponse,
+)
 
 
 @dataclass
@@ -90,83 +111,103 @@ class AIPrompts:
 - Если вероятность выше 0.70, устанавливай true для этой категории
 - В объяснении укажи конкретные слова или фразы, которые повлияли на оценку"""
 
+    MODERATION_BATCH_CHECK = """Ты - профессиональный модератор контента. Проанализируй каждый из следующих текстов на наличие запрещенного содержания. Тексты пронумерованы и разделены строкой "---":
+
+{texts}
+
+Оцени каждый текст отдельно по трем категориям:
+- profanity (нецензурная лексика): мат, завуалированная нецензурная лексика, грубые просторечные выражения
+- offensive (оскорбительный контент): оскорбления, дискриминация, агрессия, призывы к насилию, угрозы
+- inappropriate (неприемлемый контент): сексуальный подтекст, намеки на нелегальную деятельность, пропаганда опасного поведения
+
+Устанавливай true для категории, только если вероятность нарушения выше 0.70.
+
+Важно: Верни ответ строго в следующем формате JSON, по одному элементу на каждый текст в том же порядке:
+{{"results": [{{"index": 1, "profanity": true/false, "offensive": true/false, "inappropriate": true/false}}]}}"""
+
 
 class AIService:
-    def __init__(self, settings: Settings):
-        self.api_key = settings.ai_api_key
-        self.api_url = "https://openrouter.ai/api/v1/chat/completions"
-        self.model = "google/gemini-2.0-flash-lite-preview-02-05:free"
+    def __init__(
+        self,
+        settings: Settings,
+        http_client: HttpClient,
+        result_cache: Optional[AIResultCacheProtocol] = None,
+        openrouter_guard: ProviderGuard = openrouter_guard,
+        cloudflare_guard: ProviderGuard = cloudflare_guard,
+        backend: Optional[AIBackendProtocol] = None,
+    ):
+        self.backend = backend or create_ai_backend(settings, http_client)
         self.prompts = AIPrompts()
         self.settings = settings
+        self.http_client = http_client
+        self.result_cache = result_cache
+        self.openrouter_guard = openrouter_guard
+        self.cloudflare_guard = cloudflare_guard
+
+    @staticmethod
+    @asynccontextmanager
+    async def _guarded(guard: ProviderGuard) -> AsyncIterator[None]:
+        try:
+            async with guard.slot():
+                yield
+        except CircuitOpenError as e:
+            raise AIProviderUnavailableError(str(e))
+        except RateLimitExceededError as e:
+            raise AIRateLimitError(str(e))
+
+    def _cache_key(self, kind: str, *inputs: str) -> str:
+        payload = json.dumps(
+            [self.backend.model, AI_PROMPT_VERSION, kind, *inputs], ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def _get_cached(
+        self, kind: str, keys: List[str], bypass_cache: bool = False
+    ) -> List[Optional[Dict[str, Any]]]:
+        if self.result_cache is None:
+            return [None for _ in keys]
+        if bypass_cache:
+            ai_result_cache_requests_total.labels(kind, "bypass").inc(len(keys))
+            return [None for _ in keys]
+
+        try:
+            cached = await self.result_cache.get_many(keys)
+        except AIResultCacheError as e:
+            logger.warning(f"AI result cache unavailable: {e}")
+            cached = [None for _ in keys]
+        hits = sum(value is not None for value in cached)
+        ai_result_cache_requests_total.labels(kind, "hit").inc(hits)
+        ai_result_cache_requests_total.labels(kind, "miss").inc(len(keys) - hits)
+        return cached
+
+    async def _store_cached(self, items: Dict[str, Dict[str, Any]]) -> None:
+        if self.result_cache is None or not items:
+            return
+        try:
+            await self.result_cache.set_many(items)
+        except AIResultCacheError as e:
+            logger.warning(f"AI result cache unavailable: {e}")
 
     async def _make_api_request(
         self, prompt: str, expected_fields: list[str], response_type: type[T]
     ) -> T:
         try:
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.post(
-                        url=self.api_url,
-                        headers={
-                            "Authorization": f"Bearer {self.api_key}",
-                            "Content-Type": "application/json",
-                        },
-                        json={
-                            "model": self.model,
-                            "messages": [
-                                {
-                                    "role": "user",
-                                    "content": [{"type": "text", "text": prompt}],
-                                }
-                            ],
-                        },
-                    ) as response:
-                        if response.status == 401:
-                            raise AIAuthenticationError(
-                                "Неверный API ключ или аутентификация не удалась"
-                            )
-                        elif response.status == 429:
-                            raise AIRateLimitError()
-                        elif response.status != 200:
-                            error_text = await response.text()
-                            raise AIRequestError(
-                                f"Запрос API не выполнен: {error_text}"
-                            )
-
-                        try:
-                            data = await response.json()
-                        except JSONDecodeError as e:
-                            raise AIResponseParsingError(
-                                f"Не удалось разобрать ответ API: {str(e)}"
-                            )
-
-                        try:
-                            ai_response = data["choices"][0]["message"]["content"]
-                        except (KeyError, IndexError) as e:
-                            raise AIInvalidResponseFormat(
-                                f"Непредвиденная структура ответа: {str(e)}"
-                            )
-
-                        cleaned_response = ai_response.strip()
-                        cleaned_response = (
-                            cleaned_response.replace("```json", "")
-                            .replace("```", "")
-                            .strip()
-                        )
-
-                        try:
-                            response_json = json.loads(cleaned_response)
-                        except JSONDecodeError as e:
-                            raise AIResponseParsingError(
-                                f"Не удалось разобрать ответ API: {str(e)}"
-                            )
-
-                        return cast(T, response_json)
-
-                except aiohttp.ClientError as e:
-                    raise AIConnectionError(
-                        f"Не удалось подключиться к сервису AI: {str(e)}"
-                    )
+            async with self._guarded(self.openrouter_guard):
+                ai_response = await self.backend.complete(prompt, expected_fields)
+
+            cleaned_response = ai_response.strip()
+            cleaned_response = (
+                cleaned_response.replace("```json", "").replace("```", "").strip()
+            )
+
+            try:
+                response_json = json.loads(cleaned_response)
+            except JSONDecodeError as e:
+                raise AIResponseParsingError(
+                    f"Не удалось разобрать ответ API: {str(e)}"
+                )
+
+            return cast(T, response_json)
 
         except Exception as e:
             if isinstance(
@@ -177,6 +218,7 @@ class AIService:
                     AIContentModerationError,
                     AIImageGenerationError,
                     AIInvalidResponseFormat,
+                    AIProviderUnavailableError,
                     AIRateLimitError,
                     AIRequestError,
                     AIResponseParsingError,
@@ -186,22 +228,92 @@ class AIService:
             raise AIRequestError(f"Непредвиденная ошибка при запросе AI: {str(e)}")
 
     async def generate_ad(
-        self, advertiser_name: str, ad_title: str
+        self, advertiser_name: str, ad_title: str, bypass_cache: bool = False
     ) -> GeneratedAdResponse:
+        key = self._cache_key(AI_CACHE_KIND_AD_GENERATION, advertiser_name, ad_title)
+        (cached,) = await self._get_cached(
+            AI_CACHE_KIND_AD_GENERATION, [key], bypass_cache
+        )
+        if cached is not None:
+            return cast(GeneratedAdResponse, cached)
+
         prompt = self.prompts.AD_GENERATION.format(
             advertiser_name=advertiser_name, ad_title=ad_title
         )
-        return await self._make_api_request(
+        response = await self._make_api_request(
             prompt, ["generated_text"], GeneratedAdResponse
         )
+        await self._store_cached({key: dict(response)})
+        return response
 
     async def check_forbidden_words(self, text: str) -> ModerationResponse:
+        key = self._cache_key(AI_CACHE_KIND_MODERATION, text)
+        (cached,) = await self._get_cached(AI_CACHE_KIND_MODERATION, [key])
+        if cached is not None:
+            return self._moderation_verdict(cached)
+
         prompt = self.prompts.MODERATION_CHECK.format(text=text)
-        return await self._make_api_request(
+        response = await self._make_api_request(
             prompt, ["profanity", "offensive", "inappropriate"], ModerationResponse
         )
+        try:
+            verdict = self._moderation_verdict(response)
+        except (KeyError, TypeError) as e:
+            raise AIInvalidResponseFormat(
+                f"Непредвиденная структура ответа модерации: {str(e)}"
+            )
+        await self._store_cached({key: dict(verdict)})
+        return verdict
+
+    async def check_forbidden_words_batch(
+        self, texts: List[str]
+    ) -> List[ModerationResponse]:
+        # Verdicts are cached per text and shared with check_forbidden_words,
+        # only texts without one are sent to the model.
+        keys = [self._cache_key(AI_CACHE_KIND_MODERATION, text) for text in texts]
+        cached = await self._get_cached(AI_CACHE_KIND_MODERATION, keys)
+        missing = [index for index, value in enumerate(cached) if value is None]
+        fresh: Dict[str, ModerationResponse] = {}
+
+        if missing:
+            prompt = self.prompts.MODERATION_BATCH_CHECK.format(
+                texts="\n---\n".join(
+                    f"{number}. {texts[index]}"
+                    for number, index in enumerate(missing, start=1)
+                )
+            )
+            response = await self._make_api_request(
+                prompt, ["results"], ModerationBatchResponse
+            )
+
+            try:
+                verdicts = {int(item["index"]): item for item in response["results"]}
+                fresh = {
+                    keys[index]: self._moderation_verdict(verdicts[number])
+                    for number, index in enumerate(missing, start=1)
+                }
+            except (KeyError, TypeError, ValueError) as e:
+                raise AIInvalidResponseFormat(
+                    f"Непредвиденная структура ответа модерации: {str(e)}"
+                )
+            await self._store_cached(
+                {key: dict(verdict) for key, verdict in fresh.items()}
+            )
+
+        return [
+            self._moderation_verdict(value) if value is not None else fresh[key]
+            for key, value in zip(keys, cached)
+        ]
+
+    @staticmethod
+    def _moderation_verdict(response: Dict[str, Any]) -> ModerationResponse:
+        return ModerationResponse(
+            profanity=bool(response["profanity"]),
+            offensive=bool(response["offensive"]),
+            inappropriate=bool(response["inappropriate"]),
+        )
 
-    async def generate_image(self, ad_title: str, ad_text: str) -> FileResponse:
+    async def generate_image(self, ad_title: str, ad_text: str) -> bytes:
         image_prompt = f"""Create a focused, single-subject advertising image description for {ad_title}:
         The image should highlight one key element from this advertising text: {ad_text}
         
@@ -222,44 +334,8 @@ class AIService:
             )
             image_description = description_response["image_description"]
 
-            cloudflare_url = f"https://api.cloudflare.com/client/v4/accounts/{self.settings.cloudflare_account_id}/ai/run/{self.settings.cloudflare_model}"
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url=cloudflare_url,
-                    headers={
-                        "Authorization": f"Bearer {self.settings.cloudflare_api_token}",
-                        "Content-Type": "application/json",
-                    },
-                    json={"prompt": image_description},
-                ) as response:
-                    if response.status == 401:
-                        raise AIAuthenticationError(
-                            "Неверные учетные данные Cloudflare"
-                        )
-                    elif response.status == 429:
-                        raise AIRateLimitError("Превышен лимит API Cloudflare")
-                    elif response.status != 200:
-                        error_text = await response.text()
-                        raise AIImageGenerationError(
-                            f"Не удалось сгенерировать изображение: {error_text}"
-                        )
-
-                    image_content = await response.read()
-
-                    temp_dir = tempfile.gettempdir()
-                    temp_file_path = os.path.join(
-                        temp_dir, f"generated_ad_{ad_title.replace(' ', '_')}.png"
-                    )
-
-                    with open(temp_file_path, "wb") as f:
-                        f.write(image_content)
-
-                    return FileResponse(
-                        temp_file_path,
-                        media_type="image/png",
-                        filename=f"generated_ad_{ad_title.replace(' ', '_')}.png",
-                    )
+            async with self._guarded(self.cloudflare_guard):
+                return await self.backend.generate_image(image_description)
 
         except Exception as e:
             if isinstance(
@@ -268,6 +344,7 @@ class AIService:
                     AIAuthenticationError,
                     AIConnectionError,
                     AIImageGenerationError,
+                    AIProviderUnavailableError,
                     AIRateLimitError,
                 ),
             ):
@@ -0,0 +1,242 @@
+import asyncio
+import hashlib
+import json
+import math
+import random
+import struct
+import zlib
+from json import JSONDecodeError
+from typing import List, Optional
+
+import aiohttp
+from src.core.http import HttpClient, http_client
+from src.core.settings import Settings, settings
+from src.domain.ai.exceptions import (
+    AIAuthenticationError,
+    AIConnectionError,
+    AIImageGenerationError,
+    AIInvalidResponseFormat,
+    AIProviderUnavailableError,
+    AIRateLimitError,
+    AIRequestError,
+    AIResponseParsingError,
+)
+from src.domain.ai.interfaces import AIBackendProtocol
+from src.domain.ai.types import AI_BACKEND_LOCAL
+
+
+def _retry_after(response: aiohttp.ClientResponse) -> Optional[float]:
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+class RemoteAIBackend:
+    def __init__(self, settings: Settings, http_client: HttpClient) -> None:
+        self.api_key = settings.ai_api_key
+        self.api_url = "https://openrouter.ai/api/v1/chat/completions"
+        self.model = "google/gemini-2.0-flash-lite-preview-02-05:free"
+        self.settings = settings
+        self.http_client = http_client
+
+    async def complete(self, prompt: str, expected_fields: List[str]) -> str:
+        session = await self.http_client.get_session()
+        try:
+            async with session.post(
+                url=self.api_url,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": self.model,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": [{"type": "text", "text": prompt}],
+                        }
+                    ],
+                },
+            ) as response:
+                if response.status == 401:
+                    raise AIAuthenticationError(
+                        "Неверный API ключ или аутентификация не удалась"
+                    )
+                elif response.status == 429:
+                    raise AIRateLimitError(retry_after=_retry_after(response))
+                elif response.status >= 500:
+                    error_text = await response.text()
+                    raise AIProviderUnavailableError(
+                        f"Сервис AI недоступен: {error_text}"
+                    )
+                elif response.status != 200:
+                    error_text = await response.text()
+                    raise AIRequestError(f"Запрос API не выполнен: {error_text}")
+
+                try:
+                    data = await response.json()
+                except JSONDecodeError as e:
+                    raise AIResponseParsingError(
+                        f"Не удалось разобрать ответ API: {str(e)}"
+                    )
+
+                try:
+                    return data["choices"][0]["message"]["content"]
+                except (KeyError, IndexError) as e:
+                    raise AIInvalidResponseFormat(
+                        f"Непредвиденная структура ответа: {str(e)}"
+                    )
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise AIConnectionError(f"Не удалось подключиться к сервису AI: {str(e)}")
+
+    async def generate_image(self, prompt: str) -> bytes:
+        cloudflare_url = f"https://api.cloudflare.com/client/v4/accounts/{self.settings.cloudflare_account_id}/ai/run/{self.settings.cloudflare_model}"
+
+        session = await self.http_client.get_session()
+        try:
+            async with session.post(
+                url=cloudflare_url,
+                headers={
+                    "Authorization": f"Bearer {self.settings.cloudflare_api_token}",
+                    "Content-Type": "application/json",
+                },
+                json={"prompt": prompt},
+            ) as response:
+                if response.status == 401:
+                    raise AIAuthenticationError("Неверные учетные данные Cloudflare")
+                elif response.status == 429:
+                    raise AIRateLimitError(
+                        "Превышен лимит API Cloudflare",
+                        retry_after=_retry_after(response),
+                    )
+                elif response.status >= 500:
+                    error_text = await response.text()
+                    raise AIProviderUnavailableError(
+                        f"Cloudflare недоступен: {error_text}"
+                    )
+                elif response.status != 200:
+                    error_text = await response.text()
+                    raise AIImageGenerationError(
+                        f"Не удалось сгенерировать изображение: {error_text}"
+                    )
+
+                return await response.read()
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise AIConnectionError(f"Не удалось подключиться к Cloudflare: {str(e)}")
+
+
+class LocalAIBackend:
+    """Offline stand-in for the providers, for load tests without network.
+
+    Answers are derived from a hash of the prompt, so equal prompts get equal
+    answers; latency, provider errors and 429s are drawn from a seeded RNG.
+    """
+
+    model = "local"
+
+    AD_TEMPLATES = (
+        "Откройте для себя новинку уже сегодня — предложение ограничено!",
+        "Технологии будущего доступны прямо сейчас. Успейте первыми!",
+        "Эксклюзивное предложение для тех, кто ценит инновации.",
+    )
+
+    def __init__(self, settings: Settings) -> None:
+        self.distribution = settings.ai_local_latency_distribution
+        self.latency_ms = settings.ai_local_latency_ms
+        self.image_latency_ms = settings.ai_local_image_latency_ms
+        self.spread = settings.ai_local_latency_spread
+        self.error_rate = settings.ai_local_error_rate
+        self.rate_limit_rate = settings.ai_local_rate_limit_rate
+        self.retry_after_seconds = settings.ai_local_retry_after_seconds
+        self._random = random.Random(settings.ai_local_seed)
+
+    def _sample_latency(self, median_ms: float) -> float:
+        if median_ms <= 0:
+            return 0.0
+        if self.distribution == "fixed":
+            latency = median_ms
+        elif self.distribution == "uniform":
+            latency = self._random.uniform(
+                median_ms * (1 - self.spread), median_ms * (1 + self.spread)
+            )
+        elif self.distribution == "normal":
+            latency = self._random.gauss(median_ms, median_ms * self.spread)
+        else:
+            # Long right tail, the usual shape of LLM response times.
+            latency = self._random.lognormvariate(math.log(median_ms), self.spread)
+        return max(0.0, latency) / 1000
+
+    async def _simulate_call(self, median_ms: float) -> None:
+        if self._random.random() < self.rate_limit_rate:
+            raise AIRateLimitError(
+                "Local backend injected rate limit",
+                retry_after=self.retry_after_seconds,
+            )
+        await asyncio.sleep(self._sample_latency(median_ms))
+        if self._random.random() < self.error_rate:
+            raise AIProviderUnavailableError("Local backend injected provider error")
+
+    async def complete(self, prompt: str, expected_fields: List[str]) -> str:
+        await self._simulate_call(self.latency_ms)
+        digest = hashlib.sha256(prompt.encode()).digest()
+
+        if "results" in expected_fields:
+            # Batch prompts join the numbered texts with this separator.
+            count = prompt.count("\n---\n") + 1
+            response: dict = {
+                "results": [
+                    {
+                        "index": index,
+                        "profanity": False,
+                        "offensive": False,
+                        "inappropriate": False,
+                    }
+                    for index in range(1, count + 1)
+                ]
+            }
+        elif "generated_text" in expected_fields:
+            response = {
+                "generated_text": self.AD_TEMPLATES[digest[0] % len(self.AD_TEMPLATES)]
+            }
+        elif "image_description" in expected_fields:
+            response = {"image_description": f"Studio shot {digest.hex()[:12]}"}
+        else:
+            response = {field: False for field in expected_fields}
+        return json.dumps(response, ensure_ascii=False)
+
+    async def generate_image(self, prompt: str) -> bytes:
+        await self._simulate_call(self.image_latency_ms)
+        return self._solid_png(hashlib.sha256(prompt.encode()).digest()[:3])
+
+    @staticmethod
+    def _solid_png(color: bytes, size: int = 64) -> bytes:
+        def chunk(kind: bytes, data: bytes) -> bytes:
+            body = kind + data
+            return (
+                struct.pack(">I", len(data))
+                + body
+                + struct.pack(">I", zlib.crc32(body))
+            )
+
+        header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+        rows = (b"\x00" + color * size) * size
+        return (
+            b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(rows))
+            + chunk(b"IEND", b"")
+        )
+
+
+def create_ai_backend(settings: Settings, http_client: HttpClient) -> AIBackendProtocol:
+    if settings.ai_backend == AI_BACKEND_LOCAL:
+        return LocalAIBackend(settings)
+    return RemoteAIBackend(settings, http_client)
+
+
+# Shared by every AIService in the process: the local backend's seeded RNG
+# has to advance across requests, not restart with each new service.
+ai_backend = create_ai_backend(settings, http_client)
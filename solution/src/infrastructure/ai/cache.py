@@ -0,0 +1,63 @@
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+import redis.asyncio as redis
+from prometheus_client import Counter
+from src.domain.ai.exceptions import AIResultCacheError
+
+ai_result_cache_requests_total = Counter(
+    "ai_result_cache_requests_total",
+    "AI result cache lookups",
+    ["kind", "result"],
+)
+
+
+class AIResultCacheRepository:
+    KEY_PREFIX = "ai:result:"
+    INDEX_KEY = "ai:result:index"
+    # Entries are indexed by write time; expired and oldest entries beyond the
+    # size bound are evicted on every write.
+    STORE_SCRIPT = """
+        redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+        redis.call('ZADD', KEYS[2], ARGV[3], KEYS[1])
+        redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', ARGV[3] - ARGV[2])
+        local excess = redis.call('ZCARD', KEYS[2]) - tonumber(ARGV[4])
+        if excess > 0 then
+            local evicted = redis.call('ZPOPMIN', KEYS[2], excess)
+            for i = 1, #evicted, 2 do
+                redis.call('DEL', evicted[i])
+            end
+        end
+    """
+
+    def __init__(self, redis: redis.Redis, ttl_seconds: int, max_entries: int) -> None:
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        try:
+            values = await self._redis.mget([self.KEY_PREFIX + key for key in keys])
+        except Exception as e:
+            raise AIResultCacheError(f"Redis error in get_many: {str(e)}")
+        return [json.loads(value) if value is not None else None for value in values]
+
+    async def set_many(self, items: Dict[str, Dict[str, Any]]) -> None:
+        now = int(time.time())
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.eval(
+                        self.STORE_SCRIPT,
+                        2,
+                        self.KEY_PREFIX + key,
+                        self.INDEX_KEY,
+                        json.dumps(value, ensure_ascii=False),
+                        self._ttl_seconds,
+                        now,
+                        self._max_entries,
+                    )
+                await pipe.execute()
+        except Exception as e:
+            raise AIResultCacheError(f"Redis error in set_many: {str(e)}")
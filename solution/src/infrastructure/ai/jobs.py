@@ -0,0 +1,210 @@
+import asyncio
+import time
+from typing import Optional
+from uuid import UUID
+
+import redis.asyncio as redis
+from prometheus_client import Counter
+from src.common.enums import ImageJobStatus
+from src.domain.ai.entities import ImageJobEntity
+from src.domain.ai.exceptions import ImageJobQueueError, ImageJobQueueFullError
+
+ai_image_jobs_total = Counter(
+    "ai_image_jobs_total",
+    "Image generation jobs by final status",
+    ["status"],
+)
+
+
+class ImageJobRepository:
+    KEY_PREFIX = "ai:image_job:"
+    QUEUE_KEY = "ai:image_jobs:queue"
+    # Jobs taken by a worker stay here until acknowledged. Each one holds a
+    # lease in LEASES_KEY that its worker keeps renewing; only jobs whose
+    # lease ran out (their worker died) are put back on the queue.
+    PROCESSING_KEY = "ai:image_jobs:processing"
+    LEASES_KEY = "ai:image_jobs:leases"
+    # The length check, job hash and queue push happen atomically so the
+    # queue never grows past its bound.
+    SUBMIT_SCRIPT = """
+        if redis.call('LLEN', KEYS[2]) >= tonumber(ARGV[5]) then
+            return 0
+        end
+        redis.call('HSET', KEYS[1], 'campaign_id', ARGV[2], 'status', ARGV[3])
+        redis.call('EXPIRE', KEYS[1], ARGV[4])
+        redis.call('LPUSH', KEYS[2], ARGV[1])
+        return 1
+    """
+    # A job moved to processing but not leased yet (its worker is between
+    # BLMOVE and ZADD, or died there) gets a fresh lease instead of being
+    # requeued, so it is recovered on a later sweep if nobody renews it.
+    REQUEUE_SCRIPT = """
+        local now = tonumber(ARGV[1])
+        local requeued = 0
+        for _, id in ipairs(redis.call('LRANGE', KEYS[1], 0, -1)) do
+            local deadline = redis.call('ZSCORE', KEYS[2], id)
+            if not deadline then
+                redis.call('ZADD', KEYS[2], now + tonumber(ARGV[2]), id)
+            elseif tonumber(deadline) <= now then
+                redis.call('LREM', KEYS[1], 1, id)
+                redis.call('ZREM', KEYS[2], id)
+                redis.call('RPUSH', KEYS[3], id)
+                requeued = requeued + 1
+            end
+        end
+        return requeued
+    """
+
+    def __init__(
+        self,
+        redis: redis.Redis,
+        ttl_seconds: int,
+        max_queue_length: int,
+        lease_seconds: int,
+    ) -> None:
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+        self._max_queue_length = max_queue_length
+        self._lease_seconds = lease_seconds
+
+    def _key(self, job_id: UUID) -> str:
+        return f"{self.KEY_PREFIX}{job_id}"
+
+    def _channel(self, job_id: UUID) -> str:
+        return f"{self.KEY_PREFIX}{job_id}:done"
+
+    async def submit(self, job: ImageJobEntity) -> None:
+        try:
+            accepted = await self._redis.eval(
+                self.SUBMIT_SCRIPT,
+                2,
+                self._key(job.id),
+                self.QUEUE_KEY,
+                str(job.id),
+                str(job.campaign_id),
+                job.status.value,
+                self._ttl_seconds,
+                self._max_queue_length,
+            )
+        except Exception as e:
+            raise ImageJobQueueError(f"Redis error in submit: {str(e)}")
+        if not accepted:
+            raise ImageJobQueueFullError(
+                f"Image generation queue is full ({self._max_queue_length} jobs)"
+            )
+
+    async def get(self, job_id: UUID) -> Optional[ImageJobEntity]:
+        try:
+            data = await self._redis.hgetall(self._key(job_id))
+        except Exception as e:
+            raise ImageJobQueueError(f"Redis error in get: {str(e)}")
+        if not data:
+            return None
+        return ImageJobEntity(
+            id=job_id,
+            campaign_id=UUID(data["campaign_id"]),
+            status=ImageJobStatus(data["status"]),
+            image_url=data.get("image_url") or None,
+            error=data.get("error") or None,
+        )
+
+    async def update(self, job: ImageJobEntity) -> None:
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.hset(
+                    self._key(job.id),
+                    mapping={
+                        "campaign_id": str(job.campaign_id),
+                        "status": job.status.value,
+                        "image_url": job.image_url or "",
+                        "error": job.error or "",
+                    },
+                )
+                pipe.expire(self._key(job.id), self._ttl_seconds)
+                if job.is_finished:
+                    pipe.publish(self._channel(job.id), job.status.value)
+                await pipe.execute()
+        except Exception as e:
+            raise ImageJobQueueError(f"Redis error in update: {str(e)}")
+        if job.is_finished:
+            ai_image_jobs_total.labels(job.status.value).inc()
+
+    async def wait(
+        self, job_id: UUID, timeout_seconds: float
+    ) -> Optional[ImageJobEntity]:
+        job = await self.get(job_id)
+        if job is None or job.is_finished or timeout_seconds <= 0:
+            return job
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        try:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self._channel(job_id))
+                # Re-read after subscribing: the job may have finished in
+                # between and its notification would be missed.
+                job = await self.get(job_id)
+                while job is not None and not job.is_finished:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=remaining
+                    )
+                    if message is not None:
+                        job = await self.get(job_id)
+            finally:
+                await pubsub.aclose()
+        except ImageJobQueueError:
+            raise
+        except Exception as e:
+            raise ImageJobQueueError(f"Redis error in wait: {str(e)}")
+        return job
+
+    async def dequeue(self, timeout_seconds: float) -> Optional[UUID]:
+        try:
+            item = await self._redis.blmove(
+                self.QUEUE_KEY, self.PROCESSING_KEY, timeout_seconds, "RIGHT", "LEFT"
+            )
+            if item:
+                await self._redis.zadd(
+                    self.LEASES_KEY, {item: time.time() + self._lease_seconds}
+                )
+        except Exception as e:
+            raise ImageJobQueueError(f"Redis error in dequeue: {str(e)}")
+        return UUID(item) if item else None
+
+    async def extend_lease(self, job_id: UUID) -> None:
+        # XX: a job that was already requeued must not get its lease back.
+        try:
+            await self._redis.zadd(
+                self.LEASES_KEY,
+                {str(job_id): time.time() + self._lease_seconds},
+                xx=True,
+            )
+        except Exception as e:
+            raise ImageJobQueueError(f"Redis error in extend_lease: {str(e)}")
+
+    async def ack(self, job_id: UUID) -> None:
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.lrem(self.PROCESSING_KEY, 1, str(job_id))
+                pipe.zrem(self.LEASES_KEY, str(job_id))
+                await pipe.execute()
+        except Exception as e:
+            raise ImageJobQueueError(f"Redis error in ack: {str(e)}")
+
+    async def requeue_expired(self) -> int:
+        try:
+            return await self._redis.eval(
+                self.REQUEUE_SCRIPT,
+                3,
+                self.PROCESSING_KEY,
+                self.LEASES_KEY,
+                self.QUEUE_KEY,
+                time.time(),
+                self._lease_seconds,
+            )
+        except Exception as e:
+            raise ImageJobQueueError(f"Redis error in requeue_expired: {str(e)}")
@@ -0,0 +1,37 @@
+from src.core.resilience import ProviderGuard
+from src.core.settings import settings
+from src.domain.ai.exceptions import (
+    AIConnectionError,
+    AIProviderUnavailableError,
+    AIRateLimitError,
+)
+
+
+def is_provider_failure(error: Exception) -> bool:
+    # Client-side errors (bad key, malformed answer) say nothing about
+    # provider health and must not open the circuit.
+    return isinstance(
+        error, (AIConnectionError, AIProviderUnavailableError, AIRateLimitError)
+    )
+
+
+openrouter_guard = ProviderGuard(
+    "openrouter",
+    requests_per_minute=settings.openrouter_requests_per_minute,
+    burst=settings.openrouter_burst,
+    max_concurrency=settings.openrouter_max_concurrency,
+    max_wait=settings.ai_rate_limit_max_wait_seconds,
+    failure_threshold=settings.ai_circuit_failure_threshold,
+    reset_timeout=settings.ai_circuit_reset_seconds,
+    is_failure=is_provider_failure,
+)
+cloudflare_guard = ProviderGuard(
+    "cloudflare",
+    requests_per_minute=settings.cloudflare_requests_per_minute,
+    burst=settings.cloudflare_burst,
+    max_concurrency=settings.cloudflare_max_concurrency,
+    max_wait=settings.ai_rate_limit_max_wait_seconds,
+    failure_threshold=settings.ai_circuit_failure_threshold,
+    reset_timeout=settings.ai_circuit_reset_seconds,
+    is_failure=is_provider_failure,
+)
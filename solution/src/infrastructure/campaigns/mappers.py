@@ -6,7 +6,7 @@ from src.application.campaigns.dtos import (
     CampaignUpdateRequest,
     TargetingSchema,
 )
-from src.common.enums import TargetingGender
+from src.common.enums import ModerationStatus, TargetingGender
 from src.domain.campaigns.entities import (
     CampaignEntity,
     CampaignUpdateEntity,
@@ -72,6 +72,8 @@ class CampaignsMapper:
             start_date=entity.start_date,
             end_date=entity.end_date,
             image_url=entity.image_url,
+            moderation_status=entity.moderation_status,
+            moderation_reason=entity.moderation_reason,
             targeting=TargetingSchema(
                 gender=entity.gender,
                 age_from=entity.age_from,
@@ -97,6 +99,8 @@ class CampaignsMapper:
             age_to=entity.age_to,
             location=entity.location,
             image_url=entity.image_url,
+            moderation_status=entity.moderation_status.value,
+            moderation_reason=entity.moderation_reason,
         )
 
     def from_model_to_entity(self, model: CampaignModel) -> CampaignEntity:
@@ -116,4 +120,8 @@ class CampaignsMapper:
             age_to=model.age_to,
             location=model.location,
             image_url=model.image_url,
+            moderation_status=ModerationStatus(model.moderation_status)
+            if model.moderation_status
+            else ModerationStatus.APPROVED,
+            moderation_reason=model.moderation_reason,
         )
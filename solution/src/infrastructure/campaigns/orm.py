@@ -2,6 +2,7 @@ from uuid import UUID
 
 from sqlalchemy import Float, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from src.common.enums import ModerationStatus
 from src.core.models import SQLAlchemyBaseModel, SQLAlchemyTimestampMixin
 
 
@@ -25,6 +26,13 @@ class CampaignModel(SQLAlchemyBaseModel, SQLAlchemyTimestampMixin):
     age_from: Mapped[int | None] = mapped_column(Integer, nullable=True)
     age_to: Mapped[int | None] = mapped_column(Integer, nullable=True)
     location: Mapped[str | None] = mapped_column(String, nullable=True)
+    moderation_status: Mapped[str] = mapped_column(
+        String,
+        nullable=False,
+        default=ModerationStatus.APPROVED.value,
+        server_default=ModerationStatus.APPROVED.value,
+    )
+    moderation_reason: Mapped[str | None] = mapped_column(String, nullable=True)
 
     advertiser = relationship("AdvertiserModel", backref="campaigns")
     unique_events = relationship(
@@ -4,7 +4,7 @@ from uuid import UUID
 from sqlalchemy import case, func, or_, select, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.common.enums import TargetingGender
+from src.common.enums import ModerationStatus, TargetingGender
 from src.domain.campaigns.entities import (
     CampaignEntity,
     CampaignUpdateEntity,
@@ -38,12 +38,13 @@ class CampaignsRepository:
                     id, advertiser_id, impressions_limit, clicks_limit,
                     cost_per_impression, cost_per_click, ad_title, ad_text,
                     start_date, end_date, gender, age_from, age_to, location,
-                    image_url, created_at, updated_at
+                    image_url, moderation_status, moderation_reason,
+                    created_at, updated_at
                 ) VALUES (
                     :id, :advertiser_id, :impressions_limit, :clicks_limit,
                     :cost_per_impression, :cost_per_click, :ad_title, :ad_text,
                     :start_date, :end_date, :gender, :age_from, :age_to, :location,
-                    :image_url,
+                    :image_url, :moderation_status, :moderation_reason,
                     CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
                 ) RETURNING *;
             """)
@@ -65,6 +66,8 @@ class CampaignsRepository:
                     "age_to": campaign.age_to,
                     "location": campaign.location,
                     "image_url": campaign.image_url,
+                    "moderation_status": campaign.moderation_status.value,
+                    "moderation_reason": campaign.moderation_reason,
                 },
             )
             row = result.mappings().first()
@@ -125,6 +128,8 @@ class CampaignsRepository:
                 "cost_per_click": campaign.cost_per_click,
                 "ad_title": campaign.ad_title,
                 "ad_text": campaign.ad_text,
+                "moderation_status": campaign.moderation_status.value,
+                "moderation_reason": campaign.moderation_reason,
             }
 
             update_fields.extend(
@@ -133,6 +138,8 @@ class CampaignsRepository:
                     "cost_per_click = :cost_per_click",
                     "ad_title = :ad_title",
                     "ad_text = :ad_text",
+                    "moderation_status = :moderation_status",
+                    "moderation_reason = :moderation_reason",
                 ]
             )
 
@@ -215,6 +222,53 @@ class CampaignsRepository:
         except SQLAlchemyError as e:
             raise CampaignRepositoryError(f"Db error: {str(e)}")
 
+    async def set_moderation_status(
+        self,
+        campaign_id: UUID,
+        status: ModerationStatus,
+        reason: Optional[str],
+        ad_title: str,
+        ad_text: str,
+    ) -> bool:
+        try:
+            # The verdict only applies to the text it was computed for: an edit
+            # made while the job was running resets the campaign to pending and
+            # is moderated by its own job.
+            query = text("""
+                UPDATE campaigns
+                SET moderation_status = :status,
+                    moderation_reason = :reason,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = :id
+                AND moderation_status = :pending
+                AND ad_title = :ad_title
+                AND ad_text = :ad_text
+            """)
+            result = await self._session.execute(
+                query,
+                {
+                    "id": campaign_id,
+                    "status": status.value,
+                    "reason": reason,
+                    "pending": ModerationStatus.PENDING.value,
+                    "ad_title": ad_title,
+                    "ad_text": ad_text,
+                },
+            )
+            return result.rowcount > 0
+        except SQLAlchemyError as e:
+            raise CampaignRepositoryError(f"Db error: {str(e)}")
+
+    async def get_pending_moderation_ids(self) -> List[UUID]:
+        try:
+            result = await self._session.execute(
+                text("SELECT id FROM campaigns WHERE moderation_status = :pending"),
+                {"pending": ModerationStatus.PENDING.value},
+            )
+            return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            raise CampaignRepositoryError(f"Db error: {str(e)}")
+
     async def get_targeted_campaigns(self, client_id: UUID) -> List[CampaignEntity]:
         try:
             current_day = await self._time_repository.get_current_date()
@@ -247,6 +301,7 @@ class CampaignsRepository:
                 select(CampaignModel)
                 .outerjoin(events_subq, events_subq.c.campaign_id == CampaignModel.id)
                 .where(
+                    CampaignModel.moderation_status == ModerationStatus.APPROVED.value,
                     CampaignModel.start_date <= current_day,
                     CampaignModel.end_date >= current_day,
                     or_(
@@ -280,3 +335,15 @@ class CampaignsRepository:
             ]
         except SQLAlchemyError as e:
             raise CampaignRepositoryError(f"Db error: {str(e)}")
+
+
+async def ensure_campaign_moderation_columns(session: AsyncSession) -> None:
+    await session.execute(
+        text("""
+            ALTER TABLE campaigns
+            ADD COLUMN IF NOT EXISTS moderation_status varchar
+                NOT NULL DEFAULT 'approved',
+            ADD COLUMN IF NOT EXISTS moderation_reason varchar
+        """)
+    )
+    await session.commit()
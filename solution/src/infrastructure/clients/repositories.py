@@ -1,10 +1,11 @@
 from datetime import datetime
-from typing import List
+from typing import Dict, List
 from uuid import UUID
 
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.types import BULK_UPSERT_CHUNK_SIZE
 from src.domain.clients.entities import ClientEntity
 from src.domain.clients.exceptions import ClientNotFoundException, ClientRepositoryError
 from src.infrastructure.clients.mappers import ClientsMapper
@@ -30,62 +31,53 @@ class ClientsRepository:
 
     async def bulk_upsert(self, entities: List[ClientEntity]) -> List[ClientEntity]:
         try:
-            models: List[ClientModel] = []
-            current_time = datetime.now()
             latest_entities = {entity.id: entity for entity in entities}
+            rows = list(latest_entities.values())
+            upserted: Dict[UUID, ClientEntity] = {}
 
-            for entity_id, entity in latest_entities.items():
+            for start in range(0, len(rows), BULK_UPSERT_CHUNK_SIZE):
+                chunk = rows[start : start + BULK_UPSERT_CHUNK_SIZE]
                 result = await self._session.execute(
-                    text("SELECT * FROM clients WHERE id = :id"), {"id": entity_id}
+                    text("""
+                        INSERT INTO clients (id, login, age, location, gender, created_at, updated_at)
+                        SELECT id, login, age, location, gender, :current_time, :current_time
+                        FROM unnest(
+                            CAST(:ids AS uuid[]),
+                            CAST(:logins AS varchar[]),
+                            CAST(:ages AS integer[]),
+                            CAST(:locations AS varchar[]),
+                            CAST(:genders AS varchar[])
+                        ) AS t(id, login, age, location, gender)
+                        ON CONFLICT (id) DO UPDATE
+                        SET login = EXCLUDED.login,
+                            age = EXCLUDED.age,
+                            location = EXCLUDED.location,
+                            gender = EXCLUDED.gender,
+                            updated_at = EXCLUDED.updated_at
+                        WHERE (clients.login, clients.age, clients.location, clients.gender)
+                            IS DISTINCT FROM
+                            (EXCLUDED.login, EXCLUDED.age, EXCLUDED.location, EXCLUDED.gender)
+                        RETURNING *
+                    """),
+                    {
+                        "ids": [entity.id for entity in chunk],
+                        "logins": [entity.login for entity in chunk],
+                        "ages": [entity.age for entity in chunk],
+                        "locations": [entity.location for entity in chunk],
+                        "genders": [entity.gender for entity in chunk],
+                        "current_time": datetime.now(),
+                    },
                 )
-                existing = result.mappings().first()
-
-                if existing:
-                    await self._session.execute(
-                        text("""
-                            UPDATE clients 
-                            SET login = :login, 
-                                age = :age, 
-                                location = :location, 
-                                gender = :gender,
-                                updated_at = :updated_at
-                            WHERE id = :id
-                        """),
-                        {
-                            "id": entity_id,
-                            "login": entity.login,
-                            "age": entity.age,
-                            "location": entity.location,
-                            "gender": entity.gender,
-                            "updated_at": current_time,
-                        },
-                    )
-                else:
-                    await self._session.execute(
-                        text("""
-                            INSERT INTO clients (id, login, age, location, gender, created_at, updated_at)
-                            VALUES (:id, :login, :age, :location, :gender, :created_at, :updated_at)
-                        """),
-                        {
-                            "id": entity_id,
-                            "login": entity.login,
-                            "age": entity.age,
-                            "location": entity.location,
-                            "gender": entity.gender,
-                            "created_at": current_time,
-                            "updated_at": current_time,
-                        },
+                for model in result.mappings().all():
+                    upserted[model["id"]] = self._mapper.from_model_to_entity(
+                        ClientModel(**model)
                     )
 
-                result = await self._session.execute(
-                    text("SELECT * FROM clients WHERE id = :id"), {"id": entity_id}
-                )
-                model = result.mappings().one()
-                count = sum(1 for e in entities if e.id == entity_id)
-                models.extend([ClientModel(**model)] * count)
-
             await self._session.flush()
-            return [self._mapper.from_model_to_entity(model) for model in models]
+            return [
+                upserted.get(entity.id, latest_entities[entity.id])
+                for entity in entities
+            ]
         except SQLAlchemyError as e:
             raise ClientRepositoryError(
                 f"Db error during bulk upsert: {str(e)}"
@@ -0,0 +1,302 @@
+from datetime import UTC, datetime
+from logging import getLogger
+from typing import Any, List, Tuple
+
+import asyncpg
+from prometheus_client import Counter
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.enums import LoadTarget
+from src.domain.advertisers.types import (
+    ML_SCORE_SNAPSHOT_ACTIVE,
+    ML_SCORE_SNAPSHOT_DROPPED,
+    ML_SCORE_SNAPSHOT_RETIRED,
+    ML_SCORE_SNAPSHOTS_RETAINED,
+)
+from src.domain.loader.entities import LoadMergeEntity
+from src.domain.loader.exceptions import LoaderError
+
+logger = getLogger(__name__)
+
+loader_rows_staged_total = Counter(
+    "loader_rows_staged_total",
+    "Rows copied into loader staging tables",
+    ["target"],
+)
+loader_rows_written_total = Counter(
+    "loader_rows_written_total",
+    "Rows inserted or changed by loader merges",
+    ["target"],
+)
+
+
+class CopyLoaderRepository:
+    ML_SCORE_SNAPSHOT_LOCK_ID = 7_031_036
+    STAGING_TABLES = {
+        LoadTarget.CLIENTS: "clients_staging",
+        LoadTarget.ML_SCORES: "ml_scores_staging",
+        LoadTarget.ML_SCORES_SNAPSHOT: "ml_scores_staging",
+    }
+    STAGING_COLUMNS = {
+        LoadTarget.CLIENTS: ["id", "login", "age", "location", "gender"],
+        LoadTarget.ML_SCORES: ["client_id", "advertiser_id", "score"],
+        LoadTarget.ML_SCORES_SNAPSHOT: ["client_id", "advertiser_id", "score"],
+    }
+    STAGING_DDL = {
+        LoadTarget.CLIENTS: """
+            CREATE TEMP TABLE clients_staging (
+                seq bigint GENERATED ALWAYS AS IDENTITY,
+                id uuid NOT NULL,
+                login varchar NOT NULL,
+                age integer NOT NULL,
+                location varchar NOT NULL,
+                gender varchar NOT NULL
+            ) ON COMMIT DROP
+        """,
+        LoadTarget.ML_SCORES: """
+            CREATE TEMP TABLE ml_scores_staging (
+                seq bigint GENERATED ALWAYS AS IDENTITY,
+                client_id uuid NOT NULL,
+                advertiser_id uuid NOT NULL,
+                score integer NOT NULL
+            ) ON COMMIT DROP
+        """,
+    }
+    STAGING_DDL[LoadTarget.ML_SCORES_SNAPSHOT] = STAGING_DDL[LoadTarget.ML_SCORES]
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def create_staging(self, target: LoadTarget) -> None:
+        try:
+            if target == LoadTarget.ML_SCORES_SNAPSHOT:
+                await self._session.execute(
+                    text("SELECT pg_advisory_xact_lock(:lock_id)"),
+                    {"lock_id": self.ML_SCORE_SNAPSHOT_LOCK_ID},
+                )
+            await self._session.execute(text(self.STAGING_DDL[target]))
+        except SQLAlchemyError as e:
+            raise LoaderError(f"Db error creating staging table: {str(e)}")
+
+    async def copy_records(
+        self, target: LoadTarget, records: List[Tuple[Any, ...]]
+    ) -> int:
+        try:
+            connection = await self._session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                self.STAGING_TABLES[target],
+                records=records,
+                columns=self.STAGING_COLUMNS[target],
+            )
+            loader_rows_staged_total.labels(target.value).inc(len(records))
+            return len(records)
+        except (SQLAlchemyError, asyncpg.PostgresError) as e:
+            raise LoaderError(f"Db error copying into staging table: {str(e)}")
+
+    async def merge(self, target: LoadTarget) -> LoadMergeEntity:
+        try:
+            await self._session.execute(text(f"ANALYZE {self.STAGING_TABLES[target]}"))
+            if target == LoadTarget.CLIENTS:
+                merged = await self._merge_clients()
+            elif target == LoadTarget.ML_SCORES:
+                merged = await self._merge_ml_scores()
+            else:
+                merged = await self._promote_ml_scores_snapshot()
+            loader_rows_written_total.labels(target.value).inc(merged.written)
+            return merged
+        except SQLAlchemyError as e:
+            raise LoaderError(f"Db error merging staging table: {str(e)}")
+
+    async def _merge_clients(self) -> LoadMergeEntity:
+        result = await self._session.execute(
+            text("""
+                INSERT INTO clients (id, login, age, location, gender, created_at, updated_at)
+                SELECT id, login, age, location, gender, :current_time, :current_time
+                FROM (
+                    SELECT DISTINCT ON (id) id, login, age, location, gender
+                    FROM clients_staging
+                    ORDER BY id, seq DESC
+                ) latest
+                ON CONFLICT (id) DO UPDATE
+                SET login = EXCLUDED.login,
+                    age = EXCLUDED.age,
+                    location = EXCLUDED.location,
+                    gender = EXCLUDED.gender,
+                    updated_at = EXCLUDED.updated_at
+                WHERE (clients.login, clients.age, clients.location, clients.gender)
+                    IS DISTINCT FROM
+                    (EXCLUDED.login, EXCLUDED.age, EXCLUDED.location, EXCLUDED.gender)
+            """),
+            {"current_time": datetime.now(UTC)},
+        )
+        return LoadMergeEntity(written=result.rowcount, rejected=0)
+
+    async def _count_ml_score_rejects(self) -> int:
+        result = await self._session.execute(
+            text("""
+                SELECT COUNT(*) FROM ml_scores_staging s
+                WHERE NOT EXISTS (SELECT 1 FROM clients c WHERE c.id = s.client_id)
+                OR NOT EXISTS (SELECT 1 FROM advertisers a WHERE a.id = s.advertiser_id)
+            """)
+        )
+        return result.scalar_one()
+
+    async def _merge_ml_scores(self) -> LoadMergeEntity:
+        rejected = await self._count_ml_score_rejects()
+
+        result = await self._session.execute(
+            text("""
+                INSERT INTO ml_scores (
+                    id, client_id, advertiser_id, score, created_at, updated_at
+                )
+                SELECT
+                    gen_random_uuid(),
+                    client_id,
+                    advertiser_id,
+                    score,
+                    :current_time,
+                    :current_time
+                FROM (
+                    SELECT DISTINCT ON (client_id, advertiser_id)
+                        client_id, advertiser_id, score
+                    FROM ml_scores_staging
+                    ORDER BY client_id, advertiser_id, seq DESC
+                ) latest
+                WHERE EXISTS (SELECT 1 FROM clients c WHERE c.id = latest.client_id)
+                AND EXISTS (SELECT 1 FROM advertisers a WHERE a.id = latest.advertiser_id)
+                ON CONFLICT (client_id, advertiser_id) DO UPDATE
+                SET score = EXCLUDED.score,
+                    updated_at = EXCLUDED.updated_at
+                WHERE ml_scores.score IS DISTINCT FROM EXCLUDED.score
+            """),
+            {"current_time": datetime.now(UTC)},
+        )
+        return LoadMergeEntity(written=result.rowcount, rejected=rejected)
+
+    async def _promote_ml_scores_snapshot(self) -> LoadMergeEntity:
+        rejected = await self._count_ml_score_rejects()
+        current_time = datetime.now(UTC)
+
+        result = await self._session.execute(
+            text("""
+                INSERT INTO ml_score_snapshots (status, row_count, activated_at)
+                VALUES (:status, 0, :current_time)
+                RETURNING version
+            """),
+            {"status": ML_SCORE_SNAPSHOT_ACTIVE, "current_time": current_time},
+        )
+        version = result.scalar_one()
+        table = f"ml_scores_v{version}"
+
+        await self._session.execute(
+            text(f"CREATE TABLE {table} (LIKE ml_scores INCLUDING DEFAULTS)")
+        )
+        result = await self._session.execute(
+            text(f"""
+                INSERT INTO {table} (
+                    id, client_id, advertiser_id, score, created_at, updated_at
+                )
+                SELECT
+                    gen_random_uuid(),
+                    client_id,
+                    advertiser_id,
+                    score,
+                    :current_time,
+                    :current_time
+                FROM (
+                    SELECT DISTINCT ON (client_id, advertiser_id)
+                        client_id, advertiser_id, score
+                    FROM ml_scores_staging
+                    ORDER BY client_id, advertiser_id, seq DESC
+                ) latest
+                WHERE EXISTS (SELECT 1 FROM clients c WHERE c.id = latest.client_id)
+                AND EXISTS (SELECT 1 FROM advertisers a WHERE a.id = latest.advertiser_id)
+            """),
+            {"current_time": current_time},
+        )
+        written = result.rowcount
+
+        for statement in (
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id)",
+            f"""CREATE UNIQUE INDEX uq_{table}_client_advertiser
+                ON {table} (client_id, advertiser_id)""",
+            f"""ALTER TABLE {table}
+                ADD CONSTRAINT ml_scores_client_id_fkey
+                    FOREIGN KEY (client_id) REFERENCES clients (id),
+                ADD CONSTRAINT ml_scores_advertiser_id_fkey
+                    FOREIGN KEY (advertiser_id) REFERENCES advertisers (id)""",
+            f"ANALYZE {table}",
+        ):
+            await self._session.execute(text(statement))
+
+        result = await self._session.execute(
+            text("""
+                UPDATE ml_score_snapshots
+                SET status = :retired, retired_at = :current_time
+                WHERE status = :active AND version <> :version
+                RETURNING version
+            """),
+            {
+                "retired": ML_SCORE_SNAPSHOT_RETIRED,
+                "active": ML_SCORE_SNAPSHOT_ACTIVE,
+                "version": version,
+                "current_time": current_time,
+            },
+        )
+        previous = f"ml_scores_v{result.scalar_one_or_none() or 0}"
+
+        for statement in (
+            "LOCK TABLE ml_scores IN ACCESS EXCLUSIVE MODE",
+            f"ALTER TABLE ml_scores RENAME TO {previous}",
+            f"ALTER INDEX ml_scores_pkey RENAME TO {previous}_pkey",
+            f"""ALTER INDEX uq_ml_scores_client_advertiser
+                RENAME TO uq_{previous}_client_advertiser""",
+            f"""ALTER TABLE {previous}
+                DROP CONSTRAINT IF EXISTS ml_scores_client_id_fkey,
+                DROP CONSTRAINT IF EXISTS ml_scores_advertiser_id_fkey""",
+            f"ALTER TABLE {table} RENAME TO ml_scores",
+            f"ALTER INDEX {table}_pkey RENAME TO ml_scores_pkey",
+            f"""ALTER INDEX uq_{table}_client_advertiser
+                RENAME TO uq_ml_scores_client_advertiser""",
+        ):
+            await self._session.execute(text(statement))
+
+        await self._session.execute(
+            text(
+                "UPDATE ml_score_snapshots SET row_count = :written WHERE version = :version"
+            ),
+            {"written": written, "version": version},
+        )
+        await self._drop_retired_ml_score_snapshots()
+
+        logger.info(
+            f"Promoted ML score snapshot {version} with {written} rows, "
+            f"previous version kept as {previous}"
+        )
+        return LoadMergeEntity(written=written, rejected=rejected)
+
+    async def _drop_retired_ml_score_snapshots(self) -> None:
+        result = await self._session.execute(
+            text("""
+                SELECT tablename FROM pg_tables
+                WHERE schemaname = current_schema()
+                AND tablename ~ '^ml_scores_v[0-9]+$'
+            """)
+        )
+        versions = sorted(
+            (int(name.removeprefix("ml_scores_v")) for name in result.scalars()),
+            reverse=True,
+        )
+        dropped = versions[ML_SCORE_SNAPSHOTS_RETAINED:]
+        for version in dropped:
+            await self._session.execute(text(f"DROP TABLE ml_scores_v{version}"))
+        if dropped:
+            await self._session.execute(
+                text("""
+                    UPDATE ml_score_snapshots SET status = :dropped
+                    WHERE version = ANY(:versions)
+                """),
+                {"dropped": ML_SCORE_SNAPSHOT_DROPPED, "versions": dropped},
+            )
@@ -2,6 +2,7 @@ import uuid
 
 from src.application.moderation.dtos import (
     ForbiddenWord,
+    ForbiddenWordMatch,
     ModerationResponse,
 )
 from src.domain.moderation.entities import (
@@ -30,6 +31,7 @@ class ModerationMapper:
             contains_forbidden_words=result.contains_forbidden_words,
             source=result.source,
             details=result.details,
+            matches=result.matches,
         )
 
     def from_entity_to_response(
@@ -39,4 +41,8 @@ class ModerationMapper:
             contains_forbidden_words=entity.contains_forbidden_words,
             source=entity.source,
             details=entity.details,
+            matches=[
+                ForbiddenWordMatch(word=match.word, start=match.start, end=match.end)
+                for match in entity.matches
+            ],
         )
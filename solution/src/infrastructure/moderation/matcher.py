@@ -0,0 +1,144 @@
+from collections import deque
+from logging import getLogger
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.core.db import async_session_maker
+from src.core.singleflight import SingleFlight
+from src.domain.moderation.entities import ForbiddenWordMatchEntity
+from src.domain.moderation.exceptions import ForbiddenWordsVersionError
+from src.domain.moderation.interfaces import (
+    ForbiddenWordsRepositoryFactoryProtocol,
+    ForbiddenWordsRepositoryProtocol,
+    ForbiddenWordsVersionRepositoryProtocol,
+)
+from src.infrastructure.moderation.repositories import ForbiddenWordsRepositoryFactory
+
+logger = getLogger(__name__)
+
+
+class AhoCorasickMatcher:
+    def __init__(self, words: Iterable[str]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Patterns ending in each state, own and inherited through fail links.
+        self._output: List[List[Tuple[str, int]]] = [[]]
+
+        # Words match as lower-cased substrings, surrounding whitespace
+        # included. An empty word would match every text, so it is skipped.
+        patterns: Dict[str, str] = {}
+        for word in words:
+            if word:
+                patterns.setdefault(word.lower(), word)
+        for pattern, word in patterns.items():
+            self._add(pattern, word)
+        self._link()
+
+    def _add(self, pattern: str, word: str) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((word, len(pattern)))
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def find_all(self, text: str) -> List[ForbiddenWordMatchEntity]:
+        matches: List[ForbiddenWordMatchEntity] = []
+        # lower() may expand a character, so keep the source index of each
+        # normalized character to report positions in the original text.
+        origins: List[int] = []
+        state = 0
+        for index, source_char in enumerate(text):
+            for char in source_char.lower():
+                origins.append(index)
+                while state and char not in self._goto[state]:
+                    state = self._fail[state]
+                state = self._goto[state].get(char, 0)
+                for word, length in self._output[state]:
+                    matches.append(
+                        ForbiddenWordMatchEntity(
+                            word=word,
+                            start=origins[len(origins) - length],
+                            end=index + 1,
+                        )
+                    )
+        return matches
+
+
+class ForbiddenWordsMatcherCache:
+    def __init__(
+        self,
+        repository_factory: Optional[ForbiddenWordsRepositoryFactoryProtocol] = None,
+    ) -> None:
+        self._repository_factory = repository_factory
+        self._version: Optional[int] = None
+        self._matcher = AhoCorasickMatcher([])
+        self._rebuilds = SingleFlight("forbidden_words_matcher")
+
+    async def get_matcher(
+        self,
+        repository: ForbiddenWordsRepositoryProtocol,
+        version_repository: Optional[ForbiddenWordsVersionRepositoryProtocol] = None,
+    ) -> AhoCorasickMatcher:
+        version = await self._get_version(repository, version_repository)
+        if version == self._version:
+            return self._matcher
+        if self._repository_factory is None:
+            return await self._load(repository, version)
+        # The rebuild is shared by concurrent callers, so it reads the words
+        # through its own session rather than the first caller's.
+        return await self._rebuilds.do(version, lambda: self._rebuild(version))
+
+    @staticmethod
+    async def _get_version(
+        repository: ForbiddenWordsRepositoryProtocol,
+        version_repository: Optional[ForbiddenWordsVersionRepositoryProtocol],
+    ) -> int:
+        if version_repository is None:
+            return await repository.get_version()
+        try:
+            version = await version_repository.get()
+            if version is not None:
+                return version
+            version = await repository.get_version()
+            await version_repository.publish(version)
+            return version
+        except ForbiddenWordsVersionError as e:
+            logger.warning(f"Falling back to database forbidden words version: {e}")
+            return await repository.get_version()
+
+    def store(self, version: int, words: List[str]) -> AhoCorasickMatcher:
+        matcher = AhoCorasickMatcher(words)
+        if self._version is None or version >= self._version:
+            self._version, self._matcher = version, matcher
+        return matcher
+
+    async def _load(
+        self, repository: ForbiddenWordsRepositoryProtocol, version: int
+    ) -> AhoCorasickMatcher:
+        return self.store(version, await repository.get_all())
+
+    async def _rebuild(self, version: int) -> AhoCorasickMatcher:
+        async with self._repository_factory() as repository:
+            return await self._load(repository, version)
+
+
+forbidden_words_matcher_cache = ForbiddenWordsMatcherCache(
+    ForbiddenWordsRepositoryFactory(async_session_maker)
+)
@@ -1,5 +1,9 @@
-from sqlalchemy import String
+from datetime import datetime
+
+import sqlalchemy
+from sqlalchemy import Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
+from src.core.db import Base
 from src.core.models import SQLAlchemyBaseModel, SQLAlchemyTimestampMixin
 
 
@@ -7,3 +11,13 @@ class ForbiddenWordsModel(SQLAlchemyBaseModel, SQLAlchemyTimestampMixin):
     __tablename__ = "forbidden_words"
 
     word: Mapped[str] = mapped_column(String, nullable=False)
+
+
+class ForbiddenWordsVersionModel(Base):
+    __tablename__ = "forbidden_words_versions"
+
+    version: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    word_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=False
+    )
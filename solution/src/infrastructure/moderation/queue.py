@@ -0,0 +1,25 @@
+from typing import Optional
+from uuid import UUID
+
+import redis.asyncio as redis
+from src.domain.moderation.exceptions import ModerationQueueError
+
+
+class ModerationQueueRepository:
+    QUEUE_KEY = "moderation:campaigns:queue"
+
+    def __init__(self, redis: redis.Redis) -> None:
+        self._redis = redis
+
+    async def enqueue(self, campaign_id: UUID) -> None:
+        try:
+            await self._redis.lpush(self.QUEUE_KEY, str(campaign_id))
+        except Exception as e:
+            raise ModerationQueueError(f"Redis error in enqueue: {str(e)}")
+
+    async def dequeue(self, timeout_seconds: float) -> Optional[UUID]:
+        try:
+            item = await self._redis.brpop([self.QUEUE_KEY], timeout=timeout_seconds)
+        except Exception as e:
+            raise ModerationQueueError(f"Redis error in dequeue: {str(e)}")
+        return UUID(item[1]) if item else None
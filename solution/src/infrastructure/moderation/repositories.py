@@ -1,9 +1,11 @@
-import uuid
-from datetime import datetime
-from typing import List
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from typing import AsyncIterator, List, Optional
 
+import redis.asyncio as redis
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.domain.moderation.exceptions import ForbiddenWordsVersionError
 
 
 class ForbiddenWordsRepository:
@@ -16,23 +18,67 @@ class ForbiddenWordsRepository:
         )
         return [row[0] for row in result.fetchall()]
 
-    async def update(self, data: List[str]) -> None:
-        current_time = datetime.now()
+    async def get_version(self) -> int:
+        result = await self.session.execute(
+            text("SELECT COALESCE(MAX(version), 0) FROM forbidden_words_versions")
+        )
+        return result.scalar_one()
+
+    async def update(self, data: List[str]) -> int:
+        current_time = datetime.now(UTC)
 
         await self.session.execute(text("DELETE FROM forbidden_words"))
+        await self.session.execute(
+            text("""
+                INSERT INTO forbidden_words (id, word, created_at, updated_at)
+                SELECT gen_random_uuid(), word, :current_time, :current_time
+                FROM unnest(CAST(:words AS varchar[])) AS t(word)
+            """),
+            {"words": data, "current_time": current_time},
+        )
+        result = await self.session.execute(
+            text("""
+                INSERT INTO forbidden_words_versions (word_count, created_at)
+                VALUES (:word_count, :current_time)
+                RETURNING version
+            """),
+            {"word_count": len(data), "current_time": current_time},
+        )
+        return result.scalar_one()
+
+
+class ForbiddenWordsRepositoryFactory:
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        self._session_maker = session_maker
+
+    @asynccontextmanager
+    async def __call__(self) -> AsyncIterator[ForbiddenWordsRepository]:
+        async with self._session_maker() as session:
+            yield ForbiddenWordsRepository(session)
+
+
+class ForbiddenWordsVersionRepository:
+    VERSION_KEY = "moderation:forbidden_words:version"
+    # Versions only move forward, so a late publisher cannot roll one back.
+    PUBLISH_SCRIPT = """
+        local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+        if tonumber(ARGV[1]) > current then
+            redis.call('SET', KEYS[1], ARGV[1])
+        end
+    """
+
+    def __init__(self, redis: redis.Redis) -> None:
+        self._redis = redis
+
+    async def get(self) -> Optional[int]:
+        try:
+            version = await self._redis.get(self.VERSION_KEY)
+        except Exception as e:
+            raise ForbiddenWordsVersionError(f"Redis error in get: {str(e)}")
+        return int(version) if version is not None else None
 
-        for word in data:
-            await self.session.execute(
-                text("""
-                    INSERT INTO forbidden_words (id, word, created_at, updated_at)
-                    VALUES (:id, :word, :created_at, :updated_at)
-                """),
-                {
-                    "id": uuid.uuid4(),
-                    "word": word,
-                    "created_at": current_time,
-                    "updated_at": current_time,
-                },
-            )
-
-        await self.session.flush()
+    async def publish(self, version: int) -> None:
+        try:
+            await self._redis.eval(self.PUBLISH_SCRIPT, 1, self.VERSION_KEY, version)
+        except Exception as e:
+            raise ForbiddenWordsVersionError(f"Redis error in publish: {str(e)}")
@@ -1,10 +1,13 @@
 from logging import getLogger
+from typing import List, Optional
 
 from src.core.settings import Settings
 from src.core.uow import AbstractUow
 from src.domain.ai.interfaces import AIServiceProtocol
 from src.domain.moderation.interfaces import (
+    ForbiddenWordsMatcherCacheProtocol,
     ForbiddenWordsRepositoryProtocol,
+    ForbiddenWordsVersionRepositoryProtocol,
     ModerationResult,
 )
 
@@ -18,23 +21,28 @@ class ModerationService:
         repository: ForbiddenWordsRepositoryProtocol,
         ai_service: AIServiceProtocol,
         settings: Settings,
+        matcher_cache: ForbiddenWordsMatcherCacheProtocol,
+        version_repository: Optional[ForbiddenWordsVersionRepositoryProtocol] = None,
     ):
         self.uow = uow
         self.repository = repository
         self.ai_service = ai_service
         self.settings = settings
+        self.matcher_cache = matcher_cache
+        self.version_repository = version_repository
 
     async def check_forbidden_words_db(self, text: str) -> ModerationResult:
         try:
             async with self.uow:
-                forbidden_words = await self.repository.get_all()
-                text_lower = text.lower()
-                contains_forbidden = any(
-                    word.lower() in text_lower for word in forbidden_words
-                )
-                return ModerationResult(
-                    contains_forbidden_words=contains_forbidden, source="database"
+                matcher = await self.matcher_cache.get_matcher(
+                    self.repository, self.version_repository
                 )
+            matches = matcher.find_all(text)
+            return ModerationResult(
+                contains_forbidden_words=bool(matches),
+                source="database",
+                matches=matches,
+            )
         except Exception as e:
             logger.error(f"Error checking forbidden words in database: {str(e)}")
             return ModerationResult(
@@ -73,6 +81,91 @@ class ModerationService:
             logger.error(f"Error checking forbidden words with AI: {str(e)}")
             return ModerationResult(contains_forbidden_words=False, source="ai_error")
 
+    async def check_forbidden_words_ai_batch(
+        self, texts: List[str]
+    ) -> List[ModerationResult]:
+        try:
+            verdicts = await self.ai_service.check_forbidden_words_batch(texts)
+        except Exception as e:
+            logger.error(f"Error checking forbidden words with AI: {str(e)}")
+            return [
+                ModerationResult(contains_forbidden_words=False, source="ai_error")
+                for _ in texts
+            ]
+
+        return [
+            ModerationResult(
+                contains_forbidden_words=any(
+                    [
+                        self.settings.ai_check_profanity and verdict["profanity"],
+                        self.settings.ai_check_offensive and verdict["offensive"],
+                        self.settings.ai_check_inappropriate
+                        and verdict["inappropriate"],
+                    ]
+                ),
+                source="ai",
+                details=verdict,
+            )
+            for verdict in verdicts
+        ]
+
+    async def check_forbidden_words_batch(
+        self,
+        texts: List[str],
+        check_database: bool = True,
+        check_ai: bool = True,
+    ) -> List[ModerationResult]:
+        results: List[Optional[ModerationResult]] = [
+            None
+            if text.strip()
+            else ModerationResult(contains_forbidden_words=False, source="empty_input")
+            for text in texts
+        ]
+
+        if check_database and any(result is None for result in results):
+            try:
+                async with self.uow:
+                    matcher = await self.matcher_cache.get_matcher(
+                        self.repository, self.version_repository
+                    )
+                for index, text in enumerate(texts):
+                    matches = matcher.find_all(text) if results[index] is None else []
+                    if matches:
+                        results[index] = ModerationResult(
+                            contains_forbidden_words=True,
+                            source="database",
+                            matches=matches,
+                        )
+            except Exception as e:
+                logger.error(f"Error checking forbidden words in database: {str(e)}")
+
+        pending = [index for index, result in enumerate(results) if result is None]
+        ai_enabled = check_ai and self.settings.ai_moderation_enabled
+        if pending and ai_enabled and self._ai_checks_enabled():
+            ai_results = await self.check_forbidden_words_ai_batch(
+                [texts[index] for index in pending]
+            )
+            for index, ai_result in zip(pending, ai_results):
+                results[index] = ai_result
+
+        return [
+            result
+            or ModerationResult(
+                contains_forbidden_words=False,
+                source="ai_skipped" if ai_enabled else "no_checks_enabled",
+            )
+            for result in results
+        ]
+
+    def _ai_checks_enabled(self) -> bool:
+        return any(
+            [
+                self.settings.ai_check_profanity,
+                self.settings.ai_check_offensive,
+                self.settings.ai_check_inappropriate,
+            ]
+        )
+
     async def check_forbidden_words(
         self,
         text: str,
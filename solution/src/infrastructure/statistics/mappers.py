@@ -1,17 +1,23 @@
-from typing import List
+from typing import List, Optional
 
 from src.application.statistics.dtos import (
     CampaignFeedbackItem,
     CampaignFeedbackResponse,
     DailyStatsResponse,
+    ReachResponse,
     StatsResponse,
 )
-from src.domain.statistics.entities import FeedbackEntity, StatisticsEntity
+from src.domain.statistics.entities import (
+    FeedbackEntity,
+    ReachEntity,
+    StatisticsEntity,
+)
+from src.domain.statistics.types import REACH_HLL_STANDARD_ERROR
 
 
 class StatisticsMapper:
     def from_entity_to_statistics_schema(
-        self, entity: StatisticsEntity
+        self, entity: StatisticsEntity, reach: Optional[ReachEntity] = None
     ) -> StatsResponse:
         return StatsResponse(
             impressions_count=entity.impressions_count,
@@ -20,10 +26,11 @@ class StatisticsMapper:
             spent_impressions=entity.spent_impressions,
             spent_clicks=entity.spent_clicks,
             spent_total=entity.spent_total,
+            unique_clients=reach.unique_clients if reach else None,
         )
 
     def from_entity_to_schema_daily_stats(
-        self, entity: StatisticsEntity
+        self, entity: StatisticsEntity, unique_clients: Optional[int] = None
     ) -> DailyStatsResponse:
         return DailyStatsResponse(
             impressions_count=entity.impressions_count,
@@ -33,6 +40,7 @@ class StatisticsMapper:
             spent_clicks=entity.spent_clicks,
             spent_total=entity.spent_total,
             date=entity.date,
+            unique_clients=unique_clients,
         )
 
     def from_entity_to_schema_campaign_feedback(
@@ -56,3 +64,9 @@ class StatisticsMapper:
                 for entity in entities
             ],
         )
+
+    def from_entity_to_reach_schema(self, entity: ReachEntity) -> ReachResponse:
+        return ReachResponse(
+            unique_clients=entity.unique_clients,
+            relative_standard_error=REACH_HLL_STANDARD_ERROR,
+        )
@@ -1,9 +1,11 @@
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
 import sqlalchemy
 from sqlalchemy import ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from src.core.db import Base
 from src.core.models import SQLAlchemyBaseModel, SQLAlchemyTimestampMixin
 
 
@@ -44,3 +46,40 @@ class UniqueEventModel(SQLAlchemyBaseModel, SQLAlchemyTimestampMixin):
             "campaign_id", "client_id", "event_type", name="uix_campaign_client_event"
         ),
     )
+
+
+class CampaignDailyStatsModel(Base):
+    __tablename__ = "campaign_daily_stats"
+
+    campaign_id: Mapped[UUID] = mapped_column(
+        sqlalchemy.UUID(as_uuid=True),
+        ForeignKey("campaigns.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    date: Mapped[int] = mapped_column(
+        sqlalchemy.Integer,
+        primary_key=True,
+    )
+    impressions_count: Mapped[int] = mapped_column(
+        sqlalchemy.Integer,
+        nullable=False,
+        default=0,
+    )
+    clicks_count: Mapped[int] = mapped_column(
+        sqlalchemy.Integer,
+        nullable=False,
+        default=0,
+    )
+
+
+class StatsRollupWatermarkModel(Base):
+    __tablename__ = "stats_rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(
+        sqlalchemy.String(length=50),
+        primary_key=True,
+    )
+    value: Mapped[datetime] = mapped_column(
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+    )
@@ -1,22 +1,33 @@
-from typing import Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
+import redis.asyncio as redis
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from src.application.statistics.dtos import ClientStatsResponse
 from src.common.types import EVENT_TYPE_CLICK, EVENT_TYPE_IMPRESSION
 from src.domain.campaigns.exceptions import CampaignNotFoundException
-from src.domain.statistics.entities import FeedbackEntity, StatisticsEntity
+from src.domain.statistics.entities import (
+    FeedbackEntity,
+    ReachEntity,
+    StatisticsEntity,
+)
 from src.domain.statistics.exceptions import (
     ClicksLimitReachedError,
     DuplicateClickError,
     NoImpressionError,
     StatisticsRepositoryError,
 )
+from src.domain.statistics.types import (
+    STATS_CACHE_SCOPE_ADVERTISER,
+    STATS_CACHE_SCOPE_CAMPAIGN,
+)
 from src.domain.time.interfaces import TimeRepositoryProtocol
 from src.infrastructure.statistics.mappers import StatisticsMapper
 from src.infrastructure.statistics.orm import UniqueEventModel
+from src.infrastructure.time.repositories import CURRENT_DATE_KEY
 
 
 class StatisticsRepository:
@@ -173,63 +184,55 @@ class StatisticsRepository:
             )
 
     async def get_campaign_daily_stats(
-        self, campaign_id: UUID
+        self, campaign_id: UUID, date_from: int, date_to: int, bucket_size: int
     ) -> List[StatisticsEntity]:
         try:
             query = text(
                 """
-                WITH daily_stats AS (
+                WITH buckets AS (
+                    SELECT generate_series(
+                        CAST(:date_from AS INTEGER),
+                        CAST(:date_to AS INTEGER),
+                        CAST(:bucket_size AS INTEGER)
+                    ) as date
+                ),
+                daily_stats AS (
                     SELECT 
-                        campaign_id,
-                        date,
-                        SUM(CASE WHEN event_type = :impression_type THEN 1 ELSE 0 END) as impressions_count,
-                        SUM(CASE WHEN event_type = :click_type THEN 1 ELSE 0 END) as clicks_count
-                    FROM unique_events
-                    WHERE campaign_id = :campaign_id
-                    GROUP BY campaign_id, date
+                        CAST(:date_from AS INTEGER) + 
+                        ((s.date - CAST(:date_from AS INTEGER)) / CAST(:bucket_size AS INTEGER)) * CAST(:bucket_size AS INTEGER) as bucket,
+                        s.impressions_count,
+                        s.clicks_count,
+                        s.impressions_count * c.cost_per_impression as spent_impressions,
+                        s.clicks_count * c.cost_per_click as spent_clicks
+                    FROM campaign_daily_stats s
+                    JOIN campaigns c ON c.id = s.campaign_id
+                    WHERE s.campaign_id = :campaign_id
+                    AND s.date BETWEEN :date_from AND :date_to
                 )
                 SELECT 
-                    c.id as campaign_id,
-                    COALESCE(d.date, c.start_date) as date,
-                    COALESCE(d.impressions_count, 0) as impressions_count,
-                    COALESCE(d.clicks_count, 0) as clicks_count,
-                    CASE 
-                        WHEN COALESCE(d.impressions_count, 0) > 0 
-                        THEN CAST(COALESCE(d.clicks_count, 0) AS FLOAT) / COALESCE(d.impressions_count, 0)
-                        ELSE 0 
-                    END as conversion,
-                    COALESCE(d.impressions_count, 0) * c.cost_per_impression as spent_impressions,
-                    COALESCE(d.clicks_count, 0) * c.cost_per_click as spent_clicks,
-                    (COALESCE(d.impressions_count, 0) * c.cost_per_impression) + 
-                    (COALESCE(d.clicks_count, 0) * c.cost_per_click) as spent_total
-                FROM campaigns c
-                LEFT JOIN daily_stats d ON c.id = d.campaign_id
-                WHERE c.id = :campaign_id
-                ORDER BY COALESCE(d.date, c.start_date)
+                    b.date,
+                    COALESCE(SUM(d.impressions_count), 0) as impressions_count,
+                    COALESCE(SUM(d.clicks_count), 0) as clicks_count,
+                    COALESCE(SUM(d.spent_impressions), 0) as spent_impressions,
+                    COALESCE(SUM(d.spent_clicks), 0) as spent_clicks
+                FROM buckets b
+                LEFT JOIN daily_stats d ON d.bucket = b.date
+                GROUP BY b.date
+                ORDER BY b.date
                 """
             )
             result = await self._session.execute(
                 query,
                 {
                     "campaign_id": campaign_id,
-                    "impression_type": EVENT_TYPE_IMPRESSION,
-                    "click_type": EVENT_TYPE_CLICK,
+                    "date_from": date_from,
+                    "date_to": date_to,
+                    "bucket_size": bucket_size,
                 },
             )
-            models = result.mappings().all()
             return [
-                StatisticsEntity(
-                    id=uuid4(),
-                    campaign_id=model["campaign_id"],
-                    date=model["date"],
-                    impressions_count=model["impressions_count"],
-                    clicks_count=model["clicks_count"],
-                    conversion=model["conversion"],
-                    spent_impressions=model["spent_impressions"],
-                    spent_clicks=model["spent_clicks"],
-                    spent_total=model["spent_total"],
-                )
-                for model in models
+                self._to_bucket_entity(campaign_id, model)
+                for model in result.mappings().all()
             ]
         except SQLAlchemyError as e:
             raise StatisticsRepositoryError(f"Db error: {str(e)}")
@@ -239,67 +242,55 @@ class StatisticsRepository:
             )
 
     async def get_advertiser_daily_stats(
-        self, advertiser_id: UUID
+        self, advertiser_id: UUID, date_from: int, date_to: int, bucket_size: int
     ) -> List[StatisticsEntity]:
         try:
             query = text(
                 """
-                WITH daily_stats AS (
+                WITH buckets AS (
+                    SELECT generate_series(
+                        CAST(:date_from AS INTEGER),
+                        CAST(:date_to AS INTEGER),
+                        CAST(:bucket_size AS INTEGER)
+                    ) as date
+                ),
+                daily_stats AS (
                     SELECT 
-                        c.advertiser_id,
-                        ue.date,
-                        SUM(CASE WHEN ue.event_type = :impression_type THEN 1 ELSE 0 END) as impressions_count,
-                        SUM(CASE WHEN ue.event_type = :click_type THEN 1 ELSE 0 END) as clicks_count
+                        CAST(:date_from AS INTEGER) + 
+                        ((s.date - CAST(:date_from AS INTEGER)) / CAST(:bucket_size AS INTEGER)) * CAST(:bucket_size AS INTEGER) as bucket,
+                        s.impressions_count,
+                        s.clicks_count,
+                        s.impressions_count * c.cost_per_impression as spent_impressions,
+                        s.clicks_count * c.cost_per_click as spent_clicks
                     FROM campaigns c
-                    LEFT JOIN unique_events ue ON c.id = ue.campaign_id
+                    JOIN campaign_daily_stats s ON s.campaign_id = c.id
                     WHERE c.advertiser_id = :advertiser_id
-                    GROUP BY c.advertiser_id, ue.date
+                    AND s.date BETWEEN :date_from AND :date_to
                 )
                 SELECT 
-                    :advertiser_id as campaign_id,
-                    COALESCE(d.date, (SELECT MIN(start_date) FROM campaigns WHERE advertiser_id = :advertiser_id)) as date,
-                    COALESCE(d.impressions_count, 0) as impressions_count,
-                    COALESCE(d.clicks_count, 0) as clicks_count,
-                    CASE 
-                        WHEN COALESCE(d.impressions_count, 0) > 0 
-                        THEN CAST(COALESCE(d.clicks_count, 0) AS FLOAT) / COALESCE(d.impressions_count, 0)
-                        ELSE 0 
-                    END as conversion,
-                    SUM(COALESCE(d.impressions_count, 0) * c.cost_per_impression) as spent_impressions,
-                    SUM(COALESCE(d.clicks_count, 0) * c.cost_per_click) as spent_clicks,
-                    SUM(
-                        (COALESCE(d.impressions_count, 0) * c.cost_per_impression) + 
-                        (COALESCE(d.clicks_count, 0) * c.cost_per_click)
-                    ) as spent_total
-                FROM campaigns c
-                LEFT JOIN daily_stats d ON c.advertiser_id = d.advertiser_id
-                WHERE c.advertiser_id = :advertiser_id
-                GROUP BY c.advertiser_id, d.date, d.impressions_count, d.clicks_count
-                ORDER BY COALESCE(d.date, (SELECT MIN(start_date) FROM campaigns WHERE advertiser_id = :advertiser_id))
+                    b.date,
+                    COALESCE(SUM(d.impressions_count), 0) as impressions_count,
+                    COALESCE(SUM(d.clicks_count), 0) as clicks_count,
+                    COALESCE(SUM(d.spent_impressions), 0) as spent_impressions,
+                    COALESCE(SUM(d.spent_clicks), 0) as spent_clicks
+                FROM buckets b
+                LEFT JOIN daily_stats d ON d.bucket = b.date
+                GROUP BY b.date
+                ORDER BY b.date
                 """
             )
             result = await self._session.execute(
                 query,
                 {
                     "advertiser_id": advertiser_id,
-                    "impression_type": EVENT_TYPE_IMPRESSION,
-                    "click_type": EVENT_TYPE_CLICK,
+                    "date_from": date_from,
+                    "date_to": date_to,
+                    "bucket_size": bucket_size,
                 },
             )
-            models = result.mappings().all()
             return [
-                StatisticsEntity(
-                    id=uuid4(),
-                    campaign_id=model["campaign_id"],
-                    date=model["date"],
-                    impressions_count=model["impressions_count"],
-                    clicks_count=model["clicks_count"],
-                    conversion=model["conversion"],
-                    spent_impressions=model["spent_impressions"],
-                    spent_clicks=model["spent_clicks"],
-                    spent_total=model["spent_total"],
-                )
-                for model in models
+                self._to_bucket_entity(advertiser_id, model)
+                for model in result.mappings().all()
             ]
         except SQLAlchemyError as e:
             raise StatisticsRepositoryError(f"Db error: {str(e)}")
@@ -308,7 +299,64 @@ class StatisticsRepository:
                 f"Unexpected error in get_advertiser_daily_stats: {str(e)}"
             )
 
-    async def register_impression(self, client_id: UUID, campaign_id: UUID):
+    async def get_advertiser_period(
+        self, advertiser_id: UUID
+    ) -> Optional[Tuple[int, int]]:
+        try:
+            result = await self._session.execute(
+                text(
+                    """
+                    SELECT MIN(start_date) as start_date, MAX(end_date) as end_date
+                    FROM campaigns
+                    WHERE advertiser_id = :advertiser_id
+                    """
+                ),
+                {"advertiser_id": advertiser_id},
+            )
+            model = result.mappings().first()
+            if not model or model["start_date"] is None:
+                return None
+            return model["start_date"], model["end_date"]
+        except SQLAlchemyError as e:
+            raise StatisticsRepositoryError(f"Db error: {str(e)}")
+
+    def _to_bucket_entity(self, owner_id: UUID, model) -> StatisticsEntity:
+        impressions_count = int(model["impressions_count"])
+        clicks_count = int(model["clicks_count"])
+        spent_impressions = float(model["spent_impressions"])
+        spent_clicks = float(model["spent_clicks"])
+        return StatisticsEntity(
+            id=uuid4(),
+            campaign_id=owner_id,
+            date=model["date"],
+            impressions_count=impressions_count,
+            clicks_count=clicks_count,
+            conversion=clicks_count / impressions_count if impressions_count else 0.0,
+            spent_impressions=spent_impressions,
+            spent_clicks=spent_clicks,
+            spent_total=spent_impressions + spent_clicks,
+        )
+
+    async def _increment_daily_stats(
+        self, campaign_id: UUID, date: int, impressions: int, clicks: int
+    ) -> None:
+        await self._session.execute(
+            text("""
+                INSERT INTO campaign_daily_stats (campaign_id, date, impressions_count, clicks_count)
+                VALUES (:campaign_id, :date, :impressions, :clicks)
+                ON CONFLICT (campaign_id, date) DO UPDATE SET
+                    impressions_count = campaign_daily_stats.impressions_count + EXCLUDED.impressions_count,
+                    clicks_count = campaign_daily_stats.clicks_count + EXCLUDED.clicks_count
+            """),
+            {
+                "campaign_id": campaign_id,
+                "date": date,
+                "impressions": impressions,
+                "clicks": clicks,
+            },
+        )
+
+    async def register_impression(self, client_id: UUID, campaign_id: UUID) -> bool:
         try:
             current_day = await self._time_repository.get_current_date()
 
@@ -399,13 +447,15 @@ class StatisticsRepository:
                     and check_data.get("current_impressions", 0)
                     >= check_data.get("impressions_limit", 0)
                 ):
-                    return
+                    return False
                 else:
                     raise StatisticsRepositoryError(
                         "Failed to register impression for unknown reason"
                     )
 
+            await self._increment_daily_stats(campaign_id, current_day, 1, 0)
             await self._session.flush()
+            return True
         except SQLAlchemyError as e:
             raise StatisticsRepositoryError(f"Db error: {str(e)}")
         except Exception as e:
@@ -536,6 +586,7 @@ class StatisticsRepository:
                         "Failed to register click for unknown reason"
                     )
 
+            await self._increment_daily_stats(campaign_id, current_day, 0, 1)
             await self._session.flush()
         except SQLAlchemyError as e:
             raise StatisticsRepositoryError(f"Database error: {str(e)}")
@@ -654,3 +705,210 @@ class StatisticsRepository:
             raise StatisticsRepositoryError(
                 f"Unexpected error in get_campaign_feedbacks: {str(e)}"
             )
+
+
+# Shared cache fills outlive the request that started them, so they read
+# through a session of their own instead of borrowing the request's one.
+class StatisticsRepositoryFactory:
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        mapper: StatisticsMapper,
+        time_repository: TimeRepositoryProtocol,
+    ) -> None:
+        self._session_maker = session_maker
+        self._mapper = mapper
+        self._time_repository = time_repository
+
+    @asynccontextmanager
+    async def __call__(self) -> AsyncIterator[StatisticsRepository]:
+        async with self._session_maker() as session:
+            yield StatisticsRepository(session, self._mapper, self._time_repository)
+
+
+DAILY_STATS_WATERMARK = "campaign_daily_stats"
+
+
+async def backfill_campaign_daily_stats(session: AsyncSession) -> None:
+    await session.execute(
+        text("""
+            CREATE INDEX IF NOT EXISTS ix_unique_events_created_at
+            ON unique_events (created_at)
+        """)
+    )
+    await session.commit()
+
+    # Blocks the per-event increments until the recount commits: increments
+    # committed earlier are part of the recount, later ones apply on top.
+    await session.execute(
+        text("LOCK TABLE campaign_daily_stats IN SHARE ROW EXCLUSIVE MODE")
+    )
+    watermark = (
+        await session.execute(
+            text("SELECT value FROM stats_rollup_watermarks WHERE name = :name"),
+            {"name": DAILY_STATS_WATERMARK},
+        )
+    ).scalar_one_or_none()
+
+    # Recounts every (campaign, day) that received events since the last run,
+    # or all of them on the first run, so events written by a version that
+    # did not maintain the rollup are picked up.
+    touched = "SELECT campaign_id, date FROM unique_events"
+    params: Dict[str, object] = {
+        "impression_type": EVENT_TYPE_IMPRESSION,
+        "click_type": EVENT_TYPE_CLICK,
+    }
+    if watermark is not None:
+        # Events carry their transaction's start time, so one committed after
+        # the previous run can be stamped slightly before its watermark.
+        touched += (
+            " WHERE created_at >= CAST(:watermark AS timestamptz) - interval '1 hour'"
+        )
+        params["watermark"] = watermark
+    await session.execute(
+        text(f"""
+            INSERT INTO campaign_daily_stats (campaign_id, date, impressions_count, clicks_count)
+            SELECT
+                campaign_id,
+                date,
+                COUNT(*) FILTER (WHERE event_type = :impression_type),
+                COUNT(*) FILTER (WHERE event_type = :click_type)
+            FROM unique_events
+            WHERE (campaign_id, date) IN ({touched})
+            GROUP BY campaign_id, date
+            ON CONFLICT (campaign_id, date) DO UPDATE SET
+                impressions_count = EXCLUDED.impressions_count,
+                clicks_count = EXCLUDED.clicks_count
+        """),
+        params,
+    )
+    await session.execute(
+        text("""
+            INSERT INTO stats_rollup_watermarks (name, value)
+            VALUES (:name, now())
+            ON CONFLICT (name) DO UPDATE SET value = EXCLUDED.value
+        """),
+        {"name": DAILY_STATS_WATERMARK},
+    )
+    await session.commit()
+
+
+class ReachRepository:
+    CAMPAIGN_KEY = "reach:campaign:{campaign_id}"
+    ADVERTISER_KEY = "reach:advertiser:{advertiser_id}"
+
+    def __init__(self, redis: redis.Redis) -> None:
+        self._redis = redis
+
+    async def add_impression(
+        self, client_id: UUID, campaign_id: UUID, advertiser_id: UUID, date: int
+    ) -> None:
+        campaign_key = self.CAMPAIGN_KEY.format(campaign_id=campaign_id)
+        advertiser_key = self.ADVERTISER_KEY.format(advertiser_id=advertiser_id)
+        member = str(client_id)
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.pfadd(campaign_key, member)
+                pipe.pfadd(f"{campaign_key}:{date}", member)
+                pipe.pfadd(advertiser_key, member)
+                pipe.pfadd(f"{advertiser_key}:{date}", member)
+                await pipe.execute()
+        except Exception as e:
+            raise StatisticsRepositoryError(f"Redis error in add_impression: {str(e)}")
+
+    async def get_campaign_reach(self, campaign_id: UUID) -> ReachEntity:
+        return await self._count(self.CAMPAIGN_KEY.format(campaign_id=campaign_id))
+
+    async def get_advertiser_reach(self, advertiser_id: UUID) -> ReachEntity:
+        return await self._count(
+            self.ADVERTISER_KEY.format(advertiser_id=advertiser_id)
+        )
+
+    async def get_campaign_daily_reach(
+        self, campaign_id: UUID, dates: List[int]
+    ) -> Dict[int, int]:
+        return await self._count_daily(
+            self.CAMPAIGN_KEY.format(campaign_id=campaign_id), dates
+        )
+
+    async def get_advertiser_daily_reach(
+        self, advertiser_id: UUID, dates: List[int]
+    ) -> Dict[int, int]:
+        return await self._count_daily(
+            self.ADVERTISER_KEY.format(advertiser_id=advertiser_id), dates
+        )
+
+    async def _count(self, key: str) -> ReachEntity:
+        # The cumulative sketch is updated on every impression, so the total
+        # is one PFCOUNT regardless of how long the campaign has run.
+        try:
+            total = await self._redis.pfcount(key)
+        except Exception as e:
+            raise StatisticsRepositoryError(f"Redis error in get_reach: {str(e)}")
+        return ReachEntity(unique_clients=int(total))
+
+    async def _count_daily(self, key: str, dates: List[int]) -> Dict[int, int]:
+        if not dates:
+            return {}
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for date in dates:
+                    pipe.pfcount(f"{key}:{date}")
+                counts = await pipe.execute()
+        except Exception as e:
+            raise StatisticsRepositoryError(f"Redis error in get_daily_reach: {str(e)}")
+        return {date: int(count) for date, count in zip(dates, counts)}
+
+
+class StatisticsCacheRepository:
+    VERSION_KEY = "stats:version:{scope}:{entity_id}"
+    ENTRY_KEY = "stats:cache:{endpoint}:{entity_id}:{day}:{version}:{params}"
+
+    def __init__(self, redis: redis.Redis, ttl_seconds: int) -> None:
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+
+    async def build_key(
+        self, endpoint: str, scope: str, entity_id: UUID, *params: object
+    ) -> str:
+        version_key = self.VERSION_KEY.format(scope=scope, entity_id=entity_id)
+        try:
+            day, version = await self._redis.mget(CURRENT_DATE_KEY, version_key)
+        except Exception as e:
+            raise StatisticsRepositoryError(f"Redis error in build_key: {str(e)}")
+        return self.ENTRY_KEY.format(
+            endpoint=endpoint,
+            entity_id=entity_id,
+            day=day or 0,
+            version=version or 0,
+            params=":".join(str(param) for param in params),
+        )
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            return await self._redis.get(key)
+        except Exception as e:
+            raise StatisticsRepositoryError(f"Redis error in get: {str(e)}")
+
+    async def set(self, key: str, value: str) -> None:
+        try:
+            await self._redis.set(key, value, ex=self._ttl_seconds)
+        except Exception as e:
+            raise StatisticsRepositoryError(f"Redis error in set: {str(e)}")
+
+    async def bump_version(self, campaign_id: UUID, advertiser_id: UUID) -> None:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.incr(
+                    self.VERSION_KEY.format(
+                        scope=STATS_CACHE_SCOPE_CAMPAIGN, entity_id=campaign_id
+                    )
+                )
+                pipe.incr(
+                    self.VERSION_KEY.format(
+                        scope=STATS_CACHE_SCOPE_ADVERTISER, entity_id=advertiser_id
+                    )
+                )
+                await pipe.execute()
+        except Exception as e:
+            raise StatisticsRepositoryError(f"Redis error in bump_version: {str(e)}")
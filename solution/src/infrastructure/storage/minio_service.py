@@ -1,21 +1,92 @@
+import asyncio
 import io
 import json
-from typing import Final
+import time
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from typing import Any, BinaryIO, Callable, Final, Optional, TypeVar
 from uuid import UUID
 
 from minio import Minio
 from minio.error import S3Error
-from src.core.settings import Settings
+from prometheus_client import Gauge, Histogram
+from src.core.settings import Settings, settings
 from src.domain.storage.exceptions import (
     MinioDeleteError,
+    MinioFileTooLargeError,
     MinioGetUrlError,
+    MinioInvalidFileType,
     MinioServiceError,
     MinioUploadError,
 )
 
+logger = getLogger(__name__)
+
+R = TypeVar("R")
+
+minio_operation_seconds = Histogram(
+    "minio_operation_seconds",
+    "Duration of object storage calls run on the storage thread pool",
+    ["operation"],
+)
+minio_up = Gauge(
+    "minio_up",
+    "Whether the last object storage health check succeeded",
+)
+
+# The minio client is synchronous, so its calls run on a bounded pool shared
+# by the process instead of blocking the event loop for a whole S3 request.
+storage_executor = ThreadPoolExecutor(
+    max_workers=settings.minio_io_threads, thread_name_prefix="minio"
+)
+
+IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    for signature, content_type in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+class _SizeLimitedReader:
+    # Replays the sniffed head, then reads the rest of the stream, failing
+    # as soon as more than `limit` bytes have been consumed.
+    def __init__(self, head: bytes, stream: BinaryIO, limit: int) -> None:
+        self._head = head
+        self._stream = stream
+        self._limit = limit
+        self._size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            chunk, self._head = self._head + self._stream.read(), b""
+        elif size <= len(self._head):
+            chunk, self._head = self._head[:size], self._head[size:]
+        else:
+            chunk = self._head + self._stream.read(size - len(self._head))
+            self._head = b""
+        self._size += len(chunk)
+        if self._size > self._limit:
+            raise MinioFileTooLargeError(
+                f"Image exceeds the {self._limit // (1024 * 1024)} MB limit"
+            )
+        return chunk
+
 
 class MinioService:
     MAX_FILE_SIZE: Final[int] = 10 * 1024 * 1024
+    # Smallest part S3 accepts; bounds the memory one upload holds at a time.
+    UPLOAD_PART_SIZE: Final[int] = 5 * 1024 * 1024
+    SNIFF_SIZE: Final[int] = 12
 
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
@@ -26,7 +97,9 @@ class MinioService:
             secure=settings.minio_secure,
         )
         self.bucket_name = settings.minio_bucket_name
-        self._ensure_bucket_exists()
+        self._bucket_ready = False
+        self._bootstrap_lock = asyncio.Lock()
+        self._healthy = True
 
     def _ensure_bucket_exists(self) -> None:
         try:
@@ -58,25 +131,118 @@ class MinioService:
         except S3Error as e:
             raise MinioServiceError(f"Failed to ensure bucket exists: {e}")
 
-    async def upload_image(self, campaign_id: UUID, image_data: bytes) -> str:
+    async def _run(
+        self, operation: str, func: Callable[..., R], *args: Any, **kwargs: Any
+    ) -> R:
+        def timed() -> R:
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                minio_operation_seconds.labels(operation).observe(
+                    time.perf_counter() - started
+                )
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(storage_executor, timed)
+
+    async def ensure_bucket(self) -> None:
+        # Bucket and policy are set up once per process; a failed attempt is
+        # retried by the next call instead of on every request.
+        if self._bucket_ready:
+            return
+        async with self._bootstrap_lock:
+            if not self._bucket_ready:
+                await self._run("bootstrap", self._ensure_bucket_exists)
+                self._bucket_ready = True
+
+    async def check_health(self) -> bool:
         try:
-            result = self.client.put_object(
-                self.bucket_name,
-                f"{campaign_id}",
-                io.BytesIO(image_data),
-                length=len(image_data),
-                content_type="image/jpeg",
+            exists = await self._run(
+                "bucket_exists", self.client.bucket_exists, self.bucket_name
             )
-            return result.object_name
+            if not exists:
+                self._bucket_ready = False
+            await self.ensure_bucket()
+            healthy = True
+        except Exception as e:
+            logger.warning(f"Object storage health check failed: {e}")
+            healthy = False
 
+        if healthy and not self._healthy:
+            logger.info("Object storage is available again")
+        self._healthy = healthy
+        minio_up.set(1 if healthy else 0)
+        return healthy
+
+    async def health_check_forever(self, interval_seconds: float) -> None:
+        while True:
+            await self.check_health()
+            await asyncio.sleep(interval_seconds)
+
+    def _put_image_stream(self, object_name: str, image: BinaryIO) -> str:
+        head = image.read(self.SNIFF_SIZE)
+        content_type = sniff_image_type(head)
+        if content_type is None:
+            raise MinioInvalidFileType(
+                "Unsupported image format, expected jpeg, png, gif or webp"
+            )
+
+        # Unknown length makes the client stream the data as a multipart
+        # upload, holding one part in memory; a failed upload is aborted and
+        # leaves the previous object in place.
+        result = self.client.put_object(
+            self.bucket_name,
+            object_name,
+            _SizeLimitedReader(head, image, self.MAX_FILE_SIZE),
+            length=-1,
+            part_size=self.UPLOAD_PART_SIZE,
+            content_type=content_type,
+        )
+        return result.object_name
+
+    async def upload_image(self, campaign_id: UUID, image: BinaryIO) -> str:
+        try:
+            await self.ensure_bucket()
+            return await self._run(
+                "put_object", self._put_image_stream, f"{campaign_id}", image
+            )
+
+        except (MinioInvalidFileType, MinioFileTooLargeError):
+            raise
         except S3Error as e:
             raise MinioUploadError(f"Failed to upload image: {e}")
         except Exception as e:
             raise MinioUploadError(f"Unexpected error uploading image: {e}")
 
+    async def upload_generated_image(self, job_id: UUID, image_data: bytes) -> str:
+        object_name = f"generated/{job_id}.png"
+        try:
+            await self.ensure_bucket()
+            await self._run(
+                "put_object",
+                self.client.put_object,
+                self.bucket_name,
+                object_name,
+                io.BytesIO(image_data),
+                length=len(image_data),
+                content_type="image/png",
+            )
+        except S3Error as e:
+            raise MinioUploadError(f"Failed to upload generated image: {e}")
+        except Exception as e:
+            raise MinioUploadError(f"Unexpected error uploading generated image: {e}")
+        return f"{self.settings.minio_public_url}/{self.bucket_name}/{object_name}"
+
     async def delete_image(self, campaign_id: UUID) -> None:
         try:
-            self.client.remove_object(self.bucket_name, f"{campaign_id}")
+            await self.ensure_bucket()
+            await self._run(
+                "remove_object",
+                self.client.remove_object,
+                self.bucket_name,
+                f"{campaign_id}",
+            )
 
         except S3Error as e:
             if e.code == "NoSuchKey":
@@ -92,3 +258,6 @@ class MinioService:
 
         except Exception as e:
             raise MinioGetUrlError(f"Unexpected error getting image URL: {e}")
+
+
+minio_service = MinioService(settings)
@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 import aiohttp
+from src.core.http import HttpClient
 from src.core.settings import Settings
 from src.domain.campaigns.entities import CampaignEntity
 from src.domain.campaigns.interfaces import YandexDirectServiceProtocol
@@ -12,8 +13,14 @@ class YandexDirectService(YandexDirectServiceProtocol):
     CAMPAIGNS_URL = "https://api-sandbox.direct.yandex.com/json/v5/campaigns"
     ADS_URL = "https://api-sandbox.direct.yandex.com/json/v5/ads"
 
-    def __init__(self, settings: Settings, token: Optional[str] = None):
+    def __init__(
+        self,
+        settings: Settings,
+        http_client: HttpClient,
+        token: Optional[str] = None,
+    ):
         self.settings = settings
+        self.http_client = http_client
         self.token = token or settings.yandex_token
         self.headers = {
             "Authorization": f"Bearer {self.token}",
@@ -25,19 +32,19 @@ class YandexDirectService(YandexDirectServiceProtocol):
     ) -> Optional[Dict[str, Any]]:
         try:
             json_body = json.dumps(body, ensure_ascii=False).encode("utf8")
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url, data=json_body, headers=self.headers
-                ) as response:
-                    if response.status != 200:
-                        return None
-
-                    data = await response.json()
-                    if data.get("error"):
-                        error = data["error"]
-                        return None
-
-                    return data
+            session = await self.http_client.get_session()
+            async with session.post(
+                url, data=json_body, headers=self.headers
+            ) as response:
+                if response.status != 200:
+                    return None
+
+                data = await response.json()
+                if data.get("error"):
+                    error = data["error"]
+                    return None
+
+                return data
 
         except aiohttp.ClientError:
             return None
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+from uuid import UUID
+
+import redis.asyncio as redis
+from src.application.ai.use_cases import GenerateImageUseCase
+from src.core.db import async_session_maker, init_db
+from src.core.http import http_client
+from src.core.redis import init_redis
+from src.core.settings import settings
+from src.core.uow import SQLAlchemyUow
+from src.domain.ai.exceptions import ImageJobQueueError
+from src.infrastructure.advertisers.orm import AdvertiserModel as AdvertiserModel
+from src.infrastructure.ai.ai_service import AIService
+from src.infrastructure.ai.backends import ai_backend
+from src.infrastructure.ai.jobs import ImageJobRepository
+from src.infrastructure.campaigns.mappers import CampaignsMapper
+from src.infrastructure.campaigns.orm import CampaignModel as CampaignModel
+from src.infrastructure.campaigns.repositories import CampaignsRepository
+from src.infrastructure.clients.orm import ClientModel as ClientModel
+from src.infrastructure.moderation.orm import ForbiddenWordsModel as ForbiddenWordsModel
+from src.infrastructure.statistics.orm import (
+    CampaignDailyStatsModel as CampaignDailyStatsModel,
+)
+from src.infrastructure.statistics.orm import UniqueEventModel as UniqueEventModel
+from src.infrastructure.storage.minio_service import MinioService, minio_service
+from src.infrastructure.time.repositories import TimeRepository
+
+logger = logging.getLogger(__name__)
+
+DEQUEUE_TIMEOUT_SECONDS = 5
+RETRY_DELAY_SECONDS = 1.0
+
+
+async def generate_image(
+    job_id: UUID,
+    jobs: ImageJobRepository,
+    redis_client: redis.Redis,
+    ai_service: AIService,
+    minio_service: MinioService,
+) -> None:
+    async with async_session_maker() as session:
+        repository = CampaignsRepository(
+            session, CampaignsMapper(), TimeRepository(redis=redis_client)
+        )
+        usecase = GenerateImageUseCase(
+            SQLAlchemyUow(session), ai_service, repository, minio_service, jobs
+        )
+        job = await usecase.execute(job_id)
+
+    if job is None:
+        logger.info(f"Image job {job_id} expired before it was processed")
+    elif job.error:
+        logger.warning(f"Image job {job_id} failed: {job.error}")
+    else:
+        logger.info(f"Image job {job_id} finished: {job.image_url}")
+
+
+async def consume(
+    jobs: ImageJobRepository,
+    redis_client: redis.Redis,
+    ai_service: AIService,
+    minio_service: MinioService,
+) -> None:
+    while True:
+        try:
+            job_id = await jobs.dequeue(DEQUEUE_TIMEOUT_SECONDS)
+        except ImageJobQueueError as e:
+            logger.error(str(e))
+            await asyncio.sleep(RETRY_DELAY_SECONDS)
+            continue
+        if job_id is None:
+            continue
+
+        heartbeat = asyncio.create_task(keep_lease(jobs, job_id))
+        try:
+            await generate_image(job_id, jobs, redis_client, ai_service, minio_service)
+            await jobs.ack(job_id)
+        except ImageJobQueueError as e:
+            # Left in the processing list and requeued once its lease expires.
+            logger.error(f"Failed to record image job {job_id}: {e}")
+            await asyncio.sleep(RETRY_DELAY_SECONDS)
+        finally:
+            heartbeat.cancel()
+
+
+async def keep_lease(jobs: ImageJobRepository, job_id: UUID) -> None:
+    while True:
+        await asyncio.sleep(settings.image_job_lease_seconds / 3)
+        try:
+            await jobs.extend_lease(job_id)
+        except ImageJobQueueError as e:
+            logger.error(str(e))
+
+
+async def requeue_expired_forever(jobs: ImageJobRepository) -> None:
+    # Every worker sweeps, so jobs of a worker that never comes back are
+    # still picked up by the others.
+    while True:
+        try:
+            requeued = await jobs.requeue_expired()
+            if requeued:
+                logger.info(f"Re-enqueued {requeued} image jobs with expired leases")
+        except ImageJobQueueError as e:
+            logger.error(str(e))
+        await asyncio.sleep(settings.image_job_lease_seconds)
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+
+    await init_db()
+    redis_client = await init_redis()
+    jobs = ImageJobRepository(
+        redis_client,
+        ttl_seconds=settings.image_job_ttl_seconds,
+        max_queue_length=settings.image_job_queue_max_length,
+        lease_seconds=settings.image_job_lease_seconds,
+    )
+    ai_service = AIService(
+        settings=settings, http_client=http_client, backend=ai_backend
+    )
+    try:
+        await asyncio.gather(
+            requeue_expired_forever(jobs),
+            *(
+                consume(jobs, redis_client, ai_service, minio_service)
+                for _ in range(settings.image_worker_concurrency)
+            ),
+        )
+    finally:
+        await http_client.close()
+        await redis_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+import argparse
+import asyncio
+import sys
+from typing import AsyncIterator
+
+from src.application.loader.dtos import LoadResultSchema
+from src.application.loader.use_cases import BulkLoadUseCase
+from src.common.enums import LoadFormat, LoadTarget
+from src.core.db import async_session_maker, init_db
+from src.core.uow import SQLAlchemyUow
+from src.infrastructure.advertisers.orm import AdvertiserModel as AdvertiserModel
+from src.infrastructure.advertisers.repositories import ensure_ml_scores_unique_key
+from src.infrastructure.campaigns.orm import CampaignModel as CampaignModel
+from src.infrastructure.clients.orm import ClientModel as ClientModel
+from src.infrastructure.loader.repositories import CopyLoaderRepository
+from src.infrastructure.moderation.orm import ForbiddenWordsModel as ForbiddenWordsModel
+from src.infrastructure.statistics.orm import (
+    CampaignDailyStatsModel as CampaignDailyStatsModel,
+)
+from src.infrastructure.statistics.orm import UniqueEventModel as UniqueEventModel
+
+
+async def read_lines(path: str) -> AsyncIterator[bytes]:
+    if path == "-":
+        for line in sys.stdin.buffer:
+            yield line
+        return
+
+    with open(path, "rb") as file:
+        for line in file:
+            yield line
+
+
+def report_progress(result: LoadResultSchema) -> None:
+    print(
+        f"{result.target.value}: received {result.received}, staged {result.staged}, "
+        f"invalid {result.invalid}, rejected {result.rejected}, written {result.written}",
+        file=sys.stderr,
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Загрузка клиентов или ML скоров через COPY"
+    )
+    parser.add_argument("target", choices=[target.value for target in LoadTarget])
+    parser.add_argument("path", help="Путь к CSV/NDJSON файлу или '-' для stdin")
+    parser.add_argument(
+        "--format",
+        choices=[format.value for format in LoadFormat],
+        help="По умолчанию определяется по расширению файла",
+    )
+    args = parser.parse_args()
+
+    format = args.format or (
+        LoadFormat.CSV.value if args.path.endswith(".csv") else LoadFormat.NDJSON.value
+    )
+
+    await init_db()
+    async with async_session_maker() as session:
+        await ensure_ml_scores_unique_key(session)
+        usecase = BulkLoadUseCase(SQLAlchemyUow(session), CopyLoaderRepository(session))
+        result = await usecase.execute(
+            target=LoadTarget(args.target),
+            format=LoadFormat(format),
+            lines=read_lines(args.path),
+            on_progress=report_progress,
+        )
+
+    print(result.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
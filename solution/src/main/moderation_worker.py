@@ -0,0 +1,156 @@
+import asyncio
+import logging
+from uuid import UUID
+
+import redis.asyncio as redis
+from src.application.campaigns.use_cases import ModerateCampaignUseCase
+from src.core.db import async_session_maker, init_db
+from src.core.http import http_client
+from src.core.redis import init_redis
+from src.core.settings import settings
+from src.core.uow import SQLAlchemyUow
+from src.domain.campaigns.exceptions import (
+    CampaignModerationUnavailableError,
+    CampaignRepositoryError,
+)
+from src.domain.moderation.exceptions import ModerationQueueError
+from src.infrastructure.advertisers.orm import AdvertiserModel as AdvertiserModel
+from src.infrastructure.ai.ai_service import AIService
+from src.infrastructure.ai.backends import ai_backend
+from src.infrastructure.ai.cache import AIResultCacheRepository
+from src.infrastructure.campaigns.mappers import CampaignsMapper
+from src.infrastructure.campaigns.orm import CampaignModel as CampaignModel
+from src.infrastructure.campaigns.repositories import (
+    CampaignsRepository,
+    ensure_campaign_moderation_columns,
+)
+from src.infrastructure.clients.orm import ClientModel as ClientModel
+from src.infrastructure.moderation.matcher import forbidden_words_matcher_cache
+from src.infrastructure.moderation.orm import ForbiddenWordsModel as ForbiddenWordsModel
+from src.infrastructure.moderation.queue import ModerationQueueRepository
+from src.infrastructure.moderation.repositories import (
+    ForbiddenWordsRepository,
+    ForbiddenWordsVersionRepository,
+)
+from src.infrastructure.moderation.services import ModerationService
+from src.infrastructure.statistics.orm import (
+    CampaignDailyStatsModel as CampaignDailyStatsModel,
+)
+from src.infrastructure.statistics.orm import UniqueEventModel as UniqueEventModel
+from src.infrastructure.time.repositories import TimeRepository
+
+logger = logging.getLogger(__name__)
+
+DEQUEUE_TIMEOUT_SECONDS = 5.0
+RETRY_DELAY_SECONDS = 1.0
+
+
+async def moderate_campaign(
+    campaign_id: UUID, redis_client: redis.Redis, ai_service: AIService
+) -> None:
+    async with async_session_maker() as session:
+        uow = SQLAlchemyUow(session)
+        moderation_service = ModerationService(
+            uow,
+            ForbiddenWordsRepository(session),
+            ai_service,
+            settings,
+            forbidden_words_matcher_cache,
+            ForbiddenWordsVersionRepository(redis_client),
+        )
+        repository = CampaignsRepository(
+            session, CampaignsMapper(), TimeRepository(redis=redis_client)
+        )
+        usecase = ModerateCampaignUseCase(uow, repository, moderation_service, settings)
+        status = await usecase.execute(campaign_id)
+
+    if status is None:
+        logger.info(f"Campaign {campaign_id} changed or deleted during moderation")
+    else:
+        logger.info(f"Campaign {campaign_id} moderated: {status.value}")
+
+
+async def consume(
+    queue: ModerationQueueRepository, redis_client: redis.Redis, ai_service: AIService
+) -> None:
+    while True:
+        try:
+            campaign_id = await queue.dequeue(DEQUEUE_TIMEOUT_SECONDS)
+        except ModerationQueueError as e:
+            logger.error(str(e))
+            await asyncio.sleep(RETRY_DELAY_SECONDS)
+            continue
+        if campaign_id is None:
+            continue
+
+        try:
+            await moderate_campaign(campaign_id, redis_client, ai_service)
+        except CampaignModerationUnavailableError as e:
+            # Retried once the provider's circuit lets a probe through again.
+            logger.warning(f"Campaign {campaign_id} left pending: {e}")
+            await requeue_later(queue, campaign_id, settings.ai_circuit_reset_seconds)
+        except CampaignRepositoryError as e:
+            logger.error(f"Failed to moderate campaign {campaign_id}: {e}")
+            await requeue_later(queue, campaign_id, RETRY_DELAY_SECONDS)
+
+
+async def requeue_later(
+    queue: ModerationQueueRepository, campaign_id: UUID, delay_seconds: float
+) -> None:
+    await asyncio.sleep(delay_seconds)
+    try:
+        await queue.enqueue(campaign_id)
+    except ModerationQueueError as e:
+        # Still pending in the database, picked up on the next start.
+        logger.error(str(e))
+
+
+async def requeue_pending(
+    queue: ModerationQueueRepository, redis_client: redis.Redis
+) -> None:
+    async with async_session_maker() as session:
+        await ensure_campaign_moderation_columns(session)
+        repository = CampaignsRepository(
+            session, CampaignsMapper(), TimeRepository(redis=redis_client)
+        )
+        campaign_ids = await repository.get_pending_moderation_ids()
+
+    # Duplicates are harmless: a campaign that is no longer pending is skipped.
+    for campaign_id in campaign_ids:
+        await queue.enqueue(campaign_id)
+    logger.info(f"Re-enqueued {len(campaign_ids)} campaigns pending moderation")
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+
+    await init_db()
+    redis_client = await init_redis()
+    queue = ModerationQueueRepository(redis_client)
+    ai_service = AIService(
+        settings=settings,
+        http_client=http_client,
+        result_cache=AIResultCacheRepository(
+            redis_client,
+            ttl_seconds=settings.ai_result_cache_ttl_seconds,
+            max_entries=settings.ai_result_cache_max_entries,
+        )
+        if settings.ai_result_cache_enabled
+        else None,
+        backend=ai_backend,
+    )
+    try:
+        await requeue_pending(queue, redis_client)
+        await asyncio.gather(
+            *(
+                consume(queue, redis_client, ai_service)
+                for _ in range(settings.moderation_worker_concurrency)
+            )
+        )
+    finally:
+        await http_client.close()
+        await redis_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
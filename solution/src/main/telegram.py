@@ -12,12 +12,16 @@ from src.adapters.telegram.handlers.campaigns.router import (
 )
 from src.adapters.telegram.handlers.main import router as main_router
 from src.core.db import init_db
+from src.core.http import http_client
 from src.core.redis import init_redis
 from src.core.settings import settings
 from src.infrastructure.advertisers.orm import AdvertiserModel as AdvertiserModel
 from src.infrastructure.campaigns.orm import CampaignModel as CampaignModel
 from src.infrastructure.clients.orm import ClientModel as ClientModel
 from src.infrastructure.moderation.orm import ForbiddenWordsModel as ForbiddenWordsModel
+from src.infrastructure.statistics.orm import (
+    CampaignDailyStatsModel as CampaignDailyStatsModel,
+)
 from src.infrastructure.statistics.orm import UniqueEventModel as UniqueEventModel
 
 
@@ -29,6 +33,7 @@ async def lifespan():
     try:
         yield
     finally:
+        await http_client.close()
         if redis_client:
             await redis_client.close()
             redis_client = None
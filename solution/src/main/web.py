@@ -1,4 +1,5 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -13,15 +14,29 @@ from src.adapters.api.clients_router import router as clients_router
 from src.adapters.api.export_router import router as export_router
 from src.adapters.api.frontend_router import router as frontend_router
 from src.adapters.api.healthcheck_router import router as healthcheck_router
+from src.adapters.api.loader_router import router as loader_router
 from src.adapters.api.moderation_router import router as moderation_router
 from src.adapters.api.statistics_router import router as statistics_router
 from src.adapters.api.time_router import router as time_router
-from src.core.db import init_db
+from src.core.db import async_session_maker, init_db
+from src.core.http import http_client
+from src.core.loop_monitor import monitor_event_loop_lag
+from src.core.settings import settings
 from src.infrastructure.advertisers.orm import AdvertiserModel as AdvertiserModel
+from src.infrastructure.advertisers.repositories import ensure_ml_scores_unique_key
+from src.infrastructure.advertisers.score_store import ml_score_store
 from src.infrastructure.campaigns.orm import CampaignModel as CampaignModel
+from src.infrastructure.campaigns.repositories import (
+    ensure_campaign_moderation_columns,
+)
 from src.infrastructure.clients.orm import ClientModel as ClientModel
 from src.infrastructure.moderation.orm import ForbiddenWordsModel as ForbiddenWordsModel
+from src.infrastructure.statistics.orm import (
+    CampaignDailyStatsModel as CampaignDailyStatsModel,
+)
 from src.infrastructure.statistics.orm import UniqueEventModel as UniqueEventModel
+from src.infrastructure.statistics.repositories import backfill_campaign_daily_stats
+from src.infrastructure.storage.minio_service import minio_service
 
 BASE_DIR = Path(__file__).parent.parent.parent
 STATIC_DIR = BASE_DIR / "frontend" / "static"
@@ -31,7 +46,31 @@ IMAGES_DIR = BASE_DIR / "frontend" / "images"
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
+    async with async_session_maker() as session:
+        await backfill_campaign_daily_stats(session)
+        await ensure_ml_scores_unique_key(session)
+        await ensure_campaign_moderation_columns(session)
+
+    lag_task = asyncio.create_task(
+        monitor_event_loop_lag(settings.event_loop_lag_interval_seconds)
+    )
+    # The first check bootstraps the bucket without delaying startup.
+    storage_health_task = asyncio.create_task(
+        minio_service.health_check_forever(settings.minio_health_check_interval_seconds)
+    )
+    refresh_task = None
+    if settings.ml_score_store_enabled:
+        await ml_score_store.reload()
+        refresh_task = asyncio.create_task(
+            ml_score_store.refresh_forever(settings.ml_score_store_refresh_seconds)
+        )
     yield
+    for task in (lag_task, storage_health_task, refresh_task):
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+    await http_client.close()
 
 
 app = FastAPI(
@@ -64,5 +103,6 @@ app.include_router(ads_router)
 app.include_router(ai_router)
 app.include_router(moderation_router)
 app.include_router(export_router)
+app.include_router(loader_router)
 
 Instrumentator().instrument(app).expose(app)
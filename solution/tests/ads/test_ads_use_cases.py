@@ -1,4 +1,5 @@
 from unittest.mock import AsyncMock, MagicMock
+from dataclasses import replace
 from uuid import uuid4
 
 import pytest
@@ -231,6 +232,55 @@ class TestGetAdForClientUseCase:
             await use_case.execute(dummy_client.id)
         assert "Не найдены подходящие объявления" in str(exc.value)
 
+    @pytest.mark.asyncio
+    async def test_execute_ranks_with_score_store(
+        self,
+        dummy_uow: AsyncMock,
+        ads_mapper: AdsMapper,
+        dummy_client: ClientEntity,
+        dummy_campaign: CampaignEntity,
+        dummy_stats: StatisticsEntity,
+    ):
+        preferred_campaign = replace(dummy_campaign, id=uuid4(), advertiser_id=uuid4())
+        clients_repo = AsyncMock()
+        clients_repo.get_by_id.return_value = dummy_client
+
+        campaigns_repo = AsyncMock()
+        campaigns_repo.get_targeted_campaigns.return_value = [
+            dummy_campaign,
+            preferred_campaign,
+        ]
+
+        ml_score_repo = AsyncMock()
+        ml_score_store = MagicMock()
+        ml_score_store.get_scores.return_value = {preferred_campaign.advertiser_id: 90}
+
+        statistics_repo = AsyncMock()
+        statistics_repo.get_campaign_stats.return_value = dummy_stats
+        ads_mapper.from_entity_to_schema = MagicMock()
+
+        use_case = GetAdForClientUseCase(
+            uow=dummy_uow,
+            mapper=ads_mapper,
+            time_repository=AsyncMock(),
+            clients_repository=clients_repo,
+            campaigns_repository=campaigns_repo,
+            ml_score_repository=ml_score_repo,
+            statistics_repository=statistics_repo,
+            ml_score_store=ml_score_store,
+        )
+
+        await use_case.execute(dummy_client.id)
+
+        ml_score_store.get_scores.assert_called_once_with(
+            dummy_client.id,
+            {dummy_campaign.advertiser_id, preferred_campaign.advertiser_id},
+        )
+        ml_score_repo.get_ml_score.assert_not_called()
+        statistics_repo.register_impression.assert_called_once_with(
+            client_id=dummy_client.id, campaign_id=preferred_campaign.id
+        )
+
 
 class TestRecordAdClickUseCase:
     @pytest.mark.asyncio
@@ -270,6 +320,35 @@ class TestRecordAdClickUseCase:
         )
         dummy_uow.commit.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_execute_invalidates_statistics_cache(
+        self,
+        dummy_uow: AsyncMock,
+        dummy_client: ClientEntity,
+        dummy_campaign: CampaignEntity,
+    ):
+        campaigns_repo = AsyncMock()
+        campaigns_repo.get_by_id.return_value = dummy_campaign
+        clients_repo = AsyncMock()
+        clients_repo.get_by_id.return_value = dummy_client
+        statistics_cache = AsyncMock()
+
+        use_case = RecordAdClickUseCase(
+            uow=dummy_uow,
+            mapper=MagicMock(),
+            statistics_repository=AsyncMock(),
+            time_repository=AsyncMock(),
+            campaigns_repository=campaigns_repo,
+            clients_repository=clients_repo,
+            statistics_cache=statistics_cache,
+        )
+
+        await use_case.execute(dummy_campaign.id, dummy_client.id)
+
+        statistics_cache.bump_version.assert_called_once_with(
+            dummy_campaign.id, dummy_campaign.advertiser_id
+        )
+
     @pytest.mark.asyncio
     async def test_execute_campaign_not_found(
         self,
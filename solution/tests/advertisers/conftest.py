@@ -1,4 +1,5 @@
 from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID, uuid4
 
 import pytest
@@ -52,3 +53,21 @@ def ml_score_mapper() -> MLScoreMapper:
 @pytest.fixture
 def ml_score_entity() -> MLScoreEntity:
     return MLScoreEntity(id=uuid4(), client_id=uuid4(), advertiser_id=uuid4(), score=85)
+
+
+async def iterate(rows):
+    for row in rows:
+        yield row
+
+
+@pytest.fixture
+def make_session():
+    def factory(advertiser_ids, rows):
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value = sorted(advertiser_ids)
+        session.execute.return_value = result
+        session.stream.return_value = iterate(rows)
+        return session
+
+    return factory
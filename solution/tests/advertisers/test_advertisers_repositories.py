@@ -4,12 +4,18 @@ from uuid import UUID, uuid4
 import pytest
 from sqlalchemy.exc import SQLAlchemyError
 
-from src.domain.advertisers.entities import AdvertiserEntity, MLScoreEntity
+from src.common.types import BULK_UPSERT_CHUNK_SIZE
+from src.domain.advertisers.entities import (
+    AdvertiserEntity,
+    MLScoreEntity,
+    MLScoreRejectEntity,
+)
 from src.domain.advertisers.exceptions import (
     AdvertiserNotFoundException,
     AdvertiserRepositoryError,
     MLScoreRepositoryError,
 )
+from src.domain.advertisers.types import ML_SCORE_REJECT_ADVERTISER_NOT_FOUND
 from src.infrastructure.advertisers.orm import AdvertiserModel as AdvertiserModel
 from src.infrastructure.advertisers.repositories import (
     AdvertisersRepository,
@@ -101,8 +107,7 @@ class TestAdvertisersRepository:
             "created_at": "2025-02-21T19:18:00",
             "updated_at": "2025-02-21T19:18:00",
         }
-        mappings.first.return_value = model_dict
-        mappings.one.return_value = model_dict
+        mappings.all.return_value = [model_dict]
         execute_result = MagicMock()
         execute_result.mappings.return_value = mappings
         session.execute = AsyncMock(return_value=execute_result)
@@ -116,9 +121,39 @@ class TestAdvertisersRepository:
         result = await repository.bulk_upsert([advertiser_entity])
 
         assert result == [advertiser_entity]
-        assert session.execute.call_count >= 2
+        session.execute.assert_called_once()
         assert session.flush.called
 
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_chunks_and_keeps_last_write(
+        self,
+        advertisers_mapper: MagicMock,
+    ):
+        entities = [
+            AdvertiserEntity(id=uuid4(), name=f"advertiser_{i}")
+            for i in range(BULK_UPSERT_CHUNK_SIZE)
+        ]
+        renamed = AdvertiserEntity(id=entities[0].id, name="renamed")
+
+        session = AsyncMock()
+        mappings = MagicMock()
+        mappings.all.return_value = []
+        execute_result = MagicMock()
+        execute_result.mappings.return_value = mappings
+        session.execute = AsyncMock(return_value=execute_result)
+
+        repository = AdvertisersRepository(session, advertisers_mapper)
+
+        result = await repository.bulk_upsert(
+            entities + [renamed, AdvertiserEntity(id=uuid4(), name="new")]
+        )
+
+        assert result[0] == renamed
+        assert len(result) == BULK_UPSERT_CHUNK_SIZE + 2
+        assert session.execute.call_count == 2
+        first_chunk = session.execute.call_args_list[0].args[1]
+        assert first_chunk["names"][0] == "renamed"
+
 
 class TestMLScoreRepository:
     @pytest.mark.asyncio
@@ -148,7 +183,63 @@ class TestMLScoreRepository:
 
         assert clients_repository.get_by_id.called
         assert advertisers_repository.get_by_id.called
-        assert session.execute.call_count >= 2
+        session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_ml_scores_returns_rejects(self):
+        session = AsyncMock()
+        client_id, advertiser_id = uuid4(), uuid4()
+        mappings = MagicMock()
+        mappings.all.return_value = [
+            {
+                "client_id": client_id,
+                "advertiser_id": advertiser_id,
+                "client_exists": True,
+                "advertiser_exists": False,
+            }
+        ]
+        execute_result = MagicMock()
+        execute_result.mappings.return_value = mappings
+        session.execute = AsyncMock(return_value=execute_result)
+
+        repository = MLScoreRepository(session, MagicMock(), AsyncMock(), AsyncMock())
+
+        rejects = await repository.bulk_upsert_ml_scores(
+            [
+                MLScoreEntity(
+                    id=uuid4(),
+                    client_id=client_id,
+                    advertiser_id=advertiser_id,
+                    score=1,
+                ),
+                MLScoreEntity(
+                    id=uuid4(),
+                    client_id=client_id,
+                    advertiser_id=advertiser_id,
+                    score=2,
+                ),
+            ]
+        )
+
+        assert rejects == [
+            MLScoreRejectEntity(
+                client_id=client_id,
+                advertiser_id=advertiser_id,
+                reason=ML_SCORE_REJECT_ADVERTISER_NOT_FOUND,
+            )
+        ]
+        session.execute.assert_called_once()
+        assert session.execute.call_args.args[1]["scores"] == [2]
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_ml_scores_db_error(self, ml_score_entity: MLScoreEntity):
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=SQLAlchemyError("DB Error"))
+
+        repository = MLScoreRepository(session, MagicMock(), AsyncMock(), AsyncMock())
+
+        with pytest.raises(MLScoreRepositoryError):
+            await repository.bulk_upsert_ml_scores([ml_score_entity])
 
     @pytest.mark.asyncio
     async def test_get_ml_score_success(self):
@@ -5,17 +5,25 @@ import pytest
 
 from src.application.advertisers.dtos import GetAdvertiserByIdSchema, MLScoreSchema
 from src.application.advertisers.use_cases import (
+    BulkUpsertMLScoresUseCase,
     GetAdvertiserByIdUseCase,
+    StreamUpsertAdvertisersUseCase,
     UpsertAdvertisersUseCase,
     UpsertMLScoreUseCase,
 )
-from src.domain.advertisers.entities import AdvertiserEntity, MLScoreEntity
+from src.domain.advertisers.entities import (
+    AdvertiserEntity,
+    MLScoreEntity,
+    MLScoreRejectEntity,
+)
 from src.domain.advertisers.exceptions import (
     AdvertiserNotFoundException,
     AdvertiserRepositoryError,
     MLScoreRepositoryError,
 )
+from src.domain.advertisers.types import ML_SCORE_REJECT_CLIENT_NOT_FOUND
 from src.domain.clients.exceptions import ClientNotFoundException
+from src.infrastructure.advertisers.mappers import AdvertisersMapper, MLScoreMapper
 
 
 @pytest.fixture
@@ -229,3 +237,140 @@ class TestUpsertMLScoreUseCase:
         with pytest.raises(MLScoreRepositoryError) as exc:
             await use_case.execute(input_schema)
         assert "ML score error" in str(exc.value)
+
+
+async def iterate(rows):
+    for row in rows:
+        yield row
+
+
+@pytest.mark.asyncio
+class TestBulkUpsertMLScoresUseCase:
+    async def test_execute_reports_invalid_and_missing_rows(self, dummy_uow: AsyncMock):
+        client_id, missing_client_id, advertiser_id = uuid4(), uuid4(), uuid4()
+        repository = AsyncMock()
+        repository.bulk_upsert_ml_scores.return_value = [
+            MLScoreRejectEntity(
+                client_id=missing_client_id,
+                advertiser_id=advertiser_id,
+                reason=ML_SCORE_REJECT_CLIENT_NOT_FOUND,
+            )
+        ]
+
+        use_case = BulkUpsertMLScoresUseCase(
+            uow=dummy_uow, repository=repository, mapper=MLScoreMapper()
+        )
+
+        result = await use_case.execute(
+            iterate(
+                [
+                    f'{{"client_id": "{client_id}", "advertiser_id": "{advertiser_id}", "score": 1}}'.encode(),
+                    b"not json",
+                    {
+                        "client_id": str(missing_client_id),
+                        "advertiser_id": str(advertiser_id),
+                        "score": 2,
+                    },
+                    {
+                        "client_id": str(client_id),
+                        "advertiser_id": str(advertiser_id),
+                        "score": 3,
+                    },
+                ]
+            )
+        )
+
+        assert result.accepted == 2
+        assert result.rejected == 2
+        assert [reject.row for reject in result.rejects] == [2, 3]
+        assert result.rejects[1].reason == ML_SCORE_REJECT_CLIENT_NOT_FOUND
+        entities = repository.bulk_upsert_ml_scores.call_args.args[0]
+        assert [entity.score for entity in entities] == [3, 2]
+        dummy_uow.commit.assert_called_once()
+
+    async def test_execute_writes_accepted_scores_to_store(self, dummy_uow: AsyncMock):
+        client_id, missing_client_id, advertiser_id = uuid4(), uuid4(), uuid4()
+        repository = AsyncMock()
+        repository.bulk_upsert_ml_scores.return_value = [
+            MLScoreRejectEntity(
+                client_id=missing_client_id,
+                advertiser_id=advertiser_id,
+                reason=ML_SCORE_REJECT_CLIENT_NOT_FOUND,
+            )
+        ]
+        score_store = MagicMock()
+
+        use_case = BulkUpsertMLScoresUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            mapper=MLScoreMapper(),
+            score_store=score_store,
+        )
+
+        await use_case.execute(
+            iterate(
+                [
+                    {
+                        "client_id": str(client_id),
+                        "advertiser_id": str(advertiser_id),
+                        "score": 7,
+                    },
+                    {
+                        "client_id": str(missing_client_id),
+                        "advertiser_id": str(advertiser_id),
+                        "score": 2,
+                    },
+                ]
+            )
+        )
+
+        score_store.set_score.assert_called_once_with(client_id, advertiser_id, 7)
+
+    async def test_execute_repository_error(self, dummy_uow: AsyncMock):
+        repository = AsyncMock()
+        repository.bulk_upsert_ml_scores.side_effect = MLScoreRepositoryError(
+            "ML score error"
+        )
+
+        use_case = BulkUpsertMLScoresUseCase(
+            uow=dummy_uow, repository=repository, mapper=MLScoreMapper()
+        )
+
+        with pytest.raises(MLScoreRepositoryError) as exc:
+            await use_case.execute(
+                iterate(
+                    [
+                        {
+                            "client_id": str(uuid4()),
+                            "advertiser_id": str(uuid4()),
+                            "score": 1,
+                        }
+                    ]
+                )
+            )
+        assert "ML score error" in str(exc.value)
+
+
+@pytest.mark.asyncio
+class TestStreamUpsertAdvertisersUseCase:
+    async def test_execute_streams_chunks(self, dummy_uow: AsyncMock):
+        advertiser_id = uuid4()
+        repository = AsyncMock()
+        use_case = StreamUpsertAdvertisersUseCase(
+            dummy_uow, repository, AdvertisersMapper()
+        )
+
+        lines = [
+            f'{{"advertiser_id": "{advertiser_id}", "name": "Acme"}}'.encode(),
+            b'{"name": "No id"}',
+        ]
+        summaries = [summary async for summary in use_case.execute(iterate(lines))]
+
+        assert [(s.chunk, s.upserted, s.rejected) for s in summaries] == [
+            (1, 1, 1),
+            (None, 1, 1),
+        ]
+        repository.bulk_upsert.assert_called_once_with(
+            [AdvertiserEntity(id=advertiser_id, name="Acme")]
+        )
+        dummy_uow.commit.assert_called_once()
@@ -0,0 +1,56 @@
+from uuid import uuid4
+
+import pytest
+from src.infrastructure.advertisers.score_store import MLScoreStore
+
+
+@pytest.mark.asyncio
+class TestMLScoreStore:
+    async def test_load_and_lookup(self, make_session):
+        first_client, second_client = sorted([uuid4(), uuid4()])
+        first_advertiser, second_advertiser = sorted([uuid4(), uuid4()])
+        store = MLScoreStore()
+
+        await store.load(
+            make_session(
+                [first_advertiser, second_advertiser],
+                [
+                    (first_client, first_advertiser, 10),
+                    (first_client, second_advertiser, 20),
+                    (second_client, second_advertiser, 30),
+                ],
+            )
+        )
+
+        assert store.is_loaded
+        assert store.get_scores(
+            first_client, [first_advertiser, second_advertiser]
+        ) == {first_advertiser: 10, second_advertiser: 20}
+        assert store.get_scores(
+            second_client, [first_advertiser, second_advertiser]
+        ) == {second_advertiser: 30}
+        assert store.get_scores(uuid4(), [first_advertiser]) == {}
+
+    async def test_unloaded_store_has_no_scores(self):
+        store = MLScoreStore()
+        store.set_score(uuid4(), uuid4(), 1)
+
+        assert not store.is_loaded
+        assert store.get_scores(uuid4(), [uuid4()]) == {}
+
+    async def test_set_score_overrides_loaded_value(self, make_session):
+        client_id, advertiser_id = uuid4(), uuid4()
+        store = MLScoreStore()
+        await store.load(make_session([advertiser_id], [(client_id, advertiser_id, 1)]))
+
+        store.set_score(client_id, advertiser_id, 5)
+
+        assert store.get_scores(client_id, [advertiser_id]) == {advertiser_id: 5}
+
+    async def test_scores_for_unindexed_advertiser_are_kept(self, make_session):
+        client_id, advertiser_id = uuid4(), uuid4()
+        store = MLScoreStore()
+
+        await store.load(make_session([], [(client_id, advertiser_id, 4)]))
+
+        assert store.get_scores(client_id, [advertiser_id]) == {advertiser_id: 4}
@@ -0,0 +1,195 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from src.application.ai.use_cases import GenerateImageUseCase
+from src.core.http import HttpClient
+from src.core.resilience import ProviderGuard
+from src.domain.ai.entities import ImageJobEntity
+from src.infrastructure.ai.ai_service import AIService
+from src.infrastructure.ai.jobs import ImageJobRepository
+from src.infrastructure.ai.providers import is_provider_failure
+
+
+class FakeProvider:
+    """Local stand-in for OpenRouter answering with a scripted status."""
+
+    def __init__(self, status=200, delay=0.0, headers=None):
+        self.status = status
+        self.delay = delay
+        self.headers = headers or {}
+        self.calls = 0
+        self.inflight = 0
+        self.max_inflight = 0
+
+    async def handle(self, request):
+        self.calls += 1
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.inflight -= 1
+        if self.status != 200:
+            return web.Response(status=self.status, headers=self.headers)
+        content = '{"generated_text": "Buy now"}'
+        return web.json_response({"choices": [{"message": {"content": content}}]})
+
+
+@pytest_asyncio.fixture
+async def provider():
+    fake = FakeProvider()
+    app = web.Application()
+    app.router.add_post("/", fake.handle)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    fake.url = str(server.make_url("/"))
+    yield fake
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def http_client():
+    client = HttpClient(
+        limit=10,
+        limit_per_host=10,
+        keepalive_timeout=30,
+        connect_timeout=1,
+        total_timeout=5,
+    )
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+def make_guarded_service(provider, http_client):
+    def make(name, **overrides) -> AIService:
+        options = dict(
+            requests_per_minute=6000,
+            burst=10,
+            max_concurrency=10,
+            max_wait=1.0,
+            failure_threshold=2,
+            reset_timeout=0.1,
+            is_failure=is_provider_failure,
+        )
+        options.update(overrides)
+        service = AIService(
+            settings=MagicMock(),
+            http_client=http_client,
+            openrouter_guard=ProviderGuard(name, **options),
+        )
+        service.backend.api_url = provider.url
+        return service
+
+    return make
+
+
+@pytest.fixture
+def make_cached_service():
+    def make(cache) -> AIService:
+        service = AIService(
+            settings=MagicMock(), http_client=MagicMock(), result_cache=cache
+        )
+        service._make_api_request = AsyncMock()
+        return service
+
+    return make
+
+
+@pytest.fixture
+def make_local_settings():
+    def make(**overrides) -> MagicMock:
+        settings = MagicMock()
+        settings.ai_backend = "local"
+        settings.ai_local_latency_distribution = "fixed"
+        settings.ai_local_latency_ms = 0.0
+        settings.ai_local_image_latency_ms = 0.0
+        settings.ai_local_latency_spread = 0.5
+        settings.ai_local_error_rate = 0.0
+        settings.ai_local_rate_limit_rate = 0.0
+        settings.ai_local_retry_after_seconds = 30.0
+        settings.ai_local_seed = 7
+        for name, value in overrides.items():
+            setattr(settings, name, value)
+        return settings
+
+    return make
+
+
+@pytest.fixture
+def make_local_service():
+    def make(
+        settings, name="test_local_backend", backend=None, failure_threshold=3
+    ) -> AIService:
+        guard = ProviderGuard(
+            name,
+            requests_per_minute=6000,
+            burst=100,
+            max_concurrency=10,
+            max_wait=1.0,
+            failure_threshold=failure_threshold,
+            reset_timeout=30.0,
+            is_failure=is_provider_failure,
+        )
+        return AIService(
+            settings=settings,
+            http_client=MagicMock(),
+            openrouter_guard=guard,
+            cloudflare_guard=guard,
+            backend=backend,
+        )
+
+    return make
+
+
+@pytest.fixture
+def image_job() -> ImageJobEntity:
+    return ImageJobEntity(id=uuid4(), campaign_id=uuid4())
+
+
+@pytest.fixture
+def image_use_case(image_job: ImageJobEntity):
+    ai_service = AsyncMock()
+    ai_service.generate_image.return_value = b"png"
+    campaigns_repository = AsyncMock()
+    campaigns_repository.get_by_id.return_value = MagicMock(
+        ad_title="Campaign Title", ad_text="Campaign Text"
+    )
+    minio_service = AsyncMock()
+    minio_service.upload_generated_image.return_value = "http://minio/generated.png"
+    job_repository = AsyncMock()
+    job_repository.get.return_value = image_job
+    statuses = []
+    job_repository.update.side_effect = lambda job: statuses.append(job.status)
+    use_case = GenerateImageUseCase(
+        AsyncMock(), ai_service, campaigns_repository, minio_service, job_repository
+    )
+    return use_case, statuses
+
+
+@pytest.fixture
+def redis() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def redis_pipeline(redis: AsyncMock) -> MagicMock:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipeline = MagicMock()
+    pipeline.__aenter__ = AsyncMock(return_value=pipe)
+    pipeline.__aexit__ = AsyncMock(return_value=None)
+    redis.pipeline = MagicMock(return_value=pipeline)
+    return pipe
+
+
+@pytest.fixture
+def image_job_repository(redis: AsyncMock) -> ImageJobRepository:
+    return ImageJobRepository(
+        redis, ttl_seconds=60, max_queue_length=2, lease_seconds=30
+    )
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from src.core.resilience import CircuitState
+from src.domain.ai.exceptions import (
+    AIAuthenticationError,
+    AIProviderUnavailableError,
+    AIRateLimitError,
+)
+
+
+@pytest.mark.asyncio
+class TestAIProviderGuard:
+    async def test_provider_errors_open_circuit_and_fail_fast(
+        self, provider, make_guarded_service
+    ):
+        service = make_guarded_service("test_ai_guard_trip")
+        provider.status = 503
+
+        for _ in range(2):
+            with pytest.raises(AIProviderUnavailableError):
+                await service.generate_ad("Acme", "Phone")
+        with pytest.raises(AIProviderUnavailableError):
+            await service.generate_ad("Acme", "Phone")
+
+        assert provider.calls == 2
+        assert service.openrouter_guard.state == CircuitState.OPEN
+
+        provider.status = 200
+        await asyncio.sleep(0.15)
+        response = await service.generate_ad("Acme", "Phone")
+
+        assert response == {"generated_text": "Buy now"}
+        assert service.openrouter_guard.state == CircuitState.CLOSED
+
+    async def test_retry_after_keeps_circuit_open(self, provider, make_guarded_service):
+        service = make_guarded_service("test_ai_guard_retry_after")
+        provider.status = 429
+        provider.headers = {"Retry-After": "60"}
+
+        with pytest.raises(AIRateLimitError):
+            await service.generate_ad("Acme", "Phone")
+        await asyncio.sleep(0.15)
+        with pytest.raises(AIProviderUnavailableError):
+            await service.generate_ad("Acme", "Phone")
+
+        assert provider.calls == 1
+
+    async def test_authentication_errors_do_not_trip(
+        self, provider, make_guarded_service
+    ):
+        service = make_guarded_service("test_ai_guard_auth")
+        provider.status = 401
+
+        for _ in range(3):
+            with pytest.raises(AIAuthenticationError):
+                await service.generate_ad("Acme", "Phone")
+
+        assert provider.calls == 3
+        assert service.openrouter_guard.state == CircuitState.CLOSED
+
+    async def test_concurrency_is_bounded(self, provider, make_guarded_service):
+        service = make_guarded_service("test_ai_guard_concurrency", max_concurrency=2)
+        provider.delay = 0.05
+
+        await asyncio.gather(
+            *(service.generate_ad("Acme", f"Phone {i}") for i in range(6))
+        )
+
+        assert provider.calls == 6
+        assert provider.max_inflight == 2
+
+    async def test_local_rate_limit_rejects_without_calling(
+        self, provider, make_guarded_service
+    ):
+        service = make_guarded_service(
+            "test_ai_guard_rate",
+            requests_per_minute=60,
+            burst=1,
+            max_wait=0.1,
+        )
+
+        await service.generate_ad("Acme", "Phone")
+        with pytest.raises(AIRateLimitError):
+            await service.generate_ad("Acme", "Phone")
+
+        assert provider.calls == 1
+        assert service.openrouter_guard.state == CircuitState.CLOSED
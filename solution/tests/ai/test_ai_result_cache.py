@@ -0,0 +1,171 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.domain.ai.exceptions import AIInvalidResponseFormat, AIResultCacheError
+from src.infrastructure.ai.cache import AIResultCacheRepository
+
+
+class FakeResultCache:
+    def __init__(self, entries=None, error=None):
+        self.entries = dict(entries or {})
+        self.error = error
+
+    async def get_many(self, keys):
+        if self.error:
+            raise self.error
+        return [self.entries.get(key) for key in keys]
+
+    async def set_many(self, items):
+        if self.error:
+            raise self.error
+        self.entries.update(items)
+
+
+def verdict(flagged=False):
+    return {"profanity": flagged, "offensive": False, "inappropriate": False}
+
+
+@pytest.mark.asyncio
+class TestAIServiceResultCache:
+    async def test_generate_ad_is_served_from_cache(self, make_cached_service):
+        cache = FakeResultCache()
+        service = make_cached_service(cache)
+        service._make_api_request.return_value = {"generated_text": "Buy now"}
+
+        first = await service.generate_ad("Acme", "Phone")
+        second = await service.generate_ad("Acme", "Phone")
+
+        assert first == second == {"generated_text": "Buy now"}
+        service._make_api_request.assert_called_once()
+
+    async def test_generate_ad_bypass_skips_lookup_and_refreshes(
+        self, make_cached_service
+    ):
+        cache = FakeResultCache()
+        service = make_cached_service(cache)
+        service._make_api_request.side_effect = [
+            {"generated_text": "first"},
+            {"generated_text": "second"},
+        ]
+
+        await service.generate_ad("Acme", "Phone")
+        fresh = await service.generate_ad("Acme", "Phone", bypass_cache=True)
+        cached = await service.generate_ad("Acme", "Phone")
+
+        assert fresh == cached == {"generated_text": "second"}
+        assert service._make_api_request.call_count == 2
+
+    async def test_key_depends_on_model(self, make_cached_service):
+        cache = FakeResultCache()
+        service = make_cached_service(cache)
+        key = service._cache_key("moderation", "text")
+        service.backend.model = "other-model"
+
+        assert service._cache_key("moderation", "text") != key
+
+    async def test_batch_only_sends_uncached_texts(self, make_cached_service):
+        service = make_cached_service(None)
+        cache = FakeResultCache({service._cache_key("moderation", "title"): verdict()})
+        service.result_cache = cache
+        service._make_api_request.return_value = {
+            "results": [{"index": 1, **verdict(True)}]
+        }
+
+        results = await service.check_forbidden_words_batch(["title", "bad text"])
+
+        assert results == [verdict(), verdict(True)]
+        prompt = service._make_api_request.call_args.args[0]
+        assert "1. bad text" in prompt
+        assert "title" not in prompt
+        assert cache.entries[service._cache_key("moderation", "bad text")] == verdict(
+            True
+        )
+
+    async def test_batch_fully_cached_makes_no_request(self, make_cached_service):
+        service = make_cached_service(None)
+        service.result_cache = FakeResultCache(
+            {
+                service._cache_key("moderation", "a"): verdict(),
+                service._cache_key("moderation", "b"): verdict(True),
+            }
+        )
+
+        results = await service.check_forbidden_words_batch(["a", "b"])
+
+        assert results == [verdict(), verdict(True)]
+        service._make_api_request.assert_not_called()
+
+    async def test_single_check_shares_batch_verdicts(self, make_cached_service):
+        service = make_cached_service(None)
+        service.result_cache = FakeResultCache(
+            {service._cache_key("moderation", "text"): verdict(True)}
+        )
+
+        assert await service.check_forbidden_words("text") == verdict(True)
+        service._make_api_request.assert_not_called()
+
+    async def test_moderation_verdict_has_same_shape_on_miss_and_hit(
+        self, make_cached_service
+    ):
+        service = make_cached_service(FakeResultCache())
+        service._make_api_request.return_value = {**verdict(True), "reason": "slur"}
+
+        first = await service.check_forbidden_words("text")
+        second = await service.check_forbidden_words("text")
+
+        assert first == second == verdict(True)
+        service._make_api_request.assert_called_once()
+
+    async def test_malformed_moderation_verdict_is_rejected(self, make_cached_service):
+        cache = FakeResultCache()
+        service = make_cached_service(cache)
+        service._make_api_request.return_value = {"profanity": False}
+
+        with pytest.raises(AIInvalidResponseFormat):
+            await service.check_forbidden_words("text")
+
+        assert cache.entries == {}
+
+    async def test_cache_errors_fall_back_to_model(self, make_cached_service):
+        service = make_cached_service(FakeResultCache(error=AIResultCacheError("down")))
+        service._make_api_request.return_value = {"generated_text": "Buy now"}
+
+        result = await service.generate_ad("Acme", "Phone")
+
+        assert result == {"generated_text": "Buy now"}
+
+
+@pytest.mark.asyncio
+class TestAIResultCacheRepository:
+    async def test_get_many_decodes_values(self):
+        redis = AsyncMock()
+        redis.mget.return_value = ['{"generated_text": "x"}', None]
+
+        values = await AIResultCacheRepository(redis, 60, 10).get_many(["a", "b"])
+
+        assert values == [{"generated_text": "x"}, None]
+        redis.mget.assert_called_once_with(["ai:result:a", "ai:result:b"])
+
+    async def test_set_many_writes_with_ttl_and_bound(self):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        pipeline = MagicMock()
+        pipeline.__aenter__ = AsyncMock(return_value=pipe)
+        pipeline.__aexit__ = AsyncMock(return_value=None)
+        redis = MagicMock()
+        redis.pipeline.return_value = pipeline
+
+        await AIResultCacheRepository(redis, 60, 10).set_many({"a": {"x": 1}})
+
+        args = pipe.eval.call_args.args
+        assert args[2:5] == ("ai:result:a", "ai:result:index", '{"x": 1}')
+        assert args[5] == 60
+        assert args[7] == 10
+        pipe.execute.assert_called_once()
+
+    async def test_get_many_error(self):
+        redis = AsyncMock()
+        redis.mget.side_effect = ConnectionError("down")
+
+        with pytest.raises(AIResultCacheError):
+            await AIResultCacheRepository(redis, 60, 10).get_many(["a"])
@@ -1,11 +1,23 @@
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 
 from src.application.ai.dtos import AdvertisementGenerationResponse
-from src.application.ai.use_cases import GenerateAdUseCase, GenerateImageUseCase
-from src.domain.ai.exceptions import AIError, AIImageGenerationError, AIRequestError
+from src.application.ai.use_cases import (
+    GenerateAdUseCase,
+    GetImageJobUseCase,
+    SubmitImageJobUseCase,
+)
+from src.common.enums import ImageJobStatus
+from src.domain.ai.exceptions import (
+    AIError,
+    AIImageGenerationError,
+    AIRequestError,
+    ImageJobNotFoundError,
+    ImageJobQueueFullError,
+)
+from src.domain.campaigns.exceptions import CampaignNotFoundException
 
 
 class DummyAdvertiser:
@@ -13,12 +25,6 @@ class DummyAdvertiser:
         self.name = name
 
 
-class DummyCampaign:
-    def __init__(self, ad_title: str, ad_text: str):
-        self.ad_title = ad_title
-        self.ad_text = ad_text
-
-
 @pytest.mark.asyncio
 class TestGenerateAdUseCase:
     async def test_execute_plain_text_success(self):
@@ -42,7 +48,9 @@ class TestGenerateAdUseCase:
         assert result.generated_text == plain_text
         advertisers_repository.get_by_id.assert_called_once_with(advertiser_id)
         ai_service.generate_ad.assert_called_once_with(
-            advertiser_name=dummy_advertiser.name, ad_title=ad_title
+            advertiser_name=dummy_advertiser.name,
+            ad_title=ad_title,
+            bypass_cache=False,
         )
 
     async def test_execute_markdown_json_success(self):
@@ -101,57 +109,110 @@ class TestGenerateAdUseCase:
 
 @pytest.mark.asyncio
 class TestGenerateImageUseCase:
-    async def test_execute_success(self):
-        campaign_id = uuid4()
-        dummy_campaign = DummyCampaign("Campaign Title", "Campaign Text")
-        file_response = MagicMock(name="FileResponse")
+    async def test_execute_success(self, image_job, image_use_case):
+        job = image_job
+        use_case, statuses = image_use_case
+
+        result = await use_case.execute(job.id)
+
+        assert result.status == ImageJobStatus.SUCCEEDED
+        assert result.image_url == "http://minio/generated.png"
+        assert statuses == [ImageJobStatus.RUNNING, ImageJobStatus.SUCCEEDED]
+        use_case.campaigns_repository.get_by_id.assert_called_once_with(job.campaign_id)
+        use_case.ai_service.generate_image.assert_called_once_with(
+            ad_title="Campaign Title", ad_text="Campaign Text"
+        )
+        use_case.minio_service.upload_generated_image.assert_called_once_with(
+            job.id, b"png"
+        )
 
-        uow = AsyncMock()
-        ai_service = AsyncMock()
-        ai_service.generate_image.return_value = file_response
-        campaigns_repository = AsyncMock()
-        campaigns_repository.get_by_id.return_value = dummy_campaign
+    async def test_execute_ai_error(self, image_job, image_use_case):
+        job = image_job
+        use_case, statuses = image_use_case
+        use_case.ai_service.generate_image.side_effect = AIImageGenerationError(
+            "AI image generation error"
+        )
 
-        use_case = GenerateImageUseCase(uow, ai_service, campaigns_repository)
+        result = await use_case.execute(job.id)
 
-        result = await use_case.execute(campaign_id)
+        assert result.status == ImageJobStatus.FAILED
+        assert result.error == "AI image generation error"
+        assert statuses[-1] == ImageJobStatus.FAILED
+        use_case.minio_service.upload_generated_image.assert_not_called()
 
-        assert result == file_response
-        campaigns_repository.get_by_id.assert_called_once_with(campaign_id)
-        ai_service.generate_image.assert_called_once_with(
-            ad_title=dummy_campaign.ad_title, ad_text=dummy_campaign.ad_text
+    async def test_execute_generic_exception(self, image_job, image_use_case):
+        job = image_job
+        use_case, _ = image_use_case
+        use_case.minio_service.upload_generated_image.side_effect = Exception(
+            "Generic image error"
         )
 
-    async def test_execute_ai_error(self):
-        campaign_id = uuid4()
-        dummy_campaign = DummyCampaign("Campaign Title", "Campaign Text")
-        error_message = "AI image generation error"
+        result = await use_case.execute(job.id)
 
-        uow = AsyncMock()
-        ai_service = AsyncMock()
-        ai_service.generate_image.side_effect = AIError(error_message)
-        campaigns_repository = AsyncMock()
-        campaigns_repository.get_by_id.return_value = dummy_campaign
+        assert result.status == ImageJobStatus.FAILED
+        assert "Unexpected error during image generation:" in result.error
+        assert "Generic image error" in result.error
 
-        use_case = GenerateImageUseCase(uow, ai_service, campaigns_repository)
+    async def test_execute_skips_finished_job(self, image_job, image_use_case):
+        job = image_job
+        job.status = ImageJobStatus.SUCCEEDED
+        use_case, statuses = image_use_case
 
-        with pytest.raises(AIError) as exc_info:
-            await use_case.execute(campaign_id)
-        assert error_message in str(exc_info.value)
+        assert await use_case.execute(job.id) is job
+        assert statuses == []
+        use_case.ai_service.generate_image.assert_not_called()
 
-    async def test_execute_generic_exception(self):
+
+@pytest.mark.asyncio
+class TestImageJobUseCases:
+    async def test_submit_queues_job(self):
         campaign_id = uuid4()
-        dummy_campaign = DummyCampaign("Campaign Title", "Campaign Text")
+        campaigns_repository = AsyncMock()
+        job_repository = AsyncMock()
 
-        uow = AsyncMock()
-        ai_service = AsyncMock()
-        ai_service.generate_image.side_effect = Exception("Generic image error")
+        response = await SubmitImageJobUseCase(
+            campaigns_repository, job_repository
+        ).execute(campaign_id)
+
+        submitted = job_repository.submit.call_args.args[0]
+        assert submitted.campaign_id == campaign_id
+        assert response.job_id == submitted.id
+        assert response.status == "queued"
+
+    async def test_submit_unknown_campaign(self):
         campaigns_repository = AsyncMock()
-        campaigns_repository.get_by_id.return_value = dummy_campaign
+        campaigns_repository.get_by_id.side_effect = CampaignNotFoundException()
+        job_repository = AsyncMock()
+
+        with pytest.raises(CampaignNotFoundException):
+            await SubmitImageJobUseCase(campaigns_repository, job_repository).execute(
+                uuid4()
+            )
+        job_repository.submit.assert_not_called()
+
+    async def test_submit_queue_full(self):
+        job_repository = AsyncMock()
+        job_repository.submit.side_effect = ImageJobQueueFullError("full")
+
+        with pytest.raises(ImageJobQueueFullError):
+            await SubmitImageJobUseCase(AsyncMock(), job_repository).execute(uuid4())
+
+    async def test_get_waits_for_job(self, image_job):
+        job = image_job
+        job.status = ImageJobStatus.SUCCEEDED
+        job.image_url = "http://minio/generated.png"
+        job_repository = AsyncMock()
+        job_repository.wait.return_value = job
+
+        response = await GetImageJobUseCase(job_repository).execute(job.id, 10.0)
+
+        job_repository.wait.assert_called_once_with(job.id, 10.0)
+        assert response.status == "succeeded"
+        assert response.image_url == "http://minio/generated.png"
 
-        use_case = GenerateImageUseCase(uow, ai_service, campaigns_repository)
+    async def test_get_unknown_job(self):
+        job_repository = AsyncMock()
+        job_repository.wait.return_value = None
 
-        with pytest.raises(AIImageGenerationError) as exc_info:
-            await use_case.execute(campaign_id)
-        assert "Unexpected error during image generation:" in str(exc_info.value)
-        assert "Generic image error" in str(exc_info.value)
+        with pytest.raises(ImageJobNotFoundError):
+            await GetImageJobUseCase(job_repository).execute(uuid4())
@@ -0,0 +1,177 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from src.common.enums import ImageJobStatus
+from src.domain.ai.entities import ImageJobEntity
+from src.domain.ai.exceptions import ImageJobQueueError, ImageJobQueueFullError
+from src.infrastructure.ai.jobs import ImageJobRepository
+
+
+def job_hash(campaign_id, status="queued", image_url=""):
+    return {"campaign_id": str(campaign_id), "status": status, "image_url": image_url}
+
+
+@pytest.mark.asyncio
+class TestImageJobRepository:
+    async def test_submit_pushes_job_within_bound(self, redis, image_job_repository):
+        job = ImageJobEntity(id=uuid4(), campaign_id=uuid4())
+        redis.eval.return_value = 1
+
+        await image_job_repository.submit(job)
+
+        args = redis.eval.call_args.args
+        assert args[2:4] == (f"ai:image_job:{job.id}", ImageJobRepository.QUEUE_KEY)
+        assert args[4:7] == (str(job.id), str(job.campaign_id), "queued")
+        assert args[7:] == (60, 2)
+
+    async def test_submit_rejects_when_full(self, redis, image_job_repository):
+        redis.eval.return_value = 0
+
+        with pytest.raises(ImageJobQueueFullError):
+            await image_job_repository.submit(
+                ImageJobEntity(id=uuid4(), campaign_id=uuid4())
+            )
+
+    async def test_get_parses_hash(self, redis, image_job_repository):
+        job_id, campaign_id = uuid4(), uuid4()
+        redis.hgetall.return_value = job_hash(
+            campaign_id, "succeeded", "http://minio/a.png"
+        )
+
+        job = await image_job_repository.get(job_id)
+
+        assert job.campaign_id == campaign_id
+        assert job.status == ImageJobStatus.SUCCEEDED
+        assert job.image_url == "http://minio/a.png"
+        assert job.error is None
+
+    async def test_get_missing(self, redis, image_job_repository):
+        redis.hgetall.return_value = {}
+
+        assert await image_job_repository.get(uuid4()) is None
+
+    async def test_update_publishes_only_finished_jobs(
+        self, redis_pipeline, image_job_repository
+    ):
+        job = ImageJobEntity(
+            id=uuid4(), campaign_id=uuid4(), status=ImageJobStatus.RUNNING
+        )
+
+        await image_job_repository.update(job)
+        redis_pipeline.publish.assert_not_called()
+
+        job.status = ImageJobStatus.FAILED
+        job.error = "boom"
+        await image_job_repository.update(job)
+
+        redis_pipeline.publish.assert_called_once_with(
+            f"ai:image_job:{job.id}:done", "failed"
+        )
+        mapping = redis_pipeline.hset.call_args.kwargs["mapping"]
+        assert mapping["status"] == "failed"
+        assert mapping["error"] == "boom"
+
+    async def test_wait_wakes_on_notification(self, redis, image_job_repository):
+        job_id, campaign_id = uuid4(), uuid4()
+        redis.hgetall.side_effect = [
+            job_hash(campaign_id, "running"),
+            job_hash(campaign_id, "running"),
+            job_hash(campaign_id, "succeeded", "http://minio/a.png"),
+        ]
+        pubsub = AsyncMock()
+        pubsub.get_message.return_value = {"type": "message", "data": "succeeded"}
+        redis.pubsub = MagicMock(return_value=pubsub)
+
+        job = await image_job_repository.wait(job_id, 5.0)
+
+        assert job.status == ImageJobStatus.SUCCEEDED
+        pubsub.subscribe.assert_called_once_with(f"ai:image_job:{job_id}:done")
+        pubsub.aclose.assert_called_once()
+
+    async def test_wait_returns_finished_job_without_subscribing(
+        self, redis, image_job_repository
+    ):
+        job_id = uuid4()
+        redis.hgetall.return_value = job_hash(uuid4(), "failed")
+
+        job = await image_job_repository.wait(job_id, 5.0)
+
+        assert job.status == ImageJobStatus.FAILED
+        redis.pubsub.assert_not_called()
+
+    async def test_dequeue_moves_job_to_processing_under_lease(
+        self, redis, redis_pipeline, image_job_repository
+    ):
+        job_id = uuid4()
+        redis.blmove.return_value = str(job_id)
+
+        with patch("src.infrastructure.ai.jobs.time.time", return_value=1000.0):
+            assert await image_job_repository.dequeue(1) == job_id
+        redis.blmove.assert_called_once_with(
+            ImageJobRepository.QUEUE_KEY,
+            ImageJobRepository.PROCESSING_KEY,
+            1,
+            "RIGHT",
+            "LEFT",
+        )
+        redis.zadd.assert_called_once_with(
+            ImageJobRepository.LEASES_KEY, {str(job_id): 1030.0}
+        )
+
+        await image_job_repository.ack(job_id)
+        redis_pipeline.lrem.assert_called_once_with(
+            ImageJobRepository.PROCESSING_KEY, 1, str(job_id)
+        )
+        redis_pipeline.zrem.assert_called_once_with(
+            ImageJobRepository.LEASES_KEY, str(job_id)
+        )
+        redis_pipeline.execute.assert_awaited_once()
+
+    async def test_empty_dequeue_takes_no_lease(self, redis, image_job_repository):
+        redis.blmove.return_value = None
+
+        assert await image_job_repository.dequeue(1) is None
+        redis.zadd.assert_not_called()
+
+    async def test_extend_lease_only_renews_held_lease(
+        self, redis, image_job_repository
+    ):
+        job_id = uuid4()
+
+        with patch("src.infrastructure.ai.jobs.time.time", return_value=1000.0):
+            await image_job_repository.extend_lease(job_id)
+
+        redis.zadd.assert_called_once_with(
+            ImageJobRepository.LEASES_KEY, {str(job_id): 1030.0}, xx=True
+        )
+
+    async def test_requeue_expired_passes_clock_and_lease(
+        self, redis, image_job_repository
+    ):
+        redis.eval.return_value = 2
+
+        with patch("src.infrastructure.ai.jobs.time.time", return_value=1000.0):
+            assert await image_job_repository.requeue_expired() == 2
+
+        redis.eval.assert_called_once_with(
+            ImageJobRepository.REQUEUE_SCRIPT,
+            3,
+            ImageJobRepository.PROCESSING_KEY,
+            ImageJobRepository.LEASES_KEY,
+            ImageJobRepository.QUEUE_KEY,
+            1000.0,
+            30,
+        )
+
+    async def test_requeue_expired_error(self, redis, image_job_repository):
+        redis.eval.side_effect = ConnectionError("down")
+
+        with pytest.raises(ImageJobQueueError):
+            await image_job_repository.requeue_expired()
+
+    async def test_dequeue_error(self, redis, image_job_repository):
+        redis.blmove.side_effect = ConnectionError("down")
+
+        with pytest.raises(ImageJobQueueError):
+            await image_job_repository.dequeue(1)
@@ -0,0 +1,36 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from src.common.enums import ModerationStatus
+from src.domain.campaigns.entities import CampaignEntity
+
+
+@pytest.fixture
+def make_campaign():
+    def factory(
+        ad_title="Title", ad_text="Text", status=ModerationStatus.PENDING
+    ) -> CampaignEntity:
+        return CampaignEntity(
+            id=uuid4(),
+            advertiser_id=uuid4(),
+            impressions_limit=100,
+            clicks_limit=10,
+            cost_per_impression=1.0,
+            cost_per_click=2.0,
+            ad_title=ad_title,
+            ad_text=ad_text,
+            start_date=1,
+            end_date=2,
+            moderation_status=status,
+        )
+
+    return factory
+
+
+@pytest.fixture
+def async_moderation_settings():
+    settings = MagicMock()
+    settings.ai_moderation_enabled = True
+    settings.ai_moderation_async = True
+    return settings
@@ -1,3 +1,4 @@
+import io
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
@@ -17,19 +18,31 @@ from src.application.campaigns.use_cases import (
     GetCampaignByIdUseCase,
     GetCampaignsFromYandexUseCase,
     GetCampaignsUseCase,
+    ModerateCampaignUseCase,
     UpdateCampaignUseCase,
     UploadCampaignImageUseCase,
 )
+from src.common.enums import ModerationStatus
+from src.domain.ai.exceptions import AIProviderUnavailableError
 from src.domain.campaigns.exceptions import (
     CampaignForbiddenError,
+    CampaignImageInvalidError,
+    CampaignImageTooLargeError,
     CampaignModerationError,
+    CampaignModerationUnavailableError,
     CampaignNotFoundException,
 )
+from src.domain.moderation.exceptions import ModerationQueueError
+from src.domain.storage.exceptions import MinioFileTooLargeError, MinioInvalidFileType
+from src.infrastructure.campaigns.mappers import CampaignsMapper
+from src.infrastructure.moderation.matcher import ForbiddenWordsMatcherCache
+from src.infrastructure.moderation.services import ModerationService
 
 
 class FakeModerationResult:
-    def __init__(self, forbidden: bool):
+    def __init__(self, forbidden: bool, source: str = "ai"):
         self.contains_forbidden_words = forbidden
+        self.source = source
 
 
 @pytest.mark.asyncio
@@ -45,9 +58,10 @@ class TestCreateCampaignUseCase:
         settings = MagicMock()
         settings.ai_moderation_enabled = True
 
-        moderation_service.check_forbidden_words.return_value = FakeModerationResult(
-            False
-        )
+        moderation_service.check_forbidden_words_batch.return_value = [
+            FakeModerationResult(False),
+            FakeModerationResult(False),
+        ]
         advertisers_repository.get_by_id.return_value = MagicMock()
 
         dummy_campaign_entity = MagicMock()
@@ -80,7 +94,9 @@ class TestCreateCampaignUseCase:
         result = await use_case.execute(advertiser_id, campaign_data)
         assert result == dummy_dto
         advertisers_repository.get_by_id.assert_called_once_with(advertiser_id)
-        assert moderation_service.check_forbidden_words.call_count >= 2
+        moderation_service.check_forbidden_words_batch.assert_awaited_once_with(
+            ["Test Campaign", "Test text"], check_database=True, check_ai=True
+        )
         repository.create.assert_called_once_with(dummy_campaign_entity)
         mapper.from_create_schema_to_entity.assert_called_once_with(campaign_data)
         mapper.from_entity_to_schema.assert_called_once_with(dummy_campaign_entity)
@@ -97,7 +113,7 @@ class TestCreateCampaignUseCase:
         settings = MagicMock()
         settings.ai_moderation_enabled = True
 
-        moderation_service.check_forbidden_words.side_effect = [
+        moderation_service.check_forbidden_words_batch.return_value = [
             FakeModerationResult(True),
             FakeModerationResult(False),
         ]
@@ -214,9 +230,10 @@ class TestUpdateCampaignUseCase:
         settings = MagicMock()
         settings.ai_moderation_enabled = True
 
-        moderation_service.check_forbidden_words.return_value = FakeModerationResult(
-            False
-        )
+        moderation_service.check_forbidden_words_batch.return_value = [
+            FakeModerationResult(False),
+            FakeModerationResult(False),
+        ]
         dummy_update_entity = MagicMock()
         mapper.from_update_schema_to_entity.return_value = dummy_update_entity
         repository.update.return_value = dummy_update_entity
@@ -256,7 +273,7 @@ class TestUpdateCampaignUseCase:
         settings = MagicMock()
         settings.ai_moderation_enabled = True
 
-        moderation_service.check_forbidden_words.side_effect = [
+        moderation_service.check_forbidden_words_batch.return_value = [
             FakeModerationResult(True),
             FakeModerationResult(False),
         ]
@@ -297,7 +314,7 @@ class TestUploadCampaignImageUseCase:
         minio_service.get_image_url.return_value = "http://image.url"
 
         image_file = AsyncMock(spec=UploadFile)
-        image_file.read.return_value = b"binary image data"
+        image_file.file = io.BytesIO(b"binary image data")
         image_file.close.return_value = None
 
         use_case = UploadCampaignImageUseCase(
@@ -312,9 +329,8 @@ class TestUploadCampaignImageUseCase:
         assert result.image_url == "http://image.url"
         advertisers_repository.get_by_id.assert_called_once_with(advertiser_id)
         repository.get_by_id.assert_called_once_with(campaign_id)
-        minio_service.upload_image.assert_called_once_with(
-            campaign_id, b"binary image data"
-        )
+        minio_service.upload_image.assert_called_once_with(campaign_id, image_file.file)
+        image_file.read.assert_not_called()
         minio_service.get_image_url.assert_called_once_with(campaign_id)
         repository.update_image_url.assert_called_once_with(
             campaign_id, "http://image.url"
@@ -336,7 +352,7 @@ class TestUploadCampaignImageUseCase:
         repository.get_by_id.return_value = campaign_entity
 
         image_file = AsyncMock(spec=UploadFile)
-        image_file.read.return_value = b"data"
+        image_file.file = io.BytesIO(b"data")
         image_file.close.return_value = None
 
         use_case = UploadCampaignImageUseCase(
@@ -349,6 +365,42 @@ class TestUploadCampaignImageUseCase:
         with pytest.raises(CampaignForbiddenError):
             await use_case.execute(advertiser_id, campaign_id, image_file)
 
+    @pytest.mark.parametrize(
+        "storage_error, expected",
+        [
+            (MinioInvalidFileType("bad"), CampaignImageInvalidError),
+            (MinioFileTooLargeError("big"), CampaignImageTooLargeError),
+        ],
+    )
+    async def test_execute_rejected_image(self, storage_error, expected):
+        advertiser_id = uuid4()
+        campaign_id = uuid4()
+        uow = AsyncMock()
+        uow.__aenter__.return_value = uow
+        repository = AsyncMock()
+        minio_service = AsyncMock()
+
+        campaign_entity = MagicMock()
+        campaign_entity.advertiser_id = advertiser_id
+        repository.get_by_id.return_value = campaign_entity
+        minio_service.upload_image.side_effect = storage_error
+
+        image_file = AsyncMock(spec=UploadFile)
+        image_file.file = io.BytesIO(b"data")
+
+        use_case = UploadCampaignImageUseCase(
+            uow=uow,
+            repository=repository,
+            mapper=MagicMock(),
+            minio_service=minio_service,
+            advertisers_repository=AsyncMock(),
+        )
+        with pytest.raises(expected):
+            await use_case.execute(advertiser_id, campaign_id, image_file)
+        repository.update_image_url.assert_not_called()
+        uow.commit.assert_not_called()
+        image_file.close.assert_called_once()
+
 
 @pytest.mark.asyncio
 class TestDeleteCampaignImageUseCase:
@@ -526,3 +578,304 @@ class TestCreateCampaignFromYandexUseCase:
         )
         with pytest.raises(CampaignNotFoundException):
             await use_case.execute(advertiser_id, token="dummy_token")
+
+
+@pytest.mark.asyncio
+class TestAsyncCampaignModeration:
+    async def test_create_stores_pending_and_enqueues(self, async_moderation_settings):
+        uow = AsyncMock()
+        uow.__aenter__.return_value = uow
+        repository = AsyncMock()
+        moderation_service = AsyncMock()
+        moderation_queue = AsyncMock()
+        moderation_service.check_forbidden_words_batch.return_value = [
+            FakeModerationResult(False),
+            FakeModerationResult(False),
+        ]
+        repository.create.side_effect = lambda entity: entity
+
+        use_case = CreateCampaignUseCase(
+            uow=uow,
+            repository=repository,
+            mapper=CampaignsMapper(),
+            moderation_service=moderation_service,
+            advertisers_repository=AsyncMock(),
+            settings=async_moderation_settings,
+            moderation_queue=moderation_queue,
+        )
+        result = await use_case.execute(
+            uuid4(),
+            CampaignCreateRequest(
+                ad_title="Title",
+                ad_text="Text",
+                impressions_limit=100,
+                clicks_limit=10,
+                cost_per_impression=1.0,
+                cost_per_click=2.0,
+                start_date=1,
+                end_date=2,
+            ),
+        )
+
+        assert result.moderation_status == ModerationStatus.PENDING
+        moderation_service.check_forbidden_words_batch.assert_called_once_with(
+            ["Title", "Text"], check_database=True, check_ai=False
+        )
+        moderation_queue.enqueue.assert_called_once_with(result.campaign_id)
+        uow.commit.assert_called_once()
+
+    async def test_create_survives_queue_failure(self, async_moderation_settings):
+        uow = AsyncMock()
+        uow.__aenter__.return_value = uow
+        repository = AsyncMock()
+        moderation_service = AsyncMock()
+        moderation_queue = AsyncMock()
+        moderation_queue.enqueue.side_effect = ModerationQueueError("down")
+        moderation_service.check_forbidden_words_batch.return_value = [
+            FakeModerationResult(False),
+            FakeModerationResult(False),
+        ]
+        repository.create.side_effect = lambda entity: entity
+
+        use_case = CreateCampaignUseCase(
+            uow=uow,
+            repository=repository,
+            mapper=CampaignsMapper(),
+            moderation_service=moderation_service,
+            advertisers_repository=AsyncMock(),
+            settings=async_moderation_settings,
+            moderation_queue=moderation_queue,
+        )
+        result = await use_case.execute(
+            uuid4(),
+            CampaignCreateRequest(
+                ad_title="Title",
+                ad_text="Text",
+                impressions_limit=100,
+                clicks_limit=10,
+                cost_per_impression=1.0,
+                cost_per_click=2.0,
+                start_date=1,
+                end_date=2,
+            ),
+        )
+
+        assert result.moderation_status == ModerationStatus.PENDING
+
+    async def test_update_with_same_text_keeps_status(
+        self, make_campaign, async_moderation_settings
+    ):
+        uow = AsyncMock()
+        uow.__aenter__.return_value = uow
+        repository = AsyncMock()
+        moderation_service = AsyncMock()
+        moderation_queue = AsyncMock()
+        moderation_service.check_forbidden_words_batch.return_value = [
+            FakeModerationResult(False),
+            FakeModerationResult(False),
+        ]
+        repository.get_by_id.return_value = make_campaign(
+            status=ModerationStatus.APPROVED
+        )
+        repository.update.side_effect = lambda entity: make_campaign(
+            status=entity.moderation_status
+        )
+
+        use_case = UpdateCampaignUseCase(
+            uow=uow,
+            repository=repository,
+            mapper=CampaignsMapper(),
+            moderation_service=moderation_service,
+            advertisers_repository=AsyncMock(),
+            settings=async_moderation_settings,
+            moderation_queue=moderation_queue,
+        )
+        result = await use_case.execute(
+            uuid4(),
+            uuid4(),
+            CampaignUpdateRequest(
+                ad_title="Title",
+                ad_text="Text",
+                cost_per_impression=3.0,
+                cost_per_click=4.0,
+            ),
+        )
+
+        assert result.moderation_status == ModerationStatus.APPROVED
+        moderation_queue.enqueue.assert_not_called()
+
+    async def test_update_with_new_text_goes_back_to_pending(
+        self, make_campaign, async_moderation_settings
+    ):
+        uow = AsyncMock()
+        uow.__aenter__.return_value = uow
+        repository = AsyncMock()
+        moderation_service = AsyncMock()
+        moderation_queue = AsyncMock()
+        moderation_service.check_forbidden_words_batch.return_value = [
+            FakeModerationResult(False),
+            FakeModerationResult(False),
+        ]
+        repository.get_by_id.return_value = make_campaign(
+            status=ModerationStatus.APPROVED
+        )
+        repository.update.side_effect = lambda entity: make_campaign(
+            status=entity.moderation_status
+        )
+        campaign_id = uuid4()
+
+        use_case = UpdateCampaignUseCase(
+            uow=uow,
+            repository=repository,
+            mapper=CampaignsMapper(),
+            moderation_service=moderation_service,
+            advertisers_repository=AsyncMock(),
+            settings=async_moderation_settings,
+            moderation_queue=moderation_queue,
+        )
+        result = await use_case.execute(
+            uuid4(),
+            campaign_id,
+            CampaignUpdateRequest(
+                ad_title="Title",
+                ad_text="New text",
+                cost_per_impression=3.0,
+                cost_per_click=4.0,
+            ),
+        )
+
+        assert result.moderation_status == ModerationStatus.PENDING
+        moderation_queue.enqueue.assert_called_once_with(campaign_id)
+
+
+@pytest.mark.asyncio
+class TestModerateCampaignUseCase:
+    def make_use_case(self, repository, moderation_service):
+        uow = AsyncMock()
+        uow.__aenter__.return_value = uow
+        settings = MagicMock()
+        settings.ai_moderation_enabled = True
+        return ModerateCampaignUseCase(uow, repository, moderation_service, settings)
+
+    async def test_approves_clean_campaign(self, make_campaign):
+        campaign = make_campaign()
+        repository = AsyncMock()
+        repository.get_by_id.return_value = campaign
+        repository.set_moderation_status.return_value = True
+        moderation_service = AsyncMock()
+        moderation_service.check_forbidden_words_batch.return_value = [
+            FakeModerationResult(False),
+            FakeModerationResult(False),
+        ]
+
+        use_case = self.make_use_case(repository, moderation_service)
+        status = await use_case.execute(campaign.id)
+
+        assert status == ModerationStatus.APPROVED
+        moderation_service.check_forbidden_words_batch.assert_called_once_with(
+            ["Title", "Text"], check_database=True, check_ai=True
+        )
+        repository.set_moderation_status.assert_called_once_with(
+            campaign.id, ModerationStatus.APPROVED, None, "Title", "Text"
+        )
+
+    async def test_rejects_campaign_with_forbidden_text(self, make_campaign):
+        campaign = make_campaign()
+        repository = AsyncMock()
+        repository.get_by_id.return_value = campaign
+        repository.set_moderation_status.return_value = True
+        moderation_service = AsyncMock()
+        moderation_service.check_forbidden_words_batch.return_value = [
+            FakeModerationResult(False),
+            FakeModerationResult(True),
+        ]
+
+        use_case = self.make_use_case(repository, moderation_service)
+        status = await use_case.execute(campaign.id)
+
+        assert status == ModerationStatus.REJECTED
+        args = repository.set_moderation_status.call_args.args
+        assert args[1] == ModerationStatus.REJECTED
+        assert args[2] == "Текст объявления содержит запрещенные слова"
+
+    async def test_ai_failure_leaves_campaign_pending(self, make_campaign):
+        campaign = make_campaign()
+        repository = AsyncMock()
+        repository.get_by_id.return_value = campaign
+        words_repository = AsyncMock()
+        words_repository.get_version.return_value = 1
+        words_repository.get_all.return_value = ["казино"]
+        ai_service = AsyncMock()
+        ai_service.check_forbidden_words_batch.side_effect = AIProviderUnavailableError(
+            "Provider openrouter is unavailable"
+        )
+        settings = MagicMock()
+        settings.ai_moderation_enabled = True
+        settings.ai_check_profanity = True
+        uow = AsyncMock()
+        uow.__aenter__.return_value = uow
+        moderation_service = ModerationService(
+            uow, words_repository, ai_service, settings, ForbiddenWordsMatcherCache()
+        )
+
+        use_case = ModerateCampaignUseCase(
+            uow, repository, moderation_service, settings
+        )
+        with pytest.raises(CampaignModerationUnavailableError):
+            await use_case.execute(campaign.id)
+
+        ai_service.check_forbidden_words_batch.assert_called_once()
+        repository.set_moderation_status.assert_not_called()
+        assert campaign.moderation_status == ModerationStatus.PENDING
+
+    async def test_forbidden_words_reject_despite_ai_failure(self, make_campaign):
+        campaign = make_campaign()
+        repository = AsyncMock()
+        repository.get_by_id.return_value = campaign
+        repository.set_moderation_status.return_value = True
+        moderation_service = AsyncMock()
+        moderation_service.check_forbidden_words_batch.return_value = [
+            FakeModerationResult(True, source="database"),
+            FakeModerationResult(False, source="ai_error"),
+        ]
+
+        use_case = self.make_use_case(repository, moderation_service)
+        status = await use_case.execute(campaign.id)
+
+        assert status == ModerationStatus.REJECTED
+
+    async def test_skips_campaign_that_is_not_pending(self, make_campaign):
+        campaign = make_campaign(status=ModerationStatus.APPROVED)
+        repository = AsyncMock()
+        repository.get_by_id.return_value = campaign
+        moderation_service = AsyncMock()
+
+        use_case = self.make_use_case(repository, moderation_service)
+        status = await use_case.execute(campaign.id)
+
+        assert status == ModerationStatus.APPROVED
+        moderation_service.check_forbidden_words_batch.assert_not_called()
+        repository.set_moderation_status.assert_not_called()
+
+    async def test_stale_verdict_is_not_applied(self, make_campaign):
+        campaign = make_campaign()
+        repository = AsyncMock()
+        repository.get_by_id.return_value = campaign
+        repository.set_moderation_status.return_value = False
+        moderation_service = AsyncMock()
+        moderation_service.check_forbidden_words_batch.return_value = [
+            FakeModerationResult(False),
+            FakeModerationResult(False),
+        ]
+
+        use_case = self.make_use_case(repository, moderation_service)
+
+        assert await use_case.execute(campaign.id) is None
+
+    async def test_deleted_campaign_is_dropped(self):
+        repository = AsyncMock()
+        repository.get_by_id.side_effect = CampaignNotFoundException("gone")
+
+        use_case = self.make_use_case(repository, AsyncMock())
+
+        assert await use_case.execute(uuid4()) is None
@@ -4,6 +4,7 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.exc import SQLAlchemyError
 
+from src.common.types import BULK_UPSERT_CHUNK_SIZE
 from src.domain.clients.entities import ClientEntity
 from src.domain.clients.exceptions import ClientNotFoundException, ClientRepositoryError
 from src.infrastructure.clients.repositories import ClientsRepository
@@ -92,8 +93,7 @@ class TestClientsRepository:
             "location": "Testville",
             "gender": "FEMALE",
         }
-        mappings.first.return_value = model_dict
-        mappings.one.return_value = model_dict
+        mappings.all.return_value = [model_dict]
         execute_result = MagicMock()
         execute_result.mappings.return_value = mappings
         session.execute = AsyncMock(return_value=execute_result)
@@ -107,5 +107,64 @@ class TestClientsRepository:
         result = await repository.bulk_upsert([client_entity])
 
         assert result == [client_entity]
-        assert session.execute.call_count >= 2
+        session.execute.assert_called_once()
         session.flush.assert_called_once()
+
+    async def test_bulk_upsert_last_write_wins_and_skips_unchanged(self):
+        client_id = uuid4()
+        first = ClientEntity(
+            id=client_id, login="old", age=25, location="Testville", gender="FEMALE"
+        )
+        latest = ClientEntity(
+            id=client_id, login="new", age=26, location="Testville", gender="FEMALE"
+        )
+
+        session = AsyncMock()
+        mappings = MagicMock()
+        mappings.all.return_value = []
+        execute_result = MagicMock()
+        execute_result.mappings.return_value = mappings
+        session.execute = AsyncMock(return_value=execute_result)
+
+        repository = ClientsRepository(session, MagicMock())
+
+        result = await repository.bulk_upsert([first, latest])
+
+        assert result == [latest, latest]
+        params = session.execute.call_args.args[1]
+        assert params["ids"] == [client_id]
+        assert params["logins"] == ["new"]
+
+    async def test_bulk_upsert_splits_into_chunks(self):
+        entities = [
+            ClientEntity(
+                id=uuid4(), login="user", age=25, location="Testville", gender="MALE"
+            )
+            for _ in range(BULK_UPSERT_CHUNK_SIZE + 1)
+        ]
+
+        session = AsyncMock()
+        mappings = MagicMock()
+        mappings.all.return_value = []
+        execute_result = MagicMock()
+        execute_result.mappings.return_value = mappings
+        session.execute = AsyncMock(return_value=execute_result)
+
+        repository = ClientsRepository(session, MagicMock())
+
+        result = await repository.bulk_upsert(entities)
+
+        assert result == entities
+        assert session.execute.call_count == 2
+
+    async def test_bulk_upsert_db_error(self):
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=SQLAlchemyError("DB error"))
+        entity = ClientEntity(
+            id=uuid4(), login="user", age=25, location="Testville", gender="MALE"
+        )
+
+        repository = ClientsRepository(session, MagicMock())
+
+        with pytest.raises(ClientRepositoryError):
+            await repository.bulk_upsert([entity])
@@ -1,14 +1,20 @@
+import json
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
 from src.application.clients.dtos import ClientUpsertSchema
-from src.application.clients.use_cases import GetClientByIdUseCase, UpsertClientUseCase
+from src.application.clients.use_cases import (
+    GetClientByIdUseCase,
+    StreamUpsertClientsUseCase,
+    UpsertClientUseCase,
+)
 from src.common.enums import TargetingGender
 from src.common.types import ClientId
 from src.domain.clients.exceptions import ClientNotFoundException, ClientRepositoryError
+from src.infrastructure.clients.mappers import ClientsMapper
 
 
 @pytest.fixture
@@ -162,3 +168,55 @@ class TestUpsertClientUseCase:
         with pytest.raises(ClientRepositoryError) as exc:
             await use_case.execute([dummy_client_upsert])
         assert "Unexpected error during upsert:" in str(exc.value)
+
+
+async def iterate(lines):
+    for line in lines:
+        yield line
+
+
+def client_line(**overrides) -> bytes:
+    client = {
+        "client_id": str(uuid4()),
+        "login": "user",
+        "age": 25,
+        "location": "Moscow",
+        "gender": "MALE",
+    }
+    client.update(overrides)
+    return json.dumps(client).encode()
+
+
+@pytest.mark.asyncio
+class TestStreamUpsertClientsUseCase:
+    async def test_execute_yields_summary_per_chunk(self, dummy_uow: AsyncMock):
+        repository = AsyncMock()
+        use_case = StreamUpsertClientsUseCase(dummy_uow, repository, ClientsMapper())
+
+        lines = [client_line(), b"", client_line(age=-1), client_line()]
+        with patch("src.application.clients.use_cases.BULK_UPSERT_CHUNK_SIZE", 2):
+            summaries = [summary async for summary in use_case.execute(iterate(lines))]
+
+        assert [(s.chunk, s.rows, s.upserted, s.rejected) for s in summaries] == [
+            (1, 2, 1, 1),
+            (2, 1, 1, 0),
+            (None, 3, 2, 1),
+        ]
+        assert summaries[0].errors[0].row == 3
+        assert summaries[-1].done is True
+        assert repository.bulk_upsert.call_count == 2
+        assert dummy_uow.commit.call_count == 2
+
+    async def test_execute_reports_repository_error(self, dummy_uow: AsyncMock):
+        repository = AsyncMock()
+        repository.bulk_upsert.side_effect = ClientRepositoryError("DB failure")
+        use_case = StreamUpsertClientsUseCase(dummy_uow, repository, ClientsMapper())
+
+        summaries = [
+            summary async for summary in use_case.execute(iterate([client_line()]))
+        ]
+
+        assert len(summaries) == 1
+        assert summaries[0].done is True
+        assert "DB failure" in summaries[0].error
+        dummy_uow.commit.assert_not_called()
@@ -0,0 +1,57 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.core.http import HttpClient
+from src.core.resilience import ProviderGuard
+
+
+@pytest.fixture
+def make_guard():
+    def make(name, **overrides) -> ProviderGuard:
+        options = dict(
+            requests_per_minute=6000,
+            burst=10,
+            max_concurrency=2,
+            max_wait=1.0,
+            failure_threshold=2,
+            reset_timeout=0.05,
+            is_failure=lambda e: isinstance(e, ConnectionError),
+        )
+        options.update(overrides)
+        return ProviderGuard(name, **options)
+
+    return make
+
+
+@pytest.fixture
+def http_client() -> HttpClient:
+    return HttpClient(
+        limit=10,
+        limit_per_host=2,
+        keepalive_timeout=30,
+        connect_timeout=1,
+        total_timeout=5,
+    )
+
+
+@pytest.fixture
+def make_lag_session():
+    def make(lag) -> AsyncMock:
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalar.return_value = lag
+        session.execute.return_value = result
+        return session
+
+    return make
+
+
+@pytest.fixture
+def make_session_maker():
+    def make(session) -> MagicMock:
+        maker = MagicMock()
+        maker.return_value.__aenter__ = AsyncMock(return_value=session)
+        maker.return_value.__aexit__ = AsyncMock(return_value=False)
+        return maker
+
+    return make
@@ -0,0 +1,46 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from src.core.http import (
+    http_client_connections_created_total,
+    http_client_connections_reused_total,
+)
+
+
+async def ping(request):
+    return web.json_response({"ok": True})
+
+
+class TestHttpClient:
+    @pytest.mark.asyncio
+    async def test_session_is_shared_until_closed(self, http_client):
+        first = await http_client.get_session()
+        assert await http_client.get_session() is first
+
+        await http_client.close()
+        assert first.closed
+        second = await http_client.get_session()
+        assert second is not first
+        await http_client.close()
+
+    @pytest.mark.asyncio
+    async def test_requests_reuse_pooled_connection(self, http_client):
+        app = web.Application()
+        app.router.add_get("/", ping)
+        server = TestServer(app, host="127.0.0.1")
+        await server.start_server()
+        created = http_client_connections_created_total.labels("127.0.0.1")
+        reused = http_client_connections_reused_total.labels("127.0.0.1")
+        created_before, reused_before = created._value.get(), reused._value.get()
+
+        try:
+            session = await http_client.get_session()
+            for _ in range(3):
+                async with session.get(server.make_url("/")) as response:
+                    assert await response.json() == {"ok": True}
+        finally:
+            await http_client.close()
+            await server.close()
+
+        assert created._value.get() - created_before == 1
+        assert reused._value.get() - reused_before == 2
@@ -0,0 +1,31 @@
+import asyncio
+import time
+
+import pytest
+from src.core.loop_monitor import event_loop_lag_seconds, monitor_event_loop_lag
+
+
+def observed():
+    samples = {
+        sample.name: sample.value
+        for metric in event_loop_lag_seconds.collect()
+        for sample in metric.samples
+    }
+    return samples["event_loop_lag_seconds_count"], samples[
+        "event_loop_lag_seconds_sum"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_is_recorded_as_lag():
+    count_before, sum_before = observed()
+    task = asyncio.create_task(monitor_event_loop_lag(0.01))
+    await asyncio.sleep(0)
+
+    time.sleep(0.1)
+    await asyncio.sleep(0.02)
+    task.cancel()
+
+    count, total = observed()
+    assert count > count_before
+    assert total - sum_before >= 0.08
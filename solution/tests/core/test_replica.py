@@ -0,0 +1,88 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from src.common import depends
+from src.core.db import ReplicaStatus
+
+
+class TestReplicaStatus:
+    @pytest.mark.asyncio
+    async def test_replica_within_lag_is_fresh(self, make_lag_session):
+        status = ReplicaStatus(max_lag_seconds=5, check_interval_seconds=1)
+
+        assert await status.is_fresh(make_lag_session(0.5)) is True
+
+    @pytest.mark.asyncio
+    async def test_lagging_or_disconnected_replica_is_stale(self, make_lag_session):
+        status = ReplicaStatus(max_lag_seconds=5, check_interval_seconds=0)
+
+        assert await status.is_fresh(make_lag_session(30)) is False
+        assert await status.is_fresh(make_lag_session(None)) is False
+
+    @pytest.mark.asyncio
+    async def test_check_failure_marks_replica_stale(self):
+        status = ReplicaStatus(max_lag_seconds=5, check_interval_seconds=0)
+        session = AsyncMock()
+        session.execute.side_effect = Exception("connection refused")
+
+        assert await status.is_fresh(session) is False
+
+    @pytest.mark.asyncio
+    async def test_result_is_cached_within_interval(self, make_lag_session):
+        status = ReplicaStatus(max_lag_seconds=5, check_interval_seconds=60)
+        session = make_lag_session(0)
+
+        await status.is_fresh(session)
+        await status.is_fresh(session)
+
+        session.execute.assert_awaited_once()
+
+
+class TestGetReadSession:
+    @pytest.mark.asyncio
+    async def test_uses_replica_when_fresh(
+        self, monkeypatch, make_lag_session, make_session_maker
+    ):
+        replica_session = make_lag_session(0)
+        monkeypatch.setattr(
+            depends, "async_read_session_maker", make_session_maker(replica_session)
+        )
+        monkeypatch.setattr(
+            depends, "async_session_maker", make_session_maker(AsyncMock())
+        )
+        monkeypatch.setattr(depends, "replica_status", ReplicaStatus(5, 0))
+
+        sessions = [session async for session in depends.get_read_session()]
+
+        assert sessions == [replica_session]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_primary_when_stale(
+        self, monkeypatch, make_lag_session, make_session_maker
+    ):
+        primary_session = AsyncMock()
+        monkeypatch.setattr(
+            depends,
+            "async_read_session_maker",
+            make_session_maker(make_lag_session(None)),
+        )
+        monkeypatch.setattr(
+            depends, "async_session_maker", make_session_maker(primary_session)
+        )
+        monkeypatch.setattr(depends, "replica_status", ReplicaStatus(5, 0))
+
+        sessions = [session async for session in depends.get_read_session()]
+
+        assert sessions == [primary_session]
+
+    @pytest.mark.asyncio
+    async def test_uses_primary_without_replica(self, monkeypatch, make_session_maker):
+        primary_session = AsyncMock()
+        monkeypatch.setattr(depends, "async_read_session_maker", None)
+        monkeypatch.setattr(
+            depends, "async_session_maker", make_session_maker(primary_session)
+        )
+
+        sessions = [session async for session in depends.get_read_session()]
+
+        assert sessions == [primary_session]
@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+from src.core.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    RateLimitExceededError,
+    TokenBucket,
+    provider_circuit_state,
+    provider_circuit_trips_total,
+)
+
+
+class TestTokenBucket:
+    def test_burst_is_free_then_calls_are_spaced(self):
+        bucket = TokenBucket(rate_per_second=1, burst=2)
+
+        assert bucket.reserve(max_wait=0) == 0
+        assert bucket.reserve(max_wait=0) == 0
+        assert bucket.reserve(max_wait=2) == pytest.approx(1, abs=0.05)
+        assert bucket.reserve(max_wait=3) == pytest.approx(2, abs=0.05)
+
+    def test_rejects_when_wait_exceeds_limit(self):
+        bucket = TokenBucket(rate_per_second=1, burst=1)
+        bucket.reserve(max_wait=0)
+
+        with pytest.raises(RateLimitExceededError):
+            bucket.reserve(max_wait=0.5)
+        # A rejected call does not consume a token.
+        assert bucket.reserve(max_wait=2) == pytest.approx(1, abs=0.05)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker("test_breaker_opens", 3, reset_timeout=60)
+        trips = provider_circuit_trips_total.labels("test_breaker_opens")
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert trips._value.get() == 1
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    @pytest.mark.asyncio
+    async def test_half_open_allows_single_probe(self):
+        breaker = CircuitBreaker("test_breaker_probe", 1, reset_timeout=0.01)
+        breaker.record_failure()
+        await asyncio.sleep(0.02)
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.before_call() is True
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+    def test_retry_after_opens_immediately(self):
+        breaker = CircuitBreaker("test_breaker_retry_after", 5, reset_timeout=0.01)
+
+        breaker.record_failure(open_for=60)
+
+        assert breaker.state == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+class TestProviderGuard:
+    async def test_failures_trip_and_recover(self, make_guard):
+        guard = make_guard("test_guard_recover")
+        state = provider_circuit_state.labels("test_guard_recover")
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                async with guard.slot():
+                    raise ConnectionError()
+        assert state._value.get() == CircuitState.OPEN.value
+
+        with pytest.raises(CircuitOpenError):
+            async with guard.slot():
+                pytest.fail("call must not reach the provider")
+
+        await asyncio.sleep(0.06)
+        async with guard.slot():
+            pass
+        assert guard.state == CircuitState.CLOSED
+        assert state._value.get() == CircuitState.CLOSED.value
+
+    async def test_client_errors_do_not_trip(self, make_guard):
+        guard = make_guard("test_guard_client_errors")
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                async with guard.slot():
+                    raise ValueError()
+
+        assert guard.state == CircuitState.CLOSED
+
+    async def test_client_errors_do_not_reset_failure_streak(self, make_guard):
+        guard = make_guard("test_guard_client_error_streak")
+
+        with pytest.raises(ConnectionError):
+            async with guard.slot():
+                raise ConnectionError()
+        with pytest.raises(ValueError):
+            async with guard.slot():
+                raise ValueError()
+        with pytest.raises(ConnectionError):
+            async with guard.slot():
+                raise ConnectionError()
+
+        assert guard.state == CircuitState.OPEN
+
+    async def test_client_error_probe_does_not_close_circuit(self, make_guard):
+        guard = make_guard("test_guard_client_error_probe", failure_threshold=1)
+        with pytest.raises(ConnectionError):
+            async with guard.slot():
+                raise ConnectionError()
+        await asyncio.sleep(0.06)
+
+        with pytest.raises(ValueError):
+            async with guard.slot():
+                raise ValueError()
+        assert guard.state == CircuitState.HALF_OPEN
+
+        # The probe was released, so the next call can probe again.
+        async with guard.slot():
+            pass
+        assert guard.state == CircuitState.CLOSED
+
+    async def test_cancelled_probe_is_released(self, make_guard):
+        guard = make_guard("test_guard_cancel", failure_threshold=1)
+        with pytest.raises(ConnectionError):
+            async with guard.slot():
+                raise ConnectionError()
+        await asyncio.sleep(0.06)
+
+        async def hang():
+            async with guard.slot():
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(hang())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        async with guard.slot():
+            pass
+        assert guard.state == CircuitState.CLOSED
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+from src.core.singleflight import SingleFlight, singleflight_coalesced_total
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight("test_shared")
+        calls = 0
+        release = asyncio.Event()
+
+        async def load() -> int:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 42
+
+        waiters = [asyncio.create_task(flight.do("key", load)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == [42] * 5
+        assert calls == 1
+        assert singleflight_coalesced_total.labels("test_shared")._value.get() == 4
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_coalesced(self):
+        flight = SingleFlight("test_sequential")
+        calls = 0
+
+        async def load() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("key", load) == 1
+        assert await flight.do("key", load) == 2
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared_and_forgotten(self):
+        flight = SingleFlight("test_error")
+        release = asyncio.Event()
+
+        async def fail() -> int:
+            await release.wait()
+            raise ValueError("boom")
+
+        waiters = [asyncio.create_task(flight.do("key", fail)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+
+        async def succeed() -> int:
+            return 1
+
+        assert await flight.do("key", succeed) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_leaves_call_to_remaining_waiters(self):
+        flight = SingleFlight("test_cancel_leader")
+        release = asyncio.Event()
+        started = 0
+
+        async def load() -> str:
+            nonlocal started
+            started += 1
+            await release.wait()
+            return "done"
+
+        leader = asyncio.create_task(flight.do("key", load))
+        follower = asyncio.create_task(flight.do("key", load))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == "done"
+        assert started == 1
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    @pytest.mark.asyncio
+    async def test_call_is_cancelled_when_every_waiter_is(self):
+        flight = SingleFlight("test_cancel_all")
+        cleaned_up = asyncio.Event()
+
+        async def load() -> str:
+            try:
+                await asyncio.Event().wait()
+            finally:
+                cleaned_up.set()
+            return "never"
+
+        waiters = [asyncio.create_task(flight.do("key", load)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+        await asyncio.wait_for(cleaned_up.wait(), timeout=1)
+
+        async def succeed() -> str:
+            return "fresh"
+
+        assert await flight.do("key", succeed) == "fresh"
@@ -0,0 +1,28 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def make_session():
+    def factory(previous_version, existing_tables):
+        session = AsyncMock()
+
+        async def execute(statement, params=None):
+            sql = str(statement)
+            result = MagicMock()
+            result.rowcount = 2
+            if "INSERT INTO ml_score_snapshots" in sql:
+                result.scalar_one.return_value = 7
+            elif "SELECT COUNT(*)" in sql:
+                result.scalar_one.return_value = 1
+            elif "SET status = :retired" in sql:
+                result.scalar_one_or_none.return_value = previous_version
+            elif "FROM pg_tables" in sql:
+                result.scalars.return_value = existing_tables
+            return result
+
+        session.execute.side_effect = execute
+        return session
+
+    return factory
@@ -0,0 +1,30 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from src.adapters.api.dependencies import verify_admin_token
+
+
+class TestVerifyAdminToken:
+    def test_rejects_when_token_is_not_configured(self):
+        settings = MagicMock(admin_token=None)
+
+        with pytest.raises(HTTPException) as exc:
+            verify_admin_token(x_admin_token=None, settings=settings)
+        assert exc.value.status_code == 403
+
+        with pytest.raises(HTTPException) as exc:
+            verify_admin_token(x_admin_token="anything", settings=settings)
+        assert exc.value.status_code == 403
+
+    def test_rejects_wrong_token(self):
+        settings = MagicMock(admin_token="secret")
+
+        with pytest.raises(HTTPException) as exc:
+            verify_admin_token(x_admin_token="guess", settings=settings)
+        assert exc.value.status_code == 403
+
+    def test_accepts_configured_token(self):
+        settings = MagicMock(admin_token="secret")
+
+        assert verify_admin_token(x_admin_token="secret", settings=settings) is None
@@ -0,0 +1,49 @@
+import pytest
+from src.common.enums import LoadTarget
+from src.infrastructure.loader.repositories import CopyLoaderRepository
+
+
+def executed(session):
+    return [" ".join(str(c.args[0]).split()) for c in session.execute.call_args_list]
+
+
+@pytest.mark.asyncio
+class TestCopyLoaderRepositorySnapshot:
+    async def test_create_staging_takes_advisory_lock(self, make_session):
+        session = make_session(None, [])
+        repository = CopyLoaderRepository(session)
+
+        await repository.create_staging(LoadTarget.ML_SCORES_SNAPSHOT)
+
+        statements = executed(session)
+        assert "pg_advisory_xact_lock" in statements[0]
+        assert "CREATE TEMP TABLE ml_scores_staging" in statements[1]
+
+    async def test_merge_swaps_new_snapshot_in(self, make_session):
+        session = make_session(6, ["ml_scores_v6"])
+        repository = CopyLoaderRepository(session)
+
+        merged = await repository.merge(LoadTarget.ML_SCORES_SNAPSHOT)
+
+        assert merged.written == 2
+        assert merged.rejected == 1
+        statements = executed(session)
+        old_renamed = statements.index("ALTER TABLE ml_scores RENAME TO ml_scores_v6")
+        new_renamed = statements.index("ALTER TABLE ml_scores_v7 RENAME TO ml_scores")
+        assert statements.index("LOCK TABLE ml_scores IN ACCESS EXCLUSIVE MODE") < (
+            old_renamed
+        )
+        assert old_renamed < new_renamed
+        assert not any(s.startswith("DROP TABLE") for s in statements)
+
+    async def test_merge_drops_snapshots_beyond_retention(self, make_session):
+        session = make_session(6, ["ml_scores_v6", "ml_scores_v5", "ml_scores_v4"])
+        repository = CopyLoaderRepository(session)
+
+        await repository.merge(LoadTarget.ML_SCORES_SNAPSHOT)
+
+        statements = executed(session)
+        assert "DROP TABLE ml_scores_v5" in statements
+        assert "DROP TABLE ml_scores_v4" in statements
+        assert "DROP TABLE ml_scores_v6" not in statements
+        assert session.execute.call_args_list[-1].args[1]["versions"] == [5, 4]
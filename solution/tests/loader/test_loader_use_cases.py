@@ -0,0 +1,162 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from src.application.loader.use_cases import BulkLoadUseCase
+from src.common.enums import LoadFormat, LoadTarget
+from src.domain.loader.entities import LoadMergeEntity
+from src.domain.loader.exceptions import LoaderError
+from src.infrastructure.advertisers.score_store import MLScoreStore
+
+
+@pytest.fixture
+def dummy_uow():
+    uow = AsyncMock()
+    uow.__aenter__.return_value = uow
+    return uow
+
+
+async def iterate(lines):
+    for line in lines:
+        yield line
+
+
+@pytest.mark.asyncio
+class TestBulkLoadUseCase:
+    async def test_execute_csv_clients(self, dummy_uow: AsyncMock):
+        client_id = uuid4()
+        repository = AsyncMock()
+        repository.copy_records.side_effect = lambda target, records: len(records)
+        repository.merge.return_value = LoadMergeEntity(written=1, rejected=0)
+
+        use_case = BulkLoadUseCase(dummy_uow, repository)
+
+        result = await use_case.execute(
+            LoadTarget.CLIENTS,
+            LoadFormat.CSV,
+            iterate(
+                [
+                    b"client_id,login,age,location,gender\n",
+                    f"{client_id},user,25,Moscow,MALE\n".encode(),
+                    f"{client_id},user,old,Moscow,MALE\n".encode(),
+                    b"\n",
+                ]
+            ),
+        )
+
+        assert result.received == 2
+        assert result.staged == 1
+        assert result.invalid == 1
+        assert result.errors[0].line == 3
+        assert result.written == 1
+        repository.create_staging.assert_called_once_with(LoadTarget.CLIENTS)
+        repository.copy_records.assert_called_once_with(
+            LoadTarget.CLIENTS, [(client_id, "user", 25, "Moscow", "MALE")]
+        )
+        dummy_uow.commit.assert_called_once()
+
+    async def test_execute_ndjson_ml_scores_in_batches(self, dummy_uow: AsyncMock):
+        repository = AsyncMock()
+        repository.copy_records.side_effect = lambda target, records: len(records)
+        repository.merge.return_value = LoadMergeEntity(written=2, rejected=1)
+        progress = []
+
+        use_case = BulkLoadUseCase(dummy_uow, repository)
+
+        lines = [
+            f'{{"client_id": "{uuid4()}", "advertiser_id": "{uuid4()}", "score": {i}}}'.encode()
+            for i in range(3)
+        ]
+        with patch("src.application.loader.use_cases.LOADER_BATCH_SIZE", 2):
+            result = await use_case.execute(
+                LoadTarget.ML_SCORES,
+                LoadFormat.NDJSON,
+                iterate(lines),
+                on_progress=lambda result: progress.append(result.staged),
+            )
+
+        assert result.staged == 3
+        assert result.rejected == 1
+        assert repository.copy_records.call_count == 2
+        assert progress == [2, 3]
+
+    async def test_execute_repository_error(self, dummy_uow: AsyncMock):
+        repository = AsyncMock()
+        repository.create_staging.side_effect = LoaderError("Db error")
+
+        use_case = BulkLoadUseCase(dummy_uow, repository)
+
+        with pytest.raises(LoaderError) as exc:
+            await use_case.execute(LoadTarget.CLIENTS, LoadFormat.NDJSON, iterate([]))
+        assert "Db error" in str(exc.value)
+        dummy_uow.commit.assert_not_called()
+
+    async def test_execute_ml_scores_are_visible_in_score_store(
+        self, dummy_uow: AsyncMock
+    ):
+        client_id, advertiser_id = uuid4(), uuid4()
+        repository = AsyncMock()
+        repository.copy_records.side_effect = lambda target, records: len(records)
+        repository.merge.return_value = LoadMergeEntity(written=1, rejected=0)
+
+        committed = {}
+        dummy_uow.commit.side_effect = lambda: committed.update(
+            {(client_id, advertiser_id): 77}
+        )
+
+        @asynccontextmanager
+        async def session_maker():
+            session = AsyncMock()
+            result = MagicMock()
+            result.scalars.return_value = [advertiser_id]
+            session.execute.return_value = result
+            session.stream.return_value = iterate(
+                [(*key, score) for key, score in committed.items()]
+            )
+            yield session
+
+        score_store = MLScoreStore(session_maker)
+        await score_store.reload()
+        use_case = BulkLoadUseCase(dummy_uow, repository, score_store=score_store)
+
+        await use_case.execute(
+            LoadTarget.ML_SCORES_SNAPSHOT,
+            LoadFormat.NDJSON,
+            iterate(
+                [
+                    f'{{"client_id": "{client_id}", "advertiser_id": '
+                    f'"{advertiser_id}", "score": 77}}'.encode()
+                ]
+            ),
+        )
+
+        assert score_store.get_scores(client_id, [advertiser_id]) == {advertiser_id: 77}
+
+    async def test_execute_clients_do_not_reload_score_store(
+        self, dummy_uow: AsyncMock
+    ):
+        repository = AsyncMock()
+        repository.merge.return_value = LoadMergeEntity(written=0, rejected=0)
+        score_store = AsyncMock()
+
+        use_case = BulkLoadUseCase(dummy_uow, repository, score_store=score_store)
+        await use_case.execute(LoadTarget.CLIENTS, LoadFormat.NDJSON, iterate([]))
+
+        score_store.reload.assert_not_called()
+
+    async def test_execute_reload_failure_keeps_committed_result(
+        self, dummy_uow: AsyncMock
+    ):
+        repository = AsyncMock()
+        repository.merge.return_value = LoadMergeEntity(written=3, rejected=0)
+        score_store = AsyncMock()
+        score_store.reload.side_effect = Exception("db down")
+
+        use_case = BulkLoadUseCase(dummy_uow, repository, score_store=score_store)
+        result = await use_case.execute(
+            LoadTarget.ML_SCORES, LoadFormat.NDJSON, iterate([])
+        )
+
+        assert result.written == 3
+        dummy_uow.commit.assert_called_once()
@@ -0,0 +1,38 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.infrastructure.moderation.matcher import ForbiddenWordsMatcherCache
+from src.infrastructure.moderation.services import ModerationService
+
+
+@pytest.fixture
+def ai_service() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def moderation_settings() -> MagicMock:
+    settings = MagicMock()
+    settings.ai_moderation_enabled = True
+    settings.ai_check_profanity = True
+    settings.ai_check_offensive = False
+    settings.ai_check_inappropriate = False
+    return settings
+
+
+@pytest.fixture
+def moderation_service(
+    ai_service: AsyncMock, moderation_settings: MagicMock
+) -> ModerationService:
+    uow = AsyncMock()
+    uow.__aenter__.return_value = uow
+    repository = AsyncMock()
+    repository.get_version.return_value = 1
+    repository.get_all.return_value = ["казино"]
+    return ModerationService(
+        uow,
+        repository,
+        ai_service,
+        moderation_settings,
+        ForbiddenWordsMatcherCache(),
+    )
@@ -0,0 +1,153 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import pytest
+from src.domain.moderation.entities import ForbiddenWordMatchEntity
+from src.domain.moderation.exceptions import ForbiddenWordsVersionError
+from src.infrastructure.moderation.matcher import (
+    AhoCorasickMatcher,
+    ForbiddenWordsMatcherCache,
+)
+
+
+class TestAhoCorasickMatcher:
+    def test_finds_overlapping_words_with_positions(self):
+        matcher = AhoCorasickMatcher(["he", "she", "his", "hers"])
+
+        matches = matcher.find_all("ushers")
+
+        assert matches == [
+            ForbiddenWordMatchEntity(word="she", start=1, end=4),
+            ForbiddenWordMatchEntity(word="he", start=2, end=4),
+            ForbiddenWordMatchEntity(word="hers", start=2, end=6),
+        ]
+
+    def test_is_case_insensitive_and_keeps_original_word(self):
+        matcher = AhoCorasickMatcher(["Казино", "казино"])
+
+        matches = matcher.find_all("Лучшее КАЗИНО города")
+
+        assert matches == [ForbiddenWordMatchEntity(word="Казино", start=7, end=13)]
+
+    def test_surrounding_whitespace_is_part_of_the_word(self):
+        matcher = AhoCorasickMatcher([" казино "])
+
+        assert matcher.find_all("казино") == []
+        assert matcher.find_all("Лучшее КАЗИНО города") == [
+            ForbiddenWordMatchEntity(word=" казино ", start=6, end=14)
+        ]
+
+    def test_empty_word_is_ignored(self):
+        # A plain substring test would flag every text for an empty word.
+        assert AhoCorasickMatcher([""]).find_all("anything") == []
+
+    def test_positions_refer_to_original_text(self):
+        matcher = AhoCorasickMatcher(["bad"])
+
+        assert matcher.find_all("İ bad") == [
+            ForbiddenWordMatchEntity(word="bad", start=2, end=5)
+        ]
+
+    def test_no_words_match_nothing(self):
+        assert AhoCorasickMatcher([]).find_all("anything") == []
+
+
+@pytest.mark.asyncio
+class TestForbiddenWordsMatcherCache:
+    async def test_rebuilds_only_when_version_changes(self):
+        repository = AsyncMock()
+        repository.get_version.return_value = 1
+        repository.get_all.return_value = ["spam"]
+        cache = ForbiddenWordsMatcherCache()
+
+        first = await cache.get_matcher(repository)
+        second = await cache.get_matcher(repository)
+        repository.get_version.return_value = 2
+        repository.get_all.return_value = ["scam"]
+        third = await cache.get_matcher(repository)
+
+        assert first is second
+        assert repository.get_all.await_count == 2
+        assert third.find_all("scam spam") == [
+            ForbiddenWordMatchEntity(word="scam", start=0, end=4)
+        ]
+
+    async def test_store_warms_cache(self):
+        repository = AsyncMock()
+        repository.get_version.return_value = 5
+        cache = ForbiddenWordsMatcherCache()
+
+        stored = cache.store(5, ["spam"])
+
+        assert await cache.get_matcher(repository) is stored
+        repository.get_all.assert_not_awaited()
+
+    async def test_uses_shared_version_without_touching_database(self):
+        repository = AsyncMock()
+        version_repository = AsyncMock()
+        version_repository.get.return_value = 5
+        cache = ForbiddenWordsMatcherCache()
+        cache.store(5, ["spam"])
+
+        await cache.get_matcher(repository, version_repository)
+
+        repository.get_version.assert_not_awaited()
+        repository.get_all.assert_not_awaited()
+
+    async def test_publishes_database_version_when_shared_one_is_missing(self):
+        repository = AsyncMock()
+        repository.get_version.return_value = 3
+        repository.get_all.return_value = ["spam"]
+        version_repository = AsyncMock()
+        version_repository.get.return_value = None
+        cache = ForbiddenWordsMatcherCache()
+
+        await cache.get_matcher(repository, version_repository)
+
+        version_repository.publish.assert_awaited_once_with(3)
+
+    async def test_falls_back_to_database_when_redis_fails(self):
+        repository = AsyncMock()
+        repository.get_version.return_value = 2
+        repository.get_all.return_value = ["spam"]
+        version_repository = AsyncMock()
+        version_repository.get.side_effect = ForbiddenWordsVersionError("down")
+        cache = ForbiddenWordsMatcherCache()
+
+        matcher = await cache.get_matcher(repository, version_repository)
+
+        assert [match.word for match in matcher.find_all("spam")] == ["spam"]
+
+    async def test_concurrent_rebuild_reads_through_its_own_repository(self):
+        request_repository = AsyncMock()
+        request_repository.get_version.return_value = 3
+        release = asyncio.Event()
+        own_repository = AsyncMock()
+
+        async def get_all():
+            await release.wait()
+            return ["spam"]
+
+        own_repository.get_all.side_effect = get_all
+        opened = 0
+
+        @asynccontextmanager
+        async def repository_factory():
+            nonlocal opened
+            opened += 1
+            yield own_repository
+
+        cache = ForbiddenWordsMatcherCache(repository_factory)
+
+        callers = [
+            asyncio.create_task(cache.get_matcher(request_repository)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        matchers = await asyncio.gather(*callers)
+
+        assert all(matcher is matchers[0] for matcher in matchers)
+        assert opened == 1
+        own_repository.get_all.assert_awaited_once()
+        request_repository.get_all.assert_not_awaited()
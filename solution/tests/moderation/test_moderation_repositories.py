@@ -0,0 +1,97 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from src.domain.moderation.exceptions import (
+    ForbiddenWordsVersionError,
+    ModerationQueueError,
+)
+from src.infrastructure.moderation.queue import ModerationQueueRepository
+from src.infrastructure.moderation.repositories import (
+    ForbiddenWordsRepository,
+    ForbiddenWordsVersionRepository,
+)
+
+
+@pytest.mark.asyncio
+class TestForbiddenWordsRepository:
+    async def test_update_replaces_words_in_one_insert(self):
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalar_one.return_value = 3
+        session.execute.return_value = result
+        words = [f"word{i}" for i in range(50_000)]
+
+        repository = ForbiddenWordsRepository(session)
+        version = await repository.update(words)
+
+        assert version == 3
+        assert session.execute.await_count == 3
+        delete, insert, bump = session.execute.await_args_list
+        assert "DELETE FROM forbidden_words" in str(delete.args[0])
+        assert insert.args[1]["words"] == words
+        assert bump.args[1]["word_count"] == 50_000
+
+    async def test_get_version(self):
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalar_one.return_value = 0
+        session.execute.return_value = result
+
+        repository = ForbiddenWordsRepository(session)
+
+        assert await repository.get_version() == 0
+
+
+@pytest.mark.asyncio
+class TestForbiddenWordsVersionRepository:
+    async def test_get(self):
+        redis = AsyncMock()
+        redis.get.return_value = "7"
+
+        assert await ForbiddenWordsVersionRepository(redis).get() == 7
+
+    async def test_get_missing(self):
+        redis = AsyncMock()
+        redis.get.return_value = None
+
+        assert await ForbiddenWordsVersionRepository(redis).get() is None
+
+    async def test_publish_error(self):
+        redis = AsyncMock()
+        redis.eval.side_effect = ConnectionError("down")
+
+        with pytest.raises(ForbiddenWordsVersionError):
+            await ForbiddenWordsVersionRepository(redis).publish(1)
+
+
+@pytest.mark.asyncio
+class TestModerationQueueRepository:
+    async def test_enqueue_and_dequeue(self):
+        campaign_id = uuid4()
+        redis = AsyncMock()
+        redis.brpop.return_value = (
+            ModerationQueueRepository.QUEUE_KEY,
+            str(campaign_id),
+        )
+        queue = ModerationQueueRepository(redis)
+
+        await queue.enqueue(campaign_id)
+
+        redis.lpush.assert_called_once_with(
+            ModerationQueueRepository.QUEUE_KEY, str(campaign_id)
+        )
+        assert await queue.dequeue(1.0) == campaign_id
+
+    async def test_dequeue_timeout(self):
+        redis = AsyncMock()
+        redis.brpop.return_value = None
+
+        assert await ModerationQueueRepository(redis).dequeue(1.0) is None
+
+    async def test_enqueue_error(self):
+        redis = AsyncMock()
+        redis.lpush.side_effect = ConnectionError("down")
+
+        with pytest.raises(ModerationQueueError):
+            await ModerationQueueRepository(redis).enqueue(uuid4())
@@ -0,0 +1,58 @@
+import pytest
+
+
+@pytest.mark.asyncio
+class TestCheckForbiddenWordsBatch:
+    async def test_sends_only_unflagged_texts_to_ai_in_one_call(
+        self, ai_service, moderation_service
+    ):
+        ai_service.check_forbidden_words_batch.return_value = [
+            {"profanity": True, "offensive": False, "inappropriate": False},
+            {"profanity": False, "offensive": True, "inappropriate": False},
+        ]
+
+        results = await moderation_service.check_forbidden_words_batch(
+            ["Лучшее казино", "  ", "текст", "другой текст"]
+        )
+
+        ai_service.check_forbidden_words_batch.assert_awaited_once_with(
+            ["текст", "другой текст"]
+        )
+        assert [result.source for result in results] == [
+            "database",
+            "empty_input",
+            "ai",
+            "ai",
+        ]
+        assert [result.contains_forbidden_words for result in results] == [
+            True,
+            False,
+            True,
+            False,
+        ]
+        assert results[0].matches[0].word == "казино"
+
+    async def test_ai_failure_does_not_block(self, ai_service, moderation_service):
+        ai_service.check_forbidden_words_batch.side_effect = Exception("timeout")
+
+        results = await moderation_service.check_forbidden_words_batch(
+            ["title", "text"]
+        )
+
+        assert [result.source for result in results] == ["ai_error", "ai_error"]
+        assert not any(result.contains_forbidden_words for result in results)
+
+    async def test_ai_disabled(
+        self, ai_service, moderation_settings, moderation_service
+    ):
+        moderation_settings.ai_moderation_enabled = False
+
+        results = await moderation_service.check_forbidden_words_batch(
+            ["title", "text"]
+        )
+
+        ai_service.check_forbidden_words_batch.assert_not_awaited()
+        assert [result.source for result in results] == [
+            "no_checks_enabled",
+            "no_checks_enabled",
+        ]
@@ -57,6 +57,25 @@ class TestUpdateForbiddenWordsUseCase:
         repository.update.assert_awaited_once_with(data)
         dummy_uow.commit.assert_awaited_once()
 
+    async def test_execute_refreshes_matcher_cache(self, dummy_uow: AsyncMock):
+        data = ["forbidden1"]
+        repository = AsyncMock()
+        repository.update.return_value = 4
+        matcher_cache = MagicMock()
+        version_repository = AsyncMock()
+
+        use_case = UpdateForbiddenWordsUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            matcher_cache=matcher_cache,
+            version_repository=version_repository,
+        )
+
+        await use_case.execute(data)
+
+        matcher_cache.store.assert_called_once_with(4, data)
+        version_repository.publish.assert_awaited_once_with(4)
+
     async def test_execute_error(self, dummy_uow: AsyncMock):
         data = ["forbidden1", "forbidden2"]
         repository = AsyncMock()
@@ -0,0 +1,71 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.infrastructure.statistics.repositories import backfill_campaign_daily_stats
+
+
+def executed(session):
+    return [" ".join(str(c.args[0]).split()) for c in session.execute.call_args_list]
+
+
+@pytest.mark.asyncio
+class TestBackfillCampaignDailyStats:
+    async def test_first_run_recounts_every_day(self):
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(
+            **{"scalar_one_or_none.return_value": None}
+        )
+
+        await backfill_campaign_daily_stats(session)
+
+        recount = next(s for s in executed(session) if "GROUP BY" in s)
+        assert "WHERE (campaign_id, date) IN (SELECT campaign_id, date FROM" in recount
+        assert "created_at" not in recount
+        assert "NOT EXISTS" not in recount
+
+    async def test_later_runs_recount_only_days_with_new_events(self):
+        watermark = datetime(2026, 1, 1, tzinfo=UTC)
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(
+            **{"scalar_one_or_none.return_value": watermark}
+        )
+
+        await backfill_campaign_daily_stats(session)
+
+        statements = executed(session)
+        recount_index = next(i for i, s in enumerate(statements) if "GROUP BY" in s)
+        assert (
+            "created_at >= CAST(:watermark AS timestamptz)"
+            in (statements[recount_index])
+        )
+        assert (
+            session.execute.call_args_list[recount_index].args[1]["watermark"]
+            == watermark
+        )
+        # Recounted rows are overwritten, so rerunning is idempotent.
+        assert (
+            "impressions_count = EXCLUDED.impressions_count"
+            in (statements[recount_index])
+        )
+
+    async def test_recount_holds_back_live_increments(self):
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(
+            **{"scalar_one_or_none.return_value": None}
+        )
+
+        await backfill_campaign_daily_stats(session)
+
+        statements = executed(session)
+        lock = statements.index(
+            "LOCK TABLE campaign_daily_stats IN SHARE ROW EXCLUSIVE MODE"
+        )
+        recount = next(i for i, s in enumerate(statements) if "GROUP BY" in s)
+        watermark = next(
+            i
+            for i, s in enumerate(statements)
+            if s.startswith("INSERT INTO stats_rollup_watermarks")
+        )
+        assert lock < recount < watermark
+        assert session.commit.await_count == 2
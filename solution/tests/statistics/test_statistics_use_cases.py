@@ -1,3 +1,5 @@
+import asyncio
+from contextlib import asynccontextmanager, nullcontext
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
@@ -8,20 +10,31 @@ from src.application.statistics.dtos import (
     CampaignFeedbackItem,
     CampaignFeedbackResponse,
     ClientStatsResponse,
+    DailyStatsPage,
     DailyStatsResponse,
+    ReachResponse,
     StatsResponse,
 )
 from src.application.statistics.use_cases import (
     GetAdvertiserCampaignsStatsUseCase,
     GetAdvertiserDailyStatsUseCase,
+    GetAdvertiserReachUseCase,
     GetCampaignDailyStatsUseCase,
     GetCampaignFeedbackStatsUseCase,
+    GetCampaignReachUseCase,
     GetCampaignStatsUseCase,
     GetClientsStatsUseCase,
 )
 from src.domain.advertisers.exceptions import AdvertiserNotFoundException
 from src.domain.campaigns.exceptions import CampaignNotFoundException
-from src.domain.statistics.exceptions import StatisticsRepositoryError
+from src.domain.statistics.entities import ReachEntity
+from src.common.enums import StatsGranularity
+from src.domain.statistics.exceptions import (
+    InvalidStatsRangeError,
+    StatisticsRepositoryError,
+)
+from src.domain.statistics.types import STATS_CACHE_SCOPE_CAMPAIGN
+from src.infrastructure.statistics.mappers import StatisticsMapper
 
 
 @pytest.fixture
@@ -64,7 +77,9 @@ class TestGetCampaignStatsUseCase:
         assert result == expected_response
         campaigns_repository.get_by_id.assert_called_once_with(campaign_id)
         repository.get_campaign_stats.assert_called_once_with(campaign_id)
-        mapper.from_entity_to_statistics_schema.assert_called_once_with(dummy_entity)
+        mapper.from_entity_to_statistics_schema.assert_called_once_with(
+            dummy_entity, None
+        )
 
     @pytest.mark.asyncio
     async def test_execute_campaign_not_found(self, dummy_uow: AsyncMock):
@@ -136,7 +151,9 @@ class TestGetAdvertiserCampaignsStatsUseCase:
         assert result == expected_response
         advertisers_repository.get_by_id.assert_called_once_with(advertiser_id)
         repository.get_advertiser_stats.assert_called_once_with(advertiser_id)
-        mapper.from_entity_to_statistics_schema.assert_called_once_with(dummy_entity)
+        mapper.from_entity_to_statistics_schema.assert_called_once_with(
+            dummy_entity, None
+        )
 
     @pytest.mark.asyncio
     async def test_execute_advertiser_not_found(self, dummy_uow: AsyncMock):
@@ -177,6 +194,182 @@ class TestGetAdvertiserCampaignsStatsUseCase:
             await use_case.execute(advertiser_id)
         assert "Unexpected error:" in str(exc.value)
 
+    @pytest.mark.asyncio
+    async def test_execute_served_from_cache(self, dummy_uow: AsyncMock):
+        campaign_id = uuid4()
+        cached_response = StatsResponse(
+            impressions_count=5,
+            clicks_count=1,
+            conversion=0.2,
+            spent_impressions=5,
+            spent_clicks=2,
+            spent_total=7,
+        )
+        cache = AsyncMock()
+        cache.build_key.return_value = "stats:cache:key"
+        cache.get.return_value = cached_response.model_dump_json()
+        repository = AsyncMock()
+
+        use_case = GetCampaignStatsUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            campaigns_repository=AsyncMock(),
+            mapper=MagicMock(),
+            cache=cache,
+        )
+
+        result = await use_case.execute(campaign_id)
+        assert result == cached_response
+        cache.build_key.assert_called_once_with(
+            "campaign", STATS_CACHE_SCOPE_CAMPAIGN, campaign_id
+        )
+        repository.get_campaign_stats.assert_not_called()
+        cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_cache_miss_stores_response(self, dummy_uow: AsyncMock):
+        campaign_id = uuid4()
+        expected_response = StatsResponse(
+            impressions_count=5,
+            clicks_count=1,
+            conversion=0.2,
+            spent_impressions=5,
+            spent_clicks=2,
+            spent_total=7,
+        )
+        cache = AsyncMock()
+        cache.build_key.return_value = "stats:cache:key"
+        cache.get.return_value = None
+        repository = AsyncMock()
+        fill_repository = AsyncMock()
+        mapper = MagicMock()
+        mapper.from_entity_to_statistics_schema.return_value = expected_response
+
+        use_case = GetCampaignStatsUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            campaigns_repository=AsyncMock(),
+            mapper=mapper,
+            cache=cache,
+            fill_repository=lambda: nullcontext(fill_repository),
+        )
+
+        result = await use_case.execute(campaign_id)
+        assert result == expected_response
+        fill_repository.get_campaign_stats.assert_called_once_with(campaign_id)
+        repository.get_campaign_stats.assert_not_called()
+        cache.set.assert_called_once_with(
+            "stats:cache:key", expected_response.model_dump_json()
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_request_reads_are_not_cached(self, dummy_uow: AsyncMock):
+        campaign_id = uuid4()
+        expected_response = StatsResponse(
+            impressions_count=5,
+            clicks_count=1,
+            conversion=0.2,
+            spent_impressions=5,
+            spent_clicks=2,
+            spent_total=7,
+        )
+        cache = AsyncMock()
+        cache.build_key.return_value = "stats:cache:key"
+        cache.get.return_value = None
+        replica_repository = AsyncMock()
+        mapper = MagicMock()
+        mapper.from_entity_to_statistics_schema.return_value = expected_response
+
+        use_case = GetCampaignStatsUseCase(
+            uow=dummy_uow,
+            repository=replica_repository,
+            campaigns_repository=AsyncMock(),
+            mapper=mapper,
+            cache=cache,
+        )
+
+        result = await use_case.execute(campaign_id)
+        assert result == expected_response
+        replica_repository.get_campaign_stats.assert_called_once_with(campaign_id)
+        cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_cache_fill_runs_once_on_its_own_session(
+        self, dummy_uow: AsyncMock
+    ):
+        campaign_id = uuid4()
+        expected_response = StatsResponse(
+            impressions_count=5,
+            clicks_count=1,
+            conversion=0.2,
+            spent_impressions=5,
+            spent_clicks=2,
+            spent_total=7,
+        )
+        cache = AsyncMock()
+        cache.build_key.return_value = f"stats:cache:fill:{campaign_id}"
+        cache.get.return_value = None
+        request_repository = AsyncMock()
+        fill_repository = AsyncMock()
+        release = asyncio.Event()
+
+        async def get_campaign_stats(campaign_id):
+            await release.wait()
+            return MagicMock()
+
+        fill_repository.get_campaign_stats.side_effect = get_campaign_stats
+        opened = 0
+
+        @asynccontextmanager
+        async def open_fill_repository():
+            nonlocal opened
+            opened += 1
+            yield fill_repository
+
+        mapper = MagicMock()
+        mapper.from_entity_to_statistics_schema.return_value = expected_response
+        use_case = GetCampaignStatsUseCase(
+            uow=dummy_uow,
+            repository=request_repository,
+            campaigns_repository=AsyncMock(),
+            mapper=mapper,
+            cache=cache,
+            fill_repository=open_fill_repository,
+        )
+
+        requests = [
+            asyncio.create_task(use_case.execute(campaign_id)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*requests) == [expected_response] * 3
+        assert opened == 1
+        fill_repository.get_campaign_stats.assert_called_once_with(campaign_id)
+        request_repository.get_campaign_stats.assert_not_called()
+        cache.set.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_cache_unavailable(self, dummy_uow: AsyncMock):
+        expected_response = MagicMock()
+        cache = AsyncMock()
+        cache.build_key.side_effect = StatisticsRepositoryError("redis down")
+        repository = AsyncMock()
+        mapper = MagicMock()
+        mapper.from_entity_to_statistics_schema.return_value = expected_response
+
+        use_case = GetCampaignStatsUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            campaigns_repository=AsyncMock(),
+            mapper=mapper,
+            cache=cache,
+        )
+
+        result = await use_case.execute(uuid4())
+        assert result == expected_response
+        repository.get_campaign_stats.assert_called_once()
+
 
 class TestGetCampaignDailyStatsUseCase:
     @pytest.mark.asyncio
@@ -205,7 +398,11 @@ class TestGetCampaignDailyStatsUseCase:
         )
 
         campaigns_repository = AsyncMock()
-        campaigns_repository.get_by_id.return_value = MagicMock()
+        campaigns_repository.get_by_id.return_value = MagicMock(
+            id=campaign_id, start_date=1, end_date=30
+        )
+        time_repository = AsyncMock()
+        time_repository.get_current_date.return_value = 2
         repository = AsyncMock()
         repository.get_campaign_daily_stats.return_value = [
             dummy_stats_entity1,
@@ -218,14 +415,21 @@ class TestGetCampaignDailyStatsUseCase:
             uow=dummy_uow,
             repository=repository,
             campaigns_repository=campaigns_repository,
+            time_repository=time_repository,
             mapper=mapper,
         )
         result = await use_case.execute(campaign_id)
-        assert result == [response1, response2]
+        assert result == DailyStatsPage(items=[response1, response2], next_cursor=None)
         campaigns_repository.get_by_id.assert_called_once_with(campaign_id)
-        repository.get_campaign_daily_stats.assert_called_once_with(campaign_id)
-        mapper.from_entity_to_schema_daily_stats.assert_any_call(dummy_stats_entity1)
-        mapper.from_entity_to_schema_daily_stats.assert_any_call(dummy_stats_entity2)
+        repository.get_campaign_daily_stats.assert_called_once_with(
+            campaign_id, 1, 2, 1
+        )
+        mapper.from_entity_to_schema_daily_stats.assert_any_call(
+            dummy_stats_entity1, None
+        )
+        mapper.from_entity_to_schema_daily_stats.assert_any_call(
+            dummy_stats_entity2, None
+        )
 
     @pytest.mark.asyncio
     async def test_execute_campaign_not_found(self, dummy_uow: AsyncMock):
@@ -241,6 +445,7 @@ class TestGetCampaignDailyStatsUseCase:
             uow=dummy_uow,
             repository=repository,
             campaigns_repository=campaigns_repository,
+            time_repository=AsyncMock(),
             mapper=mapper,
         )
         with pytest.raises(CampaignNotFoundException) as exc:
@@ -251,7 +456,9 @@ class TestGetCampaignDailyStatsUseCase:
     async def test_execute_unexpected_error(self, dummy_uow: AsyncMock):
         campaign_id = uuid4()
         campaigns_repository = AsyncMock()
-        campaigns_repository.get_by_id.return_value = MagicMock()
+        campaigns_repository.get_by_id.return_value = MagicMock(
+            start_date=1, end_date=30
+        )
         repository = AsyncMock()
         repository.get_campaign_daily_stats.side_effect = Exception("Unexpected error")
         mapper = MagicMock()
@@ -260,12 +467,110 @@ class TestGetCampaignDailyStatsUseCase:
             uow=dummy_uow,
             repository=repository,
             campaigns_repository=campaigns_repository,
+            time_repository=AsyncMock(),
             mapper=mapper,
         )
         with pytest.raises(StatisticsRepositoryError) as exc:
             await use_case.execute(campaign_id)
         assert "Unexpected error:" in str(exc.value)
 
+    @pytest.mark.asyncio
+    async def test_execute_weekly_paged(self, dummy_uow: AsyncMock):
+        campaign_id = uuid4()
+        campaigns_repository = AsyncMock()
+        campaigns_repository.get_by_id.return_value = MagicMock(
+            id=campaign_id, start_date=0, end_date=100
+        )
+        repository = AsyncMock()
+        repository.get_campaign_daily_stats.return_value = []
+
+        use_case = GetCampaignDailyStatsUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            campaigns_repository=campaigns_repository,
+            time_repository=AsyncMock(),
+            mapper=MagicMock(),
+        )
+        result = await use_case.execute(
+            campaign_id,
+            date_from=3,
+            date_to=40,
+            granularity=StatsGranularity.WEEK,
+            cursor=11,
+            limit=2,
+        )
+        assert result.next_cursor == 31
+        repository.get_campaign_daily_stats.assert_called_once_with(
+            campaign_id, 17, 30, 7
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_unpaged_by_default(self, dummy_uow: AsyncMock):
+        campaign_id = uuid4()
+        campaigns_repository = AsyncMock()
+        campaigns_repository.get_by_id.return_value = MagicMock(
+            id=campaign_id, start_date=0, end_date=1000
+        )
+        repository = AsyncMock()
+        repository.get_campaign_daily_stats.return_value = []
+
+        use_case = GetCampaignDailyStatsUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            campaigns_repository=campaigns_repository,
+            time_repository=AsyncMock(),
+            mapper=MagicMock(),
+        )
+        result = await use_case.execute(campaign_id, date_from=0, date_to=500)
+        assert result.next_cursor is None
+        repository.get_campaign_daily_stats.assert_called_once_with(
+            campaign_id, 0, 500, 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_total(self, dummy_uow: AsyncMock):
+        campaign_id = uuid4()
+        campaigns_repository = AsyncMock()
+        campaigns_repository.get_by_id.return_value = MagicMock(
+            id=campaign_id, start_date=0, end_date=100
+        )
+        repository = AsyncMock()
+        repository.get_campaign_daily_stats.return_value = []
+
+        use_case = GetCampaignDailyStatsUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            campaigns_repository=campaigns_repository,
+            time_repository=AsyncMock(),
+            mapper=MagicMock(),
+        )
+        result = await use_case.execute(
+            campaign_id, date_from=5, date_to=9, granularity=StatsGranularity.TOTAL
+        )
+        assert result.next_cursor is None
+        repository.get_campaign_daily_stats.assert_called_once_with(
+            campaign_id, 5, 9, 5
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_invalid_range(self, dummy_uow: AsyncMock):
+        campaigns_repository = AsyncMock()
+        campaigns_repository.get_by_id.return_value = MagicMock(
+            start_date=0, end_date=100
+        )
+        repository = AsyncMock()
+
+        use_case = GetCampaignDailyStatsUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            campaigns_repository=campaigns_repository,
+            time_repository=AsyncMock(),
+            mapper=MagicMock(),
+        )
+        with pytest.raises(InvalidStatsRangeError):
+            await use_case.execute(uuid4(), date_from=10, date_to=5)
+        repository.get_campaign_daily_stats.assert_not_called()
+
 
 class TestGetAdvertiserDailyStatsUseCase:
     @pytest.mark.asyncio
@@ -294,7 +599,10 @@ class TestGetAdvertiserDailyStatsUseCase:
         )
         advertisers_repository = AsyncMock()
         advertisers_repository.get_by_id.return_value = MagicMock()
+        time_repository = AsyncMock()
+        time_repository.get_current_date.return_value = 2
         repository = AsyncMock()
+        repository.get_advertiser_period.return_value = (1, 10)
         repository.get_advertiser_daily_stats.return_value = [
             dummy_stats_entity1,
             dummy_stats_entity2,
@@ -306,14 +614,21 @@ class TestGetAdvertiserDailyStatsUseCase:
             uow=dummy_uow,
             repository=repository,
             advertisers_repository=advertisers_repository,
+            time_repository=time_repository,
             mapper=mapper,
         )
         result = await use_case.execute(advertiser_id)
-        assert result == [response1, response2]
+        assert result == DailyStatsPage(items=[response1, response2], next_cursor=None)
         advertisers_repository.get_by_id.assert_called_once_with(advertiser_id)
-        repository.get_advertiser_daily_stats.assert_called_once_with(advertiser_id)
-        mapper.from_entity_to_schema_daily_stats.assert_any_call(dummy_stats_entity1)
-        mapper.from_entity_to_schema_daily_stats.assert_any_call(dummy_stats_entity2)
+        repository.get_advertiser_daily_stats.assert_called_once_with(
+            advertiser_id, 1, 2, 1
+        )
+        mapper.from_entity_to_schema_daily_stats.assert_any_call(
+            dummy_stats_entity1, None
+        )
+        mapper.from_entity_to_schema_daily_stats.assert_any_call(
+            dummy_stats_entity2, None
+        )
 
     @pytest.mark.asyncio
     async def test_execute_advertiser_not_found(self, dummy_uow: AsyncMock):
@@ -328,6 +643,7 @@ class TestGetAdvertiserDailyStatsUseCase:
             uow=dummy_uow,
             repository=repository,
             advertisers_repository=advertisers_repository,
+            time_repository=AsyncMock(),
             mapper=mapper,
         )
         with pytest.raises(AdvertiserNotFoundException) as exc:
@@ -340,6 +656,7 @@ class TestGetAdvertiserDailyStatsUseCase:
         advertisers_repository = AsyncMock()
         advertisers_repository.get_by_id.return_value = MagicMock()
         repository = AsyncMock()
+        repository.get_advertiser_period.return_value = (1, 10)
         repository.get_advertiser_daily_stats.side_effect = Exception(
             "Unexpected error"
         )
@@ -349,6 +666,7 @@ class TestGetAdvertiserDailyStatsUseCase:
             uow=dummy_uow,
             repository=repository,
             advertisers_repository=advertisers_repository,
+            time_repository=AsyncMock(),
             mapper=mapper,
         )
         with pytest.raises(StatisticsRepositoryError) as exc:
@@ -471,3 +789,203 @@ class TestGetCampaignFeedbackStatsUseCase:
         with pytest.raises(StatisticsRepositoryError) as exc:
             await use_case.execute(campaign_id)
         assert "Unexpected error:" in str(exc.value)
+
+
+class TestGetCampaignReachUseCase:
+    @pytest.mark.asyncio
+    async def test_execute_success(self, dummy_uow: AsyncMock):
+        campaign_id = uuid4()
+        dummy_entity = MagicMock()
+        expected_response = ReachResponse(
+            unique_clients=3, relative_standard_error=0.0081
+        )
+
+        campaigns_repository = AsyncMock()
+        repository = AsyncMock()
+        repository.get_campaign_reach.return_value = dummy_entity
+        mapper = MagicMock()
+        mapper.from_entity_to_reach_schema.return_value = expected_response
+
+        use_case = GetCampaignReachUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            campaigns_repository=campaigns_repository,
+            mapper=mapper,
+        )
+
+        result = await use_case.execute(campaign_id)
+        assert result == expected_response
+        campaigns_repository.get_by_id.assert_called_once_with(campaign_id)
+        repository.get_campaign_reach.assert_called_once_with(campaign_id)
+        mapper.from_entity_to_reach_schema.assert_called_once_with(dummy_entity)
+
+    @pytest.mark.asyncio
+    async def test_execute_campaign_not_found(self, dummy_uow: AsyncMock):
+        campaigns_repository = AsyncMock()
+        campaigns_repository.get_by_id.side_effect = CampaignNotFoundException(
+            "Campaign not found"
+        )
+        repository = AsyncMock()
+
+        use_case = GetCampaignReachUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            campaigns_repository=campaigns_repository,
+            mapper=MagicMock(),
+        )
+
+        with pytest.raises(CampaignNotFoundException):
+            await use_case.execute(uuid4())
+        repository.get_campaign_reach.assert_not_called()
+
+
+class TestGetAdvertiserReachUseCase:
+    @pytest.mark.asyncio
+    async def test_execute_success(self, dummy_uow: AsyncMock):
+        advertiser_id = uuid4()
+        dummy_entity = MagicMock()
+        expected_response = ReachResponse(
+            unique_clients=5, relative_standard_error=0.0081
+        )
+
+        advertisers_repository = AsyncMock()
+        repository = AsyncMock()
+        repository.get_advertiser_reach.return_value = dummy_entity
+        mapper = MagicMock()
+        mapper.from_entity_to_reach_schema.return_value = expected_response
+
+        use_case = GetAdvertiserReachUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            advertisers_repository=advertisers_repository,
+            mapper=mapper,
+        )
+
+        result = await use_case.execute(advertiser_id)
+        assert result == expected_response
+        advertisers_repository.get_by_id.assert_called_once_with(advertiser_id)
+        repository.get_advertiser_reach.assert_called_once_with(advertiser_id)
+
+    @pytest.mark.asyncio
+    async def test_execute_repository_error(self, dummy_uow: AsyncMock):
+        repository = AsyncMock()
+        repository.get_advertiser_reach.side_effect = Exception("redis down")
+
+        use_case = GetAdvertiserReachUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            advertisers_repository=AsyncMock(),
+            mapper=MagicMock(),
+        )
+
+        with pytest.raises(StatisticsRepositoryError):
+            await use_case.execute(uuid4())
+        repository.get_advertiser_reach.assert_called_once()
+
+
+class TestReachOnStatsEndpoints:
+    @pytest.mark.asyncio
+    async def test_campaign_stats_include_total_reach(self, dummy_uow: AsyncMock):
+        campaign_id = uuid4()
+        repository = AsyncMock()
+        repository.get_campaign_stats.return_value = MagicMock(
+            impressions_count=10,
+            clicks_count=2,
+            conversion=20.0,
+            spent_impressions=1.0,
+            spent_clicks=2.0,
+            spent_total=3.0,
+        )
+        reach_repository = AsyncMock()
+        reach_repository.get_campaign_reach.return_value = ReachEntity(unique_clients=7)
+
+        use_case = GetCampaignStatsUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            campaigns_repository=AsyncMock(),
+            mapper=StatisticsMapper(),
+            reach_repository=reach_repository,
+        )
+
+        result = await use_case.execute(campaign_id)
+        assert result.unique_clients == 7
+        reach_repository.get_campaign_reach.assert_called_once_with(campaign_id)
+
+    @pytest.mark.asyncio
+    async def test_stats_are_served_when_reach_is_unavailable(
+        self, dummy_uow: AsyncMock
+    ):
+        repository = AsyncMock()
+        repository.get_advertiser_stats.return_value = MagicMock(
+            impressions_count=10,
+            clicks_count=2,
+            conversion=20.0,
+            spent_impressions=1.0,
+            spent_clicks=2.0,
+            spent_total=3.0,
+        )
+        reach_repository = AsyncMock()
+        reach_repository.get_advertiser_reach.side_effect = StatisticsRepositoryError(
+            "redis down"
+        )
+
+        use_case = GetAdvertiserCampaignsStatsUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            advertisers_repository=AsyncMock(),
+            mapper=StatisticsMapper(),
+            reach_repository=reach_repository,
+        )
+
+        result = await use_case.execute(uuid4())
+        assert result.impressions_count == 10
+        assert result.unique_clients is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "granularity, expected",
+        [(StatsGranularity.DAY, [4, 6]), (StatsGranularity.WEEK, [None, None])],
+    )
+    async def test_daily_reach_covers_only_the_page(
+        self, dummy_uow: AsyncMock, granularity, expected
+    ):
+        campaign_id = uuid4()
+        campaigns_repository = AsyncMock()
+        campaigns_repository.get_by_id.return_value = MagicMock(
+            id=campaign_id, start_date=1, end_date=300
+        )
+        time_repository = AsyncMock()
+        time_repository.get_current_date.return_value = 250
+        repository = AsyncMock()
+        repository.get_campaign_daily_stats.return_value = [
+            MagicMock(
+                date=date,
+                impressions_count=1,
+                clicks_count=0,
+                conversion=0.0,
+                spent_impressions=1.0,
+                spent_clicks=0.0,
+                spent_total=1.0,
+            )
+            for date in (1, 2)
+        ]
+        reach_repository = AsyncMock()
+        reach_repository.get_campaign_daily_reach.return_value = {1: 4, 2: 6}
+
+        use_case = GetCampaignDailyStatsUseCase(
+            uow=dummy_uow,
+            repository=repository,
+            campaigns_repository=campaigns_repository,
+            time_repository=time_repository,
+            mapper=StatisticsMapper(),
+            reach_repository=reach_repository,
+        )
+
+        page = await use_case.execute(campaign_id, granularity=granularity, limit=2)
+        assert [item.unique_clients for item in page.items] == expected
+        if granularity == StatsGranularity.DAY:
+            reach_repository.get_campaign_daily_reach.assert_called_once_with(
+                campaign_id, [1, 2]
+            )
+        else:
+            reach_repository.get_campaign_daily_reach.assert_not_called()
@@ -0,0 +1,14 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from src.infrastructure.storage.minio_service import MinioService
+
+
+@pytest.fixture
+def minio_service() -> MinioService:
+    settings = MagicMock()
+    settings.minio_bucket_name = "images"
+    settings.minio_public_url = "http://minio.local"
+    with patch("src.infrastructure.storage.minio_service.Minio"):
+        service = MinioService(settings)
+    return service
@@ -0,0 +1,209 @@
+import asyncio
+import io
+import threading
+import time
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from minio.error import S3Error
+from src.domain.storage.exceptions import (
+    MinioFileTooLargeError,
+    MinioInvalidFileType,
+    MinioUploadError,
+)
+from src.infrastructure.storage.minio_service import (
+    MinioService,
+    minio_up,
+    sniff_image_type,
+)
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+
+def png(size=64):
+    return io.BytesIO(PNG_HEADER + b"\x00" * (size - len(PNG_HEADER)))
+
+
+@pytest.mark.asyncio
+class TestMinioService:
+    async def test_calls_run_off_the_event_loop(self, minio_service):
+        threads = []
+
+        def put_object(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return MagicMock(object_name="object")
+
+        minio_service.client.put_object.side_effect = put_object
+        minio_service.client.remove_object.side_effect = lambda *args: threads.append(
+            threading.current_thread().name
+        )
+
+        await minio_service.upload_image(uuid4(), png())
+        await minio_service.delete_image(uuid4())
+
+        assert len(threads) == 2
+        assert all(name.startswith("minio") for name in threads)
+
+    async def test_slow_upload_does_not_block_loop(self, minio_service):
+        minio_service.client.put_object.side_effect = lambda *args, **kwargs: (
+            time.sleep(0.2)
+        )
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await minio_service.upload_generated_image(uuid4(), b"data")
+        task.cancel()
+
+        assert ticks >= 10
+
+    async def test_upload_error_is_wrapped(self, minio_service):
+        minio_service.client.put_object.side_effect = S3Error(
+            "AccessDenied", "denied", "resource", "request", "host", MagicMock()
+        )
+
+        with pytest.raises(MinioUploadError):
+            await minio_service.upload_image(uuid4(), png())
+
+    async def test_generated_image_url(self, minio_service):
+        job_id = uuid4()
+
+        url = await minio_service.upload_generated_image(job_id, b"data")
+
+        assert url == f"http://minio.local/images/generated/{job_id}.png"
+        args = minio_service.client.put_object.call_args
+        assert args.args[:2] == ("images", f"generated/{job_id}.png")
+        assert args.kwargs["content_type"] == "image/png"
+
+
+@pytest.mark.asyncio
+class TestMinioServiceBootstrap:
+    async def test_constructor_does_not_touch_storage(self, minio_service):
+
+        minio_service.client.bucket_exists.assert_not_called()
+        minio_service.client.set_bucket_policy.assert_not_called()
+
+    async def test_bucket_is_bootstrapped_once(self, minio_service):
+        minio_service.client.bucket_exists.return_value = False
+
+        await asyncio.gather(
+            minio_service.upload_image(uuid4(), png()),
+            minio_service.upload_image(uuid4(), png()),
+            minio_service.delete_image(uuid4()),
+        )
+
+        minio_service.client.make_bucket.assert_called_once_with("images")
+        minio_service.client.set_bucket_policy.assert_called_once()
+
+    async def test_failed_bootstrap_is_retried(self, minio_service):
+        minio_service.client.set_bucket_policy.side_effect = [
+            S3Error("Down", "down", "resource", "request", "host", MagicMock()),
+            None,
+        ]
+
+        with pytest.raises(MinioUploadError):
+            await minio_service.upload_image(uuid4(), png())
+        await minio_service.upload_image(uuid4(), png())
+
+        assert minio_service.client.set_bucket_policy.call_count == 2
+        assert minio_service.client.put_object.call_count == 1
+
+    async def test_health_check_recreates_missing_bucket(self, minio_service):
+        minio_service.client.bucket_exists.return_value = True
+        assert await minio_service.check_health()
+        assert minio_up._value.get() == 1
+
+        minio_service.client.bucket_exists.return_value = False
+        assert await minio_service.check_health()
+
+        assert minio_service.client.make_bucket.call_count == 1
+
+    async def test_health_check_reports_outage(self, minio_service):
+        minio_service.client.bucket_exists.side_effect = ConnectionError("down")
+
+        assert not await minio_service.check_health()
+        assert minio_up._value.get() == 0
+
+
+def consume_put_object(parts):
+    # Reads the stream the way the minio client does: one part at a time.
+    def put_object(bucket, name, data, length, part_size, content_type):
+        while True:
+            chunk = data.read(part_size)
+            parts.append(len(chunk))
+            if len(chunk) < part_size:
+                return MagicMock(object_name=name)
+
+    return put_object
+
+
+@pytest.mark.parametrize(
+    "head, content_type",
+    [
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF", "image/jpeg"),
+        (PNG_HEADER, "image/png"),
+        (b"GIF89a\x01\x00", "image/gif"),
+        (b"RIFF\x24\x00\x00\x00WEBPVP8 ", "image/webp"),
+        (b"%PDF-1.7", None),
+        (b"", None),
+    ],
+)
+def test_sniff_image_type(head, content_type):
+    assert sniff_image_type(head) == content_type
+
+
+@pytest.mark.asyncio
+class TestMinioServiceStreamingUpload:
+    async def test_streams_in_fixed_size_parts(self, minio_service):
+        parts = []
+        minio_service.client.put_object.side_effect = consume_put_object(parts)
+        campaign_id = uuid4()
+        size = MinioService.UPLOAD_PART_SIZE + 123
+
+        assert await minio_service.upload_image(campaign_id, png(size)) == str(
+            campaign_id
+        )
+
+        assert parts == [MinioService.UPLOAD_PART_SIZE, 123]
+        args = minio_service.client.put_object.call_args
+        assert args.kwargs["length"] == -1
+        assert args.kwargs["part_size"] == MinioService.UPLOAD_PART_SIZE
+        assert args.kwargs["content_type"] == "image/png"
+
+    async def test_sniffed_head_is_uploaded(self, minio_service):
+        uploaded = []
+
+        def put_object(bucket, name, data, length, part_size, content_type):
+            uploaded.append(data.read(part_size))
+            return MagicMock(object_name=name)
+
+        minio_service.client.put_object.side_effect = put_object
+
+        await minio_service.upload_image(uuid4(), png(100))
+
+        assert uploaded == [png(100).getvalue()]
+
+    async def test_unknown_format_is_rejected_before_upload(self, minio_service):
+
+        with pytest.raises(MinioInvalidFileType):
+            await minio_service.upload_image(uuid4(), io.BytesIO(b"<svg></svg>"))
+
+        minio_service.client.put_object.assert_not_called()
+
+    async def test_size_limit_is_enforced_while_streaming(self, minio_service):
+        parts = []
+        minio_service.client.put_object.side_effect = consume_put_object(parts)
+
+        with pytest.raises(MinioFileTooLargeError):
+            await minio_service.upload_image(
+                uuid4(), png(MinioService.MAX_FILE_SIZE + 1)
+            )
+
+        # Fails on the part that crosses the limit, not after reading it all.
+        assert len(parts) == 2